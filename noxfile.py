@@ -166,6 +166,11 @@ def tests_fast(session: nox.Session) -> None:
     )
 
 
+@nox.session(python=False, name="query_plans")
+def query_plans(session: nox.Session) -> None:
+    session.run("python", "-m", "pytest", "tests/integration/test_query_plans.py", "-v")
+
+
 @nox.session(python=False)
 def tests_full(session: nox.Session) -> None:
     perf_log = PROJECT_ROOT / "perf-metrics.log"
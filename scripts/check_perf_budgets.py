@@ -21,11 +21,38 @@ class MetricBudget:
 METRIC_BUDGETS: dict[str, MetricBudget] = {
     "estimate_history.page": MetricBudget(250.0, 20),
     "silver_bar_history.page": MetricBudget(250.0, 20),
+    "estimate_history.first_page": MetricBudget(100.0, 20),
+    "silver_bar_history.first_page": MetricBudget(100.0, 20),
+    "estimate_history.first_page_cached": MetricBudget(10.0, 20),
+    "estimate_history.search": MetricBudget(20.0, 20),
+    "silver_bar_history.search": MetricBudget(20.0, 20),
     "estimate_totals.recompute": MetricBudget(60.0, 20),
     "view_model.synchronize": MetricBudget(120.0, 20),
     "encrypted_backup_export": MetricBudget(350.0, 5),
+    "encrypted_backup_export.validate": MetricBudget(400.0, 5),
+    "encrypted_backup_export.archive": MetricBudget(150.0, 5),
+    "encrypted_backup.export_10mib": MetricBudget(350.0, 5),
+    "encrypted_backup.online_10mib": MetricBudget(600.0, 5),
+    "encrypted_backup.export_500mib": MetricBudget(15_000.0, 3),
+    "encrypted_backup.online_500mib": MetricBudget(25_000.0, 3),
     "dda_current.parse": MetricBudget(20.0, 20),
     "dda_sse.parse_apply": MetricBudget(20.0, 20),
+    "item_search.contains": MetricBudget(10.0, 20),
+    "item_cache.build": MetricBudget(4_000.0, 3),
+    "item_cache.lookup": MetricBudget(1.0, 20),
+    "item_cache.prefix": MetricBudget(5.0, 20),
+    "item_cache.contains": MetricBudget(5.0, 20),
+    "item_cache.keystroke": MetricBudget(3.0, 20),
+    "silver_bar_optimizer.bars_1k": MetricBudget(20.0, 6),
+    "silver_bar_optimizer.bars_10k": MetricBudget(100.0, 6),
+    "silver_bar_optimizer.bars_50k": MetricBudget(400.0, 6),
+    "estimate.save": MetricBudget(60.0, 20),
+    "estimate.delete_with_bars": MetricBudget(60.0, 20),
+    "silver_bars.synchronize": MetricBudget(40.0, 20),
+    "silver_bars.assign_bulk": MetricBudget(150.0, 20),
+    "silver_bars.remove_bulk": MetricBudget(150.0, 20),
+    "silver_bars.mark_issued": MetricBudget(120.0, 20),
+    "item_catalog.upsert": MetricBudget(2_500.0, 5),
 }
 
 PROFILE_BUDGET_OVERRIDES: dict[str, dict[str, float]] = {
@@ -33,11 +60,34 @@ PROFILE_BUDGET_OVERRIDES: dict[str, dict[str, float]] = {
     # GitHub-hosted Windows runners have materially slower and more variable
     # encrypted-disk throughput than the release workstation. Run 30001409060
     # measured five 10 MiB SQLCipher exports at 537-646 ms (635 ms p95).
-    "github-windows": {"encrypted_backup_export": 800.0},
+    # The validate and archive phases read the same copy, so they share the
+    # export's headroom factor until the runner has its own measurements.
+    "github-windows": {
+        "encrypted_backup_export": 800.0,
+        "encrypted_backup_export.validate": 900.0,
+        "encrypted_backup_export.archive": 350.0,
+        "encrypted_backup.export_10mib": 800.0,
+        "encrypted_backup.online_10mib": 1_400.0,
+        "encrypted_backup.export_500mib": 35_000.0,
+        "encrypted_backup.online_500mib": 60_000.0,
+        # Every write path ends in a WAL commit on the same runner disk.
+        "estimate.save": 150.0,
+        "estimate.delete_with_bars": 150.0,
+        "silver_bars.synchronize": 100.0,
+        "silver_bars.assign_bulk": 350.0,
+        "silver_bars.remove_bulk": 350.0,
+        "silver_bars.mark_issued": 300.0,
+        "item_catalog.upsert": 5_000.0,
+    },
 }
 
+# Budgets are set for this dataset tier; samples tagged with another tier are
+# reported by run_performance_gate.py for trend reading only.
+BUDGET_TIER = "10k"
+
 PERF_PREFIX_RE = re.compile(r"\[perf\]")
 PERF_VALUE_RE = re.compile(r"\[perf\]\s+([a-zA-Z0-9_.]+)=([^\s]+)(?:\s+.*)?$")
+PERF_TIER_RE = re.compile(r"\stier=([^\s]+)")
 
 
 def percentile(values: list[float], pct: float) -> float:
@@ -74,6 +124,9 @@ def parse_metrics(log_text: str) -> tuple[dict[str, list[float]], list[str]]:
         if not math.isfinite(duration_ms) or duration_ms < 0:
             malformed.append(f"line {line_number}: {line.strip()}")
             continue
+        tier = PERF_TIER_RE.search(line, match.end(2))
+        if tier is not None and tier.group(1) != BUDGET_TIER:
+            continue
         metrics[match.group(1)].append(duration_ms)
     return dict(metrics), malformed
 
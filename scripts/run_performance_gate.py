@@ -5,190 +5,357 @@ from __future__ import annotations
 
 import argparse
 import json
-import sqlite3
+import logging
+import random
+import shutil
 import tempfile
 import time
-from collections.abc import Callable
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TypeVar
 
 from silverestimate.domain.estimate_models import EstimateLine, EstimateLineCategory
+from silverestimate.infrastructure.item_cache import ItemCacheController
+from silverestimate.persistence import schema
+from silverestimate.persistence.change_journal import (
+    current_generation,
+    prune_journal,
+)
 from silverestimate.persistence.database_driver import (
     SqlCipherConnectionBroker,
     export_database,
+    online_backup,
+)
+from silverestimate.persistence.database_manager import DatabaseManager
+from silverestimate.persistence.encrypted_backup import stream_backup_archive
+from silverestimate.persistence.estimates_repository import (
+    EstimatesRepository,
+    fetch_estimate_history_page,
+)
+from silverestimate.persistence.item_usage import (
+    ITEM_USAGE,
+    rebuild_usage,
+    usage_statements,
+)
+from silverestimate.persistence.items_repository import ItemsRepository
+from silverestimate.persistence.query_cache import QueryCache
+from silverestimate.persistence.search_index import ITEM_SEARCH_INDEX
+from silverestimate.persistence.silver_bar_command_repository import (
+    SilverBarCommandRepository,
+)
+from silverestimate.persistence.silver_bar_synchronization_repository import (
+    SilverBarSynchronizationRepository,
 )
-from silverestimate.persistence.estimates_repository import fetch_estimate_history_page
 from silverestimate.persistence.silver_bars_snapshot_repository import (
     SilverBarsSnapshotRepository,
 )
+from silverestimate.persistence.statement_stats import StatementStats
+from silverestimate.persistence.storage_metadata import BackupManifest
 from silverestimate.services.dda_rate_fetcher import (
     DDA_AGRA_MOHAR_ITEM_ID,
     parse_current_rates,
 )
 from silverestimate.services.dda_rate_stream import apply_sse_rate_event
 from silverestimate.services.estimate_calculator import compute_totals
+from silverestimate.ui.silver_bar_optimization import optimize_bar_selection
 from silverestimate.ui.view_models.estimate_entry_view_model import (
     EstimateEntryRowState,
     EstimateEntryViewModel,
 )
 
 ITEM_COUNT = 10_000
+SEARCH_ITEM_COUNT = 100_000
+SELECTION_ITEM_COUNT = 50_000
+# Items with usage statistics in the search catalogs, as a shop bills a few
+# hundred items day to day.
+USED_ITEM_COUNT = 500
 BAR_COUNT = 50_000
 ESTIMATE_COUNT = 10_000
 ESTIMATE_LINE_COUNT = 50_000
 VIEW_MODEL_ROW_COUNT = 500
 ENCRYPTED_PLAINTEXT_SIZE = 10 * 1024 * 1024
+# Backup-mode comparison sizes with their sample counts.
+BACKUP_MODE_SIZES = {"10mib": (10 * 1024 * 1024, 5), "500mib": (500 * 1024 * 1024, 3)}
+BACKUP_PAYLOAD_ROW_BYTES = 10 * 1024 * 1024
+OPTIMIZER_BAR_COUNTS = {"1k": 1_000, "10k": 10_000, "50k": 50_000}
+OPTIMIZER_SAMPLES = 6
 HOT_SAMPLES = 20
 FLUSH_SAMPLES = 5
+WRITE_SAMPLES = 20
+CATALOG_WRITE_SAMPLES = 5
+ITEM_CACHE_BUILD_SAMPLES = 3
+WRITE_ESTIMATE_LINES = 24
+WRITE_ESTIMATE_BARS = 4
+WRITE_BULK_BARS = 100
+SQL_REPORT_SHAPES = 15
+
+# Bump when the generator changes so cached fixtures are rebuilt.
+DATASET_REVISION = 1
+DATASET_SEED = 20260715
+DATASET_KEY = b"P" * 32
+DATASET_SALT = b"p" * 16
+DATASET_INSERT_BATCH = 10_000
+VOUCHER_BASE = 100_000
+BARS_PER_LIST = 250
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".perf-cache"
+
+
+@dataclass(frozen=True)
+class DatasetTier:
+    items: int
+    estimates: int
+    estimate_lines: int
+    bars: int
+
+
+DATASET_TIERS = {
+    "small": DatasetTier(1_000, 1_000, 5_000, 5_000),
+    "10k": DatasetTier(ITEM_COUNT, ESTIMATE_COUNT, ESTIMATE_LINE_COUNT, BAR_COUNT),
+    "100k": DatasetTier(ITEM_COUNT, 100_000, 500_000, 500_000),
+    "1m": DatasetTier(ITEM_COUNT, 1_000_000, 2_000_000, 500_000),
+}
+DEFAULT_TIER = "10k"
+_ITEM_WORDS = ("Ring", "Chain", "Anklet", "Pendant", "Bangle", "Payal", "Kada")
+_CUSTOMERS = ("Walk-in", "Ramesh Jewellers", "Sharma & Sons", "Order", "Repair")
 
 ResultT = TypeVar("ResultT")
 
 
-def create_deterministic_dataset(path: Path) -> None:
-    connection = sqlite3.connect(path)
-    try:
-        connection.executescript(
-            """
-            PRAGMA journal_mode = OFF;
-            PRAGMA synchronous = OFF;
-            CREATE TABLE items (
-                code TEXT PRIMARY KEY,
-                normalized_code TEXT NOT NULL,
-                name TEXT NOT NULL
-            );
-            CREATE TABLE estimates (
-                voucher_no TEXT PRIMARY KEY,
-                voucher_no_int INTEGER,
-                date TEXT,
-                note TEXT,
-                silver_rate REAL,
-                total_gross REAL,
-                total_net REAL,
-                total_fine REAL,
-                total_wage REAL,
-                last_balance_amount REAL
-            );
-            CREATE TABLE estimate_items (
-                item_id INTEGER PRIMARY KEY,
-                voucher_no TEXT NOT NULL,
-                item_code TEXT NOT NULL,
-                gross REAL,
-                net_wt REAL
-            );
-            CREATE TABLE silver_bar_lists (
-                list_id INTEGER PRIMARY KEY,
-                list_identifier TEXT,
-                issued_date TEXT
-            );
-            CREATE TABLE silver_bars (
-                bar_id INTEGER PRIMARY KEY,
-                estimate_voucher_no TEXT,
-                weight REAL,
-                purity REAL,
-                fine_weight REAL,
-                status TEXT,
-                date_added TEXT,
-                list_id INTEGER
-            );
-            """
+class _SchemaTarget:
+    """The slice of ``DatabaseManager`` that ``run_schema_setup`` calls."""
+
+    def __init__(self, connection) -> None:
+        self.conn = connection
+        self.cursor = connection.cursor()
+        self.logger = logging.getLogger("performance-gate")
+
+    def _table_exists(self, table_name: str) -> bool:
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+            (table_name,),
         )
-        connection.executemany(
-            "INSERT INTO items(code, normalized_code, name) VALUES (?, ?, ?)",
+        return self.cursor.fetchone() is not None
+
+    def _check_schema_version(self) -> int:
+        if not self._table_exists("schema_version"):
+            return 0
+        row = self.cursor.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def _update_schema_version(self, new_version: int) -> bool:
+        self.cursor.execute(
+            "INSERT INTO schema_version(version, applied_date) VALUES (?, ?)",
+            (new_version, "2026-07-15 09:30:00"),
+        )
+        return True
+
+
+def dataset_broker(
+    path: Path, *, statement_stats: StatementStats | None = None
+) -> SqlCipherConnectionBroker:
+    return SqlCipherConnectionBroker(
+        path,
+        DATASET_KEY,
+        database_salt=DATASET_SALT,
+        statement_stats=statement_stats,
+    )
+
+
+def _insert_batched(connection, statement: str, rows) -> None:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == DATASET_INSERT_BATCH:
+            connection.executemany(statement, batch)
+            batch.clear()
+    if batch:
+        connection.executemany(statement, batch)
+
+
+def create_deterministic_dataset(
+    path: Path,
+    tier: DatasetTier = DATASET_TIERS[DEFAULT_TIER],
+    *,
+    seed: int = DATASET_SEED,
+) -> None:
+    """Build a keyed database through the production schema setup.
+
+    Rows go in after ``run_schema_setup`` so the search-index, summary and
+    change-journal triggers fill their tables exactly as they do in the app.
+    Item usage is then rebuilt from the lines, and the journal is pruned, as
+    a full backup would leave it.
+    """
+    generator = random.Random(seed)
+    connection, _ = dataset_broker(path).open_writer(create=True)
+    try:
+        schema.run_schema_setup(_SchemaTarget(connection))
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("BEGIN")
+        _insert_batched(
+            connection,
+            "INSERT INTO items(code, name, purity, wage_type, wage_rate) "
+            "VALUES (?, ?, ?, ?, ?)",
             (
-                (f"I{index:05d}", f"i{index:05d}", f"Item {index:05d}")
-                for index in range(ITEM_COUNT)
+                (
+                    f"I{index:05d}",
+                    f"{_ITEM_WORDS[index % len(_ITEM_WORDS)]} {index:05d}",
+                    generator.choice((80.0, 91.6, 92.5, 99.9)),
+                    "WT" if index % 4 else "PC",
+                    round(generator.uniform(2.0, 15.0), 2),
+                )
+                for index in range(tier.items)
             ),
         )
-        connection.executemany(
+        _insert_batched(
+            connection,
             """
             INSERT INTO estimates(
                 voucher_no, voucher_no_int, date, note, silver_rate,
                 total_gross, total_net, total_fine, total_wage,
-                last_balance_amount
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                last_balance_silver, last_balance_amount
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 (
-                    f"V{index:06d}",
-                    index,
-                    f"2026-06-{(index % 28) + 1:02d}",
-                    f"Estimate {index:06d}",
+                    str(VOUCHER_BASE + index),
+                    VOUCHER_BASE + index,
+                    f"20{24 + index * 3 // tier.estimates}-"
+                    f"{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+                    f"{_CUSTOMERS[index % len(_CUSTOMERS)]} {index:06d}",
                     225_000.0,
                     500.0,
                     495.0,
                     490.0,
                     1_250.0,
                     0.0,
+                    0.0,
                 )
-                for index in range(ESTIMATE_COUNT)
+                for index in range(tier.estimates)
             ),
         )
-        connection.executemany(
+        _insert_batched(
+            connection,
             """
             INSERT INTO estimate_items(
-                item_id, voucher_no, item_code, gross, net_wt
-            ) VALUES (?, ?, ?, ?, ?)
+                voucher_no, item_code, item_name, gross, poly, net_wt, purity,
+                wage_rate, pieces, wage_type, wage, fine, line_key
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 (
-                    index,
-                    f"V{index // 5:06d}",
-                    f"I{index % ITEM_COUNT:05d}",
+                    str(VOUCHER_BASE + index % tier.estimates),
+                    f"I{index % tier.items:05d}",
+                    f"Item {index % tier.items:05d}",
                     100.0 + (index % 25),
+                    1.0,
                     99.0 + (index % 25),
+                    92.5,
+                    5.0,
+                    1,
+                    "WT",
+                    5.0 * (99.0 + (index % 25)),
+                    0.925 * (99.0 + (index % 25)),
+                    f"line-{index:08d}",
                 )
-                for index in range(ESTIMATE_LINE_COUNT)
+                for index in range(tier.estimate_lines)
             ),
         )
-        connection.executemany(
-            """
-            INSERT INTO silver_bars(
-                bar_id, estimate_voucher_no, weight, purity, fine_weight,
-                status, date_added, list_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        list_count = max(1, tier.bars // BARS_PER_LIST)
+        _insert_batched(
+            connection,
+            "INSERT INTO silver_bar_lists(list_id, list_identifier, creation_date, "
+            "issued_date) VALUES (?, ?, ?, ?)",
             (
                 (
                     index + 1,
-                    f"V{index % ESTIMATE_COUNT:06d}",
-                    1_000.0 + (index % 250),
-                    99.0,
-                    (1_000.0 + (index % 250)) * 0.99,
-                    "In Stock" if index % 3 else "Issued",
-                    f"2026-06-{(index % 28) + 1:02d}T12:{index % 60:02d}:00Z",
-                    None,
+                    f"L-{index + 1:06d}",
+                    f"2026-06-{index % 28 + 1:02d}",
+                    f"2026-07-{index % 28 + 1:02d}" if index % 2 else None,
                 )
-                for index in range(BAR_COUNT)
+                for index in range(list_count)
             ),
         )
-        connection.executescript(
-            """
-            CREATE INDEX idx_items_normalized_code
-                ON items(normalized_code, code);
-            CREATE INDEX idx_estimates_voucher_order
-                ON estimates(voucher_no_int DESC, voucher_no DESC);
-            CREATE INDEX idx_estimate_items_voucher
-                ON estimate_items(voucher_no);
-            CREATE INDEX idx_silver_bars_history
-                ON silver_bars(date_added DESC, bar_id DESC);
-            CREATE INDEX idx_silver_bars_availability
-                ON silver_bars(status, list_id, weight, date_added DESC, bar_id DESC);
+
+        def bar_row(index: int):
+            weight = round(generator.uniform(500.0, 1_250.0), 3)
+            purity = generator.choice((99.0, 99.5, 99.9))
+            list_id = index % list_count + 1 if index % 3 == 0 else None
+            if list_id is None:
+                status = "In Stock"
+            else:
+                status = "Assigned" if list_id % 2 else "Issued"
+            return (
+                str(VOUCHER_BASE + index % tier.estimates),
+                weight,
+                purity,
+                round(weight * purity / 100.0, 3),
+                f"2026-06-{index % 28 + 1:02d} 12:{index % 60:02d}:00",
+                status,
+                list_id,
+            )
+
+        _insert_batched(
+            connection,
             """
+            INSERT INTO silver_bars(
+                estimate_voucher_no, weight, purity, fine_weight, date_added,
+                status, list_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (bar_row(index) for index in range(tier.bars)),
         )
+        cursor = connection.cursor()
+        rebuild_usage(cursor)
+        prune_journal(cursor, current_generation(cursor))
         connection.commit()
+        connection.execute("PRAGMA optimize")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
     finally:
         connection.close()
 
 
+def cached_dataset(
+    cache_dir: Path | None,
+    tier_name: str,
+    *,
+    seed: int = DATASET_SEED,
+    scratch_dir: Path,
+) -> Path:
+    """Return a dataset for ``tier_name``/``seed``, building it at most once.
+
+    Without a cache directory the dataset is built under ``scratch_dir`` and
+    discarded with it. Cached files are named by tier, seed, generator
+    revision and schema revision, so any of those changing forces a rebuild.
+    """
+    name = (
+        f"scale-{tier_name}-seed{seed}-r{DATASET_REVISION}-"
+        f"v{schema.CURRENT_SCHEMA_VERSION}.{schema.SCHEMA_SETUP_REVISION}.sqlcipher"
+    )
+    target = (cache_dir or scratch_dir) / name
+    if target.is_file():
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(f"{target.name}.partial")
+    for stale in (partial, Path(f"{partial}-wal"), Path(f"{partial}-shm")):
+        stale.unlink(missing_ok=True)
+    create_deterministic_dataset(partial, DATASET_TIERS[tier_name], seed=seed)
+    partial.replace(target)
+    return target
+
+
 def _measure(operation: Callable[[], ResultT]) -> tuple[float, ResultT]:
     started = time.perf_counter()
     result = operation()
     return (time.perf_counter() - started) * 1000.0, result
 
 
-def _emit(metric: str, duration_ms: float) -> None:
-    print(f"[perf] {metric}={duration_ms:.4f}ms")
+def _emit(metric: str, duration_ms: float, *, tier: str | None = None) -> None:
+    suffix = f" tier={tier}" if tier else ""
+    print(f"[perf] {metric}={duration_ms:.4f}ms{suffix}")
 
 
 def _dda_payload() -> dict[str, object]:
@@ -230,11 +397,517 @@ def _measure_encrypted_exports(temp_root: Path) -> None:
             )
             assert encrypted.stat().st_size >= ENCRYPTED_PLAINTEXT_SIZE
             _emit("encrypted_backup_export", duration)
+            _measure_backup_phases(temp_root, encrypted, sample)
     finally:
         source.close()
+    _measure_backup_modes(temp_root)
+
+
+def _measure_backup_modes(temp_root: Path) -> None:
+    """Compare ``sqlcipher_export`` with the stepped online backup per size."""
+    key, salt = b"M" * 32, b"m" * 16
+    for label, (size, samples) in BACKUP_MODE_SIZES.items():
+        source_path = temp_root / f"backup-mode-{label}.sqlcipher"
+        source, _ = SqlCipherConnectionBroker(
+            source_path, key, database_salt=salt
+        ).open_writer(create=True)
+        try:
+            source.execute("CREATE TABLE payload(value BLOB NOT NULL)")
+            source.executemany(
+                "INSERT INTO payload(value) VALUES (zeroblob(?))",
+                [(BACKUP_PAYLOAD_ROW_BYTES,)] * (size // BACKUP_PAYLOAD_ROW_BYTES),
+            )
+            source.commit()
+            for sample in range(samples):
+                exported = temp_root / f"backup-mode-{label}-export-{sample}.sqlcipher"
+                duration, _ = _measure(
+                    lambda source=source, exported=exported: export_database(
+                        source, exported, key, target_salt=salt
+                    )
+                )
+                assert exported.stat().st_size >= size
+                exported.unlink()
+                _emit(f"encrypted_backup.export_{label}", duration)
+
+                copied = temp_root / f"backup-mode-{label}-online-{sample}.sqlcipher"
+                duration, _ = _measure(
+                    lambda source=source, copied=copied: _online_copy(
+                        source, copied, key, salt
+                    )
+                )
+                assert copied.stat().st_size >= size
+                copied.unlink()
+                _emit(f"encrypted_backup.online_{label}", duration)
+        finally:
+            source.close()
+            source_path.unlink(missing_ok=True)
+
+
+def _online_copy(source, target_path: Path, key: bytes, salt: bytes) -> None:
+    target, _ = SqlCipherConnectionBroker(
+        target_path, key, database_salt=salt
+    ).open_writer(create=True)
+    try:
+        online_backup(source, target)
+    finally:
+        target.close()
+
+
+def _measure_backup_phases(temp_root: Path, encrypted: Path, sample: int) -> None:
+    """Time the validate and archive phases that follow each export."""
+    copy, _ = SqlCipherConnectionBroker(encrypted, b"B" * 32).open_writer()
+    try:
+        duration, _ = _measure(lambda: DatabaseManager.verify_database_integrity(copy))
+    finally:
+        copy.close()
+    _emit("encrypted_backup_export.validate", duration)
+
+    archive = temp_root / f"backup-{sample}.sedbbackup"
+    duration, _ = _measure(
+        lambda: stream_backup_archive(
+            encrypted,
+            archive,
+            lambda database_sha256: BackupManifest(
+                version=2,
+                created_utc=datetime.now(timezone.utc).isoformat(),
+                database_sha256=database_sha256,
+                schema_version=0,
+                sqlcipher_version="",
+            ),
+        )
+    )
+    assert archive.stat().st_size >= encrypted.stat().st_size
+    _emit("encrypted_backup_export.archive", duration)
+
+
+def _search_catalog_items() -> Iterator[tuple[str, str]]:
+    """Yield the ``(code, name)`` pairs of the 100,000-item search catalog."""
+    words = ("Ring", "Chain", "Anklet", "Pendant", "Bangle", "Payal", "Kada")
+    for index in range(SEARCH_ITEM_COUNT):
+        yield f"IT{index:06d}", f"{words[index % len(words)]} {index:06d}"
+
+
+def _search_catalog_usage() -> dict[str, tuple[int, float]]:
+    """Return usage for ``USED_ITEM_COUNT`` items spread over the catalog."""
+    return {
+        f"IT{(index * 197) % SEARCH_ITEM_COUNT:06d}": (index + 1, float(index + 1))
+        for index in range(USED_ITEM_COUNT)
+    }
 
 
-def run(output_path: Path) -> None:
+def _measure_item_search(temp_root: Path) -> None:
+    broker = SqlCipherConnectionBroker(temp_root / "items.sqlcipher", b"I" * 32)
+    connection, _ = broker.open_writer(create=True)
+    try:
+        connection.execute("""
+            CREATE TABLE items (
+                code TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                purity REAL DEFAULT 0,
+                wage_type TEXT DEFAULT 'P',
+                wage_rate REAL DEFAULT 0,
+                tunch TEXT
+            )
+        """)
+        connection.executemany(
+            "INSERT INTO items (code, name, purity, wage_type, wage_rate) "
+            "VALUES (?, ?, 91.5, 'WT', 5.0)",
+            _search_catalog_items(),
+        )
+        for statement in usage_statements().values():
+            connection.execute(statement)
+        connection.executemany(
+            f"INSERT INTO {ITEM_USAGE}(item_code, use_count, score) VALUES (?, ?, ?)",  # nosec B608
+            [(code, *usage) for code, usage in _search_catalog_usage().items()],
+        )
+        db = SimpleNamespace(
+            conn=connection,
+            cursor=connection.cursor(),
+            logger=logging.getLogger("performance-gate"),
+        )
+        schema._ensure_search_index(db, ITEM_SEARCH_INDEX)
+        connection.commit()
+        repository = ItemsRepository(db)
+        for sample in range(HOT_SAMPLES):
+            term = f"{(sample * 977) % 10_000:04d}"
+            duration, (matches, _) = _measure(
+                lambda term=term: repository.search_items_for_selection(term)
+            )
+            assert matches and all(term in row["code"] for row in matches)
+            _emit("item_search.contains", duration)
+    finally:
+        connection.close()
+
+
+def _item_cache_rows() -> list[dict[str, object]]:
+    return [
+        {
+            "code": code,
+            "name": name,
+            "tunch": None,
+            "purity": 91.5,
+            "wage_type": "WT",
+            "wage_rate": 5.0,
+        }
+        for code, name in _search_catalog_items()
+    ]
+
+
+def _traced_bytes(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by what ``build`` returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        held = tracemalloc.get_traced_memory()[0] - before
+        del kept
+        return held
+    finally:
+        tracemalloc.stop()
+
+
+def _measure_item_cache() -> None:
+    """Measure the in-memory item catalog at the 100,000-item search size."""
+    cache = ItemCacheController()
+    for _ in range(ITEM_CACHE_BUILD_SAMPLES):
+        rows = _item_cache_rows()
+        duration, _ = _measure(lambda rows=rows: cache.replace_all(rows))
+        _emit("item_cache.build", duration)
+    assert cache.searchable
+
+    for sample in range(HOT_SAMPLES):
+        code = f"it{(sample * 4_999) % SEARCH_ITEM_COUNT:06d}"
+        duration, row = _measure(lambda code=code: cache.get(code))
+        assert row is not None and row["code"] == code.upper()
+        _emit("item_cache.lookup", duration)
+
+        prefix = f"IT{(sample * 97) % 1_000:04d}"
+        duration, rows = _measure(lambda prefix=prefix: cache.search_rows(prefix))
+        assert rows and all(row["code"].startswith(prefix) for row in rows)
+        _emit("item_cache.prefix", duration)
+
+        term = f"{(sample * 977) % 10_000:04d}"
+        duration, result = _measure(
+            lambda term=term: cache.search_for_selection(term, 500)
+        )
+        assert result is not None and result[0]
+        _emit("item_cache.contains", duration)
+
+    def loaded_cache() -> ItemCacheController:
+        loaded = ItemCacheController()
+        loaded.replace_all(_item_cache_rows())
+        return loaded
+
+    # Both layouts are built from fresh rows so neither shares their strings.
+    catalog_bytes = _traced_bytes(loaded_cache)
+    dict_bytes = _traced_bytes(
+        lambda: {str(row["code"]).upper(): row for row in _item_cache_rows()}
+    )
+    print(
+        f"[mem] item_cache.bytes={catalog_bytes} dict_rows_bytes={dict_bytes} "
+        f"items={SEARCH_ITEM_COUNT}"
+    )
+
+
+def _selection_keystrokes(sample: int) -> tuple[str, list[str]]:
+    """Return a code and the search box contents while a term for it is typed.
+
+    Samples rotate between the code itself, its last four digits, and the code
+    with its first two letters swapped, which only the typo ranking finds.
+    """
+    code = f"IT{(sample * 2_477) % SELECTION_ITEM_COUNT:06d}"
+    term = (code, code[-4:], code[1] + code[0] + code[2:])[sample % 3]
+    return code, [term[:length] for length in range(1, len(term) + 1)]
+
+
+def _measure_item_selection() -> None:
+    """Measure selection-dialog keystrokes against a 50,000-item catalog."""
+    cache = ItemCacheController()
+    cache.replace_all(_item_cache_rows()[:SELECTION_ITEM_COUNT])
+    cache.replace_usage(_search_catalog_usage())
+    for sample in range(HOT_SAMPLES):
+        code, keystrokes = _selection_keystrokes(sample)
+        for term in keystrokes:
+            duration, result = _measure(
+                lambda term=term: cache.search_for_selection(term, 500)
+            )
+            assert result is not None
+            _emit("item_cache.keystroke", duration)
+        assert code in {row["code"] for row in result[0]}
+
+
+def _measure_list_optimizer() -> None:
+    for label, bar_count in OPTIMIZER_BAR_COUNTS.items():
+        generator = random.Random(bar_count)
+        bars = [
+            {
+                "bar_id": index,
+                "fine_weight": round(
+                    generator.uniform(5.0, 30.0) * generator.uniform(0.9, 0.999), 3
+                ),
+            }
+            for index in range(bar_count)
+        ]
+        for sample in range(OPTIMIZER_SAMPLES):
+            objective = "min_bars" if sample % 2 == 0 else "max_bars"
+            target = (123.4, 1_000.0, 5_000.0)[sample // 2]
+            duration, result = _measure(
+                lambda bars=bars, objective=objective, target=target: (
+                    optimize_bar_selection(bars, target, target + 0.5, objective)
+                )
+            )
+            assert result.found and result.proven_optimal
+            _emit(f"silver_bar_optimizer.bars_{label}", duration)
+
+
+def _measure_history_reads(
+    database_path: Path,
+    tier_name: str,
+    statement_stats: StatementStats | None = None,
+) -> None:
+    """Emit the history metrics against one tier's keyed dataset."""
+    tier = DATASET_TIERS[tier_name]
+    broker = dataset_broker(database_path, statement_stats=statement_stats)
+    snapshot_repository = SilverBarsSnapshotRepository(broker.open_read_connection)
+    connection = broker.open_read_connection()
+    query_cache = QueryCache()
+    try:
+        fetch_estimate_history_page(
+            connection.cursor(), limit=500, include_total=False, cache=query_cache
+        )
+        for sample in range(HOT_SAMPLES):
+            duration, page = _measure(
+                lambda: fetch_estimate_history_page(connection.cursor(), limit=500)
+            )
+            assert len(page.items) == 500 and page.total == tier.estimates
+            _emit("estimate_history.page", duration, tier=tier_name)
+
+            duration, page = _measure(
+                lambda: snapshot_repository.search_history_bars_page(limit=1_000)
+            )
+            assert len(page.items) == 1_000 and page.total == tier.bars
+            _emit("silver_bar_history.page", duration, tier=tier_name)
+
+            # What the dialogs wait for before rows appear; the count follows.
+            duration, page = _measure(
+                lambda: fetch_estimate_history_page(
+                    connection.cursor(), limit=500, include_total=False
+                )
+            )
+            assert len(page.items) == 500 and page.total is None
+            _emit("estimate_history.first_page", duration, tier=tier_name)
+
+            # Reopening the dialog on an unchanged database.
+            duration, page = _measure(
+                lambda: fetch_estimate_history_page(
+                    connection.cursor(),
+                    limit=500,
+                    include_total=False,
+                    cache=query_cache,
+                )
+            )
+            assert len(page.items) == 500
+            _emit("estimate_history.first_page_cached", duration, tier=tier_name)
+
+            duration, page = _measure(
+                lambda: snapshot_repository.search_history_bars_page(
+                    limit=1_000, include_total=False
+                )
+            )
+            assert len(page.items) == 1_000 and page.total is None
+            _emit("silver_bar_history.first_page", duration, tier=tier_name)
+
+            term = f"{(sample * 487) % min(tier.estimates, 10_000):04d}"
+            duration, page = _measure(
+                lambda term=term: fetch_estimate_history_page(
+                    connection.cursor(), voucher_search=term, limit=500
+                )
+            )
+            assert page.items and all(term in row["voucher_no"] for row in page.items)
+            _emit("estimate_history.search", duration, tier=tier_name)
+
+            duration, page = _measure(
+                lambda term=term: snapshot_repository.search_history_bars_page(
+                    voucher_term=term, limit=1_000
+                )
+            )
+            assert page.items and page.total >= len(page.items)
+            _emit("silver_bar_history.search", duration, tier=tier_name)
+        assert query_cache.metrics().hits == HOT_SAMPLES
+    finally:
+        connection.close()
+        broker.close_idle_readers()
+
+
+def _write_session(connection) -> SimpleNamespace:
+    """Wire the write repositories to one writer the way ``DatabaseManager`` does."""
+    session = SimpleNamespace(
+        conn=connection,
+        cursor=connection.cursor(),
+        logger=logging.getLogger("performance-gate"),
+        last_error=None,
+        item_cache_controller=ItemCacheController(),
+    )
+    session.silver_bar_command_repo = SilverBarCommandRepository(session)
+    session.silver_bar_synchronization_repo = SilverBarSynchronizationRepository(
+        session
+    )
+    return session
+
+
+def _estimate_payload(sample: int, tier: DatasetTier) -> tuple:
+    """Return ``save_estimate_with_returns`` arguments for one new voucher."""
+    lines = [
+        {
+            "code": f"I{(sample * 131 + index) % tier.items:05d}",
+            "name": f"Item {index:02d}",
+            "gross": 10.0 + index,
+            "poly": 0.5,
+            "net_wt": 9.5 + index,
+            "purity": 92.5,
+            "wage_rate": 10.0,
+            "pieces": 1,
+            "wage_type": "WT",
+            "wage": 10.0 * (9.5 + index),
+            "fine": 0.925 * (9.5 + index),
+            "is_return": index % 12 == 11,
+            "is_silver_bar": False,
+            "line_key": f"w{sample:02d}-{index:02d}",
+        }
+        for index in range(WRITE_ESTIMATE_LINES)
+    ]
+    regular = [line for line in lines if not line["is_return"]]
+    totals = {
+        "total_gross": sum(line["gross"] for line in regular),
+        "total_net": sum(line["net_wt"] for line in regular),
+        "net_fine": sum(line["fine"] for line in regular),
+        "net_wage": sum(line["wage"] for line in regular),
+        "note": f"Counter sale {sample:02d}",
+    }
+    return (
+        str(VOUCHER_BASE + tier.estimates + sample),
+        "2026-07-15",
+        225_000.0,
+        regular,
+        [line for line in lines if line["is_return"]],
+        totals,
+    )
+
+
+def _measure_write_paths(
+    database_path: Path,
+    tier_name: str,
+    scratch: Path,
+    statement_stats: StatementStats | None = None,
+) -> None:
+    """Emit write-path metrics against a keyed WAL copy of one tier's dataset.
+
+    Each command runs through its production repository on a writer opened by
+    the broker, so the timings include WAL commit and synchronous=NORMAL cost.
+    """
+    tier = DATASET_TIERS[tier_name]
+    working_path = scratch / f"writes-{tier_name}.sqlcipher"
+    shutil.copyfile(database_path, working_path)
+    connection, _ = dataset_broker(
+        working_path, statement_stats=statement_stats
+    ).open_writer()
+    try:
+        session = _write_session(connection)
+        estimates = EstimatesRepository(session)
+        items = ItemsRepository(session)
+        commands = session.silver_bar_command_repo
+        synchronizer = session.silver_bar_synchronization_repo
+        doomed = [
+            str(VOUCHER_BASE + (sample * 37) % tier.estimates)
+            for sample in range(WRITE_SAMPLES)
+        ]
+        in_stock = [
+            int(row[0])
+            for row in connection.execute(
+                "SELECT bar_id FROM silver_bars "
+                "WHERE status = 'In Stock' AND list_id IS NULL "
+                f"AND estimate_voucher_no NOT IN ({','.join('?' * len(doomed))}) "
+                "ORDER BY bar_id LIMIT ?",
+                (*doomed, (WRITE_SAMPLES + 1) * WRITE_BULK_BARS),
+            )
+        ]
+        assert len(in_stock) == (WRITE_SAMPLES + 1) * WRITE_BULK_BARS
+        bulk_bars = in_stock[:WRITE_BULK_BARS]
+
+        for sample in range(WRITE_SAMPLES):
+            payload = _estimate_payload(sample, tier)
+            duration, saved = _measure(
+                lambda payload=payload: estimates.save_estimate_with_returns(*payload)
+            )
+            assert saved, session.last_error
+            _emit("estimate.save", duration, tier=tier_name)
+
+            bars = [
+                {"weight": 1_000.0 + sample + index, "purity": 99.9}
+                for index in range(WRITE_ESTIMATE_BARS)
+            ]
+            duration, synced = _measure(
+                lambda voucher_no=payload[0], bars=bars: synchronizer.synchronize(
+                    voucher_no, bars
+                )
+            )
+            assert (synced.added, synced.failed) == (WRITE_ESTIMATE_BARS, 0)
+            _emit("silver_bars.synchronize", duration, tier=tier_name)
+
+            list_id = commands.create_list(f"Benchmark {sample:02d}")
+            assert list_id is not None
+            duration, (assigned, failed) = _measure(
+                lambda list_id=list_id: commands.assign_bars_to_list_bulk(
+                    bulk_bars, list_id
+                )
+            )
+            assert (assigned, failed) == (WRITE_BULK_BARS, [])
+            _emit("silver_bars.assign_bulk", duration, tier=tier_name)
+
+            duration, (removed, failed) = _measure(
+                lambda: commands.remove_bars_from_list_bulk(bulk_bars)
+            )
+            assert (removed, failed) == (WRITE_BULK_BARS, [])
+            _emit("silver_bars.remove_bulk", duration, tier=tier_name)
+
+            issued_bars = in_stock[(sample + 1) * WRITE_BULK_BARS :][:WRITE_BULK_BARS]
+            assert commands.assign_bars_to_list_bulk(issued_bars, list_id)[1] == []
+            duration, issued = _measure(
+                lambda list_id=list_id: commands.mark_list_as_issued(list_id)
+            )
+            assert issued
+            _emit("silver_bars.mark_issued", duration, tier=tier_name)
+
+            duration, deleted = _measure(
+                lambda sample=sample: estimates.delete_single_estimate(doomed[sample])
+            )
+            assert deleted
+            _emit("estimate.delete_with_bars", duration, tier=tier_name)
+
+        catalog = [dict(row) for row in items.get_all_items()]
+        assert len(catalog) == tier.items
+        for sample in range(CATALOG_WRITE_SAMPLES):
+            for row in catalog:
+                row["wage_rate"] = 2.0 + sample
+            duration, summary = _measure(lambda: items.upsert_item_catalog(catalog))
+            assert summary is not None and summary["updated"] == tier.items
+            _emit("item_catalog.upsert", duration, tier=tier_name)
+    finally:
+        connection.close()
+
+
+def _emit_statement_report(statement_stats: StatementStats, tier_name: str) -> None:
+    """Print the costliest statement shapes; budgets never read these lines."""
+    for stat in statement_stats.snapshot()[:SQL_REPORT_SHAPES]:
+        print(
+            f"[sql] total_ms={stat.total_ms:.3f} calls={stat.calls} "
+            f"p95_ms={stat.p95_ms:.3f} max_ms={stat.max_ms:.3f} rows={stat.rows} "
+            f"tier={tier_name} sql={stat.sql}"
+        )
+    statement_stats.reset()
+
+
+def _measure_hot_paths() -> None:
     now = datetime(2026, 7, 15, 9, 30, tzinfo=timezone.utc)
     rows = tuple(
         EstimateEntryRowState(
@@ -264,72 +937,73 @@ def run(output_path: Path) -> None:
         for row in rows
     )
     current_json = json.dumps(_dda_payload(), separators=(",", ":"))
+    for _sample in range(HOT_SAMPLES):
+        duration, totals = _measure(
+            lambda: compute_totals(lines, silver_rate=225_000.0)
+        )
+        assert totals.regular.gross == 50_000.0
+        _emit("estimate_totals.recompute", duration)
 
-    with tempfile.TemporaryDirectory(prefix="silverestimate-perf-") as temp_dir:
-        temp_root = Path(temp_dir)
-        database_path = temp_root / "scale.sqlite"
-        create_deterministic_dataset(database_path)
-
-        def open_snapshot(_cancel_event=None):
-            snapshot = sqlite3.connect(database_path)
-            snapshot.row_factory = sqlite3.Row
-            return snapshot
+        model = EstimateEntryViewModel()
+        duration, _ = _measure(lambda model=model: model.set_rows(rows))
+        assert len(model.rows()) == VIEW_MODEL_ROW_COUNT
+        _emit("view_model.synchronize", duration)
 
-        snapshot_repository = SilverBarsSnapshotRepository(open_snapshot)
-        connection = sqlite3.connect(database_path)
-        connection.row_factory = sqlite3.Row
-        try:
-            for _ in range(HOT_SAMPLES):
-                duration, page = _measure(
-                    lambda: fetch_estimate_history_page(connection.cursor(), limit=500)
-                )
-                assert len(page.items) == 500 and page.total == ESTIMATE_COUNT
-                _emit("estimate_history.page", duration)
-
-                duration, page = _measure(
-                    lambda: snapshot_repository.search_history_bars_page(limit=1_000)
-                )
-                assert len(page.items) == 1_000 and page.total == BAR_COUNT
-                _emit("silver_bar_history.page", duration)
+        duration, current = _measure(
+            lambda: parse_current_rates(current_json, received_at=now)
+        )
+        assert current.final_rate == 224_867
+        _emit("dda_current.parse", duration)
 
-                duration, totals = _measure(
-                    lambda: compute_totals(lines, silver_rate=225_000.0)
-                )
-                assert totals.regular.gross == 50_000.0
-                _emit("estimate_totals.recompute", duration)
+        rate_event = {
+            "schemaVersion": 1,
+            "view": "default",
+            "sequence": current.sequence + 1,
+            "items": [
+                {
+                    "itemId": DDA_AGRA_MOHAR_ITEM_ID,
+                    "finalRate": 224_868,
+                }
+            ],
+        }
+        duration, applied = _measure(
+            lambda rate_event=rate_event, current=current: apply_sse_rate_event(
+                rate_event, previous=current, received_at=now
+            )
+        )
+        assert applied[1] is not None and applied[1].final_rate == 224_868
+        _emit("dda_sse.parse_apply", duration)
 
-                model = EstimateEntryViewModel()
-                duration, _ = _measure(lambda model=model: model.set_rows(rows))
-                assert len(model.rows()) == VIEW_MODEL_ROW_COUNT
-                _emit("view_model.synchronize", duration)
 
-                duration, current = _measure(
-                    lambda: parse_current_rates(current_json, received_at=now)
-                )
-                assert current.final_rate == 224_867
-                _emit("dda_current.parse", duration)
-
-                rate_event = {
-                    "schemaVersion": 1,
-                    "view": "default",
-                    "sequence": current.sequence + 1,
-                    "items": [
-                        {
-                            "itemId": DDA_AGRA_MOHAR_ITEM_ID,
-                            "finalRate": 224_868,
-                        }
-                    ],
-                }
-                duration, applied = _measure(
-                    lambda rate_event=rate_event, current=current: apply_sse_rate_event(
-                        rate_event, previous=current, received_at=now
-                    )
-                )
-                assert applied[1] is not None and applied[1].final_rate == 224_868
-                _emit("dda_sse.parse_apply", duration)
-        finally:
-            connection.close()
+def run(
+    output_path: Path,
+    *,
+    tiers: tuple[str, ...] = (DEFAULT_TIER,),
+    seed: int = DATASET_SEED,
+    cache_dir: Path | None = None,
+    sql_stats: bool = False,
+) -> None:
+    statement_stats = (
+        StatementStats(logger=logging.getLogger("performance-gate"))
+        if sql_stats
+        else None
+    )
+    with tempfile.TemporaryDirectory(prefix="silverestimate-perf-") as temp_dir:
+        temp_root = Path(temp_dir)
+        for tier_name in tiers:
+            database_path = cached_dataset(
+                cache_dir, tier_name, seed=seed, scratch_dir=temp_root
+            )
+            _measure_history_reads(database_path, tier_name, statement_stats)
+            _measure_write_paths(database_path, tier_name, temp_root, statement_stats)
+            if statement_stats is not None:
+                _emit_statement_report(statement_stats, tier_name)
 
+        _measure_hot_paths()
+        _measure_item_search(temp_root)
+        _measure_item_cache()
+        _measure_item_selection()
+        _measure_list_optimizer()
         _measure_encrypted_exports(temp_root)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -339,6 +1013,25 @@ def run(output_path: Path) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument(
+        "--tier",
+        action="append",
+        choices=tuple(DATASET_TIERS),
+        help=f"Dataset tier to measure; repeat for several (default: {DEFAULT_TIER})",
+    )
+    parser.add_argument("--seed", type=int, default=DATASET_SEED)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        help="Reuse generated datasets from this directory (default: .perf-cache)",
+    )
+    parser.add_argument(
+        "--sql-stats",
+        action="store_true",
+        help="Time every statement and print the costliest shapes as [sql] lines",
+    )
     args = parser.parse_args()
 
     # Capture stdout as the canonical telemetry artifact while keeping a readable log.
@@ -347,7 +1040,13 @@ def main() -> int:
 
     buffer = io.StringIO()
     with contextlib.redirect_stdout(buffer):
-        run(args.output)
+        run(
+            args.output,
+            tiers=tuple(dict.fromkeys(args.tier or (DEFAULT_TIER,))),
+            seed=args.seed,
+            cache_dir=args.cache_dir,
+            sql_stats=args.sql_stats,
+        )
     telemetry = buffer.getvalue()
     args.output.write_text(telemetry, encoding="utf-8")
     print(telemetry, end="")
@@ -278,10 +278,12 @@ class StartupController:
                 (time.perf_counter() - db_t0) * 1000.0,
                 time.time(),
             )
+            open_path = getattr(db_manager, "open_path", None)
             self._logger.info(
                 '[telemetry] {"metric":"startup.database_initialize_ms",'
-                '"duration_ms":%.3f}',
+                '"duration_ms":%.3f,"open_path":"%s"}',
                 (time.perf_counter() - db_t0) * 1000.0,
+                getattr(open_path, "value", "full"),
             )
             return cast("DbManager", db_manager)
         except Exception as exc:
@@ -11,11 +11,18 @@ CursorT = TypeVar("CursorT")
 
 @dataclass(frozen=True)
 class Page(Generic[ItemT, CursorT]):
-    """A stable page of rows and the cursor needed to continue the query."""
+    """A stable page of rows and the cursor needed to continue the query.
+
+    ``totals`` optionally carries aggregates over the whole filtered result,
+    such as silver-bar weight totals, when the repository computed them.
+    ``total`` is ``None`` when the caller asked the repository to skip the
+    count so the rows can be shown first; loaders fetch it separately.
+    """
 
     items: tuple[ItemT, ...]
-    total: int
+    total: int | None
     next_cursor: CursorT | None = None
+    totals: object | None = None
 
     @property
     def has_more(self) -> bool:
@@ -0,0 +1,102 @@
+"""Deliver commits made by other database connections to open screens."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
+
+DEFAULT_POLL_INTERVAL_MS = 2_000
+
+
+class DatabaseChangeWatcher(QObject):
+    """Poll a ``ChangeMonitor`` in the background and re-emit what it publishes.
+
+    ``changed`` carries a ``TableChanges`` and is queued to the watcher's
+    thread, so screens can reload the tables they show. It also carries
+    changes the monitor found elsewhere, such as a query-cache lookup that
+    noticed a foreign commit before the next poll. The process's own writes
+    are never reported; screens refresh after those themselves.
+    """
+
+    changed = Signal(object)
+
+    def __init__(
+        self,
+        monitor: Any,
+        parent: QObject | None = None,
+        *,
+        poll_interval_ms: int = DEFAULT_POLL_INTERVAL_MS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._logger = logger or logging.getLogger(__name__)
+        self._polling = False
+        self._unsubscribe: Callable[[], None] | None = monitor.subscribe(self._publish)
+        self._runner: LatestRequestRunner[None, object] = LatestRequestRunner(
+            lambda _request, cancel_event: monitor.poll(cancel_event),
+            self,
+            name="database-change-watcher",
+        )
+        self._runner.result.connect(self._finish)
+        self._runner.failed.connect(self._handle_failure)
+        self._runner.settled.connect(self._finish)
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(poll_interval_ms)))
+        self._timer.timeout.connect(self.poll)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._runner.shutdown()
+        self._polling = False
+
+    def poll(self) -> bool:
+        """Submit a poll unless one is still running; return whether."""
+        if self._polling:
+            return False
+        self._polling = True
+        self._runner.submit(None)
+        return True
+
+    def _publish(self, changes: object) -> None:
+        # Called on whichever thread found the changes.
+        try:
+            self.changed.emit(changes)
+        except RuntimeError as exc:
+            self._logger.debug("Dropped database changes after shutdown: %s", exc)
+
+    def _finish(self, *_args: object) -> None:
+        self._polling = False
+
+    def _handle_failure(self, _generation: int, error: object) -> None:
+        self._polling = False
+        self._logger.warning("Database change poll failed: %s", error)
+
+
+def follow_database_changes(window: object, slot: Callable[[Any], None]) -> bool:
+    """Connect ``slot`` to ``window``'s change watcher; return whether it has one.
+
+    Pass a bound method of a ``QObject`` so the connection ends with it.
+    """
+    watcher = getattr(window, "database_changes", None)
+    if not isinstance(watcher, DatabaseChangeWatcher):
+        return False
+    watcher.changed.connect(slot)
+    return True
+
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL_MS",
+    "DatabaseChangeWatcher",
+    "follow_database_changes",
+]
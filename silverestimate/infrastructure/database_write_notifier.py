@@ -0,0 +1,71 @@
+"""Qt delivery of database-writer futures to the GUI thread."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal
+
+
+class DatabaseWriteNotifier(QObject):
+    """Re-emit completed writer futures as queued Qt signals.
+
+    Futures settle on the writer thread; the signals are queued to the
+    notifier's thread, so slots can update widgets directly.
+    """
+
+    completed = Signal(int, object)
+    failed = Signal(int, object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._tickets = itertools.count(1)
+
+    def watch(self, future: Future[Any]) -> int:
+        """Return a ticket that identifies ``future`` in the emitted signals."""
+        ticket = next(self._tickets)
+        future.add_done_callback(lambda done: self._settled(ticket, done))
+        return ticket
+
+    def _settled(self, ticket: int, future: Future[Any]) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(ticket, error)
+        else:
+            self.completed.emit(ticket, future.result())
+
+
+_watching: set[DatabaseWriteNotifier] = set()
+
+
+def when_written(
+    future: Future[Any],
+    callback: Callable[[Any], None],
+    parent: QObject | None = None,
+) -> None:
+    """Call ``callback`` on this thread with the value or error of ``future``.
+
+    The error is passed as the exception instance. A future that has already
+    settled calls back before this returns; deleting ``parent`` first drops
+    the callback.
+    """
+    notifier = DatabaseWriteNotifier(parent)
+    # Nothing else holds the notifier while its queued signal is in flight.
+    _watching.add(notifier)
+
+    def settle(result: Any) -> None:
+        _watching.discard(notifier)
+        notifier.deleteLater()
+        callback(result)
+
+    notifier.completed.connect(lambda _ticket, value: settle(value))
+    notifier.failed.connect(lambda _ticket, error: settle(error))
+    notifier.watch(future)
+
+
+__all__ = ["DatabaseWriteNotifier", "when_written"]
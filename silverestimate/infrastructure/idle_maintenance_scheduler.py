@@ -0,0 +1,114 @@
+"""Schedule database maintenance for periods without user input."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
+
+DEFAULT_IDLE_AFTER_S = 120.0
+DEFAULT_POLL_INTERVAL_MS = 15_000
+
+_ACTIVITY_EVENTS = frozenset(
+    {
+        QEvent.Type.KeyPress,
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseMove,
+        QEvent.Type.Wheel,
+        QEvent.Type.TouchBegin,
+    }
+)
+
+
+class IdleMaintenanceScheduler(QObject):
+    """Run ``run(cancel_event)`` on a worker once input has been quiet a while.
+
+    Install the scheduler as an application event filter so it sees user
+    input. A pass is submitted at most once per ``idle_after_s`` while the
+    user stays away, and any input cancels a pass that is still running.
+    """
+
+    def __init__(  # noqa: PLR0913 - injectable timing for tests
+        self,
+        run: Callable[[threading.Event], object],
+        parent: QObject | None = None,
+        *,
+        idle_after_s: float = DEFAULT_IDLE_AFTER_S,
+        poll_interval_ms: int = DEFAULT_POLL_INTERVAL_MS,
+        clock: Callable[[], float] = time.monotonic,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._idle_after_s = max(0.0, float(idle_after_s))
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._last_activity = clock()
+        self._last_run: float | None = None
+        self._running = False
+        self._runner: LatestRequestRunner[None, object] = LatestRequestRunner(
+            lambda _request, cancel_event: run(cancel_event),
+            self,
+            name="database-idle-maintenance",
+        )
+        self._runner.result.connect(self._finish)
+        self._runner.failed.connect(self._handle_failure)
+        self._runner.settled.connect(self._finish)
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(poll_interval_ms)))
+        self._timer.timeout.connect(self.poll)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._runner.shutdown()
+        self._running = False
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if event.type() in _ACTIVITY_EVENTS:
+            self.record_activity()
+        return False
+
+    def record_activity(self) -> None:
+        self._last_activity = self._clock()
+        if self._running:
+            self._runner.cancel()
+            self._running = False
+
+    def poll(self) -> bool:
+        """Submit a pass when the user has been idle long enough; return whether."""
+        if self._running:
+            return False
+        now = self._clock()
+        if now - self._last_activity < self._idle_after_s:
+            return False
+        if self._last_run is not None and now - self._last_run < self._idle_after_s:
+            return False
+        self._last_run = now
+        self._running = True
+        self._runner.submit(None)
+        return True
+
+    def _finish(self, *_args: object) -> None:
+        self._running = False
+
+    def _handle_failure(self, _generation: int, error: object) -> None:
+        self._running = False
+        self._logger.warning("Idle database maintenance failed: %s", error)
+
+
+__all__ = [
+    "DEFAULT_IDLE_AFTER_S",
+    "DEFAULT_POLL_INTERVAL_MS",
+    "IdleMaintenanceScheduler",
+]
@@ -4,57 +4,193 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any, Callable, Dict, Optional, cast
 
+from silverestimate.infrastructure.item_catalog import (
+    ITEM_FIELDS,
+    LIKE_WILDCARDS,
+    ItemCatalog,
+    ItemRecord,
+    fold,
+    match_rank,
+)
+from silverestimate.infrastructure.item_search import (
+    TYPO_RANK,
+    ItemSearch,
+    selection_rank,
+)
+
+# Marks a code whose row changed without the cache seeing the new value.
+_STALE = object()
+_USAGE_QUERY = "SELECT item_code, use_count, score FROM item_usage"
+
 
 class ItemCacheController:
-    """Coordinate background warming and simple invalidation for item lookups."""
+    """Hold the item catalog in memory for lookups and searches.
+
+    A full load (``replace_all`` or the background preload) installs an
+    immutable ``ItemCatalog``. Later single-row changes sit in a small overlay
+    keyed by folded code until the next full load replaces both. Searches are
+    answered in memory only while the catalog is complete and no overlay entry
+    is stale; otherwise the search methods return ``None`` and callers query
+    the database. Selection searches go through an ``ItemSearch`` bound to the
+    current catalog, so consecutive keystrokes narrow the previous matches.
+
+    Item-usage scores (folded code -> ``(use count, score)``) are a secondary
+    selection key: within a rank, used items lead by score. The preload reads
+    them with the catalog and saves apply their committed deltas.
+
+    Rows another connection changed are re-read with ``refresh`` and usage
+    with ``reload_usage``.
+    """
 
     def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         self._logger = logger or logging.getLogger(__name__)
-        self._cache: Dict[str, dict[str, Any]] = {}
+        self._catalog = ItemCatalog()
+        self._search = ItemSearch(self._catalog)
+        # Folded code -> (change sequence, record, ``None`` if deleted, or _STALE).
+        self._overlay: dict[str, tuple[int, object]] = {}
+        self._stale = 0
+        self._sequence = 0
+        self._loads = 0
         self._thread: Optional[threading.Thread] = None
         self._preloaded = False
+        self._usage: dict[str, tuple[int, float]] = {}
+        # Deltas recorded while a preload reads usage, replayed on its result.
+        self._usage_log: list[Mapping[str, tuple[int, float]]] | None = None
+        # (catalog, used rows of that catalog by descending score).
+        self._favourites: tuple[ItemCatalog, tuple[int, ...]] | None = None
         self._lock = threading.Lock()
 
     @property
     def cache(self) -> Dict[str, dict[str, Any]]:
+        catalog, overlay = self._view()
+        snapshot = {}
+        for index in range(len(catalog)):
+            if catalog.code_key(index) not in overlay:
+                row = catalog.row(index)
+                snapshot[str(row["code"] or "").upper()] = row
+        for record in overlay.values():
+            if isinstance(record, ItemRecord):
+                snapshot[str(record.code or "").upper()] = record.as_dict()
+        return snapshot
+
+    @property
+    def searchable(self) -> bool:
+        """Whether the cache holds every item and can answer searches."""
         with self._lock:
-            return dict(self._cache)
+            return self._preloaded and not self._stale
 
     def get(self, code: str):
         if not code:
             return None
+        key = fold(code)
         with self._lock:
-            return self._cache.get(code.upper())
+            change = self._overlay.get(key)
+            catalog = self._catalog
+        if change is not None:
+            record = change[1]
+            return record.as_dict() if isinstance(record, ItemRecord) else None
+        index = catalog.find(key)
+        return catalog.row(index) if index is not None else None
 
-    def store(self, code: str, value: object) -> None:
+    def knows_absent(self, code: str) -> bool:
+        """Whether ``code`` is certainly not an item, so no query is needed."""
         if not code:
+            return False
+        key = fold(code)
+        with self._lock:
+            if not self._preloaded or self._stale:
+                return False
+            change = self._overlay.get(key)
+            catalog = self._catalog
+        if change is not None:
+            return change[1] is None
+        return catalog.find(key) is None
+
+    def store(self, code: str, value: object) -> None:
+        if not code or value is None:
             return
-        to_store: dict[str, Any] | None
-        if value is None:
-            to_store = None
-        elif isinstance(value, dict):
-            to_store = value
-        else:
-            try:
-                to_store = dict(cast(Any, value))
-            except Exception:
-                return
-        if to_store is not None:
-            with self._lock:
-                self._cache[code.upper()] = to_store
+        try:
+            row = value if isinstance(value, dict) else dict(cast(Any, value))
+        except Exception:
+            return
+        record = ItemRecord.from_row({"code": code, **row})
+        self._change(code, record)
 
     def invalidate(self, code: str) -> None:
         if not code:
             return
+        self._change(code, _STALE)
+
+    def remove(self, code: str) -> None:
+        """Record that ``code`` was deleted."""
+        if not code:
+            return
+        self._change(code, None)
+
+    def refresh(
+        self, codes: Iterable[str], connection_factory: Callable[[], Any]
+    ) -> None:
+        """Re-read ``codes`` after another connection changed them.
+
+        The codes are stale until their rows arrive, so searches use SQL in
+        between, and a change recorded meanwhile wins over the rows read here.
+        If the rows cannot be read, the whole catalog is reloaded.
+        """
+        marks = {fold(code): self._change(code, _STALE) for code in codes if code}
+        if not marks:
+            return
+        conn = None
+        try:
+            conn = connection_factory()
+            records = self._read_records(conn.cursor(), list(marks))
+        except Exception as exc:
+            self._logger.debug("Item cache refresh failed: %s", exc)
+            self.start_preload(connection_factory)
+            return
+        finally:
+            if conn is not None:
+                conn.close()
+        with self._lock:
+            for key, sequence in marks.items():
+                change = self._overlay.get(key)
+                if change is None or change[0] != sequence:
+                    continue
+                self._overlay[key] = (sequence, records.get(key))
+                self._stale -= 1
+            self._favourites = None
+
+    def reload_usage(self, connection_factory: Callable[[], Any]) -> None:
+        """Re-read usage scores after another connection saved estimates."""
+        conn = None
+        try:
+            conn = connection_factory()
+            usage = self._query_usage(conn.cursor())
+        except Exception as exc:
+            self._logger.debug("Item usage reload failed: %s", exc)
+            return
+        finally:
+            if conn is not None:
+                conn.close()
+        self.replace_usage(usage)
+
+    def clear(self) -> None:
+        """Forget every item, e.g. after the tables were dropped."""
         with self._lock:
-            self._cache.pop(code.upper(), None)
+            self._catalog = ItemCatalog()
+            self._search = ItemSearch(self._catalog)
+            self._overlay = {}
+            self._stale = 0
+            self._loads += 1
+            self._preloaded = False
+            self._usage = {}
+            self._favourites = None
 
     def replace_all(self, rows: Iterable[object] | None) -> None:
         """Atomically replace the cache after a catalog transaction."""
-        replacement: dict[str, dict[str, Any]] = {}
+        records = []
         for raw_row in rows or ():
             try:
                 row = raw_row if isinstance(raw_row, dict) else dict(cast(Any, raw_row))
@@ -62,53 +198,158 @@ class ItemCacheController:
             except TypeError, ValueError:
                 continue
             if code:
-                replacement[code.upper()] = dict(row)
+                records.append(ItemRecord.from_row(row))
+        catalog = ItemCatalog(records)
+        search = ItemSearch(catalog)
         with self._lock:
-            self._cache = replacement
+            self._catalog = catalog
+            self._search = search
+            self._overlay = {}
+            self._stale = 0
+            self._loads += 1
             self._preloaded = True
 
+    def record_usage(self, deltas: Mapping[str, tuple[int, float]]) -> None:
+        """Apply committed ``code -> (count delta, score delta)`` usage changes."""
+        if not deltas:
+            return
+        with self._lock:
+            self._usage = _with_usage(self._usage, deltas)
+            self._favourites = None
+            if self._usage_log is not None:
+                self._usage_log.append(deltas)
+
+    def replace_usage(self, usage: Mapping[str, tuple[int, float]]) -> None:
+        """Replace every usage score, e.g. after a bulk estimate change."""
+        with self._lock:
+            self._usage = _with_usage({}, usage)
+            self._favourites = None
+
+    def search_rows(self, search_term: str) -> list[dict[str, Any]] | None:
+        """Return ``fetch_item_catalog_rows`` results, or ``None`` to use SQL."""
+        view = self._searchable_view(search_term)
+        if view is None:
+            return None
+        catalog, overlay, term = view
+        if not term:
+            return self._merge(catalog, range(len(catalog)), overlay, term, 0)
+        prefix = self._merge(catalog, catalog.prefix_matches(term), overlay, term, 1)
+        if prefix or len(term) < 2:
+            return prefix
+        return self._merge(catalog, catalog.contains_matches(term), overlay, term, 3)
+
+    def search_for_selection(
+        self, search_term: str, limit: int
+    ) -> tuple[list[dict[str, Any]], bool] | None:
+        """Return ranked selection matches, or ``None`` to use SQL.
+
+        Besides the SQL query's ranks, codes one typo away from the term
+        follow the substring matches.
+        """
+        view = self._searchable_view(search_term)
+        if view is None:
+            return None
+        catalog, overlay, term = view
+        with self._lock:
+            search = self._search
+            usage = self._usage
+        if search.catalog is not catalog:
+            # A full load landed in between; search the catalog already read.
+            search = ItemSearch(catalog)
+        fetch_size = limit + 1
+        # Overlaid codes are dropped from the catalog's matches, so ask for
+        # enough extra rows to still fill the page.
+        matches = search.ranked(
+            term, fetch_size + len(overlay), self._favourite_rows(catalog)
+        )
+        if overlay:
+            ranked = [
+                (rank, catalog.record(index))
+                for rank, index in matches
+                if catalog.code_key(index) not in overlay
+            ]
+            for record in overlay.values():
+                if not isinstance(record, ItemRecord):
+                    continue
+                rank = (
+                    selection_rank(term, record.code_key, record.name_key)
+                    if term
+                    else 0
+                )
+                if rank is not None:
+                    ranked.append((rank, record))
+
+            def selection_order(match: tuple[int, ItemRecord]):
+                rank, record = match
+                score = usage.get(record.code_key, (0, 0.0))[1]
+                # Typo rows are not reordered by usage, as in ``ItemSearch``.
+                return rank, -score if rank < TYPO_RANK else 0.0, record.sort_key
+
+            ranked.sort(key=selection_order)
+            rows = [record.as_dict() for _rank, record in ranked[:fetch_size]]
+        else:
+            rows = [catalog.row(index) for _rank, index in matches[:fetch_size]]
+        truncated = len(rows) > limit
+        return rows[:limit], truncated
+
+    def get_many(self, codes: Iterable[str]) -> dict[str, dict[str, Any]] | None:
+        """Return rows for ``codes`` keyed by upper-cased code, or ``None``."""
+        with self._lock:
+            if not self._preloaded or self._stale:
+                return None
+        rows: dict[str, dict[str, Any]] = {}
+        for code in codes:
+            row = self.get(code)
+            if row is not None:
+                rows[str(row.get("code") or "").strip().upper()] = row
+        return rows
+
     def start_preload(self, connection_factory: Optional[Callable[[], Any]]) -> None:
         """Warm the cache using a keyed broker connection in the background."""
         if not connection_factory:
             return
-        if self._preloaded:
+        if self.searchable:
             return
         if self._thread and self._thread.is_alive():
             return
+        with self._lock:
+            started_at = self._sequence
+            load = self._loads
 
         def _worker() -> None:
-            local_cache: dict[str, dict[str, Any]] = {}
             conn = None
             try:
                 conn = connection_factory()
                 cur = conn.cursor()
-                cur.execute(
-                    "SELECT code, name, tunch, purity, wage_type, wage_rate FROM items"
-                )
-                rows = cur.fetchall()
-                for row in rows:
-                    try:
-                        key = (row["code"] or "").upper()
-                        local_cache[key] = {
-                            "code": row["code"],
-                            "name": row["name"],
-                            "tunch": row["tunch"],
-                            "purity": row["purity"],
-                            "wage_type": row["wage_type"],
-                            "wage_rate": row["wage_rate"],
-                        }
-                    except Exception as exc:
-                        self._logger.debug("Skipping malformed item-cache row: %s", exc)
+                usage = self._read_usage(cur)
+                catalog = self._read_catalog(cur)
+                search = ItemSearch(catalog)
             except Exception as exc:
                 self._logger.debug("Item cache preload failed: %s", exc)
             else:
                 with self._lock:
-                    self._cache = local_cache
+                    if self._loads != load:
+                        self._logger.debug("Discarded superseded item cache preload")
+                        return
+                    self._usage = _replayed(usage, self._usage_log)
+                    self._favourites = None
+                    # Changes made while the query ran are newer than its rows.
+                    self._overlay = {
+                        key: change
+                        for key, change in self._overlay.items()
+                        if change[0] > started_at
+                    }
+                    self._stale = sum(
+                        change[1] is _STALE for change in self._overlay.values()
+                    )
+                    self._catalog = catalog
+                    self._search = search
+                    self._loads += 1
                     self._preloaded = True
-                self._logger.debug(
-                    "Preloaded item cache with %s items", len(local_cache)
-                )
+                self._logger.debug("Preloaded item cache with %s items", len(catalog))
             finally:
+                with self._lock:
+                    self._usage_log = None
                 if conn is not None:
                     try:
                         conn.close()
@@ -123,3 +364,145 @@ class ItemCacheController:
             thread.start()
         except Exception:
             self._thread = None
+
+    def _read_catalog(self, cursor: Any) -> ItemCatalog:
+        records: list[ItemRecord] = []
+        cursor.execute(f"SELECT {', '.join(ITEM_FIELDS)} FROM items")  # nosec B608
+        for row in cursor.fetchall():
+            try:
+                records.append(ItemRecord(*(row[field] for field in ITEM_FIELDS)))
+            except Exception as exc:
+                self._logger.debug("Skipping malformed item-cache row: %s", exc)
+        return ItemCatalog(records)
+
+    def _read_records(self, cursor: Any, codes: list[str]) -> dict[str, ItemRecord]:
+        """Return the stored rows for folded ``codes`` by folded code."""
+        placeholders = ", ".join("?" for _ in codes)
+        cursor.execute(
+            f"SELECT {', '.join(ITEM_FIELDS)} FROM items "  # nosec B608
+            f"WHERE UPPER(code) IN ({placeholders})",
+            codes,
+        )
+        records = {}
+        for row in cursor.fetchall():
+            record = ItemRecord(*(row[field] for field in ITEM_FIELDS))
+            records[record.code_key] = record
+        return records
+
+    def _read_usage(self, cursor: Any) -> dict[str, tuple[int, float]]:
+        """Read usage for a preload and log later deltas until it installs."""
+        with self._lock:
+            self._usage_log = []
+        return self._query_usage(cursor)
+
+    def _query_usage(self, cursor: Any) -> dict[str, tuple[int, float]]:
+        try:
+            cursor.execute(_USAGE_QUERY)
+            rows = cursor.fetchall()
+        except Exception as exc:
+            # Databases without usage statistics rank by code alone.
+            self._logger.debug("Item usage was not loaded: %s", exc)
+            return {}
+        return _with_usage({}, {row[0]: (row[1], row[2]) for row in rows})
+
+    def _favourite_rows(self, catalog: ItemCatalog) -> tuple[int, ...]:
+        """Return ``catalog`` rows with usage, most likely first."""
+        with self._lock:
+            favourites, usage = self._favourites, self._usage
+        if favourites is not None and favourites[0] is catalog:
+            return favourites[1]
+        scored = []
+        for key, (_count, score) in usage.items():
+            index = catalog.find(key)
+            if index is not None:
+                scored.append((-score, index))
+        scored.sort()
+        rows = tuple(index for _score, index in scored)
+        with self._lock:
+            if self._usage is usage:
+                self._favourites = (catalog, rows)
+        return rows
+
+    def _change(self, code: str, record: object) -> int:
+        """Record ``record`` for ``code`` and return the change's sequence."""
+        key = fold(code)
+        with self._lock:
+            self._sequence += 1
+            previous = self._overlay.get(key)
+            if previous is not None and previous[1] is _STALE:
+                self._stale -= 1
+            if record is _STALE:
+                self._stale += 1
+            self._overlay[key] = (self._sequence, record)
+            return self._sequence
+
+    def _view(self) -> tuple[ItemCatalog, dict[str, object]]:
+        with self._lock:
+            overlay = {key: change[1] for key, change in self._overlay.items()}
+            return self._catalog, overlay
+
+    def _searchable_view(
+        self, search_term: str
+    ) -> tuple[ItemCatalog, dict[str, object], str] | None:
+        term = fold((search_term or "").strip())
+        if LIKE_WILDCARDS.intersection(term):
+            return None
+        with self._lock:
+            if not self._preloaded or self._stale:
+                return None
+            overlay = {key: change[1] for key, change in self._overlay.items()}
+            return self._catalog, overlay, term
+
+    @staticmethod
+    def _merge(  # noqa: PLR0913 - catalog matches plus the overlay filter
+        catalog: ItemCatalog,
+        indexes: Iterable[int],
+        overlay: dict[str, object],
+        term: str,
+        max_rank: int,
+    ) -> list[dict[str, Any]]:
+        """Combine catalog matches with overlay rows matching ``term``, in code order."""
+        if not overlay:
+            return [catalog.row(index) for index in indexes]
+        records = [
+            catalog.record(index)
+            for index in indexes
+            if catalog.code_key(index) not in overlay
+        ]
+        for record in overlay.values():
+            if not isinstance(record, ItemRecord):
+                continue
+            rank = match_rank(term, record.code_key, record.name_key) if term else 0
+            if rank is not None and rank <= max_rank:
+                records.append(record)
+        records.sort(key=lambda record: record.sort_key)
+        return [record.as_dict() for record in records]
+
+
+def _with_usage(
+    usage: Mapping[str, tuple[int, float]],
+    deltas: Mapping[str, tuple[int, float]],
+) -> dict[str, tuple[int, float]]:
+    """Return ``usage`` plus ``deltas``, keyed by folded code."""
+    merged = dict(usage)
+    for code, (count, score) in deltas.items():
+        key = fold(str(code or "").strip())
+        if not key:
+            continue
+        previous_count, previous_score = merged.get(key, (0, 0.0))
+        total = previous_count + int(count or 0)
+        if total > 0:
+            merged[key] = (total, previous_score + float(score or 0.0))
+        else:
+            merged.pop(key, None)
+    return merged
+
+
+def _replayed(
+    usage: dict[str, tuple[int, float]],
+    usage_log: list[Mapping[str, tuple[int, float]]] | None,
+) -> dict[str, tuple[int, float]]:
+    """Return preloaded ``usage`` plus the deltas saved after it was read."""
+    for deltas in usage_log or ():
+        usage = _with_usage(usage, deltas)
+    return usage
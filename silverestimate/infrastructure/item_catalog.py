@@ -0,0 +1,462 @@
+"""Compact, read-only snapshot of the item catalog with search indexes.
+
+Rows are stored column by column in ``code COLLATE NOCASE`` order. Low
+cardinality text (wage types, tunch notes) is interned, a code that is already
+upper case doubles as its own search key, and the two numeric columns live in
+``array('d')``. Code and name prefix searches bisect the rows and a
+name-ordered index of them. Contains searches for terms of three or more
+characters only test the rows sharing the term's rarest trigram. Shorter
+terms run ``str.find`` over each key column joined into one text, so rows
+that do not match cost no Python work. Code and name matches come out
+separately in code order, ready for an early stop at the first page. Matching folds ASCII case only, like SQLite's
+``NOCASE`` collation and ``LIKE``, so results agree with the SQL search
+queries.
+
+Codes one typo away from a term are found per position ``j`` of the term. A
+missing character or two swapped ones give a single code to look up. A
+different character or an extra one give a code of known length that starts
+with ``term[:j]`` and ends with the rest of the term. Per-length orderings of
+the rows by code and by reversed code find both ranges, and only the smaller
+one is scanned.
+"""
+
+from __future__ import annotations
+
+import string
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+ITEM_FIELDS = ("code", "name", "tunch", "purity", "wage_type", "wage_rate")
+NGRAM_SIZE = 3
+# LIKE treats these as wildcards; terms that contain them stay on SQL.
+LIKE_WILDCARDS = frozenset("%_")
+
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_PREFIX_END = "\U0010ffff"
+_SEPARATOR = "\n"
+_NUMERIC_FIELDS = ("purity", "wage_rate")
+
+
+def fold(text: object) -> str:
+    """Fold ``text`` for matching the way ``LIKE`` does: ASCII letters only."""
+    return str(text or "").translate(_ASCII_UPPER)
+
+
+def _nocase(text: str) -> str:
+    # NOCASE orders by the lower-case form, which puts "_" before letters.
+    return text.translate(_ASCII_LOWER)
+
+
+def match_rank(key: str, code_key: str, name_key: str) -> int | None:
+    """Rank a row for ``key`` as the selection query does, or ``None``.
+
+    0 is a code prefix, 1 a name prefix, 2 a code substring, 3 a name
+    substring.
+    """
+    if code_key.startswith(key):
+        return 0
+    if name_key.startswith(key):
+        return 1
+    if key in code_key:
+        return 2
+    if key in name_key:
+        return 3
+    return None
+
+
+def within_one_edit(key: str, other: str) -> bool:
+    """Whether ``other`` is ``key`` or one typo away from it.
+
+    A typo is one inserted, deleted, or replaced character, or two adjacent
+    characters swapped.
+    """
+    if key == other:
+        return True
+    length, other_length = len(key), len(other)
+    if abs(length - other_length) > 1:
+        return False
+    start = 0
+    shortest = min(length, other_length)
+    while start < shortest and key[start] == other[start]:
+        start += 1
+    if length > other_length:
+        return key[start + 1 :] == other[start:]
+    if length < other_length:
+        return key[start:] == other[start + 1 :]
+    tail = start + 2
+    return key[start + 1 :] == other[start + 1 :] or (
+        key[start] == other[start + 1]
+        and key[start + 1] == other[start]
+        and key[tail:] == other[tail:]
+    )
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _shared(key: str, text: Any) -> str:
+    """Return ``text`` itself when it already equals its folded ``key``."""
+    return text if key == text else key
+
+
+class ItemRecord:
+    """One catalog row held outside a snapshot, such as a pending edit."""
+
+    __slots__ = ITEM_FIELDS
+
+    def __init__(  # noqa: PLR0913 - one argument per items column
+        self,
+        code: Any,
+        name: Any,
+        tunch: Any,
+        purity: Any,
+        wage_type: Any,
+        wage_rate: Any,
+    ) -> None:
+        self.code = code
+        self.name = name
+        self.tunch = _intern(tunch)
+        self.purity = purity
+        self.wage_type = _intern(wage_type)
+        self.wage_rate = wage_rate
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> ItemRecord:
+        return cls(*(row.get(field) for field in ITEM_FIELDS))
+
+    @property
+    def code_key(self) -> str:
+        return fold(self.code)
+
+    @property
+    def name_key(self) -> str:
+        return fold(self.name)
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        code = str(self.code or "")
+        return _nocase(code), code
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in ITEM_FIELDS}
+
+
+class ItemCatalog:
+    """Immutable columnar item catalog; indexes are positions in code order."""
+
+    __slots__ = (
+        "_by_length",
+        "_code_keys",
+        "_code_starts",
+        "_code_text",
+        "_codes",
+        "_irregular",
+        "_name_keys",
+        "_name_order",
+        "_name_starts",
+        "_name_text",
+        "_names",
+        "_ngrams",
+        "_purity",
+        "_tunches",
+        "_wage_rate",
+        "_wage_types",
+    )
+
+    def __init__(self, records: Iterable[ItemRecord] = ()) -> None:
+        ordered = sorted(records, key=lambda record: record.sort_key)
+        self._codes = [record.code for record in ordered]
+        self._names = [record.name for record in ordered]
+        self._tunches = [record.tunch for record in ordered]
+        self._wage_types = [record.wage_type for record in ordered]
+        self._code_keys = [_shared(record.code_key, record.code) for record in ordered]
+        self._name_keys = [_shared(record.name_key, record.name) for record in ordered]
+        self._purity = array("d")
+        self._wage_rate = array("d")
+        # Numeric cells that are not floats (NULL, integers from callers) keep
+        # their exact value here so rows round-trip unchanged.
+        self._irregular: dict[tuple[int, str], Any] = {}
+        for index, record in enumerate(ordered):
+            for field, column in (
+                ("purity", self._purity),
+                ("wage_rate", self._wage_rate),
+            ):
+                value = getattr(record, field)
+                if type(value) is float:
+                    column.append(value)
+                else:
+                    column.append(0.0)
+                    self._irregular[(index, field)] = value
+        self._name_order = array(
+            "I", sorted(range(len(ordered)), key=self._name_keys.__getitem__)
+        )
+        self._ngrams = self._build_ngrams()
+        self._code_text, self._code_starts = _joined(self._code_keys)
+        self._name_text, self._name_starts = _joined(self._name_keys)
+        self._by_length = self._build_length_orders()
+
+    def _build_ngrams(self) -> dict[str, array]:
+        postings: dict[str, array] = {}
+        for index, (code_key, name_key) in enumerate(
+            zip(self._code_keys, self._name_keys, strict=True)
+        ):
+            grams = {
+                text[start : start + NGRAM_SIZE]
+                for text in (code_key, name_key)
+                for start in range(len(text) - NGRAM_SIZE + 1)
+            }
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(index)
+        return postings
+
+    def _build_length_orders(self) -> dict[int, tuple[array, array]]:
+        """Group rows by code length, ordered by code and by reversed code."""
+        code_keys = self._code_keys
+        groups: dict[int, list[int]] = {}
+        for index, code_key in enumerate(code_keys):
+            groups.setdefault(len(code_key), []).append(index)
+        orders = {}
+        for length, indexes in groups.items():
+            forward = sorted(indexes, key=code_keys.__getitem__)
+            backward = sorted(indexes, key=lambda index: code_keys[index][::-1])
+            orders[length] = (array("I", forward), array("I", backward))
+        return orders
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def find(self, code: object) -> int | None:
+        """Return the index of ``code`` (ASCII case-insensitive), if present."""
+        key = fold(code)
+        index = bisect_left(self._code_keys, _nocase(key), key=_nocase)
+        if index < len(self._code_keys) and self._code_keys[index] == key:
+            return index
+        return None
+
+    def code_key(self, index: int) -> str:
+        return self._code_keys[index]
+
+    def record(self, index: int) -> ItemRecord:
+        return ItemRecord(**self.row(index))
+
+    def row(self, index: int) -> dict[str, Any]:
+        row = {
+            "code": self._codes[index],
+            "name": self._names[index],
+            "tunch": self._tunches[index],
+            "purity": self._purity[index],
+            "wage_type": self._wage_types[index],
+            "wage_rate": self._wage_rate[index],
+        }
+        if self._irregular:
+            for field in _NUMERIC_FIELDS:
+                if (index, field) in self._irregular:
+                    row[field] = self._irregular[(index, field)]
+        return row
+
+    def rank(self, key: str, index: int) -> int | None:
+        return match_rank(key, self._code_keys[index], self._name_keys[index])
+
+    def prefix_matches(self, key: str) -> list[int]:
+        """Return rows whose code or name starts with ``key``, in code order."""
+        start, end = self._code_prefix(key)
+        matches = set(range(start, end))
+        name_start, name_end = self._name_prefix(key)
+        matches.update(self._name_order[name_start:name_end])
+        return sorted(matches)
+
+    def contains_matches(self, key: str) -> list[int]:
+        """Return rows whose code or name contains ``key``, in code order."""
+        matches = set(self._code_rows_containing(key))
+        matches.update(self._name_rows_containing(key))
+        return sorted(matches)
+
+    def ranked_matches(self, key: str, limit: int) -> list[tuple[int, int]]:
+        """Return up to ``limit`` ``(rank, index)`` pairs in selection order."""
+        if not key:
+            return [(0, index) for index in range(min(limit, len(self)))]
+        start, end = self._code_prefix(key)
+        ranked = [(0, index) for index in range(start, min(end, start + limit))]
+        if len(ranked) >= limit:
+            return ranked
+        name_start, name_end = self._name_prefix(key)
+        for index in sorted(self._name_order[name_start:name_end]):
+            if not start <= index < end:
+                ranked.append((1, index))
+                if len(ranked) >= limit:
+                    return ranked
+        code_keys, name_keys = self._code_keys, self._name_keys
+        for index in self._code_rows_containing(key):
+            if not start <= index < end and not name_keys[index].startswith(key):
+                ranked.append((2, index))
+                if len(ranked) >= limit:
+                    return ranked
+        for index in self._name_rows_containing(key):
+            if key not in code_keys[index] and not name_keys[index].startswith(key):
+                ranked.append((3, index))
+                if len(ranked) >= limit:
+                    return ranked
+        return ranked
+
+    def ranked_within(self, key: str, indexes: Iterable[int]) -> list[list[int]]:
+        """Split the ``indexes`` matching ``key`` into one list per rank.
+
+        Each list keeps the order of ``indexes``.
+        """
+        code_keys, name_keys = self._code_keys, self._name_keys
+        buckets: list[list[int]] = [[], [], [], []]
+        for index in indexes:
+            rank = match_rank(key, code_keys[index], name_keys[index])
+            if rank is not None:
+                buckets[rank].append(index)
+        return buckets
+
+    def typo_matches(self, key: str) -> list[int]:
+        """Return rows whose code is one typo from ``key``, in code order."""
+        found: set[int] = set()
+        for position in range(len(key) + 1):
+            head, rest = key[:position], key[position:]
+            # An extra character before ``rest``.
+            found.update(self._codes_between(len(key) + 1, head, rest))
+            if not rest:
+                continue
+            # A different character, a missing one, or two swapped ones.
+            found.update(self._codes_between(len(key), head, rest[1:]))
+            for variant in (head + rest[1:], head + rest[1::-1] + rest[2:]):
+                index = self.find(variant)
+                if index is not None:
+                    found.add(index)
+        exact = self.find(key)
+        if exact is not None:
+            found.discard(exact)
+        return sorted(found)
+
+    def _codes_between(self, length: int, head: str, tail: str) -> Iterable[int]:
+        """Return rows with a ``length``-character code around ``head``/``tail``."""
+        orders = self._by_length.get(length)
+        if orders is None:
+            return ()
+        forward, backward = orders
+        code_keys = self._code_keys
+        start, end = _prefix_range(forward, code_keys, head)
+        tail_start, tail_end = _suffix_range(backward, code_keys, tail)
+        if end - start <= tail_end - tail_start:
+            return (
+                index for index in forward[start:end] if code_keys[index].endswith(tail)
+            )
+        return (
+            index
+            for index in backward[tail_start:tail_end]
+            if code_keys[index].startswith(head)
+        )
+
+    def _code_prefix(self, key: str) -> tuple[int, int]:
+        lowered = _nocase(key)
+        return (
+            bisect_left(self._code_keys, lowered, key=_nocase),
+            bisect_left(self._code_keys, lowered + _PREFIX_END, key=_nocase),
+        )
+
+    def _name_prefix(self, key: str) -> tuple[int, int]:
+        name_key = self._name_keys.__getitem__
+        return (
+            bisect_left(self._name_order, key, key=name_key),
+            bisect_left(self._name_order, key + _PREFIX_END, key=name_key),
+        )
+
+    def _code_rows_containing(self, key: str) -> Iterator[int]:
+        return self._rows_containing(
+            key, self._code_keys, self._code_text, self._code_starts
+        )
+
+    def _name_rows_containing(self, key: str) -> Iterator[int]:
+        return self._rows_containing(
+            key, self._name_keys, self._name_text, self._name_starts
+        )
+
+    def _rows_containing(
+        self, key: str, keys: list[str], text: str, starts: array
+    ) -> Iterator[int]:
+        """Yield the rows whose ``keys`` entry contains ``key``, in code order."""
+        if len(key) < NGRAM_SIZE:
+            return _found_rows(key, keys, text, starts)
+        # Only rows holding every trigram of the term can contain it.
+        postings = []
+        for start in range(len(key) - NGRAM_SIZE + 1):
+            posting = self._ngrams.get(key[start : start + NGRAM_SIZE])
+            if posting is None:
+                return iter(())
+            postings.append(posting)
+        return (index for index in min(postings, key=len) if key in keys[index])
+
+
+def _joined(keys: list[str]) -> tuple[str, array]:
+    """Join ``keys`` into one searchable text and record where each starts."""
+    starts = array("I")
+    offset = 0
+    for key in keys:
+        starts.append(offset)
+        offset += len(key) + 1
+    return _SEPARATOR.join(keys), starts
+
+
+def _found_rows(key: str, keys: list[str], text: str, starts: array) -> Iterator[int]:
+    """Yield the rows whose ``keys`` entry contains ``key``, in code order.
+
+    ``text`` is ``keys`` joined by ``_SEPARATOR``. The row after a match is
+    tested directly, which is cheapest while matches are dense; after a miss,
+    one C-level ``find`` skips every row up to the next match.
+    """
+    if _SEPARATOR in key:
+        # The match could span two rows; test each row instead.
+        yield from (index for index, value in enumerate(keys) if key in value)
+        return
+    rows = len(keys)
+    index = 0
+    while index < rows:
+        if key not in keys[index]:
+            position = text.find(key, starts[index])
+            if position < 0:
+                return
+            index = bisect_right(starts, position) - 1
+        yield index
+        index += 1
+
+
+def _prefix_range(order: array, keys: list[str], prefix: str) -> tuple[int, int]:
+    key = keys.__getitem__
+    return (
+        bisect_left(order, prefix, key=key),
+        bisect_left(order, prefix + _PREFIX_END, key=key),
+    )
+
+
+def _suffix_range(order: array, keys: list[str], suffix: str) -> tuple[int, int]:
+    reversed_suffix = suffix[::-1]
+
+    def reversed_key(index: int) -> str:
+        return keys[index][::-1]
+
+    return (
+        bisect_left(order, reversed_suffix, key=reversed_key),
+        bisect_left(order, reversed_suffix + _PREFIX_END, key=reversed_key),
+    )
+
+
+__all__ = [
+    "ITEM_FIELDS",
+    "LIKE_WILDCARDS",
+    "ItemCatalog",
+    "ItemRecord",
+    "fold",
+    "match_rank",
+    "within_one_edit",
+]
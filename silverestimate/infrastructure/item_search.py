@@ -0,0 +1,163 @@
+"""Incremental, typo-tolerant selection search over an ``ItemCatalog``.
+
+The item-selection dialog searches again on every keystroke, and a longer term
+can only match rows the shorter one matched: a code or name that starts with
+or contains ``"AD1"`` also starts with or contains ``"AD"``. ``ItemSearch``
+therefore remembers the complete match set of the last term, split by rank,
+and answers a term that extends it by re-ranking only those rows. A row's
+rank can only get worse as the term grows, so the lists stay small.
+
+Ranks follow the SQL selection query (code prefix, name prefix, code
+substring, name substring). When those do not fill the page and the term is
+long enough, codes one typo away from the whole term follow as
+``TYPO_RANK``. Callers may pass favourite rows, most likely first; matching
+favourites lead their rank and the rest follow in code order.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from operator import itemgetter
+
+from silverestimate.infrastructure.item_catalog import (
+    ItemCatalog,
+    match_rank,
+    within_one_edit,
+)
+
+TYPO_RANK = 4
+# Shorter terms are one edit away from too many unrelated codes.
+MIN_TYPO_LENGTH = 3
+# Larger match sets are not kept for narrowing; re-ranking them row by row
+# costs more than the catalog's own scan.
+MAX_NARROWED_ROWS = 2000
+
+
+def selection_rank(key: str, code_key: str, name_key: str) -> int | None:
+    """Rank one row for ``key`` like ``ItemSearch`` does, or ``None``."""
+    rank = match_rank(key, code_key, name_key)
+    if rank is None and len(key) >= MIN_TYPO_LENGTH and within_one_edit(key, code_key):
+        return TYPO_RANK
+    return rank
+
+
+class ItemSearch:
+    """Ranked selection search over one catalog snapshot."""
+
+    def __init__(self, catalog: ItemCatalog) -> None:
+        self._catalog = catalog
+        self._lock = threading.Lock()
+        # The last term whose complete match set is known, and that set.
+        self._key: str | None = None
+        self._buckets: list[list[int]] = []
+        # The favourites, term, and matching favourites of the last search.
+        self._preferred: tuple[Sequence[int], str, list[tuple[int, int]]] | None = None
+
+    @property
+    def catalog(self) -> ItemCatalog:
+        return self._catalog
+
+    def ranked(
+        self, key: str, limit: int, favourites: Sequence[int] = ()
+    ) -> list[tuple[int, int]]:
+        """Return up to ``limit`` ``(rank, index)`` pairs in selection order.
+
+        ``key`` is a folded search term; ``favourites`` are catalog rows from
+        most to least likely.
+        """
+        if not favourites:
+            return self._ranked(key, limit)
+        preferred = self._preferred_matches(key, favourites)
+        # Favourites are dropped from the plain matches, so ask for enough
+        # extra rows to still fill the page.
+        matches = self._ranked(key, limit + len(preferred))
+        chosen = {index for _rank, index in preferred}
+        merged = preferred + [match for match in matches if match[1] not in chosen]
+        # Stable, so favourites stay ahead of the code-ordered rows per rank.
+        merged.sort(key=itemgetter(0))
+        return merged[:limit]
+
+    def _ranked(self, key: str, limit: int) -> list[tuple[int, int]]:
+        catalog = self._catalog
+        if not key:
+            return catalog.ranked_matches(key, limit)
+        buckets = self._narrow(key)
+        if buckets is None:
+            matches = catalog.ranked_matches(key, limit)
+            if len(matches) >= limit:
+                self._remember(None, [])
+                return matches
+            # Fewer rows than asked for is every match.
+            buckets = [[], [], [], []]
+            for rank, index in matches:
+                buckets[rank].append(index)
+            kept = key if len(matches) <= MAX_NARROWED_ROWS else None
+            self._remember(kept, buckets)
+        ranked = [
+            (rank, index)
+            for rank, bucket in enumerate(buckets)
+            for index in bucket[:limit]
+        ][:limit]
+        needed = limit - len(ranked)
+        if needed > 0 and len(key) >= MIN_TYPO_LENGTH:
+            # Every exact match is already listed, so anything the catalog
+            # ranks is not a typo.
+            typos = [
+                index
+                for index in catalog.typo_matches(key)
+                if catalog.rank(key, index) is None
+            ]
+            ranked.extend((TYPO_RANK, index) for index in typos[:needed])
+        return ranked
+
+    def _preferred_matches(
+        self, key: str, favourites: Sequence[int]
+    ) -> list[tuple[int, int]]:
+        """Rank the favourites matching ``key``, keeping their order."""
+        with self._lock:
+            previous = self._preferred
+        candidates: Iterable[int] = favourites
+        if (
+            previous is not None
+            and previous[0] is favourites
+            and key.startswith(previous[1])
+        ):
+            candidates = [index for _rank, index in previous[2]]
+        rank = self._catalog.rank
+        preferred = []
+        for index in candidates:
+            match = rank(key, index)
+            if match is not None:
+                preferred.append((match, index))
+        with self._lock:
+            self._preferred = (favourites, key, preferred)
+        return preferred
+
+    def _narrow(self, key: str) -> list[list[int]] | None:
+        """Re-rank the remembered matches when ``key`` extends their term."""
+        with self._lock:
+            previous_key, previous = self._key, self._buckets
+        if previous_key is None or not key.startswith(previous_key):
+            return None
+        buckets = self._catalog.ranked_within(key, chain.from_iterable(previous))
+        # Rows from a better old rank land after the others; restore code
+        # order (each list is a few presorted runs).
+        for bucket in buckets:
+            bucket.sort()
+        self._remember(key, buckets)
+        return buckets
+
+    def _remember(self, key: str | None, buckets: list[list[int]]) -> None:
+        with self._lock:
+            self._key, self._buckets = key, buckets
+
+
+__all__ = [
+    "MAX_NARROWED_ROWS",
+    "MIN_TYPO_LENGTH",
+    "TYPO_RANK",
+    "ItemSearch",
+    "selection_rank",
+]
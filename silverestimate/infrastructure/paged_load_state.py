@@ -13,11 +13,19 @@ CursorT = TypeVar("CursorT")
 
 @dataclass
 class PagedLoadState(Generic[RowT, CursorT]):
-    """Accumulate pages while leaving query and presentation policy to callers."""
+    """Accumulate pages while leaving query and presentation policy to callers.
+
+    ``total`` is ``None`` while an uncounted first page is on screen. Loaders
+    then count the query separately and hand the result to ``apply_total``
+    with the ``generation`` they read when asking, so a count for an earlier
+    query never lands on a newer one.
+    """
 
     rows: list[RowT] = field(default_factory=list)
     cursor: CursorT | None = None
-    total: int = 0
+    total: int | None = 0
+    totals: object | None = None
+    generation: int = 0
 
     @property
     def loaded(self) -> int:
@@ -27,10 +35,16 @@ class PagedLoadState(Generic[RowT, CursorT]):
     def has_more(self) -> bool:
         return self.cursor is not None
 
+    @property
+    def total_pending(self) -> bool:
+        return self.total is None
+
     def reset(self) -> None:
         self.rows.clear()
         self.cursor = None
         self.total = 0
+        self.totals = None
+        self.generation += 1
 
     def apply(
         self,
@@ -44,8 +58,31 @@ class PagedLoadState(Generic[RowT, CursorT]):
         else:
             self.rows = page_rows
         self.cursor = page.next_cursor
-        self.total = max(0, int(page.total))
+        if page.total is not None:
+            self.total = max(0, int(page.total))
+        elif not page.has_more:
+            # The last page makes the loaded rows the whole result.
+            self.total = len(self.rows)
+        elif not append:
+            self.total = None
+        if page.totals is not None or not append:
+            self.totals = page.totals
         return self.rows
 
+    def apply_total(
+        self,
+        total: int,
+        totals: object | None = None,
+        *,
+        generation: int,
+    ) -> bool:
+        """Record a separately fetched count; ``False`` when it is stale."""
+        if generation != self.generation:
+            return False
+        self.total = max(0, int(total))
+        if totals is not None:
+            self.totals = totals
+        return True
+
 
 __all__ = ["PagedLoadState"]
@@ -0,0 +1,48 @@
+"""Helpers for the futures that database writes hand back to their callers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def settled_future(apply: Callable[[], T]) -> Future[T]:
+    """Run ``apply`` now and return its result, or its error, as a done future."""
+    future: Future[T] = Future()
+    try:
+        future.set_result(apply())
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def map_future(future: Future[T], transform: Callable[[T], R]) -> Future[R]:
+    """Return a future settled with ``transform`` applied to ``future``'s result.
+
+    ``transform`` runs on whichever thread settles ``future``. Errors from
+    either step, and cancellation, pass through to the returned future.
+    """
+    mapped: Future[R] = Future()
+
+    def settle(done: Future[T]) -> None:
+        if done.cancelled():
+            mapped.cancel()
+            return
+        error = done.exception()
+        if error is not None:
+            mapped.set_exception(error)
+            return
+        try:
+            mapped.set_result(transform(done.result()))
+        except Exception as exc:
+            mapped.set_exception(exc)
+
+    future.add_done_callback(settle)
+    return mapped
+
+
+__all__ = ["map_future", "settled_future"]
@@ -0,0 +1,290 @@
+"""Trigger-fed row change journal and differential export/apply helpers.
+
+Every insert, update, and delete on a journaled table appends
+``(generation, table_name, row_key, op)`` to ``change_journal``. The
+generation is the journal's AUTOINCREMENT id, so it only grows and survives
+pruning through ``sqlite_sequence``. A differential copies the current rows
+for every key touched after a base generation, lists keys that no longer
+exist, and carries the journal slice so a replica keeps the same generations.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+CHANGE_JOURNAL = "change_journal"
+CHANGE_JOURNAL_HORIZON = "change_journal_horizon"
+
+# Journaled table -> key column, parents before children.
+JOURNALED_TABLES = {
+    "items": "code",
+    "estimates": "voucher_no",
+    "silver_bar_lists": "list_id",
+    "silver_bars": "bar_id",
+    "estimate_items": "id",
+    "bar_transfers": "id",
+}
+
+# Tables inside a differential database besides the journaled row copies.
+DIFF_DELETED_ROWS = "deleted_rows"
+DIFF_JOURNAL = "journal"
+DIFF_RANGE = "differential"
+
+
+class ChangeJournalError(RuntimeError):
+    """Raised when a differential cannot be produced or applied."""
+
+
+@dataclass(frozen=True)
+class DifferentialStats:
+    """Generation range and row counts carried by one differential."""
+
+    base_generation: int
+    generation: int
+    upserted_rows: int
+    deleted_rows: int
+
+
+def _journal_insert(table: str, key_expression: str, op: str) -> str:
+    return (
+        f"INSERT INTO {CHANGE_JOURNAL}(table_name, row_key, op) "
+        f"VALUES ('{table}', {key_expression}, '{op}'); "
+    )
+
+
+def journal_statements() -> dict[str, str]:
+    """Return the journal tables and one trigger per table and operation."""
+    statements = {
+        CHANGE_JOURNAL: (
+            f"CREATE TABLE IF NOT EXISTS {CHANGE_JOURNAL} ("
+            "generation INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "table_name TEXT NOT NULL, "
+            "row_key NOT NULL, "
+            "op TEXT NOT NULL CHECK (op IN ('I', 'U', 'D')))"
+        ),
+        f"idx_{CHANGE_JOURNAL}_row": (
+            f"CREATE INDEX IF NOT EXISTS idx_{CHANGE_JOURNAL}_row "
+            f"ON {CHANGE_JOURNAL}(table_name, generation, row_key)"
+        ),
+        CHANGE_JOURNAL_HORIZON: (
+            f"CREATE TABLE IF NOT EXISTS {CHANGE_JOURNAL_HORIZON} ("
+            "id INTEGER PRIMARY KEY CHECK (id = 1), "
+            "pruned_through INTEGER NOT NULL)"
+        ),
+    }
+    for table, key in JOURNALED_TABLES.items():
+        prefix = f"trg_{CHANGE_JOURNAL}_{table}"
+        # A changed key is journaled as a delete of the old key.
+        rekey = (
+            f"INSERT INTO {CHANGE_JOURNAL}(table_name, row_key, op) "
+            f"SELECT '{table}', old.{key}, 'D' WHERE old.{key} IS NOT new.{key}; "
+        )
+        statements[f"{prefix}_insert"] = (
+            f"CREATE TRIGGER IF NOT EXISTS {prefix}_insert AFTER INSERT ON {table} "
+            f"BEGIN {_journal_insert(table, f'new.{key}', 'I')}END"
+        )
+        statements[f"{prefix}_update"] = (
+            f"CREATE TRIGGER IF NOT EXISTS {prefix}_update AFTER UPDATE ON {table} "
+            f"BEGIN {rekey}{_journal_insert(table, f'new.{key}', 'U')}END"
+        )
+        statements[f"{prefix}_delete"] = (
+            f"CREATE TRIGGER IF NOT EXISTS {prefix}_delete AFTER DELETE ON {table} "
+            f"BEGIN {_journal_insert(table, f'old.{key}', 'D')}END"
+        )
+    return statements
+
+
+def current_generation(cursor: Any, schema: str = "main") -> int:
+    """Return the newest generation ever issued, including pruned ones."""
+    cursor.execute(
+        f"SELECT seq FROM {schema}.sqlite_sequence WHERE name = ?",  # nosec B608
+        (CHANGE_JOURNAL,),
+    )
+    row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def journal_horizon(cursor: Any) -> int:
+    """Return the generation through which journal rows may be missing."""
+    cursor.execute(
+        f"SELECT pruned_through FROM {CHANGE_JOURNAL_HORIZON} WHERE id = 1"  # nosec B608
+    )
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+def advance_horizon(cursor: Any, generation: int) -> None:
+    """Refuse differentials based before ``generation`` from now on."""
+    cursor.execute(
+        f"INSERT INTO {CHANGE_JOURNAL_HORIZON}(id, pruned_through) "  # nosec B608
+        "VALUES (1, ?) ON CONFLICT(id) DO UPDATE SET "
+        "pruned_through = MAX(pruned_through, excluded.pruned_through)",
+        (int(generation),),
+    )
+
+
+def prune_journal(cursor: Any, through_generation: int) -> int:
+    """Delete journal rows up to ``through_generation``; return the count."""
+    cursor.execute(
+        f"DELETE FROM {CHANGE_JOURNAL} WHERE generation <= ?",  # nosec B608
+        (int(through_generation),),
+    )
+    deleted = int(cursor.rowcount or 0)
+    advance_horizon(cursor, through_generation)
+    return deleted
+
+
+def write_differential(
+    cursor: Any, schema: str, since_generation: int
+) -> DifferentialStats:
+    """Copy rows changed after ``since_generation`` into attached ``schema``.
+
+    Run inside a transaction so the rows and the journal slice come from one
+    snapshot.
+    """
+    horizon = journal_horizon(cursor)
+    if since_generation < horizon:
+        raise ChangeJournalError(
+            f"Changes through generation {horizon} are no longer journaled; "
+            "create a full backup instead"
+        )
+    generation = current_generation(cursor)
+    if since_generation > generation:
+        raise ChangeJournalError(
+            f"Generation {since_generation} is newer than this database ({generation})"
+        )
+    window = (since_generation, generation)
+    cursor.execute(
+        f"CREATE TABLE {schema}.{DIFF_RANGE} "  # nosec B608
+        "(base_generation INTEGER NOT NULL, generation INTEGER NOT NULL)"
+    )
+    cursor.execute(
+        f"INSERT INTO {schema}.{DIFF_RANGE} VALUES (?, ?)",  # nosec B608
+        window,
+    )
+    cursor.execute(
+        f"CREATE TABLE {schema}.{DIFF_JOURNAL} AS "  # nosec B608
+        "SELECT generation, table_name, row_key, op "
+        f"FROM {CHANGE_JOURNAL} WHERE generation > ? AND generation <= ?",
+        window,
+    )
+    cursor.execute(
+        f"CREATE TABLE {schema}.{DIFF_DELETED_ROWS} "  # nosec B608
+        "(table_name TEXT NOT NULL, row_key NOT NULL)"
+    )
+    upserted = 0
+    for table, key in JOURNALED_TABLES.items():
+        touched = (
+            f"SELECT DISTINCT row_key FROM {schema}.{DIFF_JOURNAL} WHERE table_name = ?"
+        )
+        cursor.execute(
+            f"CREATE TABLE {schema}.{table} AS SELECT * FROM main.{table} "  # nosec B608
+            f"WHERE {key} IN ({touched})",
+            (table,),
+        )
+        cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table}")  # nosec B608
+        upserted += int(cursor.fetchone()[0])
+        cursor.execute(
+            f"INSERT INTO {schema}.{DIFF_DELETED_ROWS}(table_name, row_key) "  # nosec B608
+            f"SELECT ?, row_key FROM ({touched}) "
+            f"WHERE row_key NOT IN (SELECT {key} FROM main.{table})",
+            (table, table),
+        )
+    cursor.execute(f"SELECT COUNT(*) FROM {schema}.{DIFF_DELETED_ROWS}")  # nosec B608
+    deleted = int(cursor.fetchone()[0])
+    return DifferentialStats(since_generation, generation, upserted, deleted)
+
+
+def read_differential_range(cursor: Any, schema: str) -> tuple[int, int]:
+    """Return ``(base_generation, generation)`` of attached differential ``schema``."""
+    cursor.execute(
+        f"SELECT base_generation, generation FROM {schema}.{DIFF_RANGE}"  # nosec B608
+    )
+    row = cursor.fetchone()
+    if not row:
+        raise ChangeJournalError("Differential range is missing")
+    return int(row[0]), int(row[1])
+
+
+def apply_differential(cursor: Any, schema: str) -> DifferentialStats:
+    """Replay attached differential ``schema`` onto the main database.
+
+    Run inside a write transaction with deferred foreign keys. Deletes go
+    first so a re-created unique value cannot collide, then rows are upserted
+    in place so children that the differential does not mention survive.
+    The journal rows written by the replay are replaced with the source's
+    own slice, keeping generations aligned with the source database.
+    """
+    base_generation, generation = read_differential_range(cursor, schema)
+    target_generation = current_generation(cursor)
+    if target_generation < base_generation:
+        raise ChangeJournalError(
+            f"This database is at generation {target_generation}; apply the changes "
+            f"up to generation {base_generation} first"
+        )
+    if target_generation > base_generation and target_generation >= generation:
+        raise ChangeJournalError(
+            f"This database is already at generation {target_generation}, past "
+            f"this differential ({generation})"
+        )
+
+    deleted = 0
+    for table, key in reversed(JOURNALED_TABLES.items()):
+        cursor.execute(
+            f"DELETE FROM main.{table} WHERE {key} IN ("  # nosec B608
+            f"SELECT row_key FROM {schema}.{DIFF_DELETED_ROWS} WHERE table_name = ?)",
+            (table,),
+        )
+        deleted += int(cursor.rowcount or 0)
+    upserted = 0
+    for table, key in JOURNALED_TABLES.items():
+        cursor.execute(f"PRAGMA {schema}.table_info({table})")
+        columns = [str(row[1]) for row in cursor.fetchall()]
+        column_list = ", ".join(columns)
+        assignments = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column != key
+        )
+        cursor.execute(
+            f"INSERT INTO main.{table}({column_list}) "  # nosec B608
+            f"SELECT {column_list} FROM {schema}.{table} WHERE true "
+            f"ON CONFLICT({key}) DO UPDATE SET {assignments}"
+        )
+        upserted += int(cursor.rowcount or 0)
+
+    cursor.execute(
+        f"DELETE FROM {CHANGE_JOURNAL} WHERE generation > ?",  # nosec B608
+        (target_generation,),
+    )
+    cursor.execute(
+        f"INSERT OR REPLACE INTO {CHANGE_JOURNAL}"  # nosec B608
+        "(generation, table_name, row_key, op) "
+        f"SELECT generation, table_name, row_key, op FROM {schema}.{DIFF_JOURNAL}"
+    )
+    cursor.execute(
+        "UPDATE main.sqlite_sequence SET seq = ? WHERE name = ?",
+        (generation, CHANGE_JOURNAL),
+    )
+    if not cursor.rowcount:
+        cursor.execute(
+            "INSERT INTO main.sqlite_sequence(name, seq) VALUES (?, ?)",
+            (CHANGE_JOURNAL, generation),
+        )
+    return DifferentialStats(base_generation, generation, upserted, deleted)
+
+
+__all__ = [
+    "CHANGE_JOURNAL",
+    "CHANGE_JOURNAL_HORIZON",
+    "ChangeJournalError",
+    "DifferentialStats",
+    "JOURNALED_TABLES",
+    "advance_horizon",
+    "apply_differential",
+    "current_generation",
+    "journal_horizon",
+    "journal_statements",
+    "prune_journal",
+    "read_differential_range",
+    "write_differential",
+]
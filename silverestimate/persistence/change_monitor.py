@@ -0,0 +1,332 @@
+"""Find commits made by other connections and publish the tables they changed.
+
+Caches in this process learn about its own writes directly: repositories bump
+query-cache generations and update the item cache once they commit. Commits
+made elsewhere, by a second copy of the application on the same file or by a
+path that bypasses the repositories, are only visible in the database.
+``ChangeMonitor`` notices them through ``PRAGMA data_version``, which moves on
+a connection whenever any other connection commits, and then reads the
+``change_journal`` rows written since the last generation it examined.
+
+Each application connection records the journal generations it writes in a
+TEMP table through a TEMP trigger (``track_local_changes``). After a commit
+those generations are claimed as the process's own, so the monitor skips them
+and publishes only foreign changes, by table and, for items, by code.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from silverestimate.persistence.change_journal import (
+    CHANGE_JOURNAL,
+    current_generation,
+    journal_horizon,
+)
+from silverestimate.persistence.database_driver import Error
+
+LOCAL_JOURNAL = "local_journal"
+# Larger item changes are reported without codes, as a reload of every item.
+MAX_CHANGED_ITEM_CODES = 500
+MAX_TRACKED_CONNECTIONS = 16
+
+
+@dataclass(frozen=True)
+class TableChanges:
+    """Tables changed by other connections up to journal ``generation``.
+
+    ``tables`` is ``None`` when the changes cannot be told apart, for example
+    after the journal was pruned past the last generation examined; every
+    table is then changed. ``item_codes`` lists the changed item codes, or is
+    ``None`` when items changed but the codes are unknown.
+    """
+
+    generation: int
+    tables: frozenset[str] | None
+    item_codes: frozenset[str] | None = frozenset()
+
+    @property
+    def everything(self) -> bool:
+        return self.tables is None
+
+    def touches(self, *tables: str) -> bool:
+        return self.tables is None or not self.tables.isdisjoint(tables)
+
+
+def track_local_changes(cursor: Any) -> bool:
+    """Record the journal generations written through ``cursor``'s connection.
+
+    Needs ``change_journal`` to exist; dropping the journal drops the trigger,
+    so call it again after the schema is set up. Returns whether tracking is
+    active.
+    """
+    try:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {LOCAL_JOURNAL} "
+            "(generation INTEGER PRIMARY KEY)"
+        )
+        cursor.execute(
+            f"CREATE TEMP TRIGGER IF NOT EXISTS {LOCAL_JOURNAL}_insert "
+            f"AFTER INSERT ON main.{CHANGE_JOURNAL} BEGIN "
+            f"INSERT OR IGNORE INTO {LOCAL_JOURNAL}(generation) "
+            "VALUES (new.generation); END"
+        )
+    except Error:
+        return False
+    return True
+
+
+class ChangeMonitor:
+    """Publish journal changes that connections outside this process committed.
+
+    Subscribers are called with a ``TableChanges`` on the thread that found
+    them, which may be a background poll or a query-cache lookup, and must not
+    call back into the monitor.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[..., Any] | None = None,
+        *,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._connection_factory = connection_factory
+        self._logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # Serializes catch-ups so each journal window is published once.
+        self._catch_up_lock = threading.Lock()
+        self._generation: int | None = None
+        # Inclusive generation ranges this process committed and has not yet
+        # passed over.
+        self._local: list[tuple[int, int]] = []
+        self._data_versions: OrderedDict[int, tuple[Any, int]] = OrderedDict()
+        self._subscribers: list[Callable[[TableChanges], None]] = []
+
+    @property
+    def generation(self) -> int | None:
+        """The newest journal generation examined, or ``None`` before ``reset``."""
+        with self._lock:
+            return self._generation
+
+    def subscribe(self, callback: Callable[[TableChanges], None]) -> Callable[[], None]:
+        """Call ``callback`` with every published change; return an unsubscriber."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def reset(self, cursor: Any) -> None:
+        """Treat everything ``cursor`` can see as examined, e.g. after a full load."""
+        try:
+            generation: int | None = current_generation(cursor)
+        except Error as exc:
+            self._logger.debug("Could not read the change generation: %s", exc)
+            generation = None
+        with self._lock:
+            self._generation = generation
+            self._local = []
+            self._data_versions.clear()
+
+    def claim_local(self, cursor: Any) -> None:
+        """Mark the generations committed through ``cursor`` as this process's.
+
+        Skipped while the connection is inside a transaction, whose rows
+        could still roll back and have their generations issued again.
+        """
+        connection = getattr(cursor, "connection", None)
+        if connection is None or connection.in_transaction:
+            return
+        try:
+            cursor.execute(
+                f"SELECT generation FROM temp.{LOCAL_JOURNAL} ORDER BY generation"  # nosec B608
+            )
+            generations = [int(row[0]) for row in cursor.fetchall()]
+            if generations:
+                cursor.execute(f"DELETE FROM temp.{LOCAL_JOURNAL}")  # nosec B608
+                connection.commit()
+        except Error as exc:
+            self._logger.debug("Could not claim local journal rows: %s", exc)
+            return
+        if not generations:
+            return
+        with self._lock:
+            floor = self._generation if self._generation is not None else 0
+            self._local = _merged([*self._local, *_ranges(generations)], after=floor)
+
+    def poll(self, cancel_event: Any | None = None) -> TableChanges | None:
+        """Check a pooled reader for foreign commits and publish them.
+
+        Returns what was published, or ``None`` when nothing changed or the
+        database could not be read.
+        """
+        if self._connection_factory is None:
+            return None
+        try:
+            connection = self._connection_factory(cancel_event)
+        except Exception as exc:
+            self._logger.debug("Change poll skipped: %s", exc)
+            return None
+        try:
+            cursor = connection.cursor()
+            if not self._data_version_moved(cursor):
+                return None
+            changes = self.catch_up(cursor)
+        except Error as exc:
+            self._logger.debug("Change poll failed: %s", exc)
+            return None
+        finally:
+            connection.close()
+        if changes is None or changes.tables == frozenset():
+            return None
+        return changes
+
+    def catch_up(self, cursor: Any) -> TableChanges | None:
+        """Publish the foreign journal changes ``cursor`` can see.
+
+        Returns the changes, with no tables when every new row was this
+        process's own, or ``None`` when ``cursor`` cannot tell: its connection
+        is inside a transaction or the journal is unreadable.
+        """
+        connection = getattr(cursor, "connection", None)
+        if connection is not None and connection.in_transaction:
+            return None
+        with self._catch_up_lock:
+            try:
+                generation = current_generation(cursor)
+                horizon = journal_horizon(cursor)
+                with self._lock:
+                    baseline, local = self._generation, list(self._local)
+                if baseline is None or generation < baseline or horizon > baseline:
+                    changes = TableChanges(generation, None, None)
+                elif generation == baseline:
+                    return TableChanges(generation, frozenset())
+                else:
+                    changes = _read_changes(cursor, baseline, generation, local)
+            except Error as exc:
+                self._logger.debug("Could not read the change journal: %s", exc)
+                return None
+            with self._lock:
+                self._generation = generation
+                self._local = _merged(self._local, after=generation)
+                subscribers = list(self._subscribers)
+            if changes.tables != frozenset():
+                for callback in subscribers:
+                    try:
+                        callback(changes)
+                    except Exception as exc:
+                        self._logger.warning(
+                            "Change subscriber failed: %s", exc, exc_info=True
+                        )
+        return changes
+
+    def _data_version_moved(self, cursor: Any) -> bool:
+        """Whether another connection committed since ``cursor``'s last check."""
+        connection = getattr(cursor, "connection", None)
+        cursor.execute("PRAGMA data_version")
+        row = cursor.fetchone()
+        version = int(row[0]) if row else 0
+        if connection is None:
+            return True
+        with self._lock:
+            seen = self._data_versions.pop(id(connection), None)
+            self._data_versions[id(connection)] = (connection, version)
+            if len(self._data_versions) > MAX_TRACKED_CONNECTIONS:
+                self._data_versions.popitem(last=False)
+        # A connection seen for the first time is compared by generation.
+        return seen is None or seen[1] != version
+
+
+def _read_changes(
+    cursor: Any, baseline: int, generation: int, local: list[tuple[int, int]]
+) -> TableChanges:
+    tables: set[str] = set()
+    codes: set[str] | None = set()
+    for low, high in _foreign_windows(baseline, generation, local):
+        cursor.execute(
+            f"SELECT DISTINCT table_name FROM {CHANGE_JOURNAL} "  # nosec B608
+            "WHERE generation > ? AND generation <= ?",
+            (low, high),
+        )
+        found = {str(row[0]) for row in cursor.fetchall()}
+        tables |= found
+        if "items" not in found or codes is None:
+            continue
+        cursor.execute(
+            f"SELECT DISTINCT row_key FROM {CHANGE_JOURNAL} "  # nosec B608
+            "WHERE table_name = 'items' AND generation > ? AND generation <= ? "
+            "LIMIT ?",
+            (low, high, MAX_CHANGED_ITEM_CODES + 1 - len(codes)),
+        )
+        codes.update(str(row[0]) for row in cursor.fetchall())
+        if len(codes) > MAX_CHANGED_ITEM_CODES:
+            codes = None
+    return TableChanges(
+        generation,
+        frozenset(tables),
+        frozenset(codes) if codes is not None else None,
+    )
+
+
+def _foreign_windows(
+    baseline: int, generation: int, local: Iterable[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Split ``(baseline, generation]`` around the local ranges.
+
+    Returns ``(low, high]`` windows.
+    """
+    windows = []
+    start = baseline
+    for low, high in sorted(local):
+        if high <= start:
+            continue
+        if low > generation:
+            break
+        if low - 1 > start:
+            windows.append((start, low - 1))
+        start = max(start, high)
+    if start < generation:
+        windows.append((start, generation))
+    return windows
+
+
+def _ranges(generations: list[int]) -> list[tuple[int, int]]:
+    """Collapse sorted generations into inclusive runs."""
+    ranges: list[tuple[int, int]] = []
+    for generation in generations:
+        if ranges and generation == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], generation)
+        else:
+            ranges.append((generation, generation))
+    return ranges
+
+
+def _merged(ranges: list[tuple[int, int]], *, after: int) -> list[tuple[int, int]]:
+    """Sort and join ``ranges``, dropping what ends at or before ``after``."""
+    merged: list[tuple[int, int]] = []
+    for low, high in sorted(ranges):
+        if high <= after:
+            continue
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+__all__ = [
+    "LOCAL_JOURNAL",
+    "MAX_CHANGED_ITEM_CODES",
+    "ChangeMonitor",
+    "TableChanges",
+    "track_local_changes",
+]
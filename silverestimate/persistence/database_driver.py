@@ -9,10 +9,16 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Protocol, TypeAlias
+from typing import Any, Callable, Iterator, Protocol, TypeAlias
+
+from silverestimate.persistence.statement_stats import (
+    StatementStats,
+    unwrap_connection,
+)
 
 try:
     from sqlcipher3 import dbapi2 as dbapi
@@ -27,7 +33,12 @@ EXPECTED_SQLCIPHER_SERIES = "4.17."
 EXPECTED_TEMP_STORE = "TEMP_STORE=2"
 EXPECTED_THREADSAFE = "THREADSAFE=1"
 DEFAULT_CACHE_KIB = 20_000
+DEFAULT_READER_POOL_SIZE = 4
+# About 1 MiB per online-backup step at the default 4 KiB page size.
+DEFAULT_BACKUP_PAGES_PER_STEP = 256
+DEFAULT_BACKUP_STEP_SLEEP_S = 0.005
 SQLCIPHER_SALT_BYTES = 16
+READER_CHECKOUT_SAMPLES = 256
 
 
 class DriverUnavailableError(RuntimeError):
@@ -71,6 +82,27 @@ class DriverIdentity:
     compile_options: frozenset[str]
 
 
+@dataclass(frozen=True)
+class ReaderPoolMetrics:
+    """Point-in-time reader-pool counters for telemetry and diagnostics."""
+
+    hits: int
+    misses: int
+    discarded: int
+    idle: int
+    active: int
+    checkout_p95_ms: float
+    checkout_max_ms: float
+
+    @property
+    def checkouts(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.checkouts if self.checkouts else 0.0
+
+
 def require_driver() -> Any:
     if dbapi is None:
         raise DriverUnavailableError(
@@ -156,11 +188,17 @@ def configure_connection(
 
 
 class _ManagedReadConnection:
-    """DB-API proxy that reliably unregisters a broker reader on close."""
+    """DB-API proxy that reliably returns a broker reader to its pool on close."""
 
-    def __init__(self, broker: "SqlCipherConnectionBroker", connection: Connection):
+    def __init__(
+        self,
+        broker: "SqlCipherConnectionBroker",
+        connection: Connection,
+        generation: int = 0,
+    ):
         self._broker = broker
         self._connection = connection
+        self._generation = generation
         self._closed = False
 
     def __getattr__(self, name: str) -> Any:
@@ -172,14 +210,16 @@ class _ManagedReadConnection:
     def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
         self.close()
 
+    @property
+    def interrupted(self) -> bool:
+        """True once maintenance has asked checked-out readers to stop."""
+        return self._broker._reader_interrupt.is_set()
+
     def close(self) -> None:
         if self._closed:
             return
         self._closed = True
-        try:
-            self._connection.close()
-        finally:
-            self._broker._reader_closed(self)
+        self._broker._reader_closed(self)
 
 
 ReadConnection: TypeAlias = _ManagedReadConnection
@@ -188,13 +228,15 @@ ReadConnection: TypeAlias = _ManagedReadConnection
 class SqlCipherConnectionBroker:
     """Own the raw key and serialize live readers against maintenance work."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - keyword-only connection options
         self,
         database_path: str | Path,
         raw_key: bytes,
         *,
         database_salt: bytes | None = None,
         logger: logging.Logger | None = None,
+        reader_pool_size: int = DEFAULT_READER_POOL_SIZE,
+        statement_stats: StatementStats | None = None,
     ) -> None:
         self.database_path = str(database_path)
         self._raw_key = bytes(raw_key)
@@ -208,6 +250,14 @@ class SqlCipherConnectionBroker:
         self._maintenance = False
         self._readers: set[_ManagedReadConnection] = set()
         self._reader_interrupt = threading.Event()
+        self._reader_pool_size = max(0, int(reader_pool_size))
+        self._idle_readers: list[Connection] = []
+        self._pool_generation = 0
+        self._pool_hits = 0
+        self._pool_misses = 0
+        self._pool_discarded = 0
+        self._checkout_ms: deque[float] = deque(maxlen=READER_CHECKOUT_SAMPLES)
+        self._statement_stats = statement_stats
 
     @property
     def raw_key(self) -> bytes:
@@ -217,6 +267,16 @@ class SqlCipherConnectionBroker:
     def database_salt(self) -> bytes | None:
         return self._database_salt
 
+    @property
+    def statement_stats(self) -> StatementStats | None:
+        """The per-statement collector, or ``None`` when timing is disabled."""
+        return self._statement_stats
+
+    def _instrument(self, connection: Connection) -> Connection:
+        if self._statement_stats is None:
+            return connection
+        return self._statement_stats.instrument(connection)
+
     def replace_key(
         self, raw_key: bytes, *, database_salt: bytes | None = None
     ) -> None:
@@ -228,6 +288,7 @@ class SqlCipherConnectionBroker:
         self._database_salt = (
             bytes(database_salt) if database_salt is not None else None
         )
+        self.close_idle_readers()
 
     def open_writer(self, *, create: bool = False) -> tuple[Connection, DriverIdentity]:
         driver = require_driver()
@@ -245,7 +306,7 @@ class SqlCipherConnectionBroker:
             )
             if create:
                 connection.execute("SELECT count(*) FROM sqlite_master").fetchone()
-            return connection, identity
+            return self._instrument(connection), identity
         except BaseException:
             connection.close()
             raise
@@ -253,24 +314,24 @@ class SqlCipherConnectionBroker:
     def open_read_connection(
         self, cancel_event: CancelFlag | None = None
     ) -> ReadConnection:
+        """Check out a keyed read-only connection, reusing a warm one when idle."""
+        started = time.perf_counter()
         with self._condition:
             if self._maintenance:
                 raise MaintenanceBusyError("Database maintenance is in progress")
-            driver = require_driver()
-            connection = driver.connect(self.database_path, timeout=15.0)
-            try:
-                configure_connection(
-                    connection,
-                    raw_key=self._raw_key,
-                    database_salt=self._database_salt,
-                    writer=False,
-                    authenticate=True,
-                )
-            except BaseException:
-                connection.close()
-                raise
-            managed = _ManagedReadConnection(self, connection)
+            pooled = bool(self._idle_readers)
+            if pooled:
+                connection = self._idle_readers.pop()
+                self._pool_hits += 1
+            else:
+                connection = self._connect_reader()
+                self._pool_misses += 1
+            managed = _ManagedReadConnection(
+                self, connection, generation=self._pool_generation
+            )
             self._readers.add(managed)
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._checkout_ms.append(elapsed_ms)
 
         def _cancelled() -> int:
             return int(
@@ -279,12 +340,95 @@ class SqlCipherConnectionBroker:
             )
 
         connection.set_progress_handler(_cancelled, 1_000)
+        self._logger.debug(
+            "[perf] database.reader_checkout_ms=%.3f pooled=%s",
+            elapsed_ms,
+            pooled,
+        )
         return managed
 
+    def _connect_reader(self) -> Connection:
+        driver = require_driver()
+        # Pooled readers move between worker threads, but the broker hands each
+        # one to a single owner at a time and the driver is built THREADSAFE=1.
+        connection = driver.connect(
+            self.database_path, timeout=15.0, check_same_thread=False
+        )
+        try:
+            configure_connection(
+                connection,
+                raw_key=self._raw_key,
+                database_salt=self._database_salt,
+                writer=False,
+                authenticate=True,
+            )
+        except BaseException:
+            connection.close()
+            raise
+        return self._instrument(connection)
+
     def _reader_closed(self, reader: _ManagedReadConnection) -> None:
+        connection = reader._connection
         with self._condition:
             self._readers.discard(reader)
+            reusable = (
+                not self._maintenance
+                and reader._generation == self._pool_generation
+                and len(self._idle_readers) < self._reader_pool_size
+                and self._reset_reader(connection)
+            )
+            if reusable:
+                self._idle_readers.append(connection)
+            else:
+                self._pool_discarded += 1
             self._condition.notify_all()
+        if not reusable:
+            self._close_quietly(connection)
+
+    def _reset_reader(self, connection: Connection) -> bool:
+        """Return a reader to a clean autocommit state before it is pooled."""
+        try:
+            connection.set_progress_handler(None, 0)
+            if connection.in_transaction:
+                connection.rollback()
+            connection.row_factory = Row
+        except Error as exc:
+            self._logger.debug("Discarding unusable pooled reader: %s", exc)
+            return False
+        return True
+
+    def _close_quietly(self, connection: Connection) -> None:
+        try:
+            connection.close()
+        except Error as exc:
+            self._logger.debug("Failed to close database reader: %s", exc)
+
+    def close_idle_readers(self) -> int:
+        """Close every pooled reader and invalidate readers still checked out."""
+        with self._condition:
+            idle = self._idle_readers
+            self._idle_readers = []
+            self._pool_generation += 1
+        for connection in idle:
+            self._close_quietly(connection)
+        return len(idle)
+
+    def reader_pool_metrics(self) -> ReaderPoolMetrics:
+        with self._condition:
+            samples = sorted(self._checkout_ms)
+            return ReaderPoolMetrics(
+                hits=self._pool_hits,
+                misses=self._pool_misses,
+                discarded=self._pool_discarded,
+                idle=len(self._idle_readers),
+                active=len(self._readers),
+                checkout_p95_ms=(
+                    samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                    if samples
+                    else 0.0
+                ),
+                checkout_max_ms=samples[-1] if samples else 0.0,
+            )
 
     @contextmanager
     def maintenance(self, *, timeout_seconds: float = 15.0) -> Iterator[None]:
@@ -295,6 +439,8 @@ class SqlCipherConnectionBroker:
                 raise MaintenanceBusyError("Database maintenance is already active")
             self._maintenance = True
             self._reader_interrupt.set()
+        self.close_idle_readers()
+        with self._condition:
             while self._readers:
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
@@ -322,19 +468,91 @@ def export_database(
     target_salt: bytes | None = None,
     schema: str = "silver_export",
 ) -> None:
-    """Copy the open source into a different-key SQLCipher database."""
-    target = str(Path(target_path).resolve()).replace("'", "''")
-    source.execute(
-        f"ATTACH DATABASE '{target}' AS {schema} "
-        f"KEY {_quote_raw_key(target_key, target_salt)}"
+    """Copy the open source into a different-key SQLCipher database.
+
+    Outside an explicit transaction the export runs in one, so it copies a
+    single snapshot even while another connection keeps writing.
+    """
+    with attached_database(
+        source, target_path, target_key, salt=target_salt, schema=schema
+    ):
+        owns_transaction = not source.in_transaction
+        if owns_transaction:
+            source.execute("BEGIN")
+        try:
+            source.execute(f"SELECT sqlcipher_export('{schema}')").fetchone()
+        except BaseException:
+            if owns_transaction and source.in_transaction:
+                source.rollback()
+            raise
+        if owns_transaction:
+            source.commit()
+
+
+@contextmanager
+def attached_database(
+    connection: Connection,
+    path: str | Path,
+    key: bytes,
+    *,
+    salt: bytes | None = None,
+    schema: str,
+) -> Iterator[str]:
+    """Attach another keyed SQLCipher file as ``schema`` for the block."""
+    target = str(Path(path).resolve()).replace("'", "''")
+    connection.execute(
+        f"ATTACH DATABASE '{target}' AS {schema} KEY {_quote_raw_key(key, salt)}"
     )
     try:
-        source.execute(f"SELECT sqlcipher_export('{schema}')").fetchone()
+        yield schema
+    finally:
+        connection.execute(f"DETACH DATABASE {schema}")
+
+
+def online_backup(  # noqa: PLR0913 - explicit copy controls
+    source: Connection | ReadConnection,
+    target: Connection,
+    *,
+    pages_per_step: int = DEFAULT_BACKUP_PAGES_PER_STEP,
+    step_sleep_s: float = DEFAULT_BACKUP_STEP_SLEEP_S,
+    progress: Callable[[int, int], None] | None = None,
+    schema: str = "main",
+) -> None:
+    """Copy ``source`` into a same-key ``target`` a few pages at a time.
+
+    The copy is taken from one WAL snapshot pinned by a read transaction, so
+    writers on other connections neither block it nor restart it. Between
+    steps the thread sleeps to leave the disk to foreground work.
+    ``progress`` receives ``(pages copied, total pages)``; an exception it
+    raises aborts the copy. ``schema`` names an attached database of
+    ``source`` to copy instead of its main one; ``target`` must use that
+    database's key.
+    """
+
+    def step(_status: int, remaining: int, total: int) -> None:
+        if progress is not None:
+            progress(total - remaining, total)
+        if remaining and step_sleep_s > 0:
+            time.sleep(step_sleep_s)
+
+    owns_transaction = not source.in_transaction
+    if owns_transaction:
+        source.execute("BEGIN")
+        source.execute(f"SELECT count(*) FROM {schema}.sqlite_master").fetchone()
+    try:
+        source.backup(
+            unwrap_connection(target),
+            pages=max(1, int(pages_per_step)),
+            progress=step,
+            name=schema,
+        )
     finally:
-        source.execute(f"DETACH DATABASE {schema}")
+        if owns_transaction and source.in_transaction:
+            source.rollback()
 
 
 __all__ = [
+    "CancelFlag",
     "Connection",
     "Cursor",
     "DatabaseAuthenticationError",
@@ -346,11 +564,14 @@ __all__ = [
     "MaintenanceBusyError",
     "OperationalError",
     "ReadConnection",
+    "ReaderPoolMetrics",
     "Row",
     "SQLCIPHER_SALT_BYTES",
     "SqlCipherConnectionBroker",
+    "attached_database",
     "configure_connection",
     "export_database",
+    "online_backup",
     "require_driver",
     "verify_driver",
 ]
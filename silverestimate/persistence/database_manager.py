@@ -4,13 +4,16 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import shutil
 import tempfile
+import time
 import zipfile
-from dataclasses import dataclass
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum, auto
 from pathlib import Path
@@ -18,6 +21,22 @@ from typing import TYPE_CHECKING, Any
 
 from silverestimate.infrastructure.db_session import ConnectionThreadGuard
 from silverestimate.infrastructure.item_cache import ItemCacheController
+from silverestimate.infrastructure.write_futures import map_future
+from silverestimate.persistence.change_journal import (
+    CHANGE_JOURNAL,
+    DIFF_JOURNAL,
+    DifferentialStats,
+    apply_differential,
+    current_generation,
+    prune_journal,
+    read_differential_range,
+    write_differential,
+)
+from silverestimate.persistence.change_monitor import (
+    ChangeMonitor,
+    TableChanges,
+    track_local_changes,
+)
 from silverestimate.persistence.database_driver import (
     SQLCIPHER_SALT_BYTES,
     Connection,
@@ -25,17 +44,73 @@ from silverestimate.persistence.database_driver import (
     DatabaseError,
     DriverIdentity,
     Error,
+    MaintenanceBusyError,
+    OperationalError,
     ReadConnection,
     SqlCipherConnectionBroker,
+    attached_database,
     export_database,
+    online_backup,
 )
 from silverestimate.persistence.database_repository_facade import (
     DatabaseRepositoryFacadeMixin,
 )
+from silverestimate.persistence.database_writer import (
+    DatabaseWriter,
+    WriteCommand,
+    WriteOutcome,
+    WriterMetrics,
+    WriterSession,
+)
+from silverestimate.persistence.encrypted_backup import (
+    ARCHIVE_MEMBERS,
+    CHANGES_MEMBER,
+    DATABASE_MEMBER,
+    DIFFERENTIAL_MEMBERS,
+    ESTIMATE_ARCHIVE_MEMBER,
+    MANIFEST_DIGEST_MEMBER,
+    MANIFEST_MEMBER,
+    BackupCancelledError,
+    BackupMode,
+    BackupProgress,
+    stream_backup_archive,
+)
+from silverestimate.persistence.estimate_archive import (
+    ARCHIVE_SCHEMA,
+    ARCHIVE_STATE,
+    archive_estimates,
+    archive_path_for,
+    attach_archive,
+    ensure_archive_state,
+    read_archive_state,
+)
+from silverestimate.persistence.idle_maintenance import (
+    IdleMaintenancePolicy,
+    IdleMaintenanceReport,
+    run_idle_maintenance,
+)
+from silverestimate.persistence.integrity_verifier import (
+    IntegrityCheckResult,
+    IntegrityProgress,
+    IntegrityState,
+    IntegrityVerifier,
+)
+from silverestimate.persistence.item_usage import (
+    read_usage,
+    rebuild_usage,
+    usage_exists,
+)
+from silverestimate.persistence.query_cache import QueryCache, QueryCacheMetrics
+from silverestimate.persistence.statement_stats import (
+    StatementStat,
+    statement_stats_from_environment,
+)
 from silverestimate.persistence.storage_metadata import (
     BackupManifest,
     BindingMigrationJournal,
+    DifferentialManifest,
     KdfMetadata,
+    OpenFingerprint,
     RekeyJournal,
     RestoreJournal,
     StorageMetadataError,
@@ -60,6 +135,8 @@ if TYPE_CHECKING:
 
 SQLITE_HEADER = b"SQLite format 3\x00"
 BACKUP_FORMAT_VERSION = 2
+DIFFERENTIAL_FORMAT_VERSION = 1
+DIFFERENTIAL_SCHEMA = "silver_diff"
 JOURNAL_VERSION = 2
 BINDING_MIGRATION_VERSION = 1
 
@@ -77,6 +154,13 @@ class DatabaseOpenStatus(Enum):
     MIGRATED_TO_DEVICE_BOUND = auto()
 
 
+class DatabaseOpenPath(Enum):
+    """Whether open ran the full page scans or trusted a clean-close fingerprint."""
+
+    FULL = "full"
+    FAST = "fast"
+
+
 class MaintenanceStatus(Enum):
     SUCCESS = auto()
     ROLLED_BACK = auto()
@@ -89,6 +173,12 @@ class MaintenanceOutcome:
     status: MaintenanceStatus
     message: str
     path: str | None = None
+    phase_ms: dict[str, float] = field(default_factory=dict)
+
+
+def _raise_if_backup_cancelled(cancel_event: Any | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise BackupCancelledError("Database backup cancelled.")
 
 
 class DatabaseManager(DatabaseRepositoryFacadeMixin):
@@ -104,7 +194,17 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         self.conn: Connection | None = None
         self.cursor: Cursor | None = None
         self._session = ConnectionThreadGuard(logger=self.logger)
+        self._statement_stats = statement_stats_from_environment(logger=self.logger)
+        self._writer: DatabaseWriter | None = None
+        self._last_optimize_at = float("-inf")
+        self._last_analyze_at = float("-inf")
         self._item_cache_controller = ItemCacheController(logger=self.logger)
+        self._query_cache = QueryCache(logger=self.logger)
+        self._change_monitor = ChangeMonitor(
+            self.open_read_connection, logger=self.logger
+        )
+        self._query_cache.follow(self._change_monitor)
+        self._change_monitor.subscribe(self._refresh_item_cache)
         self._items_repo: ItemsRepository | None = None
         self._estimates_repo: EstimatesRepository | None = None
         self._silver_bar_query_repo: SilverBarQueryRepository | None = None
@@ -113,12 +213,22 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
             SilverBarSynchronizationRepository | None
         ) = None
         self.database_salt: bytes | None = None
+        self.open_path = DatabaseOpenPath.FULL
+        self.integrity_status = IntegrityCheckResult(
+            IntegrityState.PENDING, "Database has not been validated"
+        )
         self._path = Path(self.database_path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._metadata_path = self._path.with_name(f"{self._path.stem}.kdf.json")
         self._rekey_journal = self._path.with_suffix(".rekey.json")
         self._restore_journal = self._path.with_suffix(".restore.json")
         self._binding_journal = self._path.with_suffix(".binding.json")
+        self._open_fingerprint_path = self._path.with_suffix(".open.json")
+        self._integrity_verifier = IntegrityVerifier(
+            self.open_read_connection,
+            self._path.with_suffix(".integrity.json"),
+            logger=self.logger,
+        )
         self._recover_missing_live_from_journal()
         binding_switch_pending = self._inspect_binding_migration()
 
@@ -135,12 +245,13 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                 self.key,
                 database_salt=self.database_salt,
                 logger=self.logger,
+                statement_stats=self._statement_stats,
             )
             self.conn, self.driver_identity = self._broker.open_writer(create=True)
             try:
                 self._bind_connection()
                 self.setup_database()
-                self.validate_database(self.conn)
+                self._validate_on_open()
             except BaseException:
                 self._close_connection()
                 self._remove_database_family(self._path)
@@ -158,16 +269,33 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         self.key = self._derive_bound_key(password, self.database_salt)
         self._activate_pending_restore()
         self._resolve_interrupted_rekey(password)
+        fingerprint = self._read_open_fingerprint()
+        file_state = self._database_file_state()
         self._broker = SqlCipherConnectionBroker(
             self._path,
             self.key,
             database_salt=self.database_salt,
             logger=self.logger,
+            statement_stats=self._statement_stats,
         )
         self.conn, self.driver_identity = self._broker.open_writer()
+        # The marker only survives while the file is cleanly closed.
+        self._open_fingerprint_path.unlink(missing_ok=True)
         self._bind_connection()
-        self.setup_database()
-        self.validate_database(self.conn)
+        if (
+            not binding_switch_pending
+            and self.open_status is DatabaseOpenStatus.OPENED
+            and self._fingerprint_matches(fingerprint, file_state)
+        ):
+            self.validate_schema_contract(self.conn)
+            self.open_path = DatabaseOpenPath.FAST
+            self.integrity_status = IntegrityCheckResult(
+                IntegrityState.PENDING,
+                "Full integrity verification is scheduled in the background",
+            )
+        else:
+            self.setup_database()
+            self._validate_on_open()
         if binding_switch_pending:
             self._finalize_binding_migration()
             self.open_status = DatabaseOpenStatus.MIGRATED_TO_DEVICE_BOUND
@@ -237,6 +365,35 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
     def item_cache_controller(self):
         return self._item_cache_controller
 
+    @property
+    def query_cache(self) -> QueryCache:
+        return self._query_cache
+
+    @property
+    def change_monitor(self) -> ChangeMonitor:
+        return self._change_monitor
+
+    def invalidate_tables(self, *tables: str) -> None:
+        """Expire cached reads of ``tables`` after a committed write."""
+        self._query_cache.invalidate(*tables)
+        if self.cursor is not None:
+            self._change_monitor.claim_local(self.cursor)
+
+    def _refresh_item_cache(self, changes: TableChanges) -> None:
+        """Bring the item cache up to date with another connection's commits."""
+        cache = self._item_cache_controller
+        if changes.touches("items"):
+            if changes.item_codes is None:
+                cache.clear()
+                self.start_preload_item_cache()
+            else:
+                cache.refresh(changes.item_codes, self.open_read_connection)
+        if changes.touches("estimates", "estimate_items"):
+            cache.reload_usage(self.open_read_connection)
+
+    def query_cache_metrics(self) -> QueryCacheMetrics:
+        return self._query_cache.metrics()
+
     def _derive_legacy_key(self, password: str, metadata: KdfMetadata) -> bytes:
         return crypto_utils.derive_key(
             password,
@@ -280,12 +437,15 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         self._activate_pending_restore()
         self._resolve_interrupted_rekey(password)
         self._broker = SqlCipherConnectionBroker(
-            self._path, self.key, logger=self.logger
+            self._path,
+            self.key,
+            logger=self.logger,
+            statement_stats=self._statement_stats,
         )
         self.conn, self.driver_identity = self._broker.open_writer()
         self._bind_connection()
         self.setup_database()
-        self.validate_database(self.conn)
+        self._validate_on_open()
         self._migrate_legacy_database(password)
 
     def _migrate_legacy_database(self, password: str) -> None:
@@ -332,11 +492,12 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                 self.key,
                 database_salt=self.database_salt,
                 logger=self.logger,
+                statement_stats=self._statement_stats,
             )
             self.conn, self.driver_identity = self._broker.open_writer()
             self._bind_connection()
             self.setup_database()
-            self.validate_database(self.conn)
+            self._validate_on_open()
             self._finalize_binding_migration()
             self.open_status = DatabaseOpenStatus.MIGRATED_TO_DEVICE_BOUND
         except BaseException as exc:
@@ -459,10 +620,166 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         assert self.conn is not None
         self._session.attach_to_current_thread()
         self.cursor = self.conn.cursor()
+        self._track_local_changes()
+
+    def _track_local_changes(self) -> None:
+        """Tell this connection's commits apart from other connections'."""
+        assert self.cursor is not None
+        track_local_changes(self.cursor)
+        self._change_monitor.reset(self.cursor)
 
     def open_read_connection(self, cancel_event: Any | None = None) -> ReadConnection:
         return self._broker.open_read_connection(cancel_event)
 
+    def submit_write(self, command: WriteCommand) -> Future[WriteOutcome]:
+        """Queue a write on the writer thread instead of the caller's connection."""
+        if self.conn is None:
+            raise RuntimeError("The database is closed")
+        if self._writer is None:
+            self._writer = DatabaseWriter(self._open_writer_session, logger=self.logger)
+        return self._writer.submit(command)
+
+    def _run_write(self, command: WriteCommand) -> Future[Any]:
+        """Queue a facade write on the writer thread and return a future value.
+
+        Nothing waits on the writer here: GUI callers watch the future with a
+        ``DatabaseWriteNotifier``, so the window keeps painting while a write
+        queues behind a batch or behind maintenance holding the writer.
+        ``last_error`` is set before the future settles.
+        """
+        if self.conn is None:
+            return super()._run_write(command)
+
+        def unwrap(outcome: WriteOutcome) -> Any:
+            self.last_error = outcome.error
+            return outcome.value
+
+        return map_future(self.submit_write(command), unwrap)
+
+    def writer_metrics(self) -> WriterMetrics | None:
+        return self._writer.metrics() if self._writer is not None else None
+
+    def statement_stats(self) -> tuple[StatementStat, ...]:
+        """Per-statement timings, empty unless ``SILVER_SQL_STATS`` is set."""
+        if self._statement_stats is None:
+            return ()
+        return self._statement_stats.snapshot()
+
+    def _open_writer_session(self) -> WriterSession:
+        connection, _identity = self._broker.open_writer()
+        return WriterSession(
+            connection,
+            logger=self.logger,
+            item_cache_controller=self._item_cache_controller,
+            query_cache=self._query_cache,
+            change_monitor=self._change_monitor,
+            read_connection_factory=self.open_read_connection,
+            database_path=self.database_path,
+        )
+
+    @contextmanager
+    def _maintenance(self) -> Iterator[None]:
+        """Pause the writer thread, then drain readers for file-level work."""
+        held = self._writer.hold() if self._writer is not None else nullcontext()
+        try:
+            with held, self._broker.maintenance():
+                yield
+        finally:
+            # File-level work replaces rows behind every table generation.
+            self._query_cache.clear()
+            if self.cursor is not None:
+                self._change_monitor.claim_local(self.cursor)
+
+    def run_idle_maintenance(
+        self,
+        cancel_event: Any | None = None,
+        *,
+        policy: IdleMaintenancePolicy | None = None,
+        force: bool = False,
+    ) -> IdleMaintenanceReport | None:
+        """Checkpoint the WAL, refresh statistics, and prune the journal while idle.
+
+        Safe to call from a worker thread. Returns ``None`` without touching
+        the database while a write is queued or running, or while file-level
+        maintenance is active. The pass holds a broker reader lease, so
+        maintenance waits for it and interrupts it like any other reader.
+        ``force`` runs ``PRAGMA optimize`` and ``ANALYZE`` even when their
+        intervals have not elapsed.
+        """
+        policy = policy or IdleMaintenancePolicy()
+        writer = self._writer
+        if self.conn is None or (writer is not None and not writer.idle):
+            return None
+        try:
+            lease = self._broker.open_read_connection(cancel_event)
+        except MaintenanceBusyError:
+            return None
+
+        def should_continue() -> bool:
+            return (
+                not lease.interrupted
+                and not (cancel_event is not None and cancel_event.is_set())
+                and (writer is None or writer.idle)
+            )
+
+        started = time.monotonic()
+        try:
+            connection, _identity = self._broker.open_writer()
+            try:
+                report = run_idle_maintenance(
+                    connection,
+                    Path(f"{self._path}-wal"),
+                    policy,
+                    optimize_due=force
+                    or started - self._last_optimize_at >= policy.optimize_interval_s,
+                    analyze_due=force
+                    or started - self._last_analyze_at >= policy.analyze_interval_s,
+                    should_continue=should_continue,
+                )
+            finally:
+                connection.close()
+        finally:
+            lease.close()
+        if "optimize" in report.tasks:
+            self._last_optimize_at = started
+        if "analyze" in report.tasks:
+            self._last_analyze_at = started
+        self.logger.info(
+            '[telemetry] {"metric":"database.idle_maintenance","duration_ms":%.3f,'
+            '"tasks":"%s","skipped":"%s","wal_bytes_before":%d,'
+            '"wal_bytes_after":%d,"checkpoint_mode":"%s","checkpoint_ms":%.3f,'
+            '"wal_frames":%d,"pages_moved":%d,"journal_rows_pruned":%d}',
+            report.duration_ms,
+            ",".join(report.tasks),
+            ",".join(report.skipped),
+            report.wal_bytes_before,
+            report.wal_bytes_after,
+            report.checkpoint_mode or "none",
+            report.phase_ms.get("checkpoint_passive", 0.0)
+            + report.phase_ms.get("checkpoint_restart", 0.0),
+            report.wal_frames,
+            report.pages_moved,
+            report.journal_rows_pruned,
+        )
+        return report
+
+    def _stop_writer(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        if not writer.shutdown():
+            self.logger.warning("Database writer did not stop within the timeout")
+        metrics = writer.metrics()
+        self.logger.info(
+            '[telemetry] {"metric":"database.writer","commands":%d,"failed":%d,'
+            '"batches":%d,"max_queue_depth":%d,"latency_p95_ms":%.3f}',
+            metrics.completed,
+            metrics.failed,
+            metrics.batches,
+            metrics.max_queue_depth,
+            metrics.latency_p95_ms,
+        )
+
     def _table_exists(self, table_name: str) -> bool:
         assert self.cursor is not None
         return (
@@ -499,9 +816,18 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         from silverestimate.persistence import schema
 
         schema.run_schema_setup(self)
+        self._query_cache.clear()
+        # Setup creates the journal the local-change trigger is bound to.
+        self._track_local_changes()
 
     @staticmethod
     def validate_database(connection: Connection) -> None:
+        DatabaseManager.verify_database_integrity(connection)
+        DatabaseManager.validate_schema_contract(connection)
+
+    @staticmethod
+    def verify_database_integrity(connection: Connection) -> None:
+        """Run the page-proportional checks that the fingerprint fast path defers."""
         quick = connection.execute("PRAGMA quick_check").fetchone()
         if not quick or str(quick[0]).lower() != "ok":
             raise DatabaseError(f"SQLCipher quick_check failed: {quick!r}")
@@ -513,6 +839,9 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
             raise DatabaseError(
                 f"Foreign-key validation failed with {len(violations)} violation(s)"
             )
+
+    @staticmethod
+    def validate_schema_contract(connection: Connection) -> None:
         from silverestimate.persistence.schema import CURRENT_SCHEMA_VERSION
 
         required_tables = {
@@ -544,7 +873,6 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
             )
         required_indexes = {
             "idx_items_code_upper",
-            "idx_estimates_history_keyset",
             "idx_estimate_items_voucher_line_key",
             "idx_sbars_status_list_weight_date_id",
             "idx_sbars_voucher_line_key",
@@ -561,152 +889,468 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                 f"Application schema is missing indexes: {sorted(missing_indexes)}"
             )
 
-    def close(self) -> None:
-        self._close_connection()
+    def _validate_on_open(self) -> None:
+        assert self.conn is not None
+        started = time.perf_counter()
+        self.validate_database(self.conn)
+        self.integrity_status = IntegrityCheckResult(
+            IntegrityState.VERIFIED,
+            "Database integrity verified during open",
+            checked_utc=datetime.now(UTC).isoformat(),
+            duration_ms=(time.perf_counter() - started) * 1000.0,
+        )
+        self._integrity_verifier.record_full_verification()
+
+    @property
+    def integrity_verification_pending(self) -> bool:
+        return self.integrity_status.state is IntegrityState.PENDING
+
+    def verify_integrity(self, cancel_event: Any | None = None) -> IntegrityCheckResult:
+        """Continue the incremental background verification cycle."""
+        result = self._integrity_verifier.run(cancel_event)
+        if result.state is not IntegrityState.PENDING:
+            self.integrity_status = result
+        self.logger.info(
+            '[telemetry] {"metric":"database.integrity_verify_ms",'
+            '"duration_ms":%.3f,"state":"%s"}',
+            result.duration_ms,
+            result.state.name.lower(),
+        )
+        if result.state is IntegrityState.FAILED:
+            self.logger.error(
+                "Background integrity verification failed: %s", result.message
+            )
+        return result
+
+    def integrity_progress(self) -> IntegrityProgress:
+        return self._integrity_verifier.progress()
+
+    @staticmethod
+    def _schema_sha256(connection: Connection) -> str:
+        from silverestimate.persistence.schema import SCHEMA_SETUP_REVISION
+
+        digest = hashlib.sha256()
+        digest.update(f"setup:{SCHEMA_SETUP_REVISION}".encode() + b"\x1e")
+        for row in connection.execute(
+            "SELECT type, name, tbl_name, COALESCE(sql, '') FROM sqlite_master "
+            "ORDER BY type, name"
+        ):
+            digest.update("\x1f".join(str(value) for value in row).encode())
+            digest.update(b"\x1e")
+        version = connection.execute("SELECT MAX(version) FROM schema_version")
+        digest.update(str(version.fetchone()[0]).encode())
+        return digest.hexdigest()
+
+    def _database_file_state(self) -> tuple[int, int, int]:
+        stat = self._path.stat()
+        wal = Path(f"{self._path}-wal")
+        wal_size = wal.stat().st_size if wal.exists() else 0
+        return stat.st_size, stat.st_mtime_ns, wal_size
+
+    def _read_open_fingerprint(self) -> OpenFingerprint | None:
+        if not self._open_fingerprint_path.is_file():
+            return None
+        try:
+            return OpenFingerprint.read(self._open_fingerprint_path)
+        except StorageMetadataError as exc:
+            self.logger.warning("Ignoring unreadable open fingerprint: %s", exc)
+            return None
+
+    def _fingerprint_matches(
+        self,
+        fingerprint: OpenFingerprint | None,
+        file_state: tuple[int, int, int],
+    ) -> bool:
+        if (
+            fingerprint is None
+            or (
+                fingerprint.database_size,
+                fingerprint.database_mtime_ns,
+                fingerprint.wal_size,
+            )
+            != file_state
+        ):
+            return False
+        assert self.conn is not None
+        return fingerprint.schema_sha256 == self._schema_sha256(self.conn)
+
+    def _record_open_fingerprint(self, schema_sha256: str) -> None:
+        try:
+            database_size, database_mtime_ns, wal_size = self._database_file_state()
+            OpenFingerprint(
+                version=OpenFingerprint.VERSION,
+                schema_sha256=schema_sha256,
+                database_size=database_size,
+                database_mtime_ns=database_mtime_ns,
+                wal_size=wal_size,
+                closed_utc=datetime.now(UTC).isoformat(),
+            ).write(self._open_fingerprint_path)
+        except OSError as exc:
+            self.logger.warning("Could not record the clean-close fingerprint: %s", exc)
 
-    def _close_connection(self) -> None:
+    def close(self) -> None:
+        metrics = self._query_cache.metrics()
+        if metrics.lookups:
+            self.logger.info(
+                "[perf] query_cache.hit_rate=%.3f hits=%d misses=%d "
+                "evictions=%d entries=%d bytes=%d",
+                metrics.hit_rate,
+                metrics.hits,
+                metrics.misses,
+                metrics.evictions,
+                metrics.entries,
+                metrics.bytes,
+            )
+        self._close_connection(record_clean_close=True)
+
+    def _close_connection(self, *, record_clean_close: bool = False) -> None:
+        if getattr(self, "_writer", None) is not None:
+            self._stop_writer()
+        broker = getattr(self, "_broker", None)
+        if broker is not None:
+            # Pooled readers hold file handles that block os.replace on Windows.
+            broker.close_idle_readers()
+        query_cache = getattr(self, "_query_cache", None)
+        if query_cache is not None:
+            query_cache.clear()
         if self.conn is None:
             return
+        schema_sha256: str | None = None
         try:
             self.conn.commit()
             try:
-                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                checkpoint = self.conn.execute(
+                    "PRAGMA wal_checkpoint(TRUNCATE)"
+                ).fetchone()
             except DatabaseError as exc:
                 self.logger.debug("Final WAL checkpoint was deferred: %s", exc)
+                checkpoint = None
+            status = getattr(self, "integrity_status", None)
+            if (
+                record_clean_close
+                and checkpoint is not None
+                and int(checkpoint[0]) == 0
+                and status is not None
+                and status.succeeded
+            ):
+                schema_sha256 = self._schema_sha256(self.conn)
         finally:
             self.conn.close()
             self.conn = None
             self.cursor = None
             self._session.clear()
+        if schema_sha256 is not None:
+            self._record_open_fingerprint(schema_sha256)
 
     def drop_tables(self) -> bool:
         if self.conn is None or self.cursor is None:
             return False
         tables = (
+            "items_fts",
+            "silver_bar_summary",
+            "item_usage",
             "estimate_items",
             "estimates",
             "items",
             "bar_transfers",
             "silver_bars",
             "silver_bar_lists",
+            "change_journal",
+            "change_journal_horizon",
+            ARCHIVE_STATE,
             "schema_version",
         )
         try:
-            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.execute("BEGIN IMMEDIATE")
             for table in tables:
                 self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
             self.conn.commit()
+            self._query_cache.clear()
+            self._item_cache_controller.clear()
+            # Without its key in the live file the archive is unreadable.
+            self._remove_database_family(self.estimate_archive_path)
             return True
         except Error:
             self.conn.rollback()
             self.logger.exception("Database error dropping tables")
             return False
 
+    @property
+    def estimate_archive_path(self) -> Path:
+        """Cold-storage file that old estimates are moved into."""
+        return archive_path_for(self._path)
+
+    def archive_estimates_before(self, cutoff_date: str) -> MaintenanceOutcome:
+        """Move estimates dated before ``cutoff_date`` into the archive file.
+
+        Estimates with a silver bar that is not yet issued stay live. History
+        pages and voucher lookups keep finding archived estimates.
+        """
+        if self.conn is None or self.cursor is None:
+            raise RuntimeError("The database is closed")
+        started = time.perf_counter()
+        with self._maintenance():
+            self.conn.commit()
+            try:
+                state = ensure_archive_state(self.cursor, self._path)
+                self.conn.commit()
+            except Error:
+                self.conn.rollback()
+                raise
+            with attached_database(
+                self.conn,
+                self.estimate_archive_path,
+                state.key,
+                salt=state.salt,
+                schema=ARCHIVE_SCHEMA,
+            ):
+                stats = archive_estimates(self.conn, cutoff_date)
+        self._reload_item_usage()
+        self.logger.info(
+            '[telemetry] {"metric":"estimate_archive","duration_ms":%.3f,'
+            '"estimates":%d,"lines":%d}',
+            (time.perf_counter() - started) * 1000.0,
+            stats.estimates,
+            stats.lines,
+        )
+        return MaintenanceOutcome(
+            MaintenanceStatus.SUCCESS,
+            f"Archived {stats.estimates} estimates dated before {cutoff_date}",
+            str(self.estimate_archive_path),
+        )
+
     def create_encrypted_backup(
-        self, destination: str | Path | None = None
+        self,
+        destination: str | Path | None = None,
+        *,
+        mode: BackupMode = BackupMode.EXPORT,
+        cancel_event: Any | None = None,
+        progress: BackupProgress | None = None,
     ) -> MaintenanceOutcome:
+        """Export, validate, and archive a device-bound copy of the database.
+
+        Safe to call from a worker thread. In ``EXPORT`` mode readers are
+        drained and the writer thread is held only while the export runs;
+        ``ONLINE`` mode copies pages from one snapshot without either.
+        Validation and archiving then work on the copy, hashing it while it is
+        streamed into the archive. Setting ``cancel_event`` raises
+        :class:`BackupCancelledError` and leaves no archive behind.
+        """
         destination_path = (
             Path(destination) if destination else self._path.with_suffix(".sedbbackup")
         )
         destination_path = destination_path.resolve()
-        with self._broker.maintenance():
-            assert self.conn is not None
-            self.conn.commit()
-            stage_dir = Path(
-                tempfile.mkdtemp(
-                    prefix=".silverestimate-backup-", dir=destination_path.parent
-                )
+        if self.conn is None:
+            raise RuntimeError("The database is closed")
+        assert self.database_salt is not None
+        self._session.commit_if_owner(self.conn)
+        phase_ms: dict[str, float] = {}
+        started = time.perf_counter()
+        stage_dir = Path(
+            tempfile.mkdtemp(
+                prefix=".silverestimate-backup-", dir=destination_path.parent
             )
-            try:
-                database_copy = stage_dir / "database.sqlcipher"
-                assert self.database_salt is not None
-                export_database(
-                    self.conn,
-                    database_copy,
-                    self.key,
-                    target_salt=self.database_salt,
-                )
-                self._validate_external(
-                    database_copy,
-                    self.key,
-                    self.database_salt,
+        )
+        try:
+            database_copy = stage_dir / DATABASE_MEMBER
+            if progress is not None:
+                progress("export", 0, 0)
+            archive_copy = stage_dir / ESTIMATE_ARCHIVE_MEMBER
+            if mode is BackupMode.ONLINE:
+                phase_ms["lock_wait"] = 0.0
+                schema_version, generation, archive_sha256 = self._online_backup_copy(
+                    database_copy, archive_copy, cancel_event, progress
                 )
-                schema_version = self._check_schema_version()
-                manifest = BackupManifest(
+                phase_ms["export"] = (time.perf_counter() - started) * 1000.0
+            else:
+                with self._maintenance():
+                    phase_ms["lock_wait"] = (time.perf_counter() - started) * 1000.0
+                    exported = time.perf_counter()
+                    schema_version, generation, archive_sha256 = (
+                        self._export_backup_copy(
+                            database_copy, archive_copy, cancel_event
+                        )
+                    )
+                    phase_ms["export"] = (time.perf_counter() - exported) * 1000.0
+
+            _raise_if_backup_cancelled(cancel_event)
+            if progress is not None:
+                progress("validate", 0, 0)
+            validated = time.perf_counter()
+            self._validate_external(database_copy, self.key, self.database_salt)
+            phase_ms["validate"] = (time.perf_counter() - validated) * 1000.0
+
+            _raise_if_backup_cancelled(cancel_event)
+            archived = time.perf_counter()
+            database_bytes = database_copy.stat().st_size
+            binding = crypto_utils.device_binding_fingerprint(self._device_secret)
+            stream_backup_archive(
+                database_copy,
+                destination_path,
+                lambda database_sha256: BackupManifest(
                     version=BACKUP_FORMAT_VERSION,
                     created_utc=datetime.now(UTC).isoformat(),
-                    database_sha256=sha256_file(database_copy),
+                    database_sha256=database_sha256,
                     schema_version=schema_version,
                     sqlcipher_version=self.driver_identity.sqlcipher_version,
-                    device_binding_fingerprint=(
-                        crypto_utils.device_binding_fingerprint(self._device_secret)
-                    ),
-                )
-                manifest_bytes = (
-                    json.dumps(
-                        manifest.to_dict(), sort_keys=True, separators=(",", ":")
-                    )
-                    + "\n"
-                ).encode()
-                manifest_digest = hashlib.sha256(manifest_bytes).hexdigest().encode()
-                archive_stage = destination_path.with_suffix(
-                    destination_path.suffix + ".tmp"
-                )
-                with zipfile.ZipFile(
-                    archive_stage, "w", compression=zipfile.ZIP_STORED
-                ) as archive:
-                    archive.write(database_copy, "database.sqlcipher")
-                    archive.writestr("manifest.json", manifest_bytes)
-                    archive.writestr("manifest.sha256", manifest_digest + b"\n")
-                os.replace(archive_stage, destination_path)
-            finally:
-                shutil.rmtree(stage_dir, ignore_errors=True)
+                    device_binding_fingerprint=binding,
+                    change_generation=generation,
+                    estimate_archive_sha256=archive_sha256,
+                ),
+                cancel_event=cancel_event,
+                progress=progress,
+                extra_members=(
+                    {ESTIMATE_ARCHIVE_MEMBER: archive_copy} if archive_sha256 else None
+                ),
+            )
+            phase_ms["archive"] = (time.perf_counter() - archived) * 1000.0
+        finally:
+            shutil.rmtree(stage_dir, ignore_errors=True)
+        self.logger.info(
+            '[telemetry] {"metric":"encrypted_backup_export","mode":"%s",'
+            '"duration_ms":%.3f,"lock_wait_ms":%.3f,"export_ms":%.3f,'
+            '"validate_ms":%.3f,"archive_ms":%.3f,"bytes":%d}',
+            mode.value,
+            (time.perf_counter() - started) * 1000.0,
+            phase_ms["lock_wait"],
+            phase_ms["export"],
+            phase_ms["validate"],
+            phase_ms["archive"],
+            database_bytes,
+        )
         return MaintenanceOutcome(
             MaintenanceStatus.SUCCESS,
             "Encrypted database backup created and validated",
             str(destination_path),
+            phase_ms=phase_ms,
         )
 
+    def _online_backup_copy(
+        self,
+        target: Path,
+        archive_target: Path,
+        cancel_event: Any | None,
+        progress: BackupProgress | None,
+    ) -> tuple[int, int, str | None]:
+        """Copy pages from a broker reader, then the estimate archive.
+
+        Returns the copy's schema version and generation and the archive
+        copy's digest.
+        """
+        assert self.database_salt is not None
+        source = self._broker.open_read_connection(cancel_event)
+        try:
+            copy, _identity = SqlCipherConnectionBroker(
+                target,
+                self.key,
+                database_salt=self.database_salt,
+                logger=self.logger,
+            ).open_writer(create=True)
+            try:
+
+                def step(done: int, total: int) -> None:
+                    _raise_if_backup_cancelled(cancel_event)
+                    if source.interrupted:
+                        raise MaintenanceBusyError(
+                            "Database maintenance interrupted the online backup"
+                        )
+                    if progress is not None:
+                        progress("export", done, total)
+
+                online_backup(source, copy, progress=step)
+                versions = self._backup_versions_of(copy)
+            finally:
+                copy.close()
+            return (*versions, self._estimate_archive_copy(source, archive_target))
+        finally:
+            source.close()
+
+    def _estimate_archive_copy(self, source: Any, target: Path) -> str | None:
+        """Copy the estimate archive seen by ``source``; return its digest.
+
+        Returns ``None`` when the database has no archive. The copy keeps the
+        archive's own key, which the database copy carries in its state row.
+        """
+        cursor = source.cursor()
+        with attach_archive(cursor) as archived:
+            state = read_archive_state(cursor)
+            if not archived or state is None:
+                return None
+            copy, _identity = SqlCipherConnectionBroker(
+                target, state.key, database_salt=state.salt, logger=self.logger
+            ).open_writer(create=True)
+            try:
+                online_backup(source, copy, step_sleep_s=0, schema=ARCHIVE_SCHEMA)
+            finally:
+                copy.close()
+        return sha256_file(target)
+
+    @staticmethod
+    def _schema_version_of(connection: Connection) -> int:
+        try:
+            row = connection.execute(
+                "SELECT MAX(version) FROM schema_version"
+            ).fetchone()
+        except OperationalError as exc:
+            if "no such table" in str(exc).lower():
+                return 0
+            raise
+        return int(row[0]) if row and row[0] is not None else 0
+
+    @classmethod
+    def _backup_versions_of(cls, connection: Connection) -> tuple[int, int]:
+        """Return the schema version and change-journal generation of a copy."""
+        try:
+            generation = current_generation(connection.cursor())
+        except OperationalError as exc:
+            if "no such table" not in str(exc).lower():
+                raise
+            generation = 0
+        return cls._schema_version_of(connection), generation
+
+    def _export_backup_copy(
+        self, target: Path, archive_target: Path, cancel_event: Any | None
+    ) -> tuple[int, int, str | None]:
+        """Export on a dedicated connection, then copy the estimate archive.
+
+        Returns the copy's schema version and generation and the archive
+        copy's digest.
+        """
+        assert self.database_salt is not None
+        source, _identity = self._broker.open_writer()
+        if cancel_event is not None:
+            source.set_progress_handler(lambda: int(cancel_event.is_set()), 1_000)
+        try:
+            export_database(source, target, self.key, target_salt=self.database_salt)
+            versions = self._backup_versions_of(source)
+            return (*versions, self._estimate_archive_copy(source, archive_target))
+        except OperationalError as exc:
+            if cancel_event is not None and cancel_event.is_set():
+                raise BackupCancelledError("Database backup cancelled.") from exc
+            raise
+        finally:
+            source.close()
+
     def stage_encrypted_restore(
         self, archive_path: str | Path, archive_password: str
     ) -> MaintenanceOutcome:
         archive_path = Path(archive_path).resolve()
-        with self._broker.maintenance():
+        with self._maintenance():
             stage_dir = Path(
                 tempfile.mkdtemp(
                     prefix=".silverestimate-restore-", dir=self._path.parent
                 )
             )
             try:
-                with zipfile.ZipFile(archive_path, "r") as archive:
-                    expected_names = {
-                        "database.sqlcipher",
-                        "manifest.json",
-                        "manifest.sha256",
-                    }
-                    if set(archive.namelist()) != expected_names:
-                        raise StorageMetadataError("Backup archive members are invalid")
-                    archive.extractall(stage_dir)
-                manifest_bytes = (stage_dir / "manifest.json").read_bytes()
-                recorded = (stage_dir / "manifest.sha256").read_text().strip()
-                if not hashlib.sha256(manifest_bytes).hexdigest() == recorded:
-                    raise StorageMetadataError("Backup manifest digest mismatch")
-                manifest = read_json(stage_dir / "manifest.json")
-                if manifest.get("version") != BACKUP_FORMAT_VERSION:
-                    raise StorageMetadataError(
-                        "Portable or unsupported database backups cannot be restored "
-                        "into a machine-bound installation"
-                    )
-                expected_binding = crypto_utils.device_binding_fingerprint(
-                    self._device_secret
+                manifest = self._unseal_archive(
+                    archive_path,
+                    stage_dir,
+                    members=ARCHIVE_MEMBERS,
+                    optional_members=frozenset({ESTIMATE_ARCHIVE_MEMBER}),
+                    version=BACKUP_FORMAT_VERSION,
+                    database_member=DATABASE_MEMBER,
                 )
-                if manifest.get("device_binding_fingerprint") != expected_binding:
-                    raise StorageMetadataError(
-                        "This database backup belongs to a different PC"
-                    )
-                archived_db = stage_dir / "database.sqlcipher"
-                if sha256_file(archived_db) != manifest.get("database_sha256"):
-                    raise StorageMetadataError("Backup database digest mismatch")
+                archived_db = stage_dir / DATABASE_MEMBER
                 backup_salt = self._read_database_salt(archived_db)
                 backup_key = self._derive_bound_key(archive_password, backup_salt)
                 source_broker = SqlCipherConnectionBroker(
@@ -728,12 +1372,16 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                 finally:
                     source.close()
                 self._validate_external(staged, self.key, self.database_salt)
+                archive_sha256 = self._stage_restored_archive(
+                    stage_dir / ESTIMATE_ARCHIVE_MEMBER, staged, manifest
+                )
                 journal = RestoreJournal(
                     version=JOURNAL_VERSION,
                     phase="ready",
                     staged_path=str(staged),
                     staged_sha256=sha256_file(staged),
                     retained_path=str(self._path.with_suffix(".pre-restore.sqlcipher")),
+                    staged_archive_sha256=archive_sha256,
                 )
                 write_journal(self._restore_journal, journal)
             finally:
@@ -744,6 +1392,350 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
             str(self._path.with_suffix(".restore.staged")),
         )
 
+    def _stage_restored_archive(
+        self, member: Path, staged: Path, manifest: dict[str, Any]
+    ) -> str | None:
+        """Place a backup's estimate archive beside the staged database.
+
+        Returns the staged archive's digest, or ``None`` when the backup has
+        no archive. The archive must open with the key the staged database
+        holds for it.
+        """
+        staged_archive = archive_path_for(staged)
+        self._remove_database_family(staged_archive)
+        if not member.is_file():
+            return None
+        digest = sha256_file(member)
+        if digest != manifest.get("estimate_archive_sha256"):
+            raise StorageMetadataError("Backup estimate archive digest mismatch")
+        os.replace(member, staged_archive)
+        connection, _identity = SqlCipherConnectionBroker(
+            staged, self.key, database_salt=self.database_salt, logger=self.logger
+        ).open_writer()
+        try:
+            with attach_archive(connection.cursor()) as attached:
+                if not attached:
+                    raise StorageMetadataError(
+                        "Backup estimate archive has no key in its database"
+                    )
+                connection.execute(
+                    f"SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.sqlite_master"
+                ).fetchone()
+        finally:
+            connection.close()
+        return digest
+
+    def _unseal_archive(  # noqa: PLR0913 - explicit archive layout
+        self,
+        archive_path: Path,
+        stage_dir: Path,
+        *,
+        members: frozenset[str],
+        version: int,
+        database_member: str,
+        optional_members: frozenset[str] = frozenset(),
+    ) -> dict[str, Any]:
+        """Extract a sealed archive and check its manifest, binding, and digest."""
+        with zipfile.ZipFile(archive_path, "r") as archive:
+            names = set(archive.namelist())
+            if not members <= names <= members | optional_members:
+                raise StorageMetadataError("Backup archive members are invalid")
+            archive.extractall(stage_dir)
+        manifest_bytes = (stage_dir / MANIFEST_MEMBER).read_bytes()
+        recorded = (stage_dir / MANIFEST_DIGEST_MEMBER).read_text().strip()
+        if not hashlib.sha256(manifest_bytes).hexdigest() == recorded:
+            raise StorageMetadataError("Backup manifest digest mismatch")
+        manifest = read_json(stage_dir / MANIFEST_MEMBER)
+        if manifest.get("version") != version:
+            raise StorageMetadataError(
+                "Portable or unsupported database backups cannot be restored "
+                "into a machine-bound installation"
+            )
+        expected_binding = crypto_utils.device_binding_fingerprint(self._device_secret)
+        if manifest.get("device_binding_fingerprint") != expected_binding:
+            raise StorageMetadataError("This database backup belongs to a different PC")
+        if sha256_file(stage_dir / database_member) != manifest.get("database_sha256"):
+            raise StorageMetadataError("Backup database digest mismatch")
+        return manifest
+
+    def change_generation(self) -> int:
+        """Return the newest change-journal generation of the live database."""
+        reader = self._broker.open_read_connection()
+        try:
+            return current_generation(reader.cursor())
+        finally:
+            reader.close()
+
+    def create_differential_backup(
+        self,
+        destination: str | Path,
+        since_generation: int,
+        *,
+        cancel_event: Any | None = None,
+        progress: BackupProgress | None = None,
+    ) -> MaintenanceOutcome:
+        """Archive only the rows changed after ``since_generation``.
+
+        ``since_generation`` is normally the ``change_generation`` recorded in
+        the full backup or previous differential this one builds on. The
+        export reads one snapshot on a dedicated connection, so neither the
+        writer thread nor readers are paused. Raises
+        :class:`~silverestimate.persistence.change_journal.ChangeJournalError`
+        when the journal no longer reaches back to ``since_generation``.
+        """
+        destination_path = Path(destination).resolve()
+        if self.conn is None:
+            raise RuntimeError("The database is closed")
+        assert self.database_salt is not None
+        self._session.commit_if_owner(self.conn)
+        phase_ms: dict[str, float] = {}
+        started = time.perf_counter()
+        stage_dir = Path(
+            tempfile.mkdtemp(
+                prefix=".silverestimate-backup-", dir=destination_path.parent
+            )
+        )
+        try:
+            changes = stage_dir / CHANGES_MEMBER
+            if progress is not None:
+                progress("export", 0, 0)
+            schema_version, stats = self._export_differential_copy(
+                changes, since_generation, cancel_event
+            )
+            phase_ms["export"] = (time.perf_counter() - started) * 1000.0
+
+            _raise_if_backup_cancelled(cancel_event)
+            if progress is not None:
+                progress("validate", 0, 0)
+            validated = time.perf_counter()
+            connection, _identity = SqlCipherConnectionBroker(
+                changes,
+                self.key,
+                database_salt=self.database_salt,
+                logger=self.logger,
+            ).open_writer()
+            try:
+                self.verify_database_integrity(connection)
+            finally:
+                connection.close()
+            phase_ms["validate"] = (time.perf_counter() - validated) * 1000.0
+
+            _raise_if_backup_cancelled(cancel_event)
+            archived = time.perf_counter()
+            binding = crypto_utils.device_binding_fingerprint(self._device_secret)
+            stream_backup_archive(
+                changes,
+                destination_path,
+                lambda database_sha256: DifferentialManifest(
+                    version=DIFFERENTIAL_FORMAT_VERSION,
+                    created_utc=datetime.now(UTC).isoformat(),
+                    database_sha256=database_sha256,
+                    schema_version=schema_version,
+                    sqlcipher_version=self.driver_identity.sqlcipher_version,
+                    base_generation=stats.base_generation,
+                    generation=stats.generation,
+                    upserted_rows=stats.upserted_rows,
+                    deleted_rows=stats.deleted_rows,
+                    device_binding_fingerprint=binding,
+                ),
+                cancel_event=cancel_event,
+                progress=progress,
+                member=CHANGES_MEMBER,
+            )
+            phase_ms["archive"] = (time.perf_counter() - archived) * 1000.0
+        finally:
+            shutil.rmtree(stage_dir, ignore_errors=True)
+        self.logger.info(
+            '[telemetry] {"metric":"differential_backup_export","duration_ms":%.3f,'
+            '"export_ms":%.3f,"validate_ms":%.3f,"archive_ms":%.3f,'
+            '"base_generation":%d,"generation":%d,"upserted_rows":%d,'
+            '"deleted_rows":%d}',
+            (time.perf_counter() - started) * 1000.0,
+            phase_ms["export"],
+            phase_ms["validate"],
+            phase_ms["archive"],
+            stats.base_generation,
+            stats.generation,
+            stats.upserted_rows,
+            stats.deleted_rows,
+        )
+        return MaintenanceOutcome(
+            MaintenanceStatus.SUCCESS,
+            f"Differential backup of generations {stats.base_generation + 1}-"
+            f"{stats.generation} created and validated",
+            str(destination_path),
+            phase_ms=phase_ms,
+        )
+
+    def _export_differential_copy(
+        self, target: Path, since_generation: int, cancel_event: Any | None
+    ) -> tuple[int, DifferentialStats]:
+        """Write the changed rows into a new keyed file from one snapshot."""
+        assert self.database_salt is not None
+        source, _identity = self._broker.open_writer()
+        if cancel_event is not None:
+            source.set_progress_handler(lambda: int(cancel_event.is_set()), 1_000)
+        try:
+            with attached_database(
+                source,
+                target,
+                self.key,
+                salt=self.database_salt,
+                schema=DIFFERENTIAL_SCHEMA,
+            ):
+                source.execute("BEGIN")
+                try:
+                    stats = write_differential(
+                        source.cursor(), DIFFERENTIAL_SCHEMA, since_generation
+                    )
+                    schema_version = self._schema_version_of(source)
+                    source.commit()
+                except BaseException:
+                    source.rollback()
+                    raise
+            return schema_version, stats
+        except OperationalError as exc:
+            if cancel_event is not None and cancel_event.is_set():
+                raise BackupCancelledError("Database backup cancelled.") from exc
+            raise
+        finally:
+            source.close()
+
+    def apply_differential_backup(
+        self, archive_path: str | Path, archive_password: str
+    ) -> MaintenanceOutcome:
+        """Replay a differential archive onto this database in one transaction.
+
+        The database must sit exactly inside the archive's generation range,
+        for example a restored full backup taken at its base generation. The
+        archive password is the one that was current when it was created.
+        """
+        archive_path = Path(archive_path).resolve()
+        started = time.perf_counter()
+        with self._maintenance():
+            assert self.conn is not None
+            stage_dir = Path(
+                tempfile.mkdtemp(
+                    prefix=".silverestimate-restore-", dir=self._path.parent
+                )
+            )
+            try:
+                manifest = self._unseal_archive(
+                    archive_path,
+                    stage_dir,
+                    members=DIFFERENTIAL_MEMBERS,
+                    version=DIFFERENTIAL_FORMAT_VERSION,
+                    database_member=CHANGES_MEMBER,
+                )
+                self.conn.commit()
+                if manifest.get("schema_version") != self._check_schema_version():
+                    raise StorageMetadataError(
+                        "This differential backup was taken from a different "
+                        "schema version"
+                    )
+                changes = stage_dir / CHANGES_MEMBER
+                changes_salt = self._read_database_salt(changes)
+                changes_key = self._derive_bound_key(archive_password, changes_salt)
+                with attached_database(
+                    self.conn,
+                    changes,
+                    changes_key,
+                    salt=changes_salt,
+                    schema=DIFFERENTIAL_SCHEMA,
+                ):
+                    stats, item_codes = self._apply_attached_differential(
+                        (manifest.get("base_generation"), manifest.get("generation"))
+                    )
+            finally:
+                shutil.rmtree(stage_dir, ignore_errors=True)
+        for code in item_codes:
+            self._item_cache_controller.invalidate(code)
+        if item_codes:
+            # Searches fall back to SQL until the catalog is reloaded.
+            self.start_preload_item_cache()
+        self._reload_item_usage()
+        self.logger.info(
+            '[telemetry] {"metric":"differential_backup_apply","duration_ms":%.3f,'
+            '"base_generation":%d,"generation":%d,"upserted_rows":%d,'
+            '"deleted_rows":%d}',
+            (time.perf_counter() - started) * 1000.0,
+            stats.base_generation,
+            stats.generation,
+            stats.upserted_rows,
+            stats.deleted_rows,
+        )
+        return MaintenanceOutcome(
+            MaintenanceStatus.SUCCESS,
+            f"Applied changes up to generation {stats.generation}",
+        )
+
+    def _apply_attached_differential(
+        self, manifest_range: tuple[Any, Any]
+    ) -> tuple[DifferentialStats, list[str]]:
+        assert self.conn is not None and self.cursor is not None
+        cursor = self.cursor
+        if read_differential_range(cursor, DIFFERENTIAL_SCHEMA) != manifest_range:
+            raise StorageMetadataError("Differential range does not match its manifest")
+        item_codes = [
+            str(row[0])
+            for row in cursor.execute(
+                f"SELECT DISTINCT row_key FROM {DIFFERENTIAL_SCHEMA}.{DIFF_JOURNAL} "  # nosec B608
+                "WHERE table_name = 'items'"
+            )
+        ]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("PRAGMA defer_foreign_keys = ON")
+            stats = apply_differential(cursor, DIFFERENTIAL_SCHEMA)
+            if cursor.execute("PRAGMA main.foreign_key_check").fetchone():
+                raise DatabaseError(
+                    "The differential backup does not match this database's rows"
+                )
+            if usage_exists(cursor):
+                rebuild_usage(cursor)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        return stats, item_codes
+
+    def _reload_item_usage(self) -> None:
+        """Hand the item cache fresh usage statistics after a bulk change."""
+        if self.cursor is None:
+            return
+        try:
+            usage = read_usage(self.cursor) if usage_exists(self.cursor) else {}
+        except Error as exc:
+            self.logger.debug("Failed to reload item usage: %s", exc)
+            return
+        self._item_cache_controller.replace_usage(usage)
+
+    def prune_change_journal(self, through_generation: int) -> int:
+        """Drop journal rows up to ``through_generation`` once a full backup covers them.
+
+        Differentials based before that generation are refused afterwards.
+        Returns the number of journal rows removed.
+        """
+        if self.conn is None or self.cursor is None:
+            raise RuntimeError("The database is closed")
+        through_generation = min(
+            int(through_generation), current_generation(self.cursor)
+        )
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            removed = prune_journal(self.cursor, through_generation)
+            self.conn.commit()
+        except Error:
+            self.conn.rollback()
+            raise
+        self.logger.info(
+            "Pruned %d %s rows through generation %d",
+            removed,
+            CHANGE_JOURNAL,
+            through_generation,
+        )
+        return removed
+
     def change_passwords(self, new_password: str) -> MaintenanceOutcome:
         return self._copy_switch_rekey(new_password)
 
@@ -755,7 +1747,7 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
         new_key = self._derive_bound_key(new_password, new_salt)
         target = self._path.with_suffix(".rekey.target")
         retained = self._path.with_suffix(".pre-rekey.sqlcipher")
-        with self._broker.maintenance():
+        with self._maintenance():
             assert self.conn is not None
             self.conn.commit()
             self._remove_database_family(target)
@@ -786,6 +1778,7 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                     self.key,
                     database_salt=self.database_salt,
                     logger=self.logger,
+                    statement_stats=self._statement_stats,
                 )
                 self.conn, self.driver_identity = self._broker.open_writer()
                 self._bind_connection()
@@ -804,6 +1797,7 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                     self._path,
                     self.key,
                     database_salt=self.database_salt,
+                    statement_stats=self._statement_stats,
                 )
                 self.conn, self.driver_identity = self._broker.open_writer()
                 self._bind_connection()
@@ -887,9 +1881,39 @@ class DatabaseManager(DatabaseRepositoryFacadeMixin):
                 "Pending restore activation failed and was rolled back: %s", exc
             )
             return
+        self._activate_restored_archive(
+            staged, retained, journal.get("staged_archive_sha256")
+        )
         self._restore_journal.unlink(missing_ok=True)
         self.open_status = DatabaseOpenStatus.RESTORE_ACTIVATED
 
+    def _activate_restored_archive(
+        self, staged: Path, retained: Path, staged_sha256: str | None
+    ) -> None:
+        """Swap in the restored estimate archive beside the restored database.
+
+        The previous archive always moves aside with the retained database,
+        so a backup taken before archiving never inherits an archive whose
+        key it lacks.
+        """
+        live = self.estimate_archive_path
+        staged_archive = archive_path_for(staged)
+        retained_archive = archive_path_for(retained)
+        self._remove_database_family(retained_archive)
+        if live.exists():
+            os.replace(live, retained_archive)
+        self._remove_database_family(live)
+        if staged_sha256 is None:
+            return
+        if not staged_archive.is_file() or sha256_file(staged_archive) != staged_sha256:
+            self.logger.error(
+                "Restored estimate archive is missing or corrupt; "
+                "archived estimates are unavailable"
+            )
+            self._remove_database_family(staged_archive)
+            return
+        os.replace(staged_archive, live)
+
     def _resolve_interrupted_rekey(self, password: str) -> None:
         if not self._rekey_journal.exists():
             return
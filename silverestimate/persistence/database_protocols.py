@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Iterable, Mapping
-from typing import Any, Protocol
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Protocol
 
 from silverestimate.persistence.database_driver import (
     Connection,
@@ -12,6 +13,9 @@ from silverestimate.persistence.database_driver import (
     ReadConnection,
 )
 
+if TYPE_CHECKING:
+    from silverestimate.persistence.estimates_repository import EstimateSaveOutcome
+
 DatabaseRecord = Mapping[str, Any]
 ReadConnectionFactory = Callable[[], ReadConnection]
 
@@ -25,8 +29,28 @@ class ItemCacheBoundary(Protocol):
 
     def invalidate(self, code: str) -> None: ...
 
+    def remove(self, code: str) -> None: ...
+
     def replace_all(self, rows: Iterable[object] | None) -> None: ...
 
+    def clear(self) -> None: ...
+
+    def start_preload(self, connection_factory: Callable[[], Any] | None) -> None: ...
+
+    def knows_absent(self, code: str) -> bool: ...
+
+    def get_many(self, codes: Iterable[str]) -> dict[str, dict[str, Any]] | None: ...
+
+    def search_rows(self, search_term: str) -> list[dict[str, Any]] | None: ...
+
+    def search_for_selection(
+        self, search_term: str, limit: int
+    ) -> tuple[list[dict[str, Any]], bool] | None: ...
+
+    def record_usage(self, deltas: Mapping[str, tuple[int, float]]) -> None: ...
+
+    def replace_usage(self, usage: Mapping[str, tuple[int, float]]) -> None: ...
+
 
 class SilverBarDeletionBoundary(Protocol):
     """Silver-bar commands needed while deleting an estimate."""
@@ -64,7 +88,7 @@ class ItemCatalogDatabase(Protocol):
         items: list[dict[str, Any]],
         *,
         replace_existing: bool = False,
-    ) -> dict[str, int]: ...
+    ) -> Future[dict[str, int]]: ...
 
 
 class MainCommandsDatabase(ItemCatalogDatabase, Protocol):
@@ -74,7 +98,7 @@ class MainCommandsDatabase(ItemCatalogDatabase, Protocol):
 
     def setup_database(self) -> None: ...
 
-    def delete_all_estimates(self) -> bool: ...
+    def delete_all_estimates(self) -> Future[bool]: ...
 
     def open_read_connection(self) -> ReadConnection: ...
 
@@ -98,7 +122,7 @@ class EstimateDataSource(Protocol):
         voucher_no: str,
     ) -> DatabaseRecord | None: ...
 
-    def save_estimate_with_returns(  # noqa: PLR0913 - existing persistence API
+    def save_estimate_with_silver_bars(  # noqa: PLR0913 - existing persistence API
         self,
         voucher_no: str,
         date: str,
@@ -106,15 +130,10 @@ class EstimateDataSource(Protocol):
         regular_items: list[DatabaseRecord],
         return_items: list[DatabaseRecord],
         totals: dict[str, Any],
-    ) -> bool: ...
-
-    def sync_silver_bars_for_estimate(
-        self,
-        voucher_no: str,
-        bars: list[DatabaseRecord],
-    ) -> tuple[int, int]: ...
+        silver_bars: list[DatabaseRecord] | None = None,
+    ) -> Future[EstimateSaveOutcome]: ...
 
-    def delete_single_estimate(self, voucher_no: str) -> bool: ...
+    def delete_single_estimate(self, voucher_no: str) -> Future[bool]: ...
 
 
 class StartupDatabase(Protocol):
@@ -2,7 +2,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+from silverestimate.infrastructure.write_futures import map_future, settled_future
+from silverestimate.persistence.write_commands import (
+    AddItem,
+    AssignBarsToList,
+    AssignBarToList,
+    CreateSilverBarList,
+    DeleteAllEstimates,
+    DeleteEstimate,
+    DeleteItem,
+    DeleteSilverBarList,
+    DeleteSilverBarListResult,
+    IssueSilverBarList,
+    ReactivateSilverBarList,
+    RemoveBarFromList,
+    RemoveBarsFromList,
+    SaveEstimate,
+    SyncSilverBars,
+    UpdateItem,
+    UpdateSilverBarListNote,
+    UpsertItemCatalog,
+    WriteCommand,
+)
 
 if TYPE_CHECKING:
     from silverestimate.infrastructure.item_cache import ItemCacheController
@@ -44,6 +68,14 @@ class DatabaseRepositoryFacadeMixin:
             self,
         ) -> SilverBarSynchronizationRepository: ...
 
+    def _run_write(self, command: WriteCommand) -> Future[Any]:
+        """Apply a repository write and return its value as a settled future.
+
+        ``DatabaseManager`` queues the command on its writer instead, so every
+        write method returns a future whatever runs it.
+        """
+        return settled_future(lambda: command.apply(self))
+
     def get_item_by_code(self, code):
         return self.items_repo.get_item_by_code(code)
 
@@ -74,26 +106,22 @@ class DatabaseRepositoryFacadeMixin:
         return self.items_repo.get_all_items()
 
     def add_item(self, code, name, purity, wage_type, wage_rate, tunch=None):
-        if tunch is None:
-            return self.items_repo.add_item(code, name, purity, wage_type, wage_rate)
-        return self.items_repo.add_item(
-            code, name, purity, wage_type, wage_rate, tunch=tunch
+        return self._run_write(
+            AddItem(code, name, purity, wage_type, wage_rate, tunch=tunch)
         )
 
     def update_item(self, code, name, purity, wage_type, wage_rate, tunch=None):
-        if tunch is None:
-            return self.items_repo.update_item(code, name, purity, wage_type, wage_rate)
-        return self.items_repo.update_item(
-            code, name, purity, wage_type, wage_rate, tunch=tunch
+        return self._run_write(
+            UpdateItem(code, name, purity, wage_type, wage_rate, tunch=tunch)
         )
 
     def upsert_item_catalog(self, items, *, replace_existing=False):
-        return self.items_repo.upsert_item_catalog(
-            items, replace_existing=replace_existing
+        return self._run_write(
+            UpsertItemCatalog(list(items), replace_existing=replace_existing)
         )
 
     def delete_item(self, code):
-        return self.items_repo.delete_item(code)
+        return self._run_write(DeleteItem(code))
 
     def get_estimate_by_voucher(self, voucher_no):
         return self.estimates_repo.get_estimate_by_voucher(voucher_no)
@@ -115,6 +143,7 @@ class DatabaseRepositoryFacadeMixin:
         voucher_search=None,
         cursor=None,
         limit=500,
+        use_cache=True,
     ):
         return self.estimates_repo.get_estimate_history_page(
             date_from=date_from,
@@ -122,10 +151,11 @@ class DatabaseRepositoryFacadeMixin:
             voucher_search=voucher_search,
             cursor=cursor,
             limit=limit,
+            use_cache=use_cache,
         )
 
-    def get_first_estimate_date(self):
-        return self.estimates_repo.get_first_estimate_date()
+    def get_first_estimate_date(self, *, use_cache=True):
+        return self.estimates_repo.get_first_estimate_date(use_cache=use_cache)
 
     def generate_voucher_no(self):
         return self.estimates_repo.generate_voucher_no()
@@ -133,8 +163,7 @@ class DatabaseRepositoryFacadeMixin:
     def save_estimate_with_returns(
         self, voucher_no, date, silver_rate, regular_items, return_items, totals
     ):
-        self.last_error = None
-        return self.estimates_repo.save_estimate_with_returns(
+        saved = self.save_estimate_with_silver_bars(
             voucher_no,
             date,
             silver_rate,
@@ -142,65 +171,82 @@ class DatabaseRepositoryFacadeMixin:
             return_items,
             totals,
         )
+        return map_future(saved, lambda outcome: outcome.saved)
+
+    def save_estimate_with_silver_bars(
+        self,
+        voucher_no,
+        date,
+        silver_rate,
+        regular_items,
+        return_items,
+        totals,
+        silver_bars=None,
+    ):
+        self.last_error = None
+        return self._run_write(
+            SaveEstimate(
+                voucher_no,
+                date,
+                silver_rate,
+                list(regular_items or []),
+                list(return_items or []),
+                totals,
+                None if silver_bars is None else list(silver_bars),
+            )
+        )
 
     def delete_all_estimates(self):
-        return self.estimates_repo.delete_all_estimates()
+        return self._run_write(DeleteAllEstimates())
 
     def delete_single_estimate(self, voucher_no):
-        return self.estimates_repo.delete_single_estimate(voucher_no)
+        return self._run_write(DeleteEstimate(voucher_no))
 
     def create_silver_bar_list(self, note=None):
-        return self.silver_bar_command_repo.create_list(note)
+        return self._run_write(CreateSilverBarList(note))
 
-    def get_silver_bar_lists(self, include_issued=True):
-        return self.silver_bar_query_repo.get_lists(include_issued)
+    def get_silver_bar_lists(self, include_issued=True, *, use_cache=True):
+        return self.silver_bar_query_repo.get_lists(include_issued, use_cache=use_cache)
 
-    def get_silver_bar_list_details(self, list_id):
-        return self.silver_bar_query_repo.get_list_details(list_id)
+    def get_silver_bar_list_details(self, list_id, *, use_cache=True):
+        return self.silver_bar_query_repo.get_list_details(list_id, use_cache=use_cache)
 
     def get_silver_bar_list_details_result(self, list_id):
         return self.silver_bar_query_repo.get_list_details_result(list_id)
 
     def update_silver_bar_list_note(self, list_id, new_note):
-        return self.silver_bar_command_repo.update_list_note(list_id, new_note)
+        return self._run_write(UpdateSilverBarListNote(list_id, new_note))
 
     def delete_silver_bar_list(self, list_id):
-        return self.silver_bar_command_repo.delete_list(list_id)
+        return self._run_write(DeleteSilverBarList(list_id))
 
     def delete_silver_bar_list_result(self, list_id):
-        return self.silver_bar_command_repo.delete_list_result(list_id)
+        return self._run_write(DeleteSilverBarListResult(list_id))
 
     def assign_bar_to_list(
         self, bar_id, list_id, note="Assigned to list", perform_commit=True
     ):
-        return self.silver_bar_command_repo.assign_bar_to_list(
-            bar_id,
-            list_id,
-            note=note,
-            perform_commit=perform_commit,
-        )
+        if not perform_commit:
+            # The caller owns the open transaction on this connection.
+            return self.silver_bar_command_repo.assign_bar_to_list(
+                bar_id, list_id, note=note, perform_commit=False
+            )
+        return self._run_write(AssignBarToList(bar_id, list_id, note=note))
 
     def remove_bar_from_list(
         self, bar_id, note="Removed from list", perform_commit=True
     ):
-        return self.silver_bar_command_repo.remove_bar_from_list(
-            bar_id,
-            note=note,
-            perform_commit=perform_commit,
-        )
+        if not perform_commit:
+            return self.silver_bar_command_repo.remove_bar_from_list(
+                bar_id, note=note, perform_commit=False
+            )
+        return self._run_write(RemoveBarFromList(bar_id, note=note))
 
     def assign_bars_to_list_bulk(self, bar_ids, list_id, note="Assigned to list"):
-        return self.silver_bar_command_repo.assign_bars_to_list_bulk(
-            bar_ids,
-            list_id,
-            note=note,
-        )
+        return self._run_write(AssignBarsToList(list(bar_ids), list_id, note=note))
 
     def remove_bars_from_list_bulk(self, bar_ids, note="Removed from list"):
-        return self.silver_bar_command_repo.remove_bars_from_list_bulk(
-            bar_ids,
-            note=note,
-        )
+        return self._run_write(RemoveBarsFromList(list(bar_ids), note=note))
 
     def get_bars_in_list(self, list_id, limit=None, offset=0):
         return self.silver_bar_query_repo.get_bars_in_list(
@@ -263,6 +309,29 @@ class DatabaseRepositoryFacadeMixin:
             limit=limit,
         )
 
+    def get_available_silver_bars_totals(
+        self,
+        *,
+        weight_query=None,
+        weight_tolerance=0.001,
+        min_purity=None,
+        max_purity=None,
+        date_range=None,
+    ):
+        return self.silver_bar_query_repo.get_available_bars_totals(
+            weight_query=weight_query,
+            weight_tolerance=weight_tolerance,
+            min_purity=min_purity,
+            max_purity=max_purity,
+            date_range=date_range,
+        )
+
+    def get_silver_bars_in_list_totals(self, list_id):
+        return self.silver_bar_query_repo.get_bars_in_list_totals(list_id)
+
+    def get_silver_bar_inventory_totals(self):
+        return self.silver_bar_query_repo.get_inventory_totals()
+
     def search_silver_bar_history(
         self,
         *,
@@ -295,21 +364,20 @@ class DatabaseRepositoryFacadeMixin:
             limit=limit,
         )
 
-    def count_silver_bars_by_list_ids(self, list_ids):
-        return self.silver_bar_query_repo.count_bars_by_list_ids(list_ids)
+    def count_silver_bars_by_list_ids(self, list_ids, *, use_cache=True):
+        return self.silver_bar_query_repo.count_bars_by_list_ids(
+            list_ids, use_cache=use_cache
+        )
 
     def mark_silver_bar_list_as_issued(self, list_id, issued_date=None):
-        return self.silver_bar_command_repo.mark_list_as_issued(
-            list_id,
-            issued_date=issued_date,
-        )
+        return self._run_write(IssueSilverBarList(list_id, issued_date=issued_date))
 
     def reactivate_silver_bar_list(self, list_id):
-        return self.silver_bar_command_repo.reactivate_list(list_id)
+        return self._run_write(ReactivateSilverBarList(list_id))
 
     def sync_silver_bars_for_estimate(self, voucher_no, bars):
-        result = self.silver_bar_synchronization_repo.synchronize(voucher_no, bars)
-        return result.added, result.failed
+        synced = self._run_write(SyncSilverBars(voucher_no, list(bars)))
+        return map_future(synced, lambda result: (result.added, result.failed))
 
     def get_silver_bars(
         self,
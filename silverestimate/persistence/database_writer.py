@@ -0,0 +1,520 @@
+"""Single-threaded writer actor that owns a dedicated write connection."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from silverestimate.infrastructure.item_cache import ItemCacheController
+from silverestimate.persistence.change_monitor import (
+    ChangeMonitor,
+    track_local_changes,
+)
+from silverestimate.persistence.database_driver import Connection, Cursor, Error
+from silverestimate.persistence.database_repository_facade import (
+    DatabaseRepositoryFacadeMixin,
+)
+from silverestimate.persistence.query_cache import QueryCache
+from silverestimate.persistence.write_commands import (
+    AddItem,
+    AssignBarsToList,
+    AssignBarToList,
+    CreateSilverBarList,
+    DeleteAllEstimates,
+    DeleteEstimate,
+    DeleteItem,
+    DeleteSilverBarList,
+    DeleteSilverBarListResult,
+    IssueSilverBarList,
+    ReactivateSilverBarList,
+    RemoveBarFromList,
+    RemoveBarsFromList,
+    SaveEstimate,
+    SyncSilverBars,
+    UpdateItem,
+    UpdateSilverBarListNote,
+    UpsertItemCatalog,
+    WriteCommand,
+)
+
+DEFAULT_MAX_BATCH = 32
+WRITE_LATENCY_SAMPLES = 256
+_COMMAND_SAVEPOINT = "writer_command"
+
+
+@dataclass(frozen=True)
+class WriteOutcome:
+    """Result of one command, including how long it queued and ran."""
+
+    command: str
+    value: Any
+    error: str | None
+    wait_ms: float
+    run_ms: float
+    batch_size: int
+
+    @property
+    def latency_ms(self) -> float:
+        return self.wait_ms + self.run_ms
+
+
+@dataclass(frozen=True)
+class WriterMetrics:
+    """Point-in-time writer counters for telemetry and diagnostics."""
+
+    submitted: int
+    completed: int
+    failed: int
+    batches: int
+    queue_depth: int
+    max_queue_depth: int
+    latency_p95_ms: float
+    latency_max_ms: float
+
+    @property
+    def mean_batch_size(self) -> float:
+        finished = self.completed + self.failed
+        return finished / self.batches if self.batches else 0.0
+
+
+class WriterSession(DatabaseRepositoryFacadeMixin):
+    """Repository surface bound to the writer thread's own connection."""
+
+    def __init__(  # noqa: PLR0913 - keyword-only session wiring
+        self,
+        connection: Connection,
+        *,
+        logger: logging.Logger,
+        item_cache_controller: ItemCacheController | None = None,
+        query_cache: QueryCache | None = None,
+        change_monitor: ChangeMonitor | None = None,
+        read_connection_factory: Callable[..., Any] | None = None,
+        database_path: str = "",
+    ) -> None:
+        self.logger = logger
+        self.database_path = database_path
+        self.last_error: str | None = None
+        self.raw_conn = connection
+        self.conn: Connection | None = connection
+        self.cursor: Cursor | None = connection.cursor()
+        self._item_cache_controller = item_cache_controller
+        self._query_cache = query_cache
+        self._change_monitor = change_monitor
+        if change_monitor is not None:
+            track_local_changes(self.cursor)
+        self._uncommitted_tables: set[str] | None = None
+        self._read_connection_factory = read_connection_factory
+        self._repos: dict[str, Any] = {}
+
+    @property
+    def item_cache_controller(self) -> ItemCacheController | None:
+        return self._item_cache_controller
+
+    @property
+    def query_cache(self) -> QueryCache | None:
+        return self._query_cache
+
+    def invalidate_tables(self, *tables: str) -> None:
+        """Expire cached reads of ``tables``, after the batch commits if in one."""
+        if self._uncommitted_tables is not None:
+            self._uncommitted_tables.update(tables)
+            return
+        if self._query_cache is not None:
+            self._query_cache.invalidate(*tables)
+        self._claim_local_changes()
+
+    @contextmanager
+    def deferred_invalidation(self) -> Iterator[None]:
+        """Hold table invalidations until the enclosing transaction has ended.
+
+        A batched command's own ``commit`` only releases its savepoint; bumping
+        generations then would let a reader cache rows from before the batch
+        commits under the new generation.
+        """
+        self._uncommitted_tables = set()
+        try:
+            yield
+        finally:
+            tables, self._uncommitted_tables = self._uncommitted_tables, None
+            if tables and self._query_cache is not None:
+                self._query_cache.invalidate(*tables)
+            self._claim_local_changes()
+
+    def _claim_local_changes(self) -> None:
+        if self._change_monitor is not None and self.cursor is not None:
+            self._change_monitor.claim_local(self.cursor)
+
+    def open_read_connection(self, cancel_event: Any | None = None) -> Any:
+        if self._read_connection_factory is None:
+            raise RuntimeError("No read connection factory is configured")
+        return self._read_connection_factory(cancel_event)
+
+    def _repo(self, name: str, factory: Callable[[Any], Any]) -> Any:
+        repo = self._repos.get(name)
+        if repo is None:
+            repo = self._repos[name] = factory(self)
+        return repo
+
+    @property
+    def items_repo(self):
+        from silverestimate.persistence.items_repository import ItemsRepository
+
+        return self._repo("items", ItemsRepository)
+
+    @property
+    def estimates_repo(self):
+        from silverestimate.persistence.estimates_repository import (
+            EstimatesRepository,
+        )
+
+        return self._repo("estimates", EstimatesRepository)
+
+    @property
+    def silver_bar_query_repo(self):
+        from silverestimate.persistence.silver_bar_query_repository import (
+            SilverBarQueryRepository,
+        )
+
+        return self._repo("silver_bar_query", SilverBarQueryRepository)
+
+    @property
+    def silver_bar_command_repo(self):
+        from silverestimate.persistence.silver_bar_command_repository import (
+            SilverBarCommandRepository,
+        )
+
+        return self._repo("silver_bar_command", SilverBarCommandRepository)
+
+    @property
+    def silver_bar_synchronization_repo(self):
+        from silverestimate.persistence.silver_bar_synchronization_repository import (
+            SilverBarSynchronizationRepository,
+        )
+
+        return self._repo(
+            "silver_bar_synchronization", SilverBarSynchronizationRepository
+        )
+
+    def close(self) -> None:
+        try:
+            if self.raw_conn.in_transaction:
+                self.raw_conn.rollback()
+        finally:
+            self.raw_conn.close()
+
+
+class _SavepointConnection:
+    """Map a batched command's own transaction calls onto its savepoint."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def execute(self, sql: str, *args: Any) -> Any:
+        if sql.lstrip().upper().startswith("BEGIN"):
+            return self._connection.cursor()
+        return self._connection.execute(sql, *args)
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        self._connection.execute(f"ROLLBACK TO {_COMMAND_SAVEPOINT}")
+
+
+@dataclass
+class _PendingWrite:
+    command: WriteCommand
+    future: Future[WriteOutcome]
+    enqueued: float
+
+
+class DatabaseWriter:
+    """Run repository writes on one thread that owns the write connection.
+
+    Callers submit typed commands and receive futures. Adjacent batchable
+    commands share one ``BEGIN IMMEDIATE``/``COMMIT``; other commands keep
+    the repository's own transaction. Maintenance can :meth:`hold` the writer,
+    which closes its connection until the hold ends.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], WriterSession],
+        *,
+        logger: logging.Logger | None = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        name: str = "database-writer",
+    ) -> None:
+        self._session_factory = session_factory
+        self._logger = logger or logging.getLogger(__name__)
+        self._max_batch = max(1, int(max_batch))
+        self._condition = threading.Condition()
+        self._queue: deque[_PendingWrite] = deque()
+        self._session: WriterSession | None = None
+        self._busy = False
+        self._held = 0
+        self._shutdown = False
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._latency_ms: deque[float] = deque(maxlen=WRITE_LATENCY_SAMPLES)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, command: WriteCommand) -> Future[WriteOutcome]:
+        """Queue ``command`` and return a future for its :class:`WriteOutcome`."""
+        future: Future[WriteOutcome] = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("DatabaseWriter has been shut down.")
+            self._queue.append(_PendingWrite(command, future, time.perf_counter()))
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._condition.notify_all()
+        return future
+
+    @property
+    def queue_depth(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def idle(self) -> bool:
+        """Whether no command is running or queued."""
+        with self._condition:
+            return not (self._busy or self._queue)
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Finish the running batch, close the connection, and pause the queue."""
+        with self._condition:
+            self._held += 1
+            self._condition.notify_all()
+            while self._thread.is_alive() and (self._busy or self._session is not None):
+                self._condition.wait(0.25)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._held -= 1
+                self._condition.notify_all()
+
+    def shutdown(self, timeout: float = 15.0) -> bool:
+        """Drain queued commands, close the connection, and stop the thread."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(max(0.0, timeout))
+        with self._condition:
+            abandoned = list(self._queue)
+            self._queue.clear()
+        for pending in abandoned:
+            pending.future.set_exception(
+                RuntimeError("DatabaseWriter stopped before the command ran")
+            )
+        return not self._thread.is_alive()
+
+    def metrics(self) -> WriterMetrics:
+        with self._condition:
+            samples = sorted(self._latency_ms)
+            return WriterMetrics(
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                batches=self._batches,
+                queue_depth=len(self._queue),
+                max_queue_depth=self._max_queue_depth,
+                latency_p95_ms=(
+                    samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                    if samples
+                    else 0.0
+                ),
+                latency_max_ms=samples[-1] if samples else 0.0,
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._held or not (self._queue or self._shutdown):
+                    if self._session is not None:
+                        self._close_session()
+                        self._condition.notify_all()
+                    self._condition.wait()
+                if not self._queue:
+                    self._close_session()
+                    self._condition.notify_all()
+                    return
+                batch = self._take_batch()
+                self._busy = True
+            try:
+                self._execute(batch)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _take_batch(self) -> list[_PendingWrite]:
+        batch = [self._queue.popleft()]
+        if not batch[0].command.batchable:
+            return batch
+        while (
+            self._queue
+            and len(batch) < self._max_batch
+            and self._queue[0].command.batchable
+        ):
+            batch.append(self._queue.popleft())
+        return batch
+
+    def _close_session(self) -> None:
+        session, self._session = self._session, None
+        if session is None:
+            return
+        try:
+            session.close()
+        except Error as exc:
+            self._logger.debug("Failed to close the writer connection: %s", exc)
+
+    def _execute(self, batch: list[_PendingWrite]) -> None:
+        started = time.perf_counter()
+        try:
+            if self._session is None:
+                self._session = self._session_factory()
+            session = self._session
+            if len(batch) == 1:
+                results = [self._apply(session, batch[0])]
+                if (
+                    isinstance(results[0], Exception)
+                    and session.raw_conn.in_transaction
+                ):
+                    session.raw_conn.rollback()
+            else:
+                results = self._apply_batch(session, batch)
+        except Exception as exc:
+            self._logger.error("Database writer batch failed: %s", exc, exc_info=True)
+            results = [exc] * len(batch)
+        self._settle(batch, results, started)
+
+    def _apply(self, session: WriterSession, pending: _PendingWrite) -> Any:
+        session.last_error = None
+        command_started = time.perf_counter()
+        try:
+            value = pending.command.apply(session)
+        except Exception as exc:
+            return exc
+        return (value, session.last_error, time.perf_counter() - command_started)
+
+    def _apply_batch(
+        self, session: WriterSession, batch: list[_PendingWrite]
+    ) -> list[Any]:
+        connection = session.raw_conn
+        connection.execute("BEGIN IMMEDIATE")
+        session.conn = _SavepointConnection(connection)
+        results: list[Any] = []
+        with session.deferred_invalidation():
+            try:
+                for pending in batch:
+                    connection.execute(f"SAVEPOINT {_COMMAND_SAVEPOINT}")
+                    result = self._apply(session, pending)
+                    if isinstance(result, Exception):
+                        connection.execute(f"ROLLBACK TO {_COMMAND_SAVEPOINT}")
+                    connection.execute(f"RELEASE {_COMMAND_SAVEPOINT}")
+                    results.append(result)
+                connection.commit()
+            except BaseException:
+                if connection.in_transaction:
+                    connection.rollback()
+                self._discard_cached_items(session)
+                raise
+            finally:
+                session.conn = connection
+        return results
+
+    def _discard_cached_items(self, session: WriterSession) -> None:
+        """Reload the item cache after a batch it was updated from rolled back.
+
+        Item writes update the cache once their savepoint is released, so a
+        failed batch commit leaves it holding rows that were never written.
+        """
+        item_cache = session.item_cache_controller
+        if item_cache is None:
+            return
+        item_cache.clear()
+        item_cache.start_preload(session.open_read_connection)
+
+    def _settle(
+        self, batch: list[_PendingWrite], results: list[Any], started: float
+    ) -> None:
+        finished = time.perf_counter()
+        outcomes: list[tuple[_PendingWrite, Any]] = []
+        with self._condition:
+            self._batches += 1
+            depth = len(self._queue)
+            for pending, result in zip(batch, results, strict=True):
+                if isinstance(result, Exception):
+                    self._failed += 1
+                    outcomes.append((pending, result))
+                    continue
+                value, error, run_seconds = result
+                outcome = WriteOutcome(
+                    command=pending.command.command_name,
+                    value=value,
+                    error=error,
+                    wait_ms=(started - pending.enqueued) * 1000.0,
+                    run_ms=run_seconds * 1000.0,
+                    batch_size=len(batch),
+                )
+                self._completed += 1
+                self._latency_ms.append((finished - pending.enqueued) * 1000.0)
+                outcomes.append((pending, outcome))
+        for pending, result in outcomes:
+            self._logger.debug(
+                "[perf] database.write_ms=%.3f command=%s batch=%d queue_depth=%d",
+                (finished - pending.enqueued) * 1000.0,
+                pending.command.command_name,
+                len(batch),
+                depth,
+            )
+            if isinstance(result, Exception):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+
+__all__ = [
+    "AddItem",
+    "AssignBarToList",
+    "AssignBarsToList",
+    "CreateSilverBarList",
+    "DatabaseWriter",
+    "DeleteAllEstimates",
+    "DeleteEstimate",
+    "DeleteItem",
+    "DeleteSilverBarList",
+    "DeleteSilverBarListResult",
+    "IssueSilverBarList",
+    "ReactivateSilverBarList",
+    "RemoveBarFromList",
+    "RemoveBarsFromList",
+    "SaveEstimate",
+    "SyncSilverBars",
+    "UpdateItem",
+    "UpdateSilverBarListNote",
+    "UpsertItemCatalog",
+    "WriteCommand",
+    "WriteOutcome",
+    "WriterMetrics",
+    "WriterSession",
+]
@@ -0,0 +1,140 @@
+"""Streaming writer for ``.sedbbackup`` archives."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from collections.abc import Callable, Mapping
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from silverestimate.persistence.storage_metadata import (
+    BackupManifest,
+    DifferentialManifest,
+)
+
+DATABASE_MEMBER = "database.sqlcipher"
+# Optional: a copy of the estimate archive file, keyed from the database.
+ESTIMATE_ARCHIVE_MEMBER = "estimate_archive.sqlcipher"
+CHANGES_MEMBER = "changes.sqlcipher"
+MANIFEST_MEMBER = "manifest.json"
+MANIFEST_DIGEST_MEMBER = "manifest.sha256"
+ARCHIVE_MEMBERS = frozenset({DATABASE_MEMBER, MANIFEST_MEMBER, MANIFEST_DIGEST_MEMBER})
+DIFFERENTIAL_MEMBERS = frozenset(
+    {CHANGES_MEMBER, MANIFEST_MEMBER, MANIFEST_DIGEST_MEMBER}
+)
+
+SealedManifest = BackupManifest | DifferentialManifest
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+# Zip members past this size need ZIP64 headers, which must be chosen up front.
+_ZIP64_THRESHOLD = 0x7FFFFFFF
+
+BackupProgress = Callable[[str, int, int], None]
+"""``(phase, done, total)`` where ``phase`` is export, validate, or archive.
+
+Export progress counts pages in online mode; archive progress counts bytes.
+"""
+
+
+class BackupMode(Enum):
+    """How the database copy inside a backup archive is produced.
+
+    ``EXPORT`` runs ``sqlcipher_export`` while readers are drained and the
+    writer is held. ``ONLINE`` copies pages with the backup API from one
+    snapshot, so reads and writes continue while it runs.
+    """
+
+    EXPORT = "export"
+    ONLINE = "online"
+
+
+class BackupCancelledError(RuntimeError):
+    """Raised when the caller cancels a backup in progress."""
+
+
+def manifest_bytes(manifest: SealedManifest) -> tuple[bytes, bytes]:
+    """Return the manifest JSON and the digest line that seals it."""
+    encoded = (
+        json.dumps(manifest.to_dict(), sort_keys=True, separators=(",", ":")) + "\n"
+    ).encode()
+    return encoded, hashlib.sha256(encoded).hexdigest().encode() + b"\n"
+
+
+def stream_backup_archive(  # noqa: PLR0913 - explicit streaming controls
+    database_copy: str | Path,
+    destination: str | Path,
+    manifest_for: Callable[[str], SealedManifest],
+    *,
+    cancel_event: Any = None,
+    progress: BackupProgress | None = None,
+    chunk_size: int = STREAM_CHUNK_BYTES,
+    member: str = DATABASE_MEMBER,
+    extra_members: Mapping[str, Path] | None = None,
+) -> str:
+    """Copy ``database_copy`` into a new archive, hashing it on the way.
+
+    The database bytes are read once: each chunk feeds the SHA-256 digest and
+    the stored zip member together. ``manifest_for`` receives the finished
+    digest and returns the manifest written after it. ``extra_members`` are
+    stored after the database as they are; their digests are the caller's to
+    record. The archive is staged beside ``destination`` and moved into place
+    only once complete; setting ``cancel_event`` raises
+    :class:`BackupCancelledError` and removes it.
+    """
+    source = Path(database_copy)
+    destination = Path(destination)
+    staged = destination.with_suffix(destination.suffix + ".tmp")
+    sources = {member: source, **(extra_members or {})}
+    total = sum(path.stat().st_size for path in sources.values())
+    digest = hashlib.sha256()
+    done = 0
+    try:
+        with zipfile.ZipFile(staged, "w", compression=zipfile.ZIP_STORED) as archive:
+            for name, path in sources.items():
+                size = path.stat().st_size
+                with (
+                    path.open("rb") as stream,
+                    archive.open(
+                        name, "w", force_zip64=size > _ZIP64_THRESHOLD
+                    ) as stored,
+                ):
+                    while chunk := stream.read(chunk_size):
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise BackupCancelledError("Database backup cancelled.")
+                        if name == member:
+                            digest.update(chunk)
+                        stored.write(chunk)
+                        done += len(chunk)
+                        if progress is not None:
+                            progress("archive", done, total)
+            database_sha256 = digest.hexdigest()
+            encoded, sealed = manifest_bytes(manifest_for(database_sha256))
+            archive.writestr(MANIFEST_MEMBER, encoded)
+            archive.writestr(MANIFEST_DIGEST_MEMBER, sealed)
+        os.replace(staged, destination)
+    except BaseException:
+        staged.unlink(missing_ok=True)
+        raise
+    return database_sha256
+
+
+__all__ = [
+    "ARCHIVE_MEMBERS",
+    "BackupCancelledError",
+    "BackupMode",
+    "BackupProgress",
+    "CHANGES_MEMBER",
+    "DATABASE_MEMBER",
+    "DIFFERENTIAL_MEMBERS",
+    "ESTIMATE_ARCHIVE_MEMBER",
+    "MANIFEST_DIGEST_MEMBER",
+    "MANIFEST_MEMBER",
+    "STREAM_CHUNK_BYTES",
+    "SealedManifest",
+    "manifest_bytes",
+    "stream_backup_archive",
+]
@@ -0,0 +1,359 @@
+"""Cold-storage archive for old estimates in a separate SQLCipher file.
+
+Estimates dated before a cutoff move, with their lines, into
+``<database>.archive.sqlcipher``. Estimates that produced silver bars stay
+live: the bars cascade from their estimate, and the silver-bar lists,
+history, and summaries read only the live file.
+The archive is keyed with a random raw key kept in the live database's
+``estimate_archive_state`` row, so it is only readable through the
+device-bound live file and survives password changes untouched. It is
+attached only for the queries that fall through to it.
+
+Rows are copied and committed before they are deleted from the live file. A
+crash in between leaves a voucher in both files; readers prefer the live row
+and the next archive run replaces the archived copy.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from silverestimate.persistence.database_driver import (
+    SQLCIPHER_SALT_BYTES,
+    attached_database,
+)
+from silverestimate.persistence.item_usage import (
+    UsageChange,
+    apply_usage,
+    read_line_usage,
+    usage_exists,
+)
+
+ARCHIVE_SCHEMA = "estimate_archive"
+ARCHIVE_STATE = "estimate_archive_state"
+ARCHIVE_SUFFIX = ".archive.sqlcipher"
+ARCHIVE_KEY_BYTES = 32
+
+# Archived table -> key column, parents before children.
+ARCHIVED_TABLES = {
+    "estimates": "voucher_no",
+    "estimate_items": "id",
+}
+
+_BATCH = "temp.estimate_archive_batch"
+_ARCHIVE_INDEXES = (
+    ("idx_archive_estimates_voucher", "estimates(voucher_no)", True),
+    (
+        "idx_archive_estimates_history_keyset",
+        "estimates(voucher_no_int DESC, voucher_no DESC)",
+        False,
+    ),
+    ("idx_archive_estimates_date", "estimates(date)", False),
+    ("idx_archive_estimate_items_id", "estimate_items(id)", True),
+    ("idx_archive_estimate_items_voucher", "estimate_items(voucher_no)", False),
+)
+
+
+class EstimateArchiveError(RuntimeError):
+    """Raised when the estimate archive cannot be created or extended."""
+
+
+@dataclass(frozen=True)
+class ArchiveState:
+    """Key material and bookkeeping for the archive, read from the live file."""
+
+    key: bytes = field(repr=False)
+    salt: bytes = field(repr=False)
+    max_voucher_no_int: int | None
+    archived_estimates: int
+
+
+@dataclass(frozen=True)
+class ArchiveStats:
+    """Rows moved into the archive by one run."""
+
+    estimates: int = 0
+    lines: int = 0
+
+
+def archive_path_for(database_path: str | Path) -> Path:
+    """Return the archive file that belongs beside ``database_path``."""
+    path = Path(database_path)
+    return path.with_name(path.stem + ARCHIVE_SUFFIX)
+
+
+def read_archive_state(cursor: Any) -> ArchiveState | None:
+    """Return the archive state of the main database, or ``None`` if unarchived."""
+    cursor.execute(
+        "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+        (ARCHIVE_STATE,),
+    )
+    if cursor.fetchone() is None:
+        return None
+    cursor.execute(
+        "SELECT archive_key, archive_salt, max_voucher_no_int, archived_estimates "  # nosec B608
+        f"FROM main.{ARCHIVE_STATE} WHERE id = 1"
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return ArchiveState(
+        key=bytes(row[0]),
+        salt=bytes(row[1]),
+        max_voucher_no_int=int(row[2]) if row[2] is not None else None,
+        archived_estimates=int(row[3] or 0),
+    )
+
+
+def ensure_archive_state(cursor: Any, database_path: str | Path) -> ArchiveState:
+    """Return the archive state, generating the archive key on first use."""
+    state = read_archive_state(cursor)
+    if state is not None:
+        return state
+    if archive_path_for(database_path).exists():
+        raise EstimateArchiveError(
+            "An estimate archive exists but this database does not hold its key; "
+            "restore the database that created it before archiving again"
+        )
+    cursor.execute(
+        f"CREATE TABLE IF NOT EXISTS main.{ARCHIVE_STATE} ("
+        "id INTEGER PRIMARY KEY CHECK (id = 1), "
+        "archive_key BLOB NOT NULL, "
+        "archive_salt BLOB NOT NULL, "
+        "max_voucher_no_int INTEGER, "
+        "archived_estimates INTEGER NOT NULL DEFAULT 0)"
+    )
+    cursor.execute(
+        f"INSERT INTO main.{ARCHIVE_STATE}(id, archive_key, archive_salt) "  # nosec B608
+        "VALUES (1, ?, ?)",
+        (os.urandom(ARCHIVE_KEY_BYTES), os.urandom(SQLCIPHER_SALT_BYTES)),
+    )
+    state = read_archive_state(cursor)
+    assert state is not None
+    return state
+
+
+def archived_voucher_floor(cursor: Any) -> int:
+    """Return the highest numeric voucher ever archived, or ``0``."""
+    state = read_archive_state(cursor)
+    if state is None or state.max_voucher_no_int is None:
+        return 0
+    return state.max_voucher_no_int
+
+
+def _database_files(cursor: Any) -> dict[str, str]:
+    cursor.execute("PRAGMA database_list")
+    return {str(row[1]): str(row[2] or "") for row in cursor.fetchall()}
+
+
+@contextmanager
+def attach_archive(cursor: Any) -> Iterator[bool]:
+    """Attach the archive for the block when one exists; yield whether it is.
+
+    The archive is located beside the main database file and keyed from the
+    state row, so any keyed connection to the live database can read it. The
+    connection must not be inside a transaction.
+    """
+    databases = _database_files(cursor)
+    if ARCHIVE_SCHEMA in databases:
+        yield True
+        return
+    state = read_archive_state(cursor)
+    path = archive_path_for(databases["main"]) if databases.get("main") else None
+    if state is None or path is None or not path.exists():
+        yield False
+        return
+    with attached_database(
+        cursor.connection,
+        path,
+        state.key,
+        salt=state.salt,
+        schema=ARCHIVE_SCHEMA,
+    ):
+        yield True
+
+
+def voucher_is_archived(cursor: Any, voucher_no: str) -> bool:
+    """Return whether ``voucher_no`` is held in the archive.
+
+    Like :func:`attach_archive`, this must run outside a transaction.
+    """
+    with attach_archive(cursor) as archived:
+        if not archived:
+            return False
+        cursor.execute(
+            f"SELECT 1 FROM {ARCHIVE_SCHEMA}.estimates WHERE voucher_no = ?",  # nosec B608
+            (voucher_no,),
+        )
+        return cursor.fetchone() is not None
+
+
+def _columns(cursor: Any, schema: str, table: str) -> list[str]:
+    cursor.execute(f"PRAGMA {schema}.table_info({table})")
+    return [str(row[1]) for row in cursor.fetchall()]
+
+
+def _prepare_archive_tables(cursor: Any) -> None:
+    """Create missing archive tables and add columns the live schema gained."""
+    for table in ARCHIVED_TABLES:
+        archived = _columns(cursor, ARCHIVE_SCHEMA, table)
+        if not archived:
+            # Copy the column layout without the live constraints and triggers.
+            cursor.execute(
+                f"CREATE TABLE {ARCHIVE_SCHEMA}.{table} AS "  # nosec B608
+                f"SELECT * FROM main.{table} WHERE 0"
+            )
+            continue
+        for column in _columns(cursor, "main", table):
+            if column not in archived:
+                cursor.execute(
+                    f"ALTER TABLE {ARCHIVE_SCHEMA}.{table} ADD COLUMN {column}"
+                )
+    for name, target, unique in _ARCHIVE_INDEXES:
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        cursor.execute(
+            f"CREATE {kind} IF NOT EXISTS {ARCHIVE_SCHEMA}.{name} ON {target}"
+        )
+
+
+def _batch_filters(batch: str = f"SELECT voucher_no FROM {_BATCH}") -> dict[str, str]:
+    return {table: f"voucher_no IN ({batch})" for table in ARCHIVED_TABLES}
+
+
+def archive_estimates(connection: Any, cutoff_date: str) -> ArchiveStats:
+    """Move estimates dated before ``cutoff_date`` into the attached archive.
+
+    An estimate with silver bars stays live, so its bars keep showing in
+    their lists, history, and totals. The copy into the archive commits
+    before the live rows are deleted.
+    """
+    cursor = connection.cursor()
+    _prepare_archive_tables(cursor)
+    connection.commit()
+    cursor.execute(f"DROP TABLE IF EXISTS {_BATCH}")
+    cursor.execute(
+        f"CREATE TABLE {_BATCH} AS "  # nosec B608
+        "SELECT voucher_no FROM main.estimates e WHERE e.date < ? "
+        "AND NOT EXISTS (SELECT 1 FROM main.silver_bars b "
+        "WHERE b.estimate_voucher_no = e.voucher_no)",
+        (cutoff_date,),
+    )
+    try:
+        moved = {}
+        connection.execute("BEGIN IMMEDIATE")
+        filters = _batch_filters()
+        for table in reversed(ARCHIVED_TABLES):
+            cursor.execute(
+                f"DELETE FROM {ARCHIVE_SCHEMA}.{table} "  # nosec B608
+                f"WHERE {filters[table]}"
+            )
+        for table in ARCHIVED_TABLES:
+            columns = ", ".join(_columns(cursor, "main", table))
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.{table}({columns}) "  # nosec B608
+                f"SELECT {columns} FROM main.{table} WHERE {filters[table]}"
+            )
+            moved[table] = int(cursor.rowcount or 0)
+        connection.commit()
+
+        connection.execute("BEGIN IMMEDIATE")
+        if usage_exists(cursor):
+            # Usage statistics cover live lines only.
+            usage = UsageChange()
+            read_line_usage(cursor, usage, f"ei.{filters['estimate_items']}", sign=-1)
+            apply_usage(cursor, usage)
+        for table in reversed(ARCHIVED_TABLES):
+            cursor.execute(
+                f"DELETE FROM main.{table} WHERE {filters[table]}"  # nosec B608
+            )
+        cursor.execute(
+            f"UPDATE main.{ARCHIVE_STATE} SET "  # nosec B608
+            "max_voucher_no_int = MAX(COALESCE(max_voucher_no_int, 0), COALESCE(("
+            f"SELECT MAX(voucher_no_int) FROM {ARCHIVE_SCHEMA}.estimates), 0)), "
+            f"archived_estimates = (SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.estimates) "
+            "WHERE id = 1"
+        )
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    finally:
+        cursor.execute(f"DROP TABLE IF EXISTS {_BATCH}")
+    return ArchiveStats(
+        estimates=moved["estimates"],
+        lines=moved["estimate_items"],
+    )
+
+
+def delete_archived_estimate(connection: Any, voucher_no: str) -> int:
+    """Delete ``voucher_no`` and its lines from the archive.
+
+    Returns the number of archived estimates removed. The connection must not
+    be inside a transaction; the delete commits on its own.
+    """
+    cursor = connection.cursor()
+    with attach_archive(cursor) as archived:
+        if not archived:
+            return 0
+        filters = _batch_filters("?")
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for table in reversed(ARCHIVED_TABLES):
+                cursor.execute(
+                    f"DELETE FROM {ARCHIVE_SCHEMA}.{table} WHERE {filters[table]}",  # nosec B608
+                    (voucher_no,),
+                )
+            deleted = int(cursor.rowcount or 0)
+            cursor.execute(
+                f"UPDATE main.{ARCHIVE_STATE} SET archived_estimates = ("  # nosec B608
+                f"SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.estimates) WHERE id = 1"
+            )
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+    return deleted
+
+
+def discard_archive(cursor: Any) -> None:
+    """Remove the archive file and forget its key.
+
+    The file goes first, so a failure leaves the key able to reopen it. The
+    state row is deleted on ``cursor`` for the caller to commit.
+    """
+    main = _database_files(cursor).get("main")
+    if main:
+        path = archive_path_for(main)
+        for candidate in (
+            path,
+            Path(f"{path}-wal"),
+            Path(f"{path}-shm"),
+            Path(f"{path}-journal"),
+        ):
+            candidate.unlink(missing_ok=True)
+    if read_archive_state(cursor) is not None:
+        cursor.execute(f"DELETE FROM main.{ARCHIVE_STATE}")  # nosec B608
+
+
+__all__ = [
+    "ARCHIVE_SCHEMA",
+    "ARCHIVE_STATE",
+    "ARCHIVED_TABLES",
+    "ArchiveState",
+    "ArchiveStats",
+    "EstimateArchiveError",
+    "archive_estimates",
+    "archive_path_for",
+    "archived_voucher_floor",
+    "attach_archive",
+    "delete_archived_estimate",
+    "discard_archive",
+    "ensure_archive_state",
+    "read_archive_state",
+    "voucher_is_archived",
+]
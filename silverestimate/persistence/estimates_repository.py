@@ -3,12 +3,44 @@
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Iterable, List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 from silverestimate.domain.pagination import EstimateHistoryCursor, Page
 from silverestimate.persistence.database_driver import dbapi as sqlite3
 from silverestimate.persistence.database_protocols import RepositoryDatabase
+from silverestimate.persistence.estimate_archive import (
+    ARCHIVE_SCHEMA,
+    archived_voucher_floor,
+    attach_archive,
+    delete_archived_estimate,
+    discard_archive,
+    read_archive_state,
+    voucher_is_archived,
+)
+from silverestimate.persistence.item_usage import (
+    ITEM_USAGE,
+    UsageChange,
+    apply_usage,
+    read_line_usage,
+    usage_exists,
+)
+from silverestimate.persistence.query_cache import (
+    QueryCache,
+    cached_read,
+    query_cache_of,
+    tables_changed,
+)
+from silverestimate.persistence.search_index import (
+    ESTIMATE_SEARCH_INDEX,
+    search_index_exists,
+    trigram_match,
+)
+from silverestimate.persistence.silver_bar_synchronization_repository import (
+    SilverBarSyncResult,
+)
 
 
 def fetch_estimate_history_rows(
@@ -91,6 +123,92 @@ def fetch_estimate_history_rows(
     return [dict(row) for row in cursor.fetchall()]
 
 
+@dataclass(frozen=True)
+class _HistoryFilter:
+    """WHERE clauses for the live table and the attached archive."""
+
+    where_sql: str
+    params: list[Any]
+    archive_sql: str
+    archive_params: list[Any]
+
+
+def _history_filter(
+    cursor: sqlite3.Cursor,
+    *,
+    date_from: str | None,
+    date_to: str | None,
+    voucher_search: str | None,
+) -> _HistoryFilter:
+    # (condition, params) pairs shared by the live table and the archive.
+    shared: list[tuple[str, list[Any]]] = [("1=1", [])]
+    if date_from:
+        shared.append(("date >= ?", [date_from]))
+    if date_to:
+        shared.append(("date <= ?", [date_to]))
+    live = shared
+    normalized_search = str(voucher_search or "").strip()
+    if normalized_search:
+        shared.append(("voucher_no LIKE ? COLLATE NOCASE", [f"%{normalized_search}%"]))
+        match = trigram_match(normalized_search, column="voucher_no")
+        if match is not None and search_index_exists(cursor, ESTIMATE_SEARCH_INDEX):
+            # The archive has no search index, so its LIKE filter stands alone.
+            live = [
+                *shared,
+                (
+                    f"rowid IN (SELECT rowid FROM {ESTIMATE_SEARCH_INDEX} "
+                    f"WHERE {ESTIMATE_SEARCH_INDEX} MATCH ?)",
+                    [match],
+                ),
+            ]
+    archive = [
+        *shared,
+        ("voucher_no NOT IN (SELECT voucher_no FROM main.estimates)", []),
+    ]
+    return _HistoryFilter(*_joined(live), *_joined(archive))
+
+
+def _joined(clauses: list[tuple[str, list[Any]]]) -> tuple[str, list[Any]]:
+    return (
+        " AND ".join(sql for sql, _ in clauses),
+        [param for _, params in clauses for param in params],
+    )
+
+
+def _count_history(
+    cursor: sqlite3.Cursor, history_filter: _HistoryFilter, *, archived: bool
+) -> int:
+    if archived:
+        cursor.execute(
+            f"SELECT (SELECT COUNT(*) FROM main.estimates WHERE {history_filter.where_sql}) + "  # nosec B608
+            f"(SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.estimates "
+            f"WHERE {history_filter.archive_sql})",
+            [*history_filter.params, *history_filter.archive_params],
+        )
+    else:
+        cursor.execute(
+            f"SELECT COUNT(*) FROM estimates WHERE {history_filter.where_sql}",  # nosec B608
+            history_filter.params,
+        )
+    count_row = cursor.fetchone()
+    return int(count_row[0]) if count_row else 0
+
+
+def count_estimate_history(
+    cursor: sqlite3.Cursor,
+    *,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    voucher_search: str | None = None,
+) -> int:
+    """Count every estimate, live or archived, that matches the history filter."""
+    history_filter = _history_filter(
+        cursor, date_from=date_from, date_to=date_to, voucher_search=voucher_search
+    )
+    with attach_archive(cursor) as archived:
+        return _count_history(cursor, history_filter, archived=archived)
+
+
 def fetch_estimate_history_page(
     cursor: sqlite3.Cursor,
     *,
@@ -99,29 +217,40 @@ def fetch_estimate_history_page(
     voucher_search: str | None = None,
     page_cursor: EstimateHistoryCursor | None = None,
     limit: int = 500,
+    include_total: bool = True,
+    cache: QueryCache | None = None,
 ) -> Page[dict[str, Any], EstimateHistoryCursor]:
-    """Return a keyset page using persisted estimate-header summaries."""
-    page_size = max(1, min(int(limit), 2000))
-    conditions = ["1=1"]
-    params: list[Any] = []
-    if date_from:
-        conditions.append("date >= ?")
-        params.append(date_from)
-    if date_to:
-        conditions.append("date <= ?")
-        params.append(date_to)
-    normalized_search = str(voucher_search or "").strip()
-    if normalized_search:
-        conditions.append("voucher_no LIKE ? COLLATE NOCASE")
-        params.append(f"%{normalized_search}%")
+    """Return a keyset page using persisted estimate-header summaries.
 
-    where_sql = " AND ".join(conditions)
-    cursor.execute(f"SELECT COUNT(*) FROM estimates WHERE {where_sql}", params)  # nosec B608
-    count_row = cursor.fetchone()
-    total = int(count_row[0]) if count_row else 0
+    With ``include_total=False`` the count is skipped and the page's total is
+    ``None``; callers fetch it later with ``count_estimate_history``. With a
+    ``cache``, first pages are read through it, so reopening the history on
+    an unchanged database costs no query.
+    """
+    page_size = max(1, min(int(limit), 2000))
+    if cache is not None and page_cursor is None:
+        return cache.read(
+            cursor,
+            "estimate_history.first_page",
+            (date_from, date_to, voucher_search, page_size, include_total),
+            _HEADER_TABLES,
+            lambda: fetch_estimate_history_page(
+                cursor,
+                date_from=date_from,
+                date_to=date_to,
+                voucher_search=voucher_search,
+                limit=page_size,
+                include_total=include_total,
+            ),
+        )
+    history_filter = _history_filter(
+        cursor, date_from=date_from, date_to=date_to, voucher_search=voucher_search
+    )
+    params = history_filter.params
+    archive_params = history_filter.archive_params
 
     keyset_sql = ""
-    query_params = list(params)
+    keyset_params: list[Any] = []
     if page_cursor is not None:
         numeric_cursor = (
             int(page_cursor.voucher_no_int)
@@ -132,10 +261,59 @@ def fetch_estimate_history_page(
             " AND (COALESCE(voucher_no_int, -1) < ? OR "
             "(COALESCE(voucher_no_int, -1) = ? AND voucher_no < ?))"
         )
-        query_params.extend((numeric_cursor, numeric_cursor, page_cursor.voucher_no))
-    query_params.append(page_size + 1)
-    cursor.execute(
-        f"""
+        keyset_params = [numeric_cursor, numeric_cursor, page_cursor.voucher_no]
+
+    with attach_archive(cursor) as archived:
+        total = (
+            _count_history(cursor, history_filter, archived=archived)
+            if include_total
+            else None
+        )
+
+        live_sql = _HISTORY_PAGE_SQL.format(
+            source="main.estimates", where=f"{history_filter.where_sql}{keyset_sql}"
+        )
+        if archived:
+            archive_page_sql = _HISTORY_PAGE_SQL.format(
+                source=f"{ARCHIVE_SCHEMA}.estimates",
+                where=f"{history_filter.archive_sql}{keyset_sql}",
+            )
+            cursor.execute(
+                f"SELECT * FROM (SELECT * FROM ({live_sql}) "  # nosec B608
+                f"UNION ALL SELECT * FROM ({archive_page_sql})) "
+                f"ORDER BY {_HISTORY_ORDER} LIMIT ?",
+                [
+                    *params,
+                    *keyset_params,
+                    page_size + 1,
+                    *archive_params,
+                    *keyset_params,
+                    page_size + 1,
+                    page_size + 1,
+                ],
+            )
+        else:
+            cursor.execute(live_sql, [*params, *keyset_params, page_size + 1])
+        fetched = [dict(row) for row in cursor.fetchall()]
+    has_more = len(fetched) > page_size
+    rows = fetched[:page_size]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        raw_numeric = last.get("voucher_no_int")
+        next_cursor = EstimateHistoryCursor(
+            int(raw_numeric) if raw_numeric is not None else None,
+            str(last.get("voucher_no", "") or ""),
+        )
+    return Page(items=tuple(rows), total=total, next_cursor=next_cursor)
+
+
+# Tables an estimate write may touch; bars follow their estimate.
+_HEADER_TABLES = ("estimates", "estimate_items")
+_ESTIMATE_TABLES = (*_HEADER_TABLES, "silver_bars", "silver_bar_lists", "bar_transfers")
+
+_HISTORY_ORDER = "COALESCE(voucher_no_int, -1) DESC, voucher_no DESC"
+_HISTORY_PAGE_SQL = f"""
         SELECT
             voucher_no,
             voucher_no_int,
@@ -147,25 +325,66 @@ def fetch_estimate_history_page(
             total_fine,
             total_wage,
             last_balance_amount
-        FROM estimates
-        WHERE {where_sql}{keyset_sql}
-        ORDER BY COALESCE(voucher_no_int, -1) DESC, voucher_no DESC
+        FROM {{source}}
+        WHERE {{where}}
+        ORDER BY {_HISTORY_ORDER}
         LIMIT ?
-        """,  # nosec B608
-        query_params,
-    )
-    fetched = [dict(row) for row in cursor.fetchall()]
-    has_more = len(fetched) > page_size
-    rows = fetched[:page_size]
-    next_cursor = None
-    if has_more and rows:
-        last = rows[-1]
-        raw_numeric = last.get("voucher_no_int")
-        next_cursor = EstimateHistoryCursor(
-            int(raw_numeric) if raw_numeric is not None else None,
-            str(last.get("voucher_no", "") or ""),
+"""
+
+_HEADER_COLUMNS = (
+    "voucher_no_int, date, silver_rate, total_gross, total_net, total_fine, "
+    "total_wage, note, last_balance_silver, last_balance_amount"
+)
+_LINE_COLUMNS = (
+    "item_code, item_name, gross, poly, net_wt, purity, wage_rate, pieces, "
+    "wage_type, wage, fine, is_return, is_silver_bar, line_key"
+)
+
+
+@dataclass(frozen=True)
+class EstimateSaveStats:
+    """Rows written by one estimate save."""
+
+    lines_inserted: int = 0
+    lines_updated: int = 0
+    lines_deleted: int = 0
+    lines_unchanged: int = 0
+    header_written: bool = False
+
+    @property
+    def rows_touched(self) -> int:
+        return (
+            self.lines_inserted
+            + self.lines_updated
+            + self.lines_deleted
+            + int(self.header_written)
         )
-    return Page(items=tuple(rows), total=total, next_cursor=next_cursor)
+
+
+@dataclass(frozen=True)
+class EstimateSaveOutcome:
+    """Combined result of one estimate save unit of work."""
+
+    saved: bool
+    stats: EstimateSaveStats | None = None
+    bars: SilverBarSyncResult | None = None
+    phase_ms: Mapping[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.phase_ms.values())
+
+
+class _PhaseTimer:
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self._mark = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases[name] = (now - self._mark) * 1000.0
+        self._mark = now
 
 
 class EstimatesRepository:
@@ -174,6 +393,7 @@ class EstimatesRepository:
     def __init__(self, db_manager: RepositoryDatabase) -> None:
         self._db = db_manager
         self._logger = getattr(db_manager, "logger", logging.getLogger(__name__))
+        self.last_save_stats: EstimateSaveStats | None = None
 
     @property
     def _conn(self):
@@ -192,9 +412,9 @@ class EstimatesRepository:
                 "SELECT MAX(voucher_no_int) FROM estimates WHERE voucher_no_int IS NOT NULL"
             )
             result = cursor.fetchone()
-            if result and result[0] is not None:
-                return str(int(result[0]) + 1)
-            return "1"
+            live = int(result[0]) if result and result[0] is not None else 0
+            # Archived vouchers are never reissued.
+            return str(max(live, archived_voucher_floor(cursor)) + 1)
         except (sqlite3.Error, ValueError, TypeError) as exc:
             try:
                 cursor.execute(
@@ -219,24 +439,15 @@ class EstimatesRepository:
             return None
         try:
             conn.execute("BEGIN TRANSACTION")
-            cursor.execute(
-                "SELECT * FROM estimates WHERE voucher_no = ?", (voucher_no,)
-            )
-            estimate = cursor.fetchone()
-            if not estimate:
-                conn.rollback()
-                return None
-            cursor.execute(
-                "SELECT ei.*, i.tunch AS tunch "
-                "FROM estimate_items ei "
-                "LEFT JOIN items i ON i.code = ei.item_code COLLATE NOCASE "
-                "WHERE ei.voucher_no = ? "
-                "ORDER BY ei.is_return, ei.is_silver_bar, ei.id",
-                (voucher_no,),
-            )
-            items = cursor.fetchall()
+            estimate = self._read_estimate(cursor, "main", voucher_no)
             conn.commit()
-            return {"header": dict(estimate), "items": [dict(item) for item in items]}
+            if estimate is not None:
+                return estimate
+            # Older estimates may have moved to the cold-storage archive.
+            with attach_archive(cursor) as archived:
+                if archived:
+                    return self._read_estimate(cursor, ARCHIVE_SCHEMA, voucher_no)
+            return None
         except sqlite3.Error as exc:
             conn.rollback()
             self._logger.error(
@@ -253,6 +464,28 @@ class EstimatesRepository:
             )
             return None
 
+    @staticmethod
+    def _read_estimate(
+        cursor: sqlite3.Cursor, schema: str, voucher_no: str
+    ) -> dict[str, Any] | None:
+        cursor.execute(
+            f"SELECT * FROM {schema}.estimates WHERE voucher_no = ?",  # nosec B608
+            (voucher_no,),
+        )
+        estimate = cursor.fetchone()
+        if not estimate:
+            return None
+        cursor.execute(
+            "SELECT ei.*, i.tunch AS tunch "  # nosec B608
+            f"FROM {schema}.estimate_items ei "
+            "LEFT JOIN main.items i ON i.code = ei.item_code COLLATE NOCASE "
+            "WHERE ei.voucher_no = ? "
+            "ORDER BY ei.is_return, ei.is_silver_bar, ei.id",
+            (voucher_no,),
+        )
+        items = cursor.fetchall()
+        return {"header": dict(estimate), "items": [dict(item) for item in items]}
+
     def get_estimates(self, date_from=None, date_to=None, voucher_search=None):
         cursor = self._cursor
         if not cursor:
@@ -332,6 +565,7 @@ class EstimatesRepository:
         voucher_search: str | None = None,
         cursor: EstimateHistoryCursor | None = None,
         limit: int = 500,
+        use_cache: bool = True,
     ) -> Page[dict[str, Any], EstimateHistoryCursor]:
         db_cursor = self._cursor
         if not db_cursor:
@@ -344,6 +578,7 @@ class EstimatesRepository:
                 voucher_search=voucher_search,
                 page_cursor=cursor,
                 limit=limit,
+                cache=query_cache_of(self._db) if use_cache else None,
             )
         except sqlite3.Error:
             self._logger.exception("DB Error getting estimate-history page")
@@ -416,18 +651,39 @@ class EstimatesRepository:
             )
             return []
 
-    def get_first_estimate_date(self):
+    def get_first_estimate_date(self, *, use_cache: bool = True):
         """Return the earliest estimate date (yyyy-MM-dd) or None when unavailable."""
         cursor = self._cursor
         if not cursor:
             return None
-        try:
-            cursor.execute("SELECT MIN(date) AS first_date FROM estimates")
-            row = cursor.fetchone()
+
+        def read_first_date() -> str | None:
+            with attach_archive(cursor) as archived:
+                if archived:
+                    cursor.execute(
+                        "SELECT MIN(date) AS first_date FROM ("  # nosec B608
+                        "SELECT MIN(date) AS date FROM main.estimates UNION ALL "
+                        f"SELECT MIN(date) FROM {ARCHIVE_SCHEMA}.estimates)"
+                    )
+                else:
+                    cursor.execute("SELECT MIN(date) AS first_date FROM estimates")
+                row = cursor.fetchone()
             if not row:
                 return None
             first_date = row["first_date"] if isinstance(row, sqlite3.Row) else row[0]
             return str(first_date) if first_date else None
+
+        try:
+            # Archiving changes the answer without touching the live table.
+            state = read_archive_state(cursor)
+            return cached_read(
+                self._db,
+                "estimates.first_date",
+                (state.archived_estimates if state is not None else 0,),
+                ("estimates",),
+                read_first_date,
+                use_cache=use_cache,
+            )
         except sqlite3.Error as exc:
             self._logger.error(
                 "DB Error getting first estimate date: %s", exc, exc_info=True
@@ -443,157 +699,334 @@ class EstimatesRepository:
         return_items: Iterable[dict],
         totals: dict,
     ) -> bool:
+        return self.save_estimate_with_silver_bars(
+            voucher_no,
+            date,
+            silver_rate,
+            regular_items,
+            return_items,
+            totals,
+        ).saved
+
+    def save_estimate_with_silver_bars(  # noqa: PLR0913 - mirrors the save API
+        self,
+        voucher_no: str,
+        date: str,
+        silver_rate: float,
+        regular_items: Iterable[dict],
+        return_items: Iterable[dict],
+        totals: dict,
+        silver_bars: Iterable[Mapping[str, Any]] | None = None,
+    ) -> EstimateSaveOutcome:
+        """Write header, lines, and silver-bar reconciliation in one transaction.
+
+        ``silver_bars=None`` leaves inventory untouched. Any storage error rolls
+        back every phase, so bars can no longer drift from a saved estimate.
+        """
         conn, cursor = self._conn, self._cursor
         if not conn or not cursor:
-            self._set_last_error(
+            message = (
                 "Cannot save estimate: no active database connection is available."
             )
-            return False
+            self._set_last_error(message)
+            return EstimateSaveOutcome(saved=False, error=message)
+        regular_items_list = list(regular_items or [])
+        return_items_list = list(return_items or [])
+        all_items = regular_items_list + return_items_list
+        timer = _PhaseTimer()
+        self.last_save_stats = None
         try:
             self._set_last_error(None)
-            conn.execute("BEGIN TRANSACTION")
-            regular_items_list = list(regular_items or [])
-            return_items_list = list(return_items or [])
+            conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
-                "SELECT 1 FROM estimates WHERE voucher_no = ?", (voucher_no,)
+                f"SELECT {_HEADER_COLUMNS} FROM estimates WHERE voucher_no = ?",  # nosec B608
+                (voucher_no,),
             )
-            estimate_exists = cursor.fetchone() is not None
+            existing_header = cursor.fetchone()
 
-            note = totals.get("note", "")
-            last_balance_silver = totals.get("last_balance_silver", 0.0)
-            last_balance_amount = totals.get("last_balance_amount", 0.0)
-            voucher_no_int = self._voucher_to_int(voucher_no)
-
-            all_items = regular_items_list + return_items_list
-            missing_codes = self._find_missing_item_codes(all_items)
-            if missing_codes:
+            refusal = self._save_refusal(cursor, voucher_no, existing_header, all_items)
+            if refusal:
                 conn.rollback()
-                message = self._format_missing_code_message(missing_codes, all_items)
-                self._logger.warning(
-                    "Estimate %s save aborted due to missing item codes: %s",
-                    voucher_no,
-                    ", ".join(missing_codes),
-                )
-                self._set_last_error(message)
-                return False
-
-            if estimate_exists:
-                cursor.execute(
-                    """
-                    UPDATE estimates
-                    SET date = ?, silver_rate = ?, total_gross = ?, total_net = ?,
-                        total_fine = ?, total_wage = ?, note = ?,
-                        last_balance_silver = ?, last_balance_amount = ?,
-                        voucher_no_int = ?
-                    WHERE voucher_no = ?
-                    """,
-                    (
-                        date,
-                        silver_rate,
-                        totals.get("total_gross", 0.0),
-                        totals.get("total_net", 0.0),
-                        totals.get("net_fine", 0.0),
-                        totals.get("net_wage", 0.0),
-                        note,
-                        last_balance_silver,
-                        last_balance_amount,
-                        voucher_no_int,
-                        voucher_no,
-                    ),
-                )
-            else:
-                cursor.execute(
-                    """
-                    INSERT INTO estimates
-                    (voucher_no, voucher_no_int, date, silver_rate, total_gross, total_net, total_fine, total_wage, note,
-                     last_balance_silver, last_balance_amount)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        voucher_no,
-                        voucher_no_int,
-                        date,
-                        silver_rate,
-                        totals.get("total_gross", 0.0),
-                        totals.get("total_net", 0.0),
-                        totals.get("net_fine", 0.0),
-                        totals.get("net_wage", 0.0),
-                        note,
-                        last_balance_silver,
-                        last_balance_amount,
-                    ),
+                self._set_last_error(refusal)
+                return EstimateSaveOutcome(
+                    saved=False, phase_ms=timer.phases, error=refusal
                 )
+            # Read before the header write, while the old lines keep their date.
+            usage = self._retired_usage(cursor, voucher_no)
+            timer.lap("validate")
 
-            cursor.execute(
-                "DELETE FROM estimate_items WHERE voucher_no = ?", (voucher_no,)
+            header = (
+                self._voucher_to_int(voucher_no),
+                date,
+                silver_rate,
+                totals.get("total_gross", 0.0),
+                totals.get("total_net", 0.0),
+                totals.get("net_fine", 0.0),
+                totals.get("net_wage", 0.0),
+                totals.get("note", ""),
+                totals.get("last_balance_silver", 0.0),
+                totals.get("last_balance_amount", 0.0),
             )
-            params = [
-                (
-                    voucher_no,
-                    item.get("code", ""),
-                    item.get("name", ""),
-                    float(item.get("gross", 0.0)),
-                    float(item.get("poly", 0.0)),
-                    float(item.get("net_wt", 0.0)),
-                    float(item.get("purity", 0.0)),
-                    float(item.get("wage_rate", 0.0)),
-                    int(item.get("pieces", 1)),
-                    str(item.get("wage_type", "WT") or "WT"),
-                    float(item.get("wage", 0.0)),
-                    float(item.get("fine", 0.0)),
-                    0,
-                    0,
-                    str(item.get("line_key", "") or ""),
-                )
+            header_written = self._write_estimate_header(
+                cursor, voucher_no, header, existing_header
+            )
+            timer.lap("header")
+
+            lines = [
+                self._line_values(item, is_return_line=False)
                 for item in regular_items_list
             ]
-            params.extend(
-                (
-                    voucher_no,
-                    item.get("code", ""),
-                    item.get("name", ""),
-                    float(item.get("gross", 0.0)),
-                    float(item.get("poly", 0.0)),
-                    float(item.get("net_wt", 0.0)),
-                    float(item.get("purity", 0.0)),
-                    float(item.get("wage_rate", 0.0)),
-                    int(item.get("pieces", 1)),
-                    str(item.get("wage_type", "WT") or "WT"),
-                    float(item.get("wage", 0.0)),
-                    float(item.get("fine", 0.0)),
-                    1 if item.get("is_return", False) else 0,
-                    1 if item.get("is_silver_bar", False) else 0,
-                    str(item.get("line_key", "") or ""),
-                )
+            lines.extend(
+                self._line_values(item, is_return_line=True)
                 for item in return_items_list
             )
-            if params:
-                cursor.executemany(
-                    "INSERT INTO estimate_items (voucher_no, item_code, item_name, gross, poly, net_wt, purity, wage_rate, pieces, wage_type, wage, fine, is_return, is_silver_bar, line_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    params,
-                )
+            stats = self._write_estimate_lines(cursor, voucher_no, lines)
+            stats = replace(stats, header_written=header_written)
+            usage_deltas = self._write_usage(cursor, usage, lines, date)
+            timer.lap("lines")
+
+            bars = None
+            if silver_bars is not None:
+                bars = self._reconcile_silver_bars(cursor, voucher_no, silver_bars)
+                timer.lap("silver_bars")
 
             conn.commit()
-            self._set_last_error(None)
-            return True
-        except sqlite3.IntegrityError as exc:
+            timer.lap("commit")
+            tables_changed(
+                self._db,
+                *(_ESTIMATE_TABLES if silver_bars is not None else _HEADER_TABLES),
+            )
+            self._publish_usage(usage_deltas)
+        except sqlite3.Error as exc:
+            conn.rollback()
+            message = self._describe_save_error(voucher_no, exc, all_items)
+            self._set_last_error(message)
+            return EstimateSaveOutcome(
+                saved=False, phase_ms=timer.phases, error=message
+            )
+        except Exception:
+            # Never leave the save's transaction open on this connection.
             conn.rollback()
-            detail_message = self._diagnose_integrity_error(
-                exc, regular_items_list + return_items_list
+            raise
+
+        self._set_last_error(None)
+        self.last_save_stats = stats
+        outcome = EstimateSaveOutcome(
+            saved=True, stats=stats, bars=bars, phase_ms=timer.phases
+        )
+        self._logger.debug(
+            "[perf] estimate.save_ms=%.3f voucher=%s rows_touched=%d "
+            "inserted=%d updated=%d deleted=%d unchanged=%d header=%s phases=%s",
+            outcome.total_ms,
+            voucher_no,
+            stats.rows_touched,
+            stats.lines_inserted,
+            stats.lines_updated,
+            stats.lines_deleted,
+            stats.lines_unchanged,
+            stats.header_written,
+            ",".join(f"{name}:{ms:.3f}" for name, ms in outcome.phase_ms.items()),
+        )
+        return outcome
+
+    def _reconcile_silver_bars(
+        self,
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        silver_bars: Iterable[Mapping[str, Any]],
+    ) -> SilverBarSyncResult:
+        synchronizer = getattr(self._db, "silver_bar_synchronization_repo", None)
+        if synchronizer is None:
+            raise sqlite3.OperationalError(
+                "Silver-bar synchronization is unavailable for this database."
             )
+        result: SilverBarSyncResult = synchronizer.reconcile_in_transaction(
+            cursor, voucher_no, silver_bars
+        )
+        return result
+
+    def _describe_save_error(
+        self,
+        voucher_no: str,
+        exc: sqlite3.Error,
+        items: list[dict],
+    ) -> str:
+        if isinstance(exc, sqlite3.IntegrityError):
             self._logger.error(
                 "DB integrity error saving estimate %s: %s",
                 voucher_no,
                 exc,
                 exc_info=True,
             )
-            if detail_message:
-                self._set_last_error(detail_message)
-            else:
-                self._set_last_error(
-                    f"Database integrity error while saving estimate '{voucher_no}': {exc}"
-                )
+            return self._diagnose_integrity_error(exc, items) or (
+                f"Database integrity error while saving estimate '{voucher_no}': {exc}"
+            )
+        self._logger.error(
+            "DB error saving estimate %s: %s", voucher_no, exc, exc_info=True
+        )
+        return f"Database error while saving estimate '{voucher_no}': {exc}"
+
+    @staticmethod
+    def _retired_usage(cursor: sqlite3.Cursor, voucher_no: str) -> UsageChange | None:
+        """Start a usage change that removes ``voucher_no``'s stored lines.
+
+        Returns ``None`` when the database has no usage statistics.
+        """
+        if not usage_exists(cursor):
+            return None
+        usage = UsageChange()
+        read_line_usage(cursor, usage, "ei.voucher_no = ?", (voucher_no,), sign=-1)
+        return usage
+
+    @staticmethod
+    def _write_usage(
+        cursor: sqlite3.Cursor,
+        usage: UsageChange | None,
+        lines: list[tuple[Any, ...]],
+        estimate_date: str,
+    ) -> dict[str, tuple[int, float]]:
+        """Count the saved lines into ``usage`` and store the difference."""
+        if usage is None:
+            return {}
+        usage.add_lines((line[0] for line in lines), estimate_date)
+        return apply_usage(cursor, usage)
+
+    def _publish_usage(self, deltas: Mapping[str, tuple[int, float]]) -> None:
+        """Hand committed usage deltas to the item cache's selection ranking."""
+        if not deltas:
+            return
+        cache_ctrl = getattr(self._db, "item_cache_controller", None)
+        record_usage = getattr(cache_ctrl, "record_usage", None)
+        if callable(record_usage):
+            record_usage(deltas)
+
+    @staticmethod
+    def _write_estimate_header(
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        header: tuple[Any, ...],
+        existing: Any,
+    ) -> bool:
+        if existing is None:
+            cursor.execute(
+                f"INSERT INTO estimates (voucher_no, {_HEADER_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",  # nosec B608
+                (voucher_no, *header),
+            )
+            return True
+        if tuple(existing) == header:
             return False
+        cursor.execute(
+            """
+            UPDATE estimates
+            SET voucher_no_int = ?, date = ?, silver_rate = ?, total_gross = ?,
+                total_net = ?, total_fine = ?, total_wage = ?, note = ?,
+                last_balance_silver = ?, last_balance_amount = ?
+            WHERE voucher_no = ?
+            """,
+            (*header, voucher_no),
+        )
+        return True
+
+    @staticmethod
+    def _line_values(item: dict, *, is_return_line: bool) -> tuple[Any, ...]:
+        """Return one line in ``_LINE_COLUMNS`` order."""
+        return (
+            item.get("code", ""),
+            item.get("name", ""),
+            float(item.get("gross", 0.0)),
+            float(item.get("poly", 0.0)),
+            float(item.get("net_wt", 0.0)),
+            float(item.get("purity", 0.0)),
+            float(item.get("wage_rate", 0.0)),
+            int(item.get("pieces", 1)),
+            str(item.get("wage_type", "WT") or "WT"),
+            float(item.get("wage", 0.0)),
+            float(item.get("fine", 0.0)),
+            1 if is_return_line and item.get("is_return", False) else 0,
+            1 if is_return_line and item.get("is_silver_bar", False) else 0,
+            str(item.get("line_key", "") or ""),
+        )
+
+    @staticmethod
+    def _write_estimate_lines(
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        lines: list[tuple[Any, ...]],
+    ) -> EstimateSaveStats:
+        """Apply the per-line diff between stored rows and ``lines``.
+
+        Rows are matched on ``line_key``. Lines load in ``id`` order within
+        each (is_return, is_silver_bar) group, so a matched row is kept only
+        while its id still follows the previous kept row of its group and no
+        line was inserted before it; later rows are deleted and re-inserted
+        to preserve the saved order.
+        """
+        cursor.execute(
+            f"SELECT id, {_LINE_COLUMNS} FROM estimate_items "  # nosec B608
+            "WHERE voucher_no = ? ORDER BY id",
+            (voucher_no,),
+        )
+        stored: dict[str, tuple[int, tuple[Any, ...]]] = {}
+        stale_ids: list[int] = []
+        for row in cursor.fetchall():
+            values = tuple(row)
+            key = str(values[-1] or "")
+            if not key or key in stored:
+                stale_ids.append(int(values[0]))
+                continue
+            stored[key] = (int(values[0]), values[1:])
+
+        inserts: list[tuple[Any, ...]] = []
+        updates: list[tuple[Any, ...]] = []
+        unchanged = 0
+        last_kept: dict[tuple[Any, Any], int] = {}
+        appending: set[tuple[Any, Any]] = set()
+        for line in sorted(lines, key=lambda values: (values[11], values[12])):
+            group = (line[11], line[12])
+            match = stored.pop(str(line[-1]), None) if line[-1] else None
+            if (
+                match is None
+                or group in appending
+                or match[0] < last_kept.get(group, 0)
+            ):
+                if match is not None:
+                    stale_ids.append(match[0])
+                appending.add(group)
+                inserts.append((voucher_no, *line))
+                continue
+            last_kept[group] = match[0]
+            if match[1] == line:
+                unchanged += 1
+            else:
+                updates.append((*line, match[0]))
+        stale_ids.extend(row_id for row_id, _ in stored.values())
+
+        if stale_ids:
+            cursor.executemany(
+                "DELETE FROM estimate_items WHERE id = ?",
+                [(row_id,) for row_id in stale_ids],
+            )
+        if updates:
+            assignments = ", ".join(
+                f"{column} = ?" for column in _LINE_COLUMNS.split(", ")
+            )
+            cursor.executemany(
+                f"UPDATE estimate_items SET {assignments} WHERE id = ?",  # nosec B608
+                updates,
+            )
+        if inserts:
+            cursor.executemany(
+                f"INSERT INTO estimate_items (voucher_no, {_LINE_COLUMNS}) "  # nosec B608
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                inserts,
+            )
+        return EstimateSaveStats(
+            lines_inserted=len(inserts),
+            lines_updated=len(updates),
+            lines_deleted=len(stale_ids),
+            lines_unchanged=unchanged,
+        )
 
     @staticmethod
     def _voucher_to_int(voucher_no: str) -> Optional[int]:
@@ -610,11 +1043,21 @@ class EstimatesRepository:
         if not conn or not cursor:
             return False
         try:
+            # Archived estimates go too, so the archive file and key are dropped.
+            discard_archive(cursor)
             cursor.execute("DELETE FROM estimate_items")
             cursor.execute("DELETE FROM estimates")
+            cleared_usage = usage_exists(cursor)
+            if cleared_usage:
+                cursor.execute(f"DELETE FROM {ITEM_USAGE}")  # nosec B608
             conn.commit()
+            tables_changed(self._db, *_ESTIMATE_TABLES)
+            cache_ctrl = getattr(self._db, "item_cache_controller", None)
+            replace_usage = getattr(cache_ctrl, "replace_usage", None)
+            if cleared_usage and callable(replace_usage):
+                replace_usage({})
             return True
-        except sqlite3.Error as exc:
+        except (sqlite3.Error, OSError) as exc:
             conn.rollback()
             self._logger.error(
                 "DB Error deleting all estimates: %s", exc, exc_info=True
@@ -629,7 +1072,7 @@ class EstimatesRepository:
             self._logger.error("No voucher number provided for deletion.")
             return False
         try:
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             deleted_bars_count = 0
             affected_lists: set[int] = set()
             silver_repo = getattr(self._db, "silver_bar_command_repo", None)
@@ -644,17 +1087,23 @@ class EstimatesRepository:
                 )
                 deleted_bars_count = cursor.rowcount
 
+            usage = self._retired_usage(cursor, voucher_no)
             cursor.execute(
                 "DELETE FROM estimate_items WHERE voucher_no = ?", (voucher_no,)
             )
             deleted_items_count = cursor.rowcount
             cursor.execute("DELETE FROM estimates WHERE voucher_no = ?", (voucher_no,))
             deleted_estimate_count = cursor.rowcount
+            usage_deltas = apply_usage(cursor, usage) if usage is not None else {}
 
             if silver_repo is not None and affected_lists:
                 silver_repo.cleanup_empty_lists(affected_lists)
 
             conn.commit()
+            # The live delete is committed before the archive is attached.
+            deleted_estimate_count += delete_archived_estimate(conn, voucher_no)
+            tables_changed(self._db, *_ESTIMATE_TABLES)
+            self._publish_usage(usage_deltas)
             if deleted_estimate_count > 0:
                 self._logger.info(
                     "Deleted estimate %s with %s items and %s silver bars.",
@@ -723,6 +1172,55 @@ class EstimatesRepository:
             return []
         return [code for code in unique_codes if normalized_map[code] not in found]
 
+    def _save_refusal(
+        self,
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        existing_header: Any,
+        items: List[dict],
+    ) -> str | None:
+        if existing_header is None and self._is_archived(cursor, voucher_no):
+            # Re-saving would leave a live copy beside the archived one, so
+            # archived estimates are read-only.
+            self._logger.warning(
+                "Estimate %s save refused: the estimate is archived", voucher_no
+            )
+            return (
+                f"Estimate '{voucher_no}' is archived and read-only. "
+                "Save it under a new voucher number instead."
+            )
+        return self._missing_code_error(voucher_no, items)
+
+    def _is_archived(self, cursor: sqlite3.Cursor, voucher_no: str) -> bool:
+        state = read_archive_state(cursor)
+        if state is None:
+            return False
+        number = self._voucher_to_int(voucher_no)
+        if (
+            number is not None
+            and state.max_voucher_no_int is not None
+            and number > state.max_voucher_no_int
+        ):
+            return False
+        # The archive cannot be attached inside the save's transaction, so
+        # look it up on a reader connection instead.
+        open_reader = getattr(self._db, "open_read_connection", None)
+        if not callable(open_reader):
+            return False
+        with open_reader() as reader:
+            return voucher_is_archived(reader.cursor(), voucher_no)
+
+    def _missing_code_error(self, voucher_no: str, items: List[dict]) -> str | None:
+        missing_codes = self._find_missing_item_codes(items)
+        if not missing_codes:
+            return None
+        self._logger.warning(
+            "Estimate %s save aborted due to missing item codes: %s",
+            voucher_no,
+            ", ".join(missing_codes),
+        )
+        return self._format_missing_code_message(missing_codes, items)
+
     def _collect_item_rows(self, items: Iterable[dict]) -> dict[str, int]:
         row_map: dict[str, int] = {}
         for item in items:
@@ -0,0 +1,203 @@
+"""Idle-time WAL checkpoints, query-planner statistics, and journal pruning.
+
+A pass runs on its own connection with ``busy_timeout = 0`` and a progress
+handler wired to ``should_continue``: a task that would wait for a lock is
+skipped, and a task in flight is interrupted as soon as a write is queued,
+so foreground writes never wait behind maintenance. Skipped work is simply
+retried on the next idle pass.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from silverestimate.persistence.change_journal import (
+    current_generation,
+    journal_horizon,
+    prune_journal,
+)
+from silverestimate.persistence.database_driver import OperationalError
+
+PROGRESS_HANDLER_OPS = 1_000
+
+
+@dataclass(frozen=True)
+class IdleMaintenancePolicy:
+    """WAL-page thresholds and intervals for one idle maintenance pass.
+
+    A passive checkpoint runs once the WAL file holds
+    ``passive_checkpoint_pages`` pages; a restart checkpoint follows when the
+    log still has ``restart_checkpoint_pages`` frames so new writes start at
+    the beginning of the file again. ``analysis_limit`` bounds the rows
+    ``PRAGMA optimize`` and ``ANALYZE`` sample per index. Change-journal rows
+    more than ``journal_retention_generations`` generations old are pruned;
+    a differential based before them needs a new full backup instead.
+    """
+
+    passive_checkpoint_pages: int = 1_000
+    restart_checkpoint_pages: int = 4_000
+    optimize_interval_s: float = 3_600.0
+    analyze_interval_s: float = 86_400.0
+    analysis_limit: int = 400
+    journal_retention_generations: int = 100_000
+
+
+@dataclass(frozen=True)
+class IdleMaintenanceReport:
+    """What one idle pass did, for telemetry and tests."""
+
+    tasks: tuple[str, ...] = ()
+    skipped: tuple[str, ...] = ()
+    wal_bytes_before: int = 0
+    wal_bytes_after: int = 0
+    wal_frames: int = 0
+    pages_moved: int = 0
+    checkpoint_mode: str | None = None
+    journal_rows_pruned: int = 0
+    phase_ms: Mapping[str, float] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return sum(self.phase_ms.values())
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _yielded(exc: OperationalError) -> bool:
+    """Whether ``exc`` means the task gave way to other work."""
+    message = str(exc).lower()
+    return any(word in message for word in ("locked", "busy", "interrupt"))
+
+
+def _first_row(connection: Any, statement: str) -> tuple[Any, ...]:
+    row = connection.execute(statement).fetchone()
+    return tuple(row) if row is not None else ()
+
+
+def _journal_prune_target(connection: Any, retention: int) -> int | None:
+    """Return the generation to prune through, or ``None`` when nothing is due."""
+    cursor = connection.cursor()
+    try:
+        through = current_generation(cursor) - max(0, int(retention))
+        if through <= journal_horizon(cursor):
+            return None
+    except OperationalError:
+        # Databases without a change journal have nothing to prune.
+        return None
+    return through
+
+
+def _prune_journal(connection: Any, through: int) -> int:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        pruned = prune_journal(connection.cursor(), through)
+        connection.commit()
+    except BaseException:
+        if connection.in_transaction:
+            connection.rollback()
+        raise
+    return pruned
+
+
+def run_idle_maintenance(  # noqa: PLR0913 - explicit maintenance controls
+    connection: Any,
+    wal_path: str | Path,
+    policy: IdleMaintenancePolicy,
+    *,
+    optimize_due: bool,
+    analyze_due: bool,
+    should_continue: Callable[[], bool],
+) -> IdleMaintenanceReport:
+    """Run the checkpoints and statistics updates that are due on ``connection``."""
+    wal_path = Path(wal_path)
+    connection.execute("PRAGMA busy_timeout = 0")
+    connection.set_progress_handler(
+        lambda: int(not should_continue()), PROGRESS_HANDLER_OPS
+    )
+    page_size = int(connection.execute("PRAGMA page_size").fetchone()[0])
+    wal_before = _file_size(wal_path)
+    tasks: list[str] = []
+    skipped: list[str] = []
+    phase_ms: dict[str, float] = {}
+    frames = moved = pruned = 0
+    mode: str | None = None
+
+    def attempt(name: str, statement: str | Callable[[], Any]) -> Any:
+        if not should_continue():
+            skipped.append(name)
+            return None
+        started = time.perf_counter()
+        try:
+            result = (
+                statement()
+                if callable(statement)
+                else _first_row(connection, statement)
+            )
+        except OperationalError as exc:
+            if not _yielded(exc):
+                raise
+            skipped.append(name)
+            return None
+        finally:
+            phase_ms[name] = (time.perf_counter() - started) * 1000.0
+        tasks.append(name)
+        return result
+
+    try:
+        if wal_before >= policy.passive_checkpoint_pages * page_size:
+            row = attempt("checkpoint_passive", "PRAGMA main.wal_checkpoint(PASSIVE)")
+            if row:
+                mode, frames, moved = "passive", int(row[1]), int(row[2])
+            if row and frames >= policy.restart_checkpoint_pages:
+                row = attempt(
+                    "checkpoint_restart", "PRAGMA main.wal_checkpoint(RESTART)"
+                )
+                # A busy restart returns 1 instead of raising.
+                if row and int(row[0]) == 0:
+                    mode, frames, moved = "restart", int(row[1]), int(row[2])
+                elif row:
+                    tasks.remove("checkpoint_restart")
+                    skipped.append("checkpoint_restart")
+        if optimize_due or analyze_due:
+            connection.execute(f"PRAGMA analysis_limit = {int(policy.analysis_limit)}")
+        if optimize_due:
+            attempt("optimize", "PRAGMA main.optimize")
+        if analyze_due:
+            attempt("analyze", "ANALYZE main")
+        through = _journal_prune_target(
+            connection, policy.journal_retention_generations
+        )
+        if through is not None:
+            pruned = (
+                attempt("prune_journal", lambda: _prune_journal(connection, through))
+                or 0
+            )
+    finally:
+        connection.set_progress_handler(None, 0)
+    return IdleMaintenanceReport(
+        tasks=tuple(tasks),
+        skipped=tuple(skipped),
+        wal_bytes_before=wal_before,
+        wal_bytes_after=_file_size(wal_path),
+        wal_frames=frames,
+        pages_moved=moved,
+        checkpoint_mode=mode,
+        journal_rows_pruned=pruned,
+        phase_ms=phase_ms,
+    )
+
+
+__all__ = [
+    "IdleMaintenancePolicy",
+    "IdleMaintenanceReport",
+    "run_idle_maintenance",
+]
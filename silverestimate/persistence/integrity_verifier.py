@@ -0,0 +1,260 @@
+"""Incremental background integrity verification over broker read connections."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from enum import Enum, auto
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+from silverestimate.persistence.database_driver import (
+    CancelFlag,
+    DatabaseError,
+    MaintenanceBusyError,
+    OperationalError,
+    ReadConnection,
+)
+from silverestimate.persistence.storage_metadata import (
+    StorageMetadataError,
+    atomic_write_json,
+    read_json,
+)
+
+DEFAULT_SLICE_PAUSE_SECONDS = 0.05
+SCHEMA_SLICE = "sqlite_schema"
+
+
+class IntegrityState(Enum):
+    VERIFIED = auto()
+    PENDING = auto()
+    FAILED = auto()
+
+
+@dataclass(frozen=True)
+class IntegrityCheckResult:
+    state: IntegrityState
+    message: str
+    checked_utc: str | None = None
+    duration_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.state is IntegrityState.VERIFIED
+
+
+@dataclass(frozen=True)
+class IntegrityProgress:
+    """Persisted cursor of the rolling verification cycle."""
+
+    version: int
+    last_slice: str | None = None
+    last_slice_utc: str | None = None
+    cycle_started_utc: str | None = None
+    last_completed_utc: str | None = None
+
+    VERSION: ClassVar[int] = 1
+
+    @classmethod
+    def from_dict(cls, value: dict[str, Any]) -> Self:
+        try:
+            result = cls(**value)
+        except TypeError as exc:
+            raise StorageMetadataError("Malformed integrity progress") from exc
+        if result.version != cls.VERSION:
+            raise StorageMetadataError("Unsupported integrity progress version")
+        return result
+
+    @classmethod
+    def read(cls, path: str | Path) -> Self:
+        return cls.from_dict(read_json(path))
+
+    def write(self, path: str | Path) -> None:
+        atomic_write_json(path, asdict(self))
+
+
+class IntegrityVerifier:
+    """Verify one b-tree per slice and resume where the previous run stopped.
+
+    Each slice checks out its own broker reader, so maintenance can drain the
+    verifier between slices and interrupt it within one. ``quick_check`` on a
+    table reads and authenticates every page of that table and its indexes.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[CancelFlag | None], ReadConnection],
+        progress_path: str | Path,
+        *,
+        logger: logging.Logger | None = None,
+        slice_pause_seconds: float = DEFAULT_SLICE_PAUSE_SECONDS,
+    ) -> None:
+        self._connection_factory = connection_factory
+        self._progress_path = Path(progress_path)
+        self._logger = logger or logging.getLogger(__name__)
+        self._slice_pause_seconds = max(0.0, float(slice_pause_seconds))
+
+    def record_full_verification(self) -> None:
+        """Mark a cycle complete after an all-at-once validation at open."""
+        self._save(
+            IntegrityProgress(
+                version=IntegrityProgress.VERSION,
+                last_completed_utc=_utc_now(),
+            )
+        )
+
+    def progress(self) -> IntegrityProgress:
+        if not self._progress_path.is_file():
+            return IntegrityProgress(version=IntegrityProgress.VERSION)
+        try:
+            return IntegrityProgress.read(self._progress_path)
+        except StorageMetadataError as exc:
+            self._logger.warning("Restarting integrity cycle: %s", exc)
+            return IntegrityProgress(version=IntegrityProgress.VERSION)
+
+    def run(
+        self,
+        cancel_event: CancelFlag | None = None,
+        *,
+        max_slices: int | None = None,
+    ) -> IntegrityCheckResult:
+        """Continue the rolling cycle until it completes, stops, or hits a limit."""
+        started = time.perf_counter()
+        try:
+            stopped = self._run_slices(cancel_event, max_slices)
+        except MaintenanceBusyError:
+            return self._pending(started, "Integrity verification deferred")
+        except OperationalError as exc:
+            if "interrupt" in str(exc).lower():
+                return self._pending(started, "Integrity verification interrupted")
+            return self._failed(started, str(exc))
+        except DatabaseError as exc:
+            return self._failed(started, str(exc))
+        if stopped is not None:
+            return self._pending(started, stopped)
+
+        completed = _utc_now()
+        self._save(
+            IntegrityProgress(
+                version=IntegrityProgress.VERSION,
+                last_completed_utc=completed,
+            )
+        )
+        return IntegrityCheckResult(
+            IntegrityState.VERIFIED,
+            "Database integrity verified",
+            checked_utc=completed,
+            duration_ms=(time.perf_counter() - started) * 1000.0,
+        )
+
+    def _run_slices(
+        self,
+        cancel_event: CancelFlag | None,
+        max_slices: int | None,
+    ) -> str | None:
+        progress = self.progress()
+        remaining = self._remaining_slices(progress, cancel_event)
+        for index, name in enumerate(remaining):
+            if max_slices is not None and index >= max_slices:
+                return "Integrity cycle paused"
+            if cancel_event is not None and cancel_event.is_set():
+                return "Integrity verification cancelled"
+            if progress.cycle_started_utc is None:
+                progress = replace(progress, cycle_started_utc=_utc_now())
+            self._check_slice(name, cancel_event)
+            progress = replace(progress, last_slice=name, last_slice_utc=_utc_now())
+            self._save(progress)
+            self._pause(cancel_event)
+        return None
+
+    def _remaining_slices(
+        self,
+        progress: IntegrityProgress,
+        cancel_event: CancelFlag | None,
+    ) -> list[str]:
+        with self._connection_factory(cancel_event) as connection:
+            names = sorted(
+                str(row[0])
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND COALESCE(sql, '') NOT LIKE 'CREATE VIRTUAL TABLE%'"
+                )
+            )
+        last = progress.last_slice
+        if last is None:
+            return [SCHEMA_SLICE, *names]
+        # Names are compared rather than indexed so dropped tables do not
+        # shift the cursor; the schema slice always opens a cycle.
+        return [name for name in names if last == SCHEMA_SLICE or name > last]
+
+    def _check_slice(self, name: str, cancel_event: CancelFlag | None) -> None:
+        quoted = '"' + name.replace('"', '""') + '"'
+        slice_started = time.perf_counter()
+        with self._connection_factory(cancel_event) as connection:
+            rows = [
+                str(row[0])
+                for row in connection.execute(f"PRAGMA quick_check({quoted})")
+            ]
+            if rows != ["ok"]:
+                raise DatabaseError(f"quick_check failed for {name}: {rows[:5]!r}")
+            if name != SCHEMA_SLICE:
+                violations = list(
+                    connection.execute(f"PRAGMA foreign_key_check({quoted})")
+                )
+                if violations:
+                    raise DatabaseError(
+                        f"Foreign-key validation failed for {name} with "
+                        f"{len(violations)} violation(s)"
+                    )
+        self._logger.debug(
+            "[perf] database.integrity_slice_ms=%.3f slice=%s",
+            (time.perf_counter() - slice_started) * 1000.0,
+            name,
+        )
+
+    def _pause(self, cancel_event: CancelFlag | None) -> None:
+        if self._slice_pause_seconds <= 0:
+            return
+        if isinstance(cancel_event, threading.Event):
+            cancel_event.wait(self._slice_pause_seconds)
+        else:
+            time.sleep(self._slice_pause_seconds)
+
+    def _save(self, progress: IntegrityProgress) -> None:
+        try:
+            progress.write(self._progress_path)
+        except OSError as exc:
+            self._logger.debug("Could not persist integrity progress: %s", exc)
+
+    def _pending(self, started: float, message: str) -> IntegrityCheckResult:
+        return IntegrityCheckResult(
+            IntegrityState.PENDING,
+            message,
+            duration_ms=(time.perf_counter() - started) * 1000.0,
+        )
+
+    def _failed(self, started: float, message: str) -> IntegrityCheckResult:
+        # Restart the cycle so the damaged b-tree is rechecked after repair.
+        self._save(IntegrityProgress(version=IntegrityProgress.VERSION))
+        return IntegrityCheckResult(
+            IntegrityState.FAILED,
+            message,
+            checked_utc=_utc_now(),
+            duration_ms=(time.perf_counter() - started) * 1000.0,
+        )
+
+
+def _utc_now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+__all__ = [
+    "IntegrityCheckResult",
+    "IntegrityProgress",
+    "IntegrityState",
+    "IntegrityVerifier",
+]
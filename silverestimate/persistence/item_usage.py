@@ -0,0 +1,196 @@
+"""Per-item usage statistics that rank item searches by how often items are billed.
+
+``item_usage`` holds, per upper-cased item code, the number of live estimate
+lines using it and a recency-weighted score. Scores are forward-decayed: a
+line dated ``d`` adds ``2 ** ((d - USAGE_EPOCH) / USAGE_HALF_LIFE_DAYS)``, so
+a line billed one half-life later counts twice as much. Because every line
+is weighted against the same fixed epoch, stored scores keep ordering items
+by their decayed usage at any later date without being rewritten, and one
+line's contribution can be subtracted exactly when it is edited away.
+
+The statistics are a function of the live ``estimates`` and
+``estimate_items`` rows. Writers read the usage of the lines they are about
+to replace, add the usage of the new lines, and apply the difference in the
+same transaction; bulk paths call ``rebuild_usage``.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import Any, Iterable
+
+from silverestimate.infrastructure.item_catalog import fold
+
+ITEM_USAGE = "item_usage"
+USAGE_EPOCH = date(2020, 1, 1)
+USAGE_HALF_LIFE_DAYS = 60.0
+# Weights would overflow a float 1,024 half-lives after the epoch (~168
+# years); later dates all weigh as this many half-lives, which still leaves
+# room to sum the weights of any realistic number of lines.
+USAGE_MAX_HALF_LIVES = 768.0
+
+
+def usage_weight(estimate_date: object) -> float:
+    """Return one line's score for an estimate dated ``estimate_date``.
+
+    Dates that are not ``yyyy-MM-dd`` weigh as the epoch, so rebuilding
+    always reproduces what incremental writes stored. Dates past
+    ``USAGE_MAX_HALF_LIVES`` half-lives weigh as that cap.
+    """
+    try:
+        day = date.fromisoformat(str(estimate_date or "")[:10])
+    except ValueError:
+        day = USAGE_EPOCH
+    half_lives = (day - USAGE_EPOCH).days / USAGE_HALF_LIFE_DAYS
+    return math.pow(2.0, min(half_lives, USAGE_MAX_HALF_LIVES))
+
+
+def usage_key(code: object) -> str:
+    """Return the stored key for ``code``; ``UPPER`` also folds ASCII only."""
+    return fold(str(code or "").strip())
+
+
+class UsageChange:
+    """Per-code count and score deltas accumulated for one write."""
+
+    __slots__ = ("_deltas",)
+
+    def __init__(self) -> None:
+        self._deltas: dict[str, tuple[int, float]] = {}
+
+    def add(self, code: object, count: int, score: float) -> None:
+        key = usage_key(code)
+        if not key or not count:
+            return
+        previous_count, previous_score = self._deltas.get(key, (0, 0.0))
+        self._deltas[key] = (previous_count + count, previous_score + score)
+
+    def add_lines(
+        self, codes: Iterable[object], estimate_date: object, *, sign: int = 1
+    ) -> None:
+        """Count one line per code in ``codes``, dated ``estimate_date``."""
+        weight = usage_weight(estimate_date)
+        for code in codes:
+            self.add(code, sign, sign * weight)
+
+    def deltas(self) -> dict[str, tuple[int, float]]:
+        """Return the non-zero ``code -> (count delta, score delta)`` pairs.
+
+        A line kept across a date change nets a zero count but still moves
+        the score.
+        """
+        return {
+            key: delta
+            for key, delta in self._deltas.items()
+            if delta[0] or delta[1] != 0.0
+        }
+
+
+def usage_statements() -> dict[str, str]:
+    """Return the usage table."""
+    return {
+        ITEM_USAGE: (
+            f"CREATE TABLE IF NOT EXISTS {ITEM_USAGE} ("
+            "item_code TEXT PRIMARY KEY, "
+            "use_count INTEGER NOT NULL DEFAULT 0, "
+            "score REAL NOT NULL DEFAULT 0) WITHOUT ROWID"
+        ),
+    }
+
+
+def usage_order_sql(cursor: Any, code_column: str = "code") -> str:
+    """Return an ``ORDER BY`` term putting used items first, or ``""``.
+
+    The term sorts rows of ``items`` by descending usage score; rows without
+    usage tie at zero.
+    """
+    if not usage_exists(cursor):
+        return ""
+    return (
+        f"COALESCE((SELECT score FROM {ITEM_USAGE} "  # nosec B608
+        f"WHERE item_code = UPPER({code_column})), 0) DESC, "
+    )
+
+
+def usage_exists(cursor: Any) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (ITEM_USAGE,),
+    )
+    return bool(cursor.fetchall())
+
+
+def read_line_usage(
+    cursor: Any,
+    change: UsageChange,
+    where: str = "1=1",
+    params: Iterable[Any] = (),
+    *,
+    sign: int = 1,
+) -> None:
+    """Add the usage of the live lines matching ``where`` to ``change``.
+
+    ``where`` filters ``estimate_items`` aliased as ``ei``.
+    """
+    cursor.execute(
+        "SELECT UPPER(TRIM(ei.item_code)), e.date, COUNT(*) "  # nosec B608
+        "FROM main.estimate_items ei "
+        "JOIN main.estimates e ON e.voucher_no = ei.voucher_no "
+        f"WHERE ei.item_code IS NOT NULL AND TRIM(ei.item_code) != '' AND ({where}) "
+        "GROUP BY 1, 2",
+        tuple(params),
+    )
+    for code, estimate_date, count in cursor.fetchall():
+        count = int(count)
+        change.add(code, sign * count, sign * count * usage_weight(estimate_date))
+
+
+def apply_usage(cursor: Any, change: UsageChange) -> dict[str, tuple[int, float]]:
+    """Apply ``change`` to ``item_usage`` and return the deltas written."""
+    deltas = change.deltas()
+    if not deltas:
+        return deltas
+    cursor.executemany(
+        f"INSERT INTO {ITEM_USAGE}(item_code, use_count, score) "  # nosec B608
+        "VALUES (?, ?, ?) ON CONFLICT(item_code) DO UPDATE SET "
+        "use_count = use_count + excluded.use_count, "
+        "score = score + excluded.score",
+        [(key, count, score) for key, (count, score) in deltas.items()],
+    )
+    cursor.execute(f"DELETE FROM {ITEM_USAGE} WHERE use_count <= 0")  # nosec B608
+    return deltas
+
+
+def rebuild_usage(cursor: Any) -> None:
+    """Recompute every usage row from the live estimate lines."""
+    change = UsageChange()
+    read_line_usage(cursor, change)
+    cursor.execute(f"DELETE FROM {ITEM_USAGE}")  # nosec B608
+    apply_usage(cursor, change)
+
+
+def read_usage(cursor: Any) -> dict[str, tuple[int, float]]:
+    """Return ``code -> (use count, score)`` for every used item."""
+    cursor.execute(f"SELECT item_code, use_count, score FROM {ITEM_USAGE}")  # nosec B608
+    return {
+        str(row[0]): (int(row[1]), float(row[2])) for row in cursor.fetchall() if row[0]
+    }
+
+
+__all__ = [
+    "ITEM_USAGE",
+    "USAGE_EPOCH",
+    "USAGE_HALF_LIFE_DAYS",
+    "USAGE_MAX_HALF_LIVES",
+    "UsageChange",
+    "apply_usage",
+    "read_line_usage",
+    "read_usage",
+    "rebuild_usage",
+    "usage_exists",
+    "usage_key",
+    "usage_order_sql",
+    "usage_statements",
+    "usage_weight",
+]
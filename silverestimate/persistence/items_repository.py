@@ -5,17 +5,47 @@ from __future__ import annotations
 import logging
 from typing import Any, Iterable, Optional, cast
 
-from silverestimate.domain.item_validation import ItemValidationError, validate_item
+from silverestimate.domain.item_validation import (
+    ItemValidationError,
+    ValidatedItem,
+    validate_item,
+)
 from silverestimate.domain.pagination import ItemCursor, Page
 from silverestimate.persistence.database_driver import dbapi as sqlite3
 from silverestimate.persistence.database_protocols import (
     ItemCacheBoundary,
     RepositoryDatabase,
 )
+from silverestimate.persistence.item_usage import ITEM_USAGE, usage_order_sql
+from silverestimate.persistence.query_cache import tables_changed
+from silverestimate.persistence.search_index import (
+    ITEM_SEARCH_INDEX,
+    search_index_exists,
+    trigram_match,
+)
 
 ITEM_CATALOG_COLUMNS = "code, name, tunch, purity, wage_type, wage_rate"
 
 
+def _item_search_filter(
+    cursor: sqlite3.Cursor, term: str
+) -> tuple[str, tuple[str, ...]]:
+    """Return a trigram candidate filter that narrows LIKE scans to matches.
+
+    The filter is a superset of the LIKE predicates it accompanies, so callers
+    keep their LIKE clauses and ranking unchanged. Short terms, LIKE wildcards,
+    and databases without the optional index fall back to a plain scan.
+    """
+    match = trigram_match(term)
+    if match is None or not search_index_exists(cursor, ITEM_SEARCH_INDEX):
+        return "", ()
+    return (
+        f" AND rowid IN (SELECT rowid FROM {ITEM_SEARCH_INDEX} "
+        f"WHERE {ITEM_SEARCH_INDEX} MATCH ?)",
+        (match,),
+    )
+
+
 def fetch_item_catalog_rows(
     cursor: sqlite3.Cursor,
     search_term: str,
@@ -29,18 +59,26 @@ def fetch_item_catalog_rows(
         )
         return list(cursor.fetchall())
 
-    prefix_pattern = f"{term}%"
-    cursor.execute(
-        """
+    candidate_sql, candidate_params = _item_search_filter(cursor, term)
+    union_sql = f"""
         SELECT code, name, tunch, purity, wage_type, wage_rate
-        FROM items WHERE code LIKE ? COLLATE NOCASE
+        FROM items WHERE code LIKE ? COLLATE NOCASE{candidate_sql}
         UNION ALL
         SELECT code, name, tunch, purity, wage_type, wage_rate FROM items
         WHERE name LIKE ? COLLATE NOCASE
-          AND code NOT LIKE ? COLLATE NOCASE
+          AND code NOT LIKE ? COLLATE NOCASE{candidate_sql}
         ORDER BY code COLLATE NOCASE
-        """,
-        (prefix_pattern, prefix_pattern, prefix_pattern),
+        """  # nosec B608
+    prefix_pattern = f"{term}%"
+    cursor.execute(
+        union_sql,
+        (
+            prefix_pattern,
+            *candidate_params,
+            prefix_pattern,
+            prefix_pattern,
+            *candidate_params,
+        ),
     )
     prefix_rows: list[Any] = list(cursor.fetchall())
     if prefix_rows:
@@ -51,53 +89,77 @@ def fetch_item_catalog_rows(
 
     pattern = f"%{term}%"
     cursor.execute(
-        """
-        SELECT code, name, tunch, purity, wage_type, wage_rate
-        FROM items WHERE code LIKE ? COLLATE NOCASE
-        UNION ALL
-        SELECT code, name, tunch, purity, wage_type, wage_rate FROM items
-        WHERE name LIKE ? COLLATE NOCASE
-          AND code NOT LIKE ? COLLATE NOCASE
-        ORDER BY code COLLATE NOCASE
-        """,
-        (pattern, pattern, pattern),
+        union_sql,
+        (pattern, *candidate_params, pattern, pattern, *candidate_params),
     )
     return list(cursor.fetchall())
 
 
+def _item_catalog_filter(
+    cursor: sqlite3.Cursor, search_term: str
+) -> tuple[str, list[Any]] | None:
+    """Return the item-master WHERE clause, or ``None`` when nothing can match.
+
+    Prefix matches on code or name win; without any, terms of two or more
+    characters fall back to contains matching.
+    """
+    term = (search_term or "").strip()
+    if not term:
+        return "1=1", []
+    candidate_sql, candidate_params = _item_search_filter(cursor, term)
+    prefix = f"{term}%"
+    cursor.execute(
+        "SELECT EXISTS(SELECT 1 FROM items "
+        "WHERE (code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE)"
+        f"{candidate_sql})",  # nosec B608
+        (prefix, prefix, *candidate_params),
+    )
+    has_prefix = bool(cursor.fetchone()[0])
+    if has_prefix:
+        pattern = prefix
+    elif len(term) >= 2:
+        pattern = f"%{term}%"
+    else:
+        return None
+    return (
+        f"(code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE){candidate_sql}",
+        [pattern, pattern, *candidate_params],
+    )
+
+
+def _count_items(cursor: sqlite3.Cursor, where_sql: str, params: list[Any]) -> int:
+    cursor.execute(f"SELECT COUNT(*) FROM items WHERE {where_sql}", params)  # nosec B608
+    count_row = cursor.fetchone()
+    return int(count_row[0]) if count_row else 0
+
+
+def count_item_catalog(cursor: sqlite3.Cursor, search_term: str) -> int:
+    """Count the item-master rows ``fetch_item_catalog_page`` would page through."""
+    item_filter = _item_catalog_filter(cursor, search_term)
+    if item_filter is None:
+        return 0
+    return _count_items(cursor, *item_filter)
+
+
 def fetch_item_catalog_page(
     cursor: sqlite3.Cursor,
     search_term: str,
     *,
     page_cursor: ItemCursor | None = None,
     limit: int = 1000,
+    include_total: bool = True,
 ) -> Page[dict[str, Any], ItemCursor]:
-    """Return one keyset-ordered item-master page and its total match count."""
-    page_size = max(1, min(int(limit), 5000))
-    term = (search_term or "").strip()
-    where_sql = "1=1"
-    where_params: list[Any] = []
-
-    if term:
-        prefix = f"{term}%"
-        cursor.execute(
-            "SELECT EXISTS(SELECT 1 FROM items "
-            "WHERE code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE)",
-            (prefix, prefix),
-        )
-        has_prefix = bool(cursor.fetchone()[0])
-        if has_prefix:
-            pattern = prefix
-        elif len(term) >= 2:
-            pattern = f"%{term}%"
-        else:
-            return Page(items=(), total=0, next_cursor=None)
-        where_sql = "(code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE)"
-        where_params.extend((pattern, pattern))
+    """Return one keyset-ordered item-master page and its total match count.
 
-    cursor.execute(f"SELECT COUNT(*) FROM items WHERE {where_sql}", where_params)  # nosec B608
-    count_row = cursor.fetchone()
-    total = int(count_row[0]) if count_row else 0
+    With ``include_total=False`` the count is skipped and the page's total is
+    ``None``; callers fetch it later with ``count_item_catalog``.
+    """
+    page_size = max(1, min(int(limit), 5000))
+    item_filter = _item_catalog_filter(cursor, search_term)
+    if item_filter is None:
+        return Page(items=(), total=0, next_cursor=None)
+    where_sql, where_params = item_filter
+    total = _count_items(cursor, where_sql, where_params) if include_total else None
 
     keyset_sql = ""
     params = list(where_params)
@@ -167,6 +229,8 @@ class ItemsRepository:
                 cached = cache_ctrl.get(code)
                 if cached is not None:
                     return self._normalize_row(cached)
+                if cache_ctrl.knows_absent(code):
+                    return None
             else:
                 cached = self._fallback_cache.get(key)
                 if cached is not None:
@@ -189,10 +253,15 @@ class ItemsRepository:
             self._logger.error("DB Error get_item_by_code: %s", exc, exc_info=True)
             return None
 
-    def search_items(self, search_term: str) -> list[sqlite3.Row]:
+    def search_items(self, search_term: str) -> list[Any]:
         cursor = self._cursor
         if not cursor:
             return []
+        cache_ctrl = self._cache_controller
+        if cache_ctrl:
+            cached = cache_ctrl.search_rows(search_term)
+            if cached is not None:
+                return cached
         try:
             return fetch_item_catalog_rows(cursor, search_term)
         except sqlite3.Error as exc:
@@ -223,7 +292,8 @@ class ItemsRepository:
 
         Results are capped to ``limit`` rows and ordered to prioritize:
         1) code prefix matches, 2) name prefix matches,
-        3) code contains matches, 4) name contains matches.
+        3) code contains matches, 4) name contains matches. Within each
+        group, items with a higher usage score come first, then code order.
         """
         cursor = self._cursor
         if not cursor:
@@ -237,25 +307,30 @@ class ItemsRepository:
             limit_i = 1
         if limit_i > 5000:
             limit_i = 5000
+        cache_ctrl = self._cache_controller
+        if cache_ctrl:
+            cached = cache_ctrl.search_for_selection(search_term, limit_i)
+            if cached is not None:
+                return cached
         fetch_size = limit_i + 1
 
         term = (search_term or "").strip()
         try:
+            usage_order = usage_order_sql(cursor)
             if not term:
-                cursor.execute(
-                    "SELECT code, name, tunch, purity, wage_type, wage_rate "
-                    "FROM items ORDER BY code COLLATE NOCASE LIMIT ?",
-                    (fetch_size,),
+                rows = self._selection_rows_by_usage(
+                    cursor, fetch_size, use_usage=bool(usage_order)
                 )
-                rows = cursor.fetchall()
             else:
                 prefix = f"{term}%"
                 contains = f"%{term}%"
+                candidate_sql, candidate_params = _item_search_filter(cursor, term)
                 cursor.execute(
-                    """
+                    f"""
                     SELECT code, name, tunch, purity, wage_type, wage_rate
                     FROM items
-                    WHERE code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE
+                    WHERE (code LIKE ? COLLATE NOCASE OR name LIKE ? COLLATE NOCASE)
+                        {candidate_sql}
                     ORDER BY
                         CASE
                             WHEN code LIKE ? COLLATE NOCASE THEN 0
@@ -264,12 +339,13 @@ class ItemsRepository:
                             WHEN name LIKE ? COLLATE NOCASE THEN 3
                             ELSE 4
                         END,
-                        code COLLATE NOCASE
+                        {usage_order}code COLLATE NOCASE
                     LIMIT ?
-                    """,
+                    """,  # nosec B608
                     (
                         contains,
                         contains,
+                        *candidate_params,
                         prefix,
                         prefix,
                         contains,
@@ -289,10 +365,42 @@ class ItemsRepository:
             rows = rows[:limit_i]
         return list(rows), truncated
 
-    def get_all_items(self) -> list[sqlite3.Row]:
+    @staticmethod
+    def _selection_rows_by_usage(
+        cursor: sqlite3.Cursor, fetch_size: int, *, use_usage: bool
+    ) -> list[Any]:
+        """Return the unfiltered selection list: used items first, then by code."""
+        rows: list[Any] = []
+        unused_filter = ""
+        if use_usage:
+            cursor.execute(
+                "SELECT i.code, i.name, i.tunch, i.purity, i.wage_type, i.wage_rate "  # nosec B608
+                f"FROM {ITEM_USAGE} u JOIN items i ON UPPER(i.code) = u.item_code "
+                "ORDER BY u.score DESC, i.code COLLATE NOCASE LIMIT ?",
+                (fetch_size,),
+            )
+            rows = list(cursor.fetchall())
+            unused_filter = (
+                f"WHERE UPPER(code) NOT IN (SELECT item_code FROM {ITEM_USAGE}) "
+            )
+        if len(rows) < fetch_size:
+            cursor.execute(
+                "SELECT code, name, tunch, purity, wage_type, wage_rate "  # nosec B608
+                f"FROM items {unused_filter}ORDER BY code COLLATE NOCASE LIMIT ?",
+                (fetch_size - len(rows),),
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def get_all_items(self) -> list[Any]:
         cursor = self._cursor
         if not cursor:
             return []
+        cache_ctrl = self._cache_controller
+        if cache_ctrl:
+            cached = cache_ctrl.search_rows("")
+            if cached is not None:
+                return cached
         try:
             return fetch_item_catalog_rows(cursor, "")
         except sqlite3.Error as exc:
@@ -315,6 +423,11 @@ class ItemsRepository:
         )
         if not normalized_codes:
             return {}
+        cache_ctrl = self._cache_controller
+        if cache_ctrl:
+            cached = cache_ctrl.get_many(normalized_codes)
+            if cached is not None:
+                return cached
 
         rows_by_code: dict[str, dict[str, Any]] = {}
         chunk_size = 900
@@ -383,7 +496,7 @@ class ItemsRepository:
                 ),
             )
             conn.commit()
-            self._invalidate_cache(validated.code)
+            self._cache_written(validated.code, validated)
             return True
         except ItemValidationError as exc:
             self._logger.warning("Rejected invalid item payload: %s", exc)
@@ -428,7 +541,7 @@ class ItemsRepository:
             )
             conn.commit()
             if cursor.rowcount > 0:
-                self._invalidate_cache(validated.code)
+                self._cache_written(validated.code, validated)
                 return True
             return False
         except ItemValidationError as exc:
@@ -480,7 +593,7 @@ class ItemsRepository:
         updated = len(normalized_items) - inserted
         deleted = 0
         try:
-            conn.execute("BEGIN")
+            conn.execute("BEGIN IMMEDIATE")
             cursor.executemany(
                 """
                 INSERT INTO items (code, name, purity, wage_type, wage_rate, tunch)
@@ -510,6 +623,7 @@ class ItemsRepository:
                 deleted = self._delete_codes(cursor, obsolete_codes)
 
             conn.commit()
+            tables_changed(self._db, "items")
         except sqlite3.Error as exc:
             self._logger.error(
                 "DB Error upserting item catalog: %s", exc, exc_info=True
@@ -543,7 +657,7 @@ class ItemsRepository:
             cursor.execute("DELETE FROM items WHERE code = ?", (code,))
             conn.commit()
             if cursor.rowcount > 0:
-                self._invalidate_cache(code)
+                self._cache_written(code, None)
                 return True
             return False
         except sqlite3.Error as exc:
@@ -553,15 +667,29 @@ class ItemsRepository:
 
     # --- helpers -----------------------------------------------------------------
 
-    def _invalidate_cache(self, code: str) -> None:
+    def _cache_written(self, code: str, item: ValidatedItem | None) -> None:
+        """Apply a committed add/update (``item``) or delete to the item caches."""
+        tables_changed(self._db, "items")
         try:
             cache_ctrl = self._cache_controller
-            if cache_ctrl:
-                cache_ctrl.invalidate(code)
-            else:
+            if not cache_ctrl:
                 self._fallback_cache.pop((code or "").upper(), None)
+            elif item is None:
+                cache_ctrl.remove(code)
+            else:
+                cache_ctrl.store(
+                    code,
+                    {
+                        "code": item.code,
+                        "name": item.name,
+                        "tunch": item.tunch,
+                        "purity": item.purity,
+                        "wage_type": item.wage_type,
+                        "wage_rate": item.wage_rate,
+                    },
+                )
         except Exception as exc:
-            self._logger.debug("Failed to invalidate item cache for %s: %s", code, exc)
+            self._logger.debug("Failed to update item cache for %s: %s", code, exc)
 
     @staticmethod
     def _normalize_row(row: Any) -> Optional[dict[str, Any]]:
@@ -0,0 +1,284 @@
+"""Read-through cache for repeated repository reads.
+
+Entries are keyed by a query shape and its bound parameters and tagged with
+the tables the query reads. Every table has a write generation; an entry
+remembers the generations it was loaded under and is a miss as soon as any of
+them moved. Repositories bump generations after they commit, and each lookup
+compares ``PRAGMA data_version`` on the reading connection with the value it
+showed last time, so a commit made by another connection or process also
+expires the cache. ``data_version`` does not say which table changed; a cache
+that ``follow``s a ``ChangeMonitor`` asks it which tables the other
+connections wrote and expires only those, and any other cache expires every
+table.
+
+The cache is LRU-bounded by entry count and by an estimate of the bytes the
+cached rows hold. Hits hand back copies of row containers and dict rows, so
+callers may keep mutating what a repository returns.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar, cast
+
+from silverestimate.domain.pagination import Page
+from silverestimate.persistence.change_monitor import ChangeMonitor, TableChanges
+from silverestimate.persistence.database_driver import Error
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+# Connections whose last ``data_version`` is remembered; each is held so its
+# id cannot be reused by a different connection while it is tracked.
+MAX_TRACKED_CONNECTIONS = 16
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class QueryCacheMetrics:
+    """Point-in-time cache counters for telemetry and diagnostics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    generations: tuple[tuple[str, int], ...]
+    size: int
+
+
+class QueryCache:
+    """Thread-safe LRU of read results, expired by per-table generations."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._bytes = 0
+        self._data_versions: OrderedDict[int, tuple[Any, int]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._monitor: ChangeMonitor | None = None
+
+    def follow(self, monitor: ChangeMonitor) -> None:
+        """Expire only the tables ``monitor`` reports other connections changed."""
+        self._monitor = monitor
+        monitor.subscribe(self.apply_changes)
+
+    def apply_changes(self, changes: TableChanges) -> None:
+        if changes.tables is None:
+            self.invalidate_all()
+        else:
+            self.invalidate(*changes.tables)
+
+    def generation(self, table: str) -> int:
+        with self._lock:
+            return self._epoch + self._generations.get(table, 0)
+
+    def invalidate(self, *tables: str) -> None:
+        """Expire every entry that reads one of ``tables``."""
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+    def invalidate_all(self) -> None:
+        """Expire every entry, including tables no write has named yet."""
+        with self._lock:
+            self._epoch += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._data_versions.clear()
+            self._epoch += 1
+
+    def read(  # noqa: PLR0913 - the key, its tables, and the loader
+        self,
+        cursor: Any,
+        shape: str,
+        params: tuple[Hashable, ...],
+        tables: Iterable[str],
+        loader: Callable[[], T],
+    ) -> T:
+        """Return the cached result of ``loader`` or run it and remember it.
+
+        ``cursor`` is the one ``loader`` reads through; its connection's
+        ``data_version`` is checked first. Exceptions from ``loader`` are
+        never cached.
+        """
+        self._observe_data_version(cursor)
+        key = (shape, params)
+        tables = tuple(sorted(set(tables)))
+        with self._lock:
+            generations = self._snapshot(tables)
+            entry = self._entries.get(key)
+            if entry is not None and entry.generations == generations:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                cached: T = entry.value
+                return _detach(cached)
+            self._misses += 1
+        # Generations are read before the query runs, so a write that commits
+        # while it runs leaves the stored entry already stale.
+        value = loader()
+        size = _estimate_bytes(value)
+        if size <= self.max_bytes:
+            with self._lock:
+                self._store(key, _Entry(value, generations, size))
+        return _detach(value)
+
+    def metrics(self) -> QueryCacheMetrics:
+        with self._lock:
+            return QueryCacheMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _snapshot(self, tables: tuple[str, ...]) -> tuple[tuple[str, int], ...]:
+        return tuple(
+            (table, self._epoch + self._generations.get(table, 0)) for table in tables
+        )
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+
+    def _observe_data_version(self, cursor: Any) -> None:
+        connection = getattr(cursor, "connection", None)
+        if connection is None:
+            return
+        try:
+            cursor.execute("PRAGMA data_version")
+            row = cursor.fetchone()
+        except Error as exc:
+            self._logger.debug("Could not read data_version: %s", exc)
+            self.invalidate_all()
+            return
+        version = int(row[0]) if row else 0
+        with self._lock:
+            seen = self._data_versions.pop(id(connection), None)
+            self._data_versions[id(connection)] = (connection, version)
+            if len(self._data_versions) > MAX_TRACKED_CONNECTIONS:
+                self._data_versions.popitem(last=False)
+            monitor = self._monitor
+        # A connection seen for the first time has no baseline to compare.
+        if seen is not None and seen[1] == version:
+            return
+        # The monitor publishes what it finds, which expires those tables here.
+        if monitor is None or monitor.catch_up(cursor) is None:
+            self.invalidate_all()
+
+
+def _detach(value: T) -> T:
+    """Copy row containers and dict rows so callers cannot edit the entry."""
+    detached: Any
+    if isinstance(value, Page):
+        detached = replace(value, items=tuple(_detach_row(row) for row in value.items))
+    elif isinstance(value, list):
+        detached = [_detach_row(row) for row in value]
+    else:
+        detached = _detach_row(value)
+    return cast(T, detached)
+
+
+def _detach_row(row: Any) -> Any:
+    return dict(row) if isinstance(row, dict) else row
+
+
+def _estimate_bytes(value: Any) -> int:
+    """Approximate the memory a cached result holds, one level into each row."""
+    if isinstance(value, Page):
+        return sys.getsizeof(value) + _estimate_bytes(value.items)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_row_bytes(row) for row in value)
+    return _row_bytes(value)
+
+
+def _row_bytes(row: Any) -> int:
+    if isinstance(row, dict):
+        fields: Iterable[Any] = row.values()
+    elif isinstance(row, tuple) or hasattr(row, "keys"):
+        fields = row
+    else:
+        fields = ()
+    return sys.getsizeof(row) + sum(sys.getsizeof(field) for field in fields)
+
+
+def tables_changed(db: object, *tables: str) -> None:
+    """Tell ``db``'s query cache that a committed write touched ``tables``."""
+    invalidate = getattr(db, "invalidate_tables", None)
+    if callable(invalidate):
+        invalidate(*tables)
+
+
+def query_cache_of(db: object) -> QueryCache | None:
+    cache = getattr(db, "query_cache", None)
+    return cache if isinstance(cache, QueryCache) else None
+
+
+def cached_read(  # noqa: PLR0913 - mirrors QueryCache.read
+    db: object,
+    shape: str,
+    params: tuple[Hashable, ...],
+    tables: Iterable[str],
+    loader: Callable[[], T],
+    *,
+    use_cache: bool = True,
+) -> T:
+    """Read through ``db``'s query cache unless it has none or ``use_cache`` is off."""
+    cache = query_cache_of(db)
+    cursor = getattr(db, "cursor", None)
+    if cache is None or cursor is None or not use_cache:
+        return loader()
+    return cache.read(cursor, shape, params, tables, loader)
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "QueryCache",
+    "QueryCacheMetrics",
+    "cached_read",
+    "query_cache_of",
+    "tables_changed",
+]
@@ -5,9 +5,41 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from silverestimate.persistence.change_journal import (
+    CHANGE_JOURNAL,
+    advance_horizon,
+    current_generation,
+    journal_statements,
+)
 from silverestimate.persistence.database_driver import dbapi as sqlite3
+from silverestimate.persistence.item_usage import (
+    ITEM_USAGE,
+    rebuild_usage,
+    usage_statements,
+)
+from silverestimate.persistence.search_index import (
+    ESTIMATE_SEARCH_INDEX,
+    ITEM_SEARCH_INDEX,
+)
+from silverestimate.persistence.silver_bar_summary import (
+    SILVER_BAR_SUMMARY,
+    rebuild_summary,
+    summary_statements,
+)
 
 CURRENT_SCHEMA_VERSION = 8
+# Bump when setup adds derived objects (indexes, triggers, shadow tables) to
+# an existing schema version so clean-close fingerprints force a full setup.
+SCHEMA_SETUP_REVISION = 7
+
+# Replaced by the COALESCE order indexes, which the paged views actually use.
+_SUPERSEDED_INDEXES = ("idx_estimates_history_keyset", "idx_sbars_status_list_date_id")
+
+# Trigram shadow index name -> (content table, indexed columns).
+SEARCH_INDEXES = {
+    ITEM_SEARCH_INDEX: ("items", ("code", "name")),
+    ESTIMATE_SEARCH_INDEX: ("estimates", ("voucher_no", "note")),
+}
 
 if TYPE_CHECKING:  # pragma: no cover
     from silverestimate.persistence.database_manager import DatabaseManager
@@ -193,10 +225,6 @@ def _ensure_indexes(db: "DatabaseManager") -> None:
             "CREATE INDEX IF NOT EXISTS idx_estimates_voucher_no_int "
             "ON estimates(voucher_no_int DESC)"
         ),
-        "idx_estimates_history_keyset": (
-            "CREATE INDEX IF NOT EXISTS idx_estimates_history_keyset "
-            "ON estimates(voucher_no_int DESC, voucher_no DESC)"
-        ),
         "idx_estimate_items_voucher": (
             "CREATE INDEX IF NOT EXISTS idx_estimate_items_voucher "
             "ON estimate_items(voucher_no)"
@@ -219,10 +247,6 @@ def _ensure_indexes(db: "DatabaseManager") -> None:
         "idx_sbars_status": (
             "CREATE INDEX IF NOT EXISTS idx_sbars_status ON silver_bars(status)"
         ),
-        "idx_sbars_status_list_date_id": (
-            "CREATE INDEX IF NOT EXISTS idx_sbars_status_list_date_id "
-            "ON silver_bars(status, list_id, date_added DESC, bar_id DESC)"
-        ),
         "idx_sbars_status_list_weight_date_id": (
             "CREATE INDEX IF NOT EXISTS idx_sbars_status_list_weight_date_id "
             "ON silver_bars(status, list_id, weight, date_added DESC, bar_id DESC)"
@@ -234,12 +258,37 @@ def _ensure_indexes(db: "DatabaseManager") -> None:
             "CREATE INDEX IF NOT EXISTS idx_sbars_voucher_line_key "
             "ON silver_bars(estimate_voucher_no, source_line_key)"
         ),
+        # The paged views order by these exact expressions; matching indexes
+        # let SQLite walk them in order instead of sorting every match.
+        "idx_items_catalog_order": (
+            "CREATE INDEX IF NOT EXISTS idx_items_catalog_order "
+            "ON items(UPPER(code), code)"
+        ),
+        "idx_estimates_history_order": (
+            "CREATE INDEX IF NOT EXISTS idx_estimates_history_order "
+            "ON estimates(COALESCE(voucher_no_int, -1) DESC, voucher_no DESC)"
+        ),
+        "idx_sbars_status_list_order": (
+            "CREATE INDEX IF NOT EXISTS idx_sbars_status_list_order "
+            "ON silver_bars(status, list_id, COALESCE(date_added, '') DESC, "
+            "bar_id DESC)"
+        ),
+        "idx_sbars_status_order": (
+            "CREATE INDEX IF NOT EXISTS idx_sbars_status_order "
+            "ON silver_bars(status, COALESCE(date_added, '') DESC, bar_id DESC)"
+        ),
+        "idx_sbars_order": (
+            "CREATE INDEX IF NOT EXISTS idx_sbars_order "
+            "ON silver_bars(COALESCE(date_added, '') DESC, bar_id DESC)"
+        ),
         "idx_sbar_lists_identifier": (
             "CREATE INDEX IF NOT EXISTS idx_sbar_lists_identifier "
             "ON silver_bar_lists(list_identifier)"
         ),
     }
     failures: list[str] = []
+    for name in _SUPERSEDED_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
     for position, (name, statement) in enumerate(mandatory_indexes.items()):
         savepoint = f"schema_index_{position}"
         cursor.execute(f"SAVEPOINT {savepoint}")
@@ -262,6 +311,11 @@ def _ensure_indexes(db: "DatabaseManager") -> None:
             exc,
         )
 
+    _ensure_search_indexes(db)
+    _ensure_silver_bar_summary(db)
+    _ensure_item_usage(db)
+    _ensure_change_journal(db)
+
     if failures:
         raise sqlite3.OperationalError(
             "Mandatory index creation failed: " + "; ".join(failures)
@@ -269,6 +323,164 @@ def _ensure_indexes(db: "DatabaseManager") -> None:
     logger.info("Database indexes staged.")
 
 
+def _search_index_statements(
+    index: str, table: str, columns: tuple[str, ...]
+) -> dict[str, str]:
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {index}({index}, rowid, {column_list}) "
+        f"VALUES ('delete', old.rowid, {old_values}); "
+    )
+    insert_new = (
+        f"INSERT INTO {index}(rowid, {column_list}) VALUES (new.rowid, {new_values}); "
+    )
+    return {
+        index: (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+            f"{column_list}, content='{table}', content_rowid='rowid', "
+            "tokenize='trigram')"
+        ),
+        f"trg_{index}_insert": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{index}_insert "
+            f"AFTER INSERT ON {table} BEGIN {insert_new}END"
+        ),
+        f"trg_{index}_delete": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{index}_delete "
+            f"AFTER DELETE ON {table} BEGIN {delete_old}END"
+        ),
+        f"trg_{index}_update": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{index}_update "
+            f"AFTER UPDATE OF {column_list} ON {table} "
+            f"BEGIN {delete_old}{insert_new}END"
+        ),
+    }
+
+
+def _ensure_search_indexes(db: "DatabaseManager") -> None:
+    for index in SEARCH_INDEXES:
+        _ensure_search_index(db, index)
+
+
+def _ensure_search_index(db: "DatabaseManager", index: str) -> None:
+    """Maintain one trigram shadow index that serves substring searches."""
+    cursor = db.cursor
+    logger = db.logger
+    assert cursor is not None
+    assert logger is not None
+
+    table, columns = SEARCH_INDEXES[index]
+    statements = _search_index_statements(index, table, columns)
+    savepoint = f"schema_{index}"
+    cursor.execute(f"SAVEPOINT {savepoint}")
+    try:
+        placeholders = ",".join("?" for _ in statements)
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",  # nosec B608
+            tuple(statements),
+        )
+        existing = int(cursor.fetchone()[0])
+        for statement in statements.values():
+            cursor.execute(statement)
+        if existing != len(statements):
+            # Any missing trigger means edits may have bypassed the index.
+            cursor.execute(f"INSERT INTO {index}({index}) VALUES ('rebuild')")  # nosec B608
+    except sqlite3.Error as exc:
+        cursor.execute(f"ROLLBACK TO {savepoint}")
+        logger.warning("Optional search index %s was skipped: %s", index, exc)
+    finally:
+        cursor.execute(f"RELEASE {savepoint}")
+
+
+def _ensure_silver_bar_summary(db: "DatabaseManager") -> None:
+    """Maintain the trigger-fed inventory totals behind the silver-bar views."""
+    cursor = db.cursor
+    logger = db.logger
+    assert cursor is not None
+    assert logger is not None
+
+    statements = summary_statements()
+    savepoint = f"schema_{SILVER_BAR_SUMMARY}"
+    cursor.execute(f"SAVEPOINT {savepoint}")
+    try:
+        placeholders = ",".join("?" for _ in statements)
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",  # nosec B608
+            tuple(statements),
+        )
+        existing = int(cursor.fetchone()[0])
+        for statement in statements.values():
+            cursor.execute(statement)
+        if existing != len(statements):
+            # Any missing trigger means bar edits may have bypassed the totals.
+            rebuild_summary(cursor)
+    except sqlite3.Error as exc:
+        cursor.execute(f"ROLLBACK TO {savepoint}")
+        logger.warning("Optional silver-bar summary was skipped: %s", exc)
+    finally:
+        cursor.execute(f"RELEASE {savepoint}")
+
+
+def _ensure_item_usage(db: "DatabaseManager") -> None:
+    """Maintain the item-usage statistics behind selection ranking."""
+    cursor = db.cursor
+    logger = db.logger
+    assert cursor is not None
+    assert logger is not None
+
+    statements = usage_statements()
+    savepoint = f"schema_{ITEM_USAGE}"
+    cursor.execute(f"SAVEPOINT {savepoint}")
+    try:
+        placeholders = ",".join("?" for _ in statements)
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",  # nosec B608
+            tuple(statements),
+        )
+        existing = int(cursor.fetchone()[0])
+        for statement in statements.values():
+            cursor.execute(statement)
+        if existing != len(statements):
+            # Estimates saved before the table existed are not counted yet.
+            rebuild_usage(cursor)
+    except sqlite3.Error as exc:
+        cursor.execute(f"ROLLBACK TO {savepoint}")
+        logger.warning("Optional item-usage statistics were skipped: %s", exc)
+    finally:
+        cursor.execute(f"RELEASE {savepoint}")
+
+
+def _ensure_change_journal(db: "DatabaseManager") -> None:
+    """Maintain the row change journal behind differential backups."""
+    cursor = db.cursor
+    logger = db.logger
+    assert cursor is not None
+    assert logger is not None
+
+    statements = journal_statements()
+    savepoint = f"schema_{CHANGE_JOURNAL}"
+    cursor.execute(f"SAVEPOINT {savepoint}")
+    try:
+        placeholders = ",".join("?" for _ in statements)
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",  # nosec B608
+            tuple(statements),
+        )
+        existing = int(cursor.fetchone()[0])
+        for statement in statements.values():
+            cursor.execute(statement)
+        if 0 < existing < len(statements):
+            # A missing trigger may have let edits go unjournaled, so older
+            # bases can no longer take a differential.
+            advance_horizon(cursor, current_generation(cursor))
+    except sqlite3.Error as exc:
+        cursor.execute(f"ROLLBACK TO {savepoint}")
+        logger.warning("Optional change journal was skipped: %s", exc)
+    finally:
+        cursor.execute(f"RELEASE {savepoint}")
+
+
 def _validate_schema(db: "DatabaseManager") -> None:
     cursor = db.cursor
     assert cursor is not None
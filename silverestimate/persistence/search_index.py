@@ -0,0 +1,38 @@
+"""Trigram FTS5 shadow indexes that narrow substring searches."""
+
+from __future__ import annotations
+
+from typing import Any
+
+ITEM_SEARCH_INDEX = "items_fts"
+ESTIMATE_SEARCH_INDEX = "estimates_fts"
+TRIGRAM_MIN_TERM_LENGTH = 3
+
+
+def trigram_match(term: str, *, column: str | None = None) -> str | None:
+    """Return an FTS5 query for a literal substring, or ``None`` when unsupported.
+
+    Trigram indexes cannot answer terms shorter than three characters, and
+    ``%``/``_`` keep their ``LIKE`` wildcard meaning, so both stay on scans.
+    """
+    if len(term) < TRIGRAM_MIN_TERM_LENGTH or "%" in term or "_" in term:
+        return None
+    phrase = '"' + term.replace('"', '""') + '"'
+    return f"{column} : {phrase}" if column else phrase
+
+
+def search_index_exists(cursor: Any, name: str) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (name,),
+    )
+    return bool(cursor.fetchall())
+
+
+__all__ = [
+    "ESTIMATE_SEARCH_INDEX",
+    "ITEM_SEARCH_INDEX",
+    "TRIGRAM_MIN_TERM_LENGTH",
+    "search_index_exists",
+    "trigram_match",
+]
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any, Iterable, List, Optional, Tuple
 
 from silverestimate.persistence.database_driver import dbapi as sqlite3
+from silverestimate.persistence.query_cache import tables_changed
 from silverestimate.persistence.repository_results import (
     RepositoryFailureKind,
     RepositoryResult,
@@ -54,6 +55,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 (list_identifier, creation_date, note),
             )
             conn.commit()
+            tables_changed(self._db, "silver_bar_lists")
             list_id = cursor.lastrowid
             self._logger.info(
                 "Created silver bar list %s (ID: %s).", list_identifier, list_id
@@ -76,6 +78,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 (new_note, list_id),
             )
             conn.commit()
+            tables_changed(self._db, "silver_bar_lists")
             return bool(int(cursor.rowcount) > 0)
         except sqlite3.Error as exc:
             self._logger.error(
@@ -92,7 +95,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             return False
         issued_at = issued_date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         try:
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "UPDATE silver_bar_lists SET issued_date = ? WHERE list_id = ?",
                 (issued_at, list_id),
@@ -105,6 +108,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 (list_id,),
             )
             conn.commit()
+            tables_changed(self._db, "silver_bar_lists", "silver_bars")
             return True
         except sqlite3.Error as exc:
             try:
@@ -128,7 +132,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
         if not conn or not cursor:
             return False
         try:
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "UPDATE silver_bar_lists SET issued_date = NULL WHERE list_id = ?",
                 (list_id,),
@@ -141,6 +145,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 (list_id,),
             )
             conn.commit()
+            tables_changed(self._db, "silver_bar_lists", "silver_bars")
             return True
         except sqlite3.Error as exc:
             try:
@@ -164,7 +169,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
         if not conn or not cursor:
             return False, "No database connection"
         try:
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "SELECT bar_id FROM silver_bars WHERE list_id = ?", (list_id,)
             )
@@ -190,6 +195,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             cursor.execute("DELETE FROM silver_bar_lists WHERE list_id = ?", (list_id,))
             deleted = cursor.rowcount > 0
             conn.commit()
+            tables_changed(self._db, "silver_bar_lists", "silver_bars", "bar_transfers")
             self._logger.info(
                 "Deleted list %s. Unassigned %s bars.", list_id, unassigned_count
             )
@@ -238,7 +244,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 return False
 
             if perform_commit:
-                conn.execute("BEGIN TRANSACTION")
+                conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "UPDATE silver_bars SET status = ?, list_id = ? WHERE bar_id = ?",
                 (to_status, list_id, bar_id),
@@ -261,6 +267,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             )
             if perform_commit:
                 conn.commit()
+                tables_changed(self._db, "silver_bars", "bar_transfers")
             return True
         except sqlite3.Error as exc:
             if perform_commit:
@@ -318,7 +325,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             if not valid_ids:
                 return 0, failed
 
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             update_payload = [("Assigned", list_id, bar_id) for bar_id in valid_ids]
             cursor.executemany(
                 "UPDATE silver_bars SET status = ?, list_id = ? WHERE bar_id = ?",
@@ -346,6 +353,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 transfer_rows,
             )
             conn.commit()
+            tables_changed(self._db, "silver_bars", "bar_transfers")
             return len(valid_ids), failed
         except sqlite3.Error as exc:
             try:
@@ -389,7 +397,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             current_list_id = row["list_id"]
 
             if perform_commit:
-                conn.execute("BEGIN TRANSACTION")
+                conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "UPDATE silver_bars SET status = ?, list_id = NULL WHERE bar_id = ?",
                 (to_status, bar_id),
@@ -412,6 +420,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             )
             if perform_commit:
                 conn.commit()
+                tables_changed(self._db, "silver_bars", "bar_transfers")
             return True
         except sqlite3.Error as exc:
             if perform_commit:
@@ -457,7 +466,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
             if not valid_rows:
                 return 0, failed
 
-            conn.execute("BEGIN TRANSACTION")
+            conn.execute("BEGIN IMMEDIATE")
             cursor.executemany(
                 "UPDATE silver_bars SET status = ?, list_id = NULL WHERE bar_id = ?",
                 [("In Stock", bar_id) for bar_id, _ in valid_rows],
@@ -483,6 +492,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 transfer_rows,
             )
             conn.commit()
+            tables_changed(self._db, "silver_bars", "bar_transfers")
             return len(valid_rows), failed
         except sqlite3.Error as exc:
             try:
@@ -524,6 +534,7 @@ class SilverBarCommandRepository(_SilverBarRepositoryBase):
                 ),
             )
             conn.commit()
+            tables_changed(self._db, "silver_bars")
             bar_id = cursor.lastrowid
             return int(bar_id) if bar_id is not None else None
         except sqlite3.Error as exc:
@@ -12,17 +12,32 @@ from silverestimate.domain.pagination import (
     SilverBarHistoryCursor,
 )
 from silverestimate.persistence.database_driver import dbapi as sqlite3
+from silverestimate.persistence.query_cache import cached_read
 from silverestimate.persistence.repository_results import (
     RepositoryFailureKind,
     RepositoryResult,
 )
+from silverestimate.persistence.search_index import (
+    ESTIMATE_SEARCH_INDEX,
+    search_index_exists,
+)
 from silverestimate.persistence.silver_bar_repository_base import (
     _SilverBarRepositoryBase,
 )
+from silverestimate.persistence.silver_bar_summary import (
+    SILVER_BAR_SUMMARY,
+    SilverBarTotals,
+    read_statement_count,
+    read_statement_totals,
+    read_totals_by_status,
+    summary_exists,
+)
 from silverestimate.persistence.silver_bars_queries import (
     build_available_bars_queries,
     build_bars_in_list_queries,
     build_history_bars_query,
+    build_history_count_query,
+    history_summary_key,
 )
 
 SilverBarRow = Mapping[str, Any]
@@ -31,38 +46,64 @@ SilverBarRow = Mapping[str, Any]
 class SilverBarQueryRepository(_SilverBarRepositoryBase):
     """Own every silver-bar and list read."""
 
-    def get_lists(self, include_issued: bool = True) -> list[SilverBarRow]:
+    def get_lists(
+        self, include_issued: bool = True, *, use_cache: bool = True
+    ) -> list[SilverBarRow]:
         cursor = self._cursor
         if not cursor:
             return []
-        try:
-            if include_issued:
-                query = (
-                    "SELECT list_id, list_identifier, creation_date, list_note, issued_date "
-                    "FROM silver_bar_lists ORDER BY creation_date DESC"
-                )
-            else:
-                query = (
-                    "SELECT list_id, list_identifier, creation_date, list_note, issued_date "
-                    "FROM silver_bar_lists WHERE issued_date IS NULL ORDER BY creation_date DESC"
-                )
+        if include_issued:
+            query = (
+                "SELECT list_id, list_identifier, creation_date, list_note, issued_date "
+                "FROM silver_bar_lists ORDER BY creation_date DESC"
+            )
+        else:
+            query = (
+                "SELECT list_id, list_identifier, creation_date, list_note, issued_date "
+                "FROM silver_bar_lists WHERE issued_date IS NULL ORDER BY creation_date DESC"
+            )
+
+        def read_lists() -> list[SilverBarRow]:
             cursor.execute(query)
             return cast(list[SilverBarRow], cursor.fetchall())
+
+        try:
+            return cached_read(
+                self._db,
+                "silver_bar_lists.all",
+                (bool(include_issued),),
+                ("silver_bar_lists",),
+                read_lists,
+                use_cache=use_cache,
+            )
         except sqlite3.Error as exc:
             self._logger.error(
                 "DB error fetching silver bar lists: %s", exc, exc_info=True
             )
             return []
 
-    def get_list_details(self, list_id: int) -> SilverBarRow | None:
+    def get_list_details(
+        self, list_id: int, *, use_cache: bool = True
+    ) -> SilverBarRow | None:
         cursor = self._cursor
         if not cursor:
             return None
-        try:
+
+        def read_details() -> SilverBarRow | None:
             cursor.execute(
                 "SELECT * FROM silver_bar_lists WHERE list_id = ?", (list_id,)
             )
             return cast(SilverBarRow | None, cursor.fetchone())
+
+        try:
+            return cached_read(
+                self._db,
+                "silver_bar_lists.details",
+                (list_id,),
+                ("silver_bar_lists",),
+                read_details,
+                use_cache=use_cache,
+            )
         except sqlite3.Error as exc:
             self._logger.error(
                 "DB error fetching list details for ID %s: %s",
@@ -94,12 +135,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             limit=limit,
         )
         try:
-            cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
-            )
-            count_row = cursor.fetchone()
-            total_count = int(count_row[0]) if count_row else 0
+            total_count = read_statement_totals(cursor, statements).bar_count
             cursor.execute(statements.query.query, tuple(statements.query.params))
             return cast(list[SilverBarRow], cursor.fetchall()), total_count
         except sqlite3.Error as exc:
@@ -135,12 +171,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             after_date_added=cursor.date_added if cursor else None,
             after_bar_id=cursor.bar_id if cursor else None,
         )
-        db_cursor.execute(
-            statements.count_query.query,
-            tuple(statements.count_query.params),
-        )
-        count_row = db_cursor.fetchone()
-        total = int(count_row[0]) if count_row else 0
+        totals = read_statement_totals(db_cursor, statements)
         db_cursor.execute(statements.query.query, tuple(statements.query.params))
         fetched = [dict(row) for row in db_cursor.fetchall()]
         has_more = len(fetched) > page_size
@@ -152,7 +183,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
                 str(last.get("date_added", "") or ""),
                 int(last["bar_id"]),
             )
-        return Page(tuple(rows), total, next_cursor)
+        return Page(tuple(rows), totals.bar_count, next_cursor, totals)
 
     def get_bars_in_list_page(
         self,
@@ -166,12 +197,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             return [], 0
         statements = build_bars_in_list_queries(list_id, limit=limit, offset=offset)
         try:
-            cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
-            )
-            count_row = cursor.fetchone()
-            total_count = int(count_row[0]) if count_row else 0
+            total_count = read_statement_totals(cursor, statements).bar_count
             cursor.execute(statements.query.query, tuple(statements.query.params))
             return cast(list[SilverBarRow], cursor.fetchall()), total_count
         except sqlite3.Error as exc:
@@ -199,12 +225,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             limit=page_size + 1,
             after_bar_id=cursor.bar_id if cursor else None,
         )
-        db_cursor.execute(
-            statements.count_query.query,
-            tuple(statements.count_query.params),
-        )
-        count_row = db_cursor.fetchone()
-        total = int(count_row[0]) if count_row else 0
+        totals = read_statement_totals(db_cursor, statements)
         db_cursor.execute(statements.query.query, tuple(statements.query.params))
         fetched = [dict(row) for row in db_cursor.fetchall()]
         has_more = len(fetched) > page_size
@@ -212,7 +233,68 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
         next_cursor = (
             BarListCursor(int(rows[-1]["bar_id"])) if has_more and rows else None
         )
-        return Page(tuple(rows), total, next_cursor)
+        return Page(tuple(rows), totals.bar_count, next_cursor, totals)
+
+    def get_available_bars_totals(
+        self,
+        *,
+        weight_query: Optional[float] = None,
+        weight_tolerance: float = 0.001,
+        min_purity: Optional[float] = None,
+        max_purity: Optional[float] = None,
+        date_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    ) -> SilverBarTotals:
+        """Return count and weights for every available bar matching the filter."""
+        cursor = self._cursor
+        if not cursor:
+            return SilverBarTotals()
+        statements = build_available_bars_queries(
+            weight_query=weight_query,
+            weight_tolerance=weight_tolerance,
+            min_purity=min_purity,
+            max_purity=max_purity,
+            date_range=date_range,
+        )
+        try:
+            return read_statement_totals(cursor, statements)
+        except sqlite3.Error as exc:
+            self._logger.error(
+                "DB error reading available silver-bar totals: %s",
+                exc,
+                exc_info=True,
+            )
+            return SilverBarTotals()
+
+    def get_bars_in_list_totals(self, list_id: int) -> SilverBarTotals:
+        """Return count and weights for every bar assigned to ``list_id``."""
+        cursor = self._cursor
+        if not cursor:
+            return SilverBarTotals()
+        try:
+            return read_statement_totals(cursor, build_bars_in_list_queries(list_id))
+        except sqlite3.Error as exc:
+            self._logger.error(
+                "DB error reading totals for list %s: %s",
+                list_id,
+                exc,
+                exc_info=True,
+            )
+            return SilverBarTotals()
+
+    def get_inventory_totals(self) -> dict[str, SilverBarTotals]:
+        """Return count and weights per bar status across the whole inventory."""
+        cursor = self._cursor
+        if not cursor:
+            return {}
+        try:
+            return read_totals_by_status(cursor)
+        except sqlite3.Error as exc:
+            self._logger.error(
+                "DB error reading silver-bar inventory totals: %s",
+                exc,
+                exc_info=True,
+            )
+            return {}
 
     def get_bars_in_list(
         self,
@@ -255,13 +337,14 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
         cursor = self._cursor
         if not cursor:
             return []
-        statement = build_history_bars_query(
-            voucher_term=voucher_term,
-            weight_text=weight_text,
-            status_text=status_text,
-            limit=limit,
-        )
         try:
+            statement = build_history_bars_query(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                limit=limit,
+                search_index=search_index_exists(cursor, ESTIMATE_SEARCH_INDEX),
+            )
             cursor.execute(statement.query, tuple(statement.params))
             return cast(list[SilverBarRow], cursor.fetchall())
         except sqlite3.Error as exc:
@@ -285,19 +368,21 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
         if not db_cursor:
             return Page(items=(), total=0, next_cursor=None)
         page_size = max(1, min(int(limit), 5000))
-        count_statement = build_history_bars_query(
-            voucher_term=voucher_term,
-            weight_text=weight_text,
-            status_text=status_text,
-            limit=1,
-        )
-        count_base = count_statement.query.rsplit(" ORDER BY ", 1)[0]
-        db_cursor.execute(
-            f"SELECT COUNT(*) FROM ({count_base})",  # nosec B608
-            tuple(count_statement.params[:-1]),
+        search_index = search_index_exists(db_cursor, ESTIMATE_SEARCH_INDEX)
+        total = read_statement_count(
+            db_cursor,
+            build_history_count_query(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                search_index=search_index,
+            ),
+            history_summary_key(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+            ),
         )
-        count_row = db_cursor.fetchone()
-        total = int(count_row[0]) if count_row else 0
 
         statement = build_history_bars_query(
             voucher_term=voucher_term,
@@ -306,6 +391,7 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             limit=page_size + 1,
             after_date_added=cursor.date_added if cursor else None,
             after_bar_id=cursor.bar_id if cursor else None,
+            search_index=search_index,
         )
         db_cursor.execute(statement.query, tuple(statement.params))
         fetched = [dict(row) for row in db_cursor.fetchall()]
@@ -320,7 +406,9 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
             )
         return Page(tuple(rows), total, next_cursor)
 
-    def count_bars_by_list_ids(self, list_ids: Iterable[int]) -> dict[int, int]:
+    def count_bars_by_list_ids(
+        self, list_ids: Iterable[int], *, use_cache: bool = True
+    ) -> dict[int, int]:
         cursor = self._cursor
         if not cursor:
             return {}
@@ -328,18 +416,36 @@ class SilverBarQueryRepository(_SilverBarRepositoryBase):
         if not normalized_ids:
             return {}
         placeholders = ",".join("?" for _ in normalized_ids)
-        try:
+
+        def read_counts() -> dict[int, int]:
             # Placeholder count is generated locally; values remain parameterized.
-            cursor.execute(
-                f"SELECT list_id, COUNT(*) AS count FROM silver_bars "  # nosec B608
-                f"WHERE list_id IN ({placeholders}) GROUP BY list_id",
-                normalized_ids,
-            )
+            if summary_exists(cursor):
+                query = (
+                    "SELECT list_id, SUM(bar_count) AS count "
+                    f"FROM {SILVER_BAR_SUMMARY} "
+                    f"WHERE list_id IN ({placeholders}) GROUP BY list_id"
+                )
+            else:
+                query = (
+                    "SELECT list_id, COUNT(*) AS count FROM silver_bars "
+                    f"WHERE list_id IN ({placeholders}) GROUP BY list_id"
+                )
+            cursor.execute(query, normalized_ids)  # nosec B608
             return {
                 int(row["list_id"]): int(row["count"])
                 for row in cursor.fetchall()
                 if row["list_id"] is not None
             }
+
+        try:
+            return cached_read(
+                self._db,
+                "silver_bars.count_by_list",
+                tuple(normalized_ids),
+                ("silver_bars",),
+                read_counts,
+                use_cache=use_cache,
+            )
         except sqlite3.Error as exc:
             self._logger.error(
                 "DB error counting silver bars by list ids: %s",
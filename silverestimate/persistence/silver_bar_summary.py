@@ -0,0 +1,190 @@
+"""Trigger-maintained silver-bar inventory totals keyed by status and list."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from silverestimate.persistence.silver_bars_queries import (
+        PagedSqlStatements,
+        SqlStatement,
+    )
+
+SILVER_BAR_SUMMARY = "silver_bar_summary"
+# Summary rows store unassigned bars under list id 0; list ids start at 1.
+UNASSIGNED_LIST_ID = 0
+
+
+@dataclass(frozen=True)
+class SilverBarTotals:
+    """Bar count and weight totals for every bar matching a filter."""
+
+    bar_count: int = 0
+    total_weight: float = 0.0
+    total_fine_weight: float = 0.0
+
+    @classmethod
+    def from_row(cls, row: Any) -> "SilverBarTotals":
+        if not row:
+            return cls()
+        return cls(int(row[0] or 0), float(row[1] or 0.0), float(row[2] or 0.0))
+
+
+@dataclass(frozen=True)
+class SummaryKey:
+    """A summary lookup; ``None`` fields match every status or list."""
+
+    status: str | None = None
+    list_id: int | None = None
+
+
+def _summary_delta(prefix: str, sign: str) -> str:
+    status = f"COALESCE({prefix}.status, '')"
+    list_id = f"COALESCE({prefix}.list_id, {UNASSIGNED_LIST_ID})"
+    weight = f"COALESCE({prefix}.weight, 0)"
+    fine = f"COALESCE({prefix}.fine_weight, 0)"
+    return (
+        f"INSERT INTO {SILVER_BAR_SUMMARY}"
+        "(status, list_id, bar_count, total_weight, total_fine_weight) "
+        f"VALUES ({status}, {list_id}, {sign}1, {sign}{weight}, {sign}{fine}) "
+        "ON CONFLICT(status, list_id) DO UPDATE SET "
+        "bar_count = bar_count + excluded.bar_count, "
+        "total_weight = total_weight + excluded.total_weight, "
+        "total_fine_weight = total_fine_weight + excluded.total_fine_weight; "
+    )
+
+
+def summary_statements() -> dict[str, str]:
+    """Return the summary table and the triggers that keep it current."""
+    prune = f"DELETE FROM {SILVER_BAR_SUMMARY} WHERE bar_count <= 0; "
+    return {
+        SILVER_BAR_SUMMARY: (
+            f"CREATE TABLE IF NOT EXISTS {SILVER_BAR_SUMMARY} ("
+            "status TEXT NOT NULL, "
+            "list_id INTEGER NOT NULL, "
+            "bar_count INTEGER NOT NULL DEFAULT 0, "
+            "total_weight REAL NOT NULL DEFAULT 0, "
+            "total_fine_weight REAL NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (status, list_id)) WITHOUT ROWID"
+        ),
+        f"trg_{SILVER_BAR_SUMMARY}_insert": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{SILVER_BAR_SUMMARY}_insert "
+            f"AFTER INSERT ON silver_bars BEGIN {_summary_delta('new', '')}END"
+        ),
+        f"trg_{SILVER_BAR_SUMMARY}_delete": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{SILVER_BAR_SUMMARY}_delete "
+            f"AFTER DELETE ON silver_bars "
+            f"BEGIN {_summary_delta('old', '-')}{prune}END"
+        ),
+        f"trg_{SILVER_BAR_SUMMARY}_update": (
+            f"CREATE TRIGGER IF NOT EXISTS trg_{SILVER_BAR_SUMMARY}_update "
+            "AFTER UPDATE OF status, list_id, weight, fine_weight ON silver_bars "
+            f"BEGIN {_summary_delta('old', '-')}{_summary_delta('new', '')}"
+            f"{prune}END"
+        ),
+    }
+
+
+def rebuild_summary(cursor: Any) -> None:
+    """Recompute every summary row from ``silver_bars``."""
+    cursor.execute(f"DELETE FROM {SILVER_BAR_SUMMARY}")  # nosec B608
+    cursor.execute(
+        f"INSERT INTO {SILVER_BAR_SUMMARY}"  # nosec B608
+        "(status, list_id, bar_count, total_weight, total_fine_weight) "
+        f"SELECT COALESCE(status, ''), COALESCE(list_id, {UNASSIGNED_LIST_ID}), "
+        "COUNT(*), TOTAL(weight), TOTAL(fine_weight) "
+        "FROM silver_bars GROUP BY 1, 2"
+    )
+
+
+def summary_exists(cursor: Any) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (SILVER_BAR_SUMMARY,),
+    )
+    return bool(cursor.fetchall())
+
+
+def read_summary_totals(cursor: Any, key: SummaryKey) -> SilverBarTotals | None:
+    """Return totals for ``key`` from the summary, or ``None`` when it is absent."""
+    if not summary_exists(cursor):
+        return None
+    conditions: list[str] = []
+    params: list[Any] = []
+    if key.status is not None:
+        conditions.append("status = ?")
+        params.append(key.status)
+    if key.list_id is not None:
+        conditions.append("list_id = ?")
+        params.append(int(key.list_id))
+    query = (
+        "SELECT TOTAL(bar_count), TOTAL(total_weight), TOTAL(total_fine_weight) "
+        f"FROM {SILVER_BAR_SUMMARY}"
+    )
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    cursor.execute(query, tuple(params))  # nosec B608
+    return SilverBarTotals.from_row(cursor.fetchone())
+
+
+def read_statement_totals(
+    cursor: Any, statements: "PagedSqlStatements"
+) -> SilverBarTotals:
+    """Return totals for a paged query, preferring the summary when it applies."""
+    if statements.summary_key is not None:
+        totals = read_summary_totals(cursor, statements.summary_key)
+        if totals is not None:
+            return totals
+    cursor.execute(
+        statements.totals_query.query,
+        tuple(statements.totals_query.params),
+    )
+    return SilverBarTotals.from_row(cursor.fetchone())
+
+
+def read_statement_count(
+    cursor: Any, statement: "SqlStatement", summary_key: SummaryKey | None
+) -> int:
+    """Return a ``COUNT(*)`` statement's result, preferring the summary."""
+    if summary_key is not None:
+        totals = read_summary_totals(cursor, summary_key)
+        if totals is not None:
+            return totals.bar_count
+    cursor.execute(statement.query, tuple(statement.params))
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+def read_totals_by_status(cursor: Any) -> dict[str, SilverBarTotals]:
+    """Return inventory totals per bar status across every list."""
+    if summary_exists(cursor):
+        query = (
+            "SELECT status, TOTAL(bar_count), TOTAL(total_weight), "
+            f"TOTAL(total_fine_weight) FROM {SILVER_BAR_SUMMARY} GROUP BY status"
+        )
+    else:
+        query = (
+            "SELECT COALESCE(status, ''), COUNT(*), TOTAL(weight), "
+            "TOTAL(fine_weight) FROM silver_bars GROUP BY 1"
+        )
+    cursor.execute(query)  # nosec B608
+    return {
+        str(row[0]): SilverBarTotals.from_row(tuple(row)[1:])
+        for row in cursor.fetchall()
+    }
+
+
+__all__ = [
+    "SILVER_BAR_SUMMARY",
+    "UNASSIGNED_LIST_ID",
+    "SilverBarTotals",
+    "SummaryKey",
+    "read_statement_count",
+    "read_statement_totals",
+    "read_summary_totals",
+    "read_totals_by_status",
+    "rebuild_summary",
+    "summary_exists",
+    "summary_statements",
+]
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Any, Tuple
 
 from silverestimate.persistence.database_driver import dbapi as sqlite3
+from silverestimate.persistence.query_cache import tables_changed
 from silverestimate.persistence.silver_bar_repository_base import (
     _SilverBarRepositoryBase,
 )
@@ -123,15 +124,10 @@ class SilverBarSynchronizationRepository(_SilverBarRepositoryBase):
 
         return added, failed
 
-    def _synchronize_counts(
+    def _desired_bars(
         self,
-        voucher_no: str,
         bars: Iterable[Mapping[str, Any]],
-    ) -> Tuple[int, int]:
-        conn, cursor = self._conn, self._cursor
-        if not conn or not cursor or not voucher_no:
-            return 0, 0
-
+    ) -> tuple[list[Mapping[str, Any]], int]:
         desired: list[Mapping[str, Any]] = []
         parse_failures = 0
         seen_line_keys: set[str] = set()
@@ -147,116 +143,149 @@ class SilverBarSynchronizationRepository(_SilverBarRepositoryBase):
                     continue
                 seen_line_keys.add(line_key)
             desired.append(normalized)
+        return desired, parse_failures
 
-        added = 0
-        failed = parse_failures
-
-        try:
-            conn.execute("BEGIN TRANSACTION")
-            use_line_keys = any(
-                isinstance(entry.get("line_key"), str) and entry.get("line_key")
-                for entry in desired
+    def _reconcile(
+        self,
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        desired: list[Mapping[str, Any]],
+    ) -> tuple[int, int]:
+        use_line_keys = any(
+            isinstance(entry.get("line_key"), str) and entry.get("line_key")
+            for entry in desired
+        )
+        if not use_line_keys:
+            return self._sync_silver_bars_for_estimate_by_order(
+                cursor,
+                voucher_no,
+                desired,
             )
-            if not use_line_keys:
-                added, sync_failed = self._sync_silver_bars_for_estimate_by_order(
-                    cursor,
-                    voucher_no,
-                    desired,
-                )
-                failed += sync_failed
+        added = 0
+        failed = 0
+        cursor.execute(
+            "SELECT bar_id, weight, purity, status, list_id, source_line_key "
+            "FROM silver_bars WHERE estimate_voucher_no = ? ORDER BY bar_id",
+            (voucher_no,),
+        )
+        existing_rows = cursor.fetchall()
+        existing_by_key: dict[str, Any] = {}
+        unkeyed_rows: list[Any] = []
+        for row in existing_rows:
+            source_line_key = str(row["source_line_key"] or "").strip()
+            if source_line_key:
+                existing_by_key[source_line_key] = row
             else:
-                cursor.execute(
-                    "SELECT bar_id, weight, purity, status, list_id, source_line_key "
-                    "FROM silver_bars WHERE estimate_voucher_no = ? ORDER BY bar_id",
-                    (voucher_no,),
-                )
-                existing_rows = cursor.fetchall()
-                existing_by_key: dict[str, Any] = {}
-                unkeyed_rows: list[Any] = []
-                for row in existing_rows:
-                    source_line_key = str(row["source_line_key"] or "").strip()
-                    if source_line_key:
-                        existing_by_key[source_line_key] = row
-                    else:
-                        unkeyed_rows.append(row)
-
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                for desired_entry in desired:
-                    new_weight = float(desired_entry["weight"])
-                    new_purity = float(desired_entry["purity"])
-                    line_key = str(desired_entry.get("line_key") or "").strip() or None
-
-                    existing = existing_by_key.get(line_key) if line_key else None
-                    matched_unkeyed = False
-                    if existing is None and unkeyed_rows:
-                        existing = unkeyed_rows.pop(0)
-                        matched_unkeyed = True
-
-                    if existing is not None:
-                        if matched_unkeyed and line_key:
-                            cursor.execute(
-                                "UPDATE silver_bars SET source_line_key = ? WHERE bar_id = ?",
-                                (line_key, existing["bar_id"]),
-                            )
-                            if cursor.rowcount <= 0:
-                                failed += 1
-
-                        if self._synced_bar_values_match(
-                            existing, new_weight, new_purity
-                        ):
-                            continue
-
-                        if not self._bar_row_is_mutable(existing):
-                            failed += 1
-                            continue
-
-                        fine_weight = new_weight * (new_purity / 100.0)
-                        if line_key:
-                            cursor.execute(
-                                "UPDATE silver_bars SET weight = ?, purity = ?, fine_weight = ?, source_line_key = ? "
-                                "WHERE bar_id = ?",
-                                (
-                                    new_weight,
-                                    new_purity,
-                                    fine_weight,
-                                    line_key,
-                                    existing["bar_id"],
-                                ),
-                            )
-                        else:
-                            cursor.execute(
-                                "UPDATE silver_bars SET weight = ?, purity = ?, fine_weight = ? "
-                                "WHERE bar_id = ?",
-                                (
-                                    new_weight,
-                                    new_purity,
-                                    fine_weight,
-                                    existing["bar_id"],
-                                ),
-                            )
-                        if cursor.rowcount <= 0:
-                            failed += 1
-                        continue
-
-                    fine_weight = new_weight * (new_purity / 100.0)
+                unkeyed_rows.append(row)
+
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for desired_entry in desired:
+            new_weight = float(desired_entry["weight"])
+            new_purity = float(desired_entry["purity"])
+            line_key = str(desired_entry.get("line_key") or "").strip() or None
+
+            existing = existing_by_key.get(line_key) if line_key else None
+            matched_unkeyed = False
+            if existing is None and unkeyed_rows:
+                existing = unkeyed_rows.pop(0)
+                matched_unkeyed = True
+
+            if existing is not None:
+                if matched_unkeyed and line_key:
+                    cursor.execute(
+                        "UPDATE silver_bars SET source_line_key = ? WHERE bar_id = ?",
+                        (line_key, existing["bar_id"]),
+                    )
+                    if cursor.rowcount <= 0:
+                        failed += 1
+
+                if self._synced_bar_values_match(existing, new_weight, new_purity):
+                    continue
+
+                if not self._bar_row_is_mutable(existing):
+                    failed += 1
+                    continue
+
+                fine_weight = new_weight * (new_purity / 100.0)
+                if line_key:
                     cursor.execute(
-                        "INSERT INTO silver_bars "
-                        "(estimate_voucher_no, weight, purity, fine_weight, date_added, status, list_id, source_line_key) "
-                        "VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                        "UPDATE silver_bars SET weight = ?, purity = ?, fine_weight = ?, source_line_key = ? "
+                        "WHERE bar_id = ?",
                         (
-                            voucher_no,
                             new_weight,
                             new_purity,
                             fine_weight,
-                            now,
-                            "In Stock",
                             line_key,
+                            existing["bar_id"],
                         ),
                     )
-                    added += 1
+                else:
+                    cursor.execute(
+                        "UPDATE silver_bars SET weight = ?, purity = ?, fine_weight = ? "
+                        "WHERE bar_id = ?",
+                        (
+                            new_weight,
+                            new_purity,
+                            fine_weight,
+                            existing["bar_id"],
+                        ),
+                    )
+                if cursor.rowcount <= 0:
+                    failed += 1
+                continue
+
+            fine_weight = new_weight * (new_purity / 100.0)
+            cursor.execute(
+                "INSERT INTO silver_bars "
+                "(estimate_voucher_no, weight, purity, fine_weight, date_added, status, list_id, source_line_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                (
+                    voucher_no,
+                    new_weight,
+                    new_purity,
+                    fine_weight,
+                    now,
+                    "In Stock",
+                    line_key,
+                ),
+            )
+            added += 1
+
+        return added, failed
+
+    def reconcile_in_transaction(
+        self,
+        cursor: sqlite3.Cursor,
+        voucher_no: str,
+        bars: Iterable[Mapping[str, Any]],
+    ) -> SilverBarSyncResult:
+        """Reconcile bars inside the caller's open transaction without committing.
+
+        Storage errors propagate so the caller can roll back its whole unit of
+        work.
+        """
+        if not voucher_no:
+            return SilverBarSyncResult(added=0, failed=0)
+        desired, parse_failures = self._desired_bars(bars)
+        added, failed = self._reconcile(cursor, voucher_no, desired)
+        return SilverBarSyncResult(added=added, failed=failed + parse_failures)
 
+    def _synchronize_counts(
+        self,
+        voucher_no: str,
+        bars: Iterable[Mapping[str, Any]],
+    ) -> Tuple[int, int]:
+        conn, cursor = self._conn, self._cursor
+        if not conn or not cursor or not voucher_no:
+            return 0, 0
+
+        desired, failed = self._desired_bars(bars)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            added, sync_failed = self._reconcile(cursor, voucher_no, desired)
             conn.commit()
-            return added, failed
+            tables_changed(self._db, "silver_bars", "silver_bar_lists", "bar_transfers")
+            return added, failed + sync_failed
         except sqlite3.Error as exc:
             conn.rollback()
             self._logger.error(
@@ -5,6 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, List, Sequence
 
+from silverestimate.persistence.search_index import (
+    ESTIMATE_SEARCH_INDEX,
+    trigram_match,
+)
+from silverestimate.persistence.silver_bar_summary import (
+    UNASSIGNED_LIST_ID,
+    SummaryKey,
+)
+
+_COUNT_SELECT = "SELECT COUNT(*) FROM"
+_TOTALS_SELECT = "SELECT COUNT(*), TOTAL(weight), TOTAL(fine_weight) FROM"
+
 
 @dataclass(frozen=True)
 class SqlStatement:
@@ -16,10 +28,28 @@ class SqlStatement:
 
 @dataclass(frozen=True)
 class PagedSqlStatements:
-    """A data query plus a paired count query."""
+    """A data query plus paired count and totals queries.
+
+    ``summary_key`` is set when the filter matches a summary-table row, so
+    counts and totals can be read without scanning ``silver_bars``.
+    """
 
     query: SqlStatement
     count_query: SqlStatement
+    totals_query: SqlStatement
+    summary_key: SummaryKey | None = None
+
+
+def _paired_statements(
+    query: SqlStatement,
+    count_query: SqlStatement,
+    summary_key: SummaryKey | None,
+) -> PagedSqlStatements:
+    totals_query = SqlStatement(
+        count_query.query.replace(_COUNT_SELECT, _TOTALS_SELECT, 1),
+        count_query.params,
+    )
+    return PagedSqlStatements(query, count_query, totals_query, summary_key)
 
 
 def normalize_row_limit(limit: Any, *, default: int, minimum: int = 100) -> int:
@@ -114,9 +144,10 @@ def build_available_bars_queries(
         query += " LIMIT ?"
         params.append(int(limit))
 
-    return PagedSqlStatements(
-        query=SqlStatement(query, tuple(params)),
-        count_query=SqlStatement(count_query, tuple(count_params)),
+    return _paired_statements(
+        SqlStatement(query, tuple(params)),
+        SqlStatement(count_query, tuple(count_params)),
+        None if count_params else SummaryKey("In Stock", UNASSIGNED_LIST_ID),
     )
 
 
@@ -147,15 +178,39 @@ def build_bars_in_list_queries(
             query += " OFFSET ?"
             params.append(int(offset))
 
-    return PagedSqlStatements(
-        query=SqlStatement(query, tuple(params)),
-        count_query=SqlStatement(
+    return _paired_statements(
+        SqlStatement(query, tuple(params)),
+        SqlStatement(
             "SELECT COUNT(*) FROM silver_bars WHERE list_id = ?",
             (list_id,),
         ),
+        SummaryKey(list_id=int(list_id)) if list_id is not None else None,
     )
 
 
+def history_summary_key(
+    *,
+    voucher_term: str = "",
+    weight_text: str = "",
+    status_text: str = "All Statuses",
+) -> SummaryKey | None:
+    """Return the summary lookup that counts a history search, if one does."""
+
+    if str(voucher_term or "").strip():
+        return None
+    normalized_weight = str(weight_text or "").strip()
+    if normalized_weight:
+        try:
+            float(normalized_weight)
+            return None
+        except TypeError, ValueError:
+            pass
+    normalized_status = str(status_text or "").strip()
+    if normalized_status and normalized_status != "All Statuses":
+        return SummaryKey(status=normalized_status)
+    return SummaryKey()
+
+
 def build_history_bars_query(
     *,
     voucher_term: str = "",
@@ -164,8 +219,14 @@ def build_history_bars_query(
     limit: int = 2000,
     after_date_added: str | None = None,
     after_bar_id: int | None = None,
+    search_index: bool = False,
 ) -> SqlStatement:
-    """Build the history search query used by the history dialog worker."""
+    """Build the history search query used by the history dialog worker.
+
+    With ``search_index`` set, voucher/note terms are first narrowed to the
+    estimates matched by the trigram index, so bars are reached through
+    ``idx_sbars_voucher`` instead of a scan of every bar.
+    """
 
     conditions: List[str] = []
     params: List[Any] = []
@@ -173,6 +234,15 @@ def build_history_bars_query(
     normalized_voucher = str(voucher_term or "").strip()
     if normalized_voucher:
         pattern = f"%{normalized_voucher}%"
+        match = trigram_match(normalized_voucher) if search_index else None
+        if match is not None:
+            conditions.append(
+                "sb.estimate_voucher_no IN ("
+                "SELECT matched.voucher_no FROM estimates matched "
+                f"WHERE matched.rowid IN (SELECT rowid FROM {ESTIMATE_SEARCH_INDEX} "
+                f"WHERE {ESTIMATE_SEARCH_INDEX} MATCH ?))"
+            )
+            params.append(match)
         conditions.append("(sb.estimate_voucher_no LIKE ? OR e.note LIKE ?)")
         params.extend([pattern, pattern])
 
@@ -212,3 +282,22 @@ def build_history_bars_query(
     query += " ORDER BY COALESCE(sb.date_added, '') DESC, sb.bar_id DESC LIMIT ?"
     params.append(normalize_row_limit(limit, default=2000))
     return SqlStatement(query, tuple(params))
+
+
+def build_history_count_query(
+    *,
+    voucher_term: str = "",
+    weight_text: str = "",
+    status_text: str = "All Statuses",
+    search_index: bool = False,
+) -> SqlStatement:
+    """Build a count of every bar a history search matches."""
+
+    statement = build_history_bars_query(
+        voucher_term=voucher_term,
+        weight_text=weight_text,
+        status_text=status_text,
+        search_index=search_index,
+    )
+    base = statement.query.rsplit(" ORDER BY ", 1)[0]
+    return SqlStatement(f"{_COUNT_SELECT} ({base})", tuple(statement.params[:-1]))
@@ -12,10 +12,22 @@ from silverestimate.domain.pagination import (
     Page,
     SilverBarHistoryCursor,
 )
+from silverestimate.persistence.search_index import (
+    ESTIMATE_SEARCH_INDEX,
+    search_index_exists,
+)
+from silverestimate.persistence.silver_bar_summary import (
+    SilverBarTotals,
+    read_statement_count,
+    read_statement_totals,
+    read_totals_by_status,
+)
 from silverestimate.persistence.silver_bars_queries import (
     build_available_bars_queries,
     build_bars_in_list_queries,
     build_history_bars_query,
+    build_history_count_query,
+    history_summary_key,
 )
 
 
@@ -54,12 +66,7 @@ class SilverBarsSnapshotRepository:
         )
         with closing(self._connect()) as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
-            )
-            count_row = cursor.fetchone()
-            total_count = int(count_row[0]) if count_row else 0
+            total_count = read_statement_totals(cursor, statements).bar_count
             cursor.execute(statements.query.query, tuple(statements.query.params))
             rows = [dict(row) for row in cursor.fetchall()]
         return rows, total_count
@@ -74,6 +81,7 @@ class SilverBarsSnapshotRepository:
         date_range: Any = None,
         cursor: AvailableBarCursor | None = None,
         limit: int = 1500,
+        include_total: bool = True,
     ) -> Page[dict[str, Any], AvailableBarCursor]:
         page_size = max(1, min(int(limit), 5000))
         statements = build_available_bars_queries(
@@ -88,12 +96,9 @@ class SilverBarsSnapshotRepository:
         )
         with closing(self._connect()) as conn:
             db_cursor = conn.cursor()
-            db_cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
+            totals = (
+                read_statement_totals(db_cursor, statements) if include_total else None
             )
-            count_row = db_cursor.fetchone()
-            total = int(count_row[0]) if count_row else 0
             db_cursor.execute(statements.query.query, tuple(statements.query.params))
             fetched = [dict(row) for row in db_cursor.fetchall()]
         has_more = len(fetched) > page_size
@@ -105,7 +110,9 @@ class SilverBarsSnapshotRepository:
                 str(last.get("date_added", "") or ""),
                 int(last["bar_id"]),
             )
-        return Page(tuple(rows), total, next_cursor)
+        return Page(
+            tuple(rows), totals.bar_count if totals else None, next_cursor, totals
+        )
 
     def get_bars_in_list_page(
         self,
@@ -117,12 +124,7 @@ class SilverBarsSnapshotRepository:
         statements = build_bars_in_list_queries(list_id, limit=limit, offset=offset)
         with closing(self._connect()) as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
-            )
-            count_row = cursor.fetchone()
-            total_count = int(count_row[0]) if count_row else 0
+            total_count = read_statement_totals(cursor, statements).bar_count
             cursor.execute(statements.query.query, tuple(statements.query.params))
             rows = [dict(row) for row in cursor.fetchall()]
         return rows, total_count
@@ -133,6 +135,7 @@ class SilverBarsSnapshotRepository:
         *,
         cursor: BarListCursor | None = None,
         limit: int = 1500,
+        include_total: bool = True,
     ) -> Page[dict[str, Any], BarListCursor]:
         page_size = max(1, min(int(limit), 5000))
         statements = build_bars_in_list_queries(
@@ -142,12 +145,9 @@ class SilverBarsSnapshotRepository:
         )
         with closing(self._connect()) as conn:
             db_cursor = conn.cursor()
-            db_cursor.execute(
-                statements.count_query.query,
-                tuple(statements.count_query.params),
+            totals = (
+                read_statement_totals(db_cursor, statements) if include_total else None
             )
-            count_row = db_cursor.fetchone()
-            total = int(count_row[0]) if count_row else 0
             db_cursor.execute(statements.query.query, tuple(statements.query.params))
             fetched = [dict(row) for row in db_cursor.fetchall()]
         has_more = len(fetched) > page_size
@@ -155,7 +155,37 @@ class SilverBarsSnapshotRepository:
         next_cursor = (
             BarListCursor(int(rows[-1]["bar_id"])) if has_more and rows else None
         )
-        return Page(tuple(rows), total, next_cursor)
+        return Page(
+            tuple(rows), totals.bar_count if totals else None, next_cursor, totals
+        )
+
+    def get_available_bars_totals(
+        self,
+        *,
+        weight_query: Any = None,
+        weight_tolerance: float = 0.001,
+        min_purity: Any = None,
+        max_purity: Any = None,
+        date_range: Any = None,
+    ) -> SilverBarTotals:
+        statements = build_available_bars_queries(
+            weight_query=weight_query,
+            weight_tolerance=weight_tolerance,
+            min_purity=min_purity,
+            max_purity=max_purity,
+            date_range=date_range,
+        )
+        with closing(self._connect()) as conn:
+            return read_statement_totals(conn.cursor(), statements)
+
+    def get_bars_in_list_totals(self, list_id: int | None) -> SilverBarTotals:
+        statements = build_bars_in_list_queries(list_id)
+        with closing(self._connect()) as conn:
+            return read_statement_totals(conn.cursor(), statements)
+
+    def get_inventory_totals(self) -> dict[str, SilverBarTotals]:
+        with closing(self._connect()) as conn:
+            return read_totals_by_status(conn.cursor())
 
     def search_history_bars(
         self,
@@ -165,14 +195,15 @@ class SilverBarsSnapshotRepository:
         status_text: str = "All Statuses",
         limit: int = 2000,
     ) -> list[dict[str, Any]]:
-        statement = build_history_bars_query(
-            voucher_term=voucher_term,
-            weight_text=weight_text,
-            status_text=status_text,
-            limit=limit,
-        )
         with closing(self._connect()) as conn:
             cursor = conn.cursor()
+            statement = build_history_bars_query(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                limit=limit,
+                search_index=search_index_exists(cursor, ESTIMATE_SEARCH_INDEX),
+            )
             cursor.execute(statement.query, tuple(statement.params))
             return [dict(row) for row in cursor.fetchall()]
 
@@ -184,31 +215,32 @@ class SilverBarsSnapshotRepository:
         status_text: str = "All Statuses",
         cursor: SilverBarHistoryCursor | None = None,
         limit: int = 1000,
+        include_total: bool = True,
     ) -> Page[dict[str, Any], SilverBarHistoryCursor]:
         page_size = max(1, min(int(limit), 5000))
-        count_statement = build_history_bars_query(
-            voucher_term=voucher_term,
-            weight_text=weight_text,
-            status_text=status_text,
-            limit=1,
-        )
-        statement = build_history_bars_query(
-            voucher_term=voucher_term,
-            weight_text=weight_text,
-            status_text=status_text,
-            limit=page_size + 1,
-            after_date_added=cursor.date_added if cursor else None,
-            after_bar_id=cursor.bar_id if cursor else None,
-        )
         with closing(self._connect()) as conn:
             db_cursor = conn.cursor()
-            count_base = count_statement.query.rsplit(" ORDER BY ", 1)[0]
-            db_cursor.execute(
-                f"SELECT COUNT(*) FROM ({count_base})",  # nosec B608
-                tuple(count_statement.params[:-1]),
+            search_index = search_index_exists(db_cursor, ESTIMATE_SEARCH_INDEX)
+            statement = build_history_bars_query(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                limit=page_size + 1,
+                after_date_added=cursor.date_added if cursor else None,
+                after_bar_id=cursor.bar_id if cursor else None,
+                search_index=search_index,
+            )
+            total = (
+                self._count_history_bars(
+                    db_cursor,
+                    voucher_term=voucher_term,
+                    weight_text=weight_text,
+                    status_text=status_text,
+                    search_index=search_index,
+                )
+                if include_total
+                else None
             )
-            count_row = db_cursor.fetchone()
-            total = int(count_row[0]) if count_row else 0
             db_cursor.execute(statement.query, tuple(statement.params))
             fetched = [dict(row) for row in db_cursor.fetchall()]
         has_more = len(fetched) > page_size
@@ -221,3 +253,44 @@ class SilverBarsSnapshotRepository:
                 int(last["bar_id"]),
             )
         return Page(tuple(rows), total, next_cursor)
+
+    def count_history_bars(
+        self,
+        *,
+        voucher_term: str = "",
+        weight_text: str = "",
+        status_text: str = "All Statuses",
+    ) -> int:
+        with closing(self._connect()) as conn:
+            db_cursor = conn.cursor()
+            return self._count_history_bars(
+                db_cursor,
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                search_index=search_index_exists(db_cursor, ESTIMATE_SEARCH_INDEX),
+            )
+
+    @staticmethod
+    def _count_history_bars(
+        db_cursor: Any,
+        *,
+        voucher_term: str,
+        weight_text: str,
+        status_text: str,
+        search_index: bool,
+    ) -> int:
+        return read_statement_count(
+            db_cursor,
+            build_history_count_query(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+                search_index=search_index,
+            ),
+            history_summary_key(
+                voucher_term=voucher_term,
+                weight_text=weight_text,
+                status_text=status_text,
+            ),
+        )
@@ -0,0 +1,386 @@
+"""Opt-in per-statement SQL timing for broker connections.
+
+When a broker is given a :class:`StatementStats`, every connection it opens is
+wrapped so each statement is timed from ``execute`` until the cursor is
+exhausted, re-executed, closed, or dropped. Statements are grouped by their
+normalized text: literals become ``?`` and ``IN (?, ?, ...)`` lists collapse,
+so keyset pages and bulk updates of different sizes share one shape. Only
+shapes and parameter types are ever logged, never bound values or literals.
+
+Without a collector the broker hands out the driver's own connections, so the
+disabled path costs nothing per statement.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping, MutableMapping
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+SQL_STATS_ENV = "SILVER_SQL_STATS"
+SQL_SLOW_MS_ENV = "SILVER_SQL_SLOW_MS"
+DEFAULT_SLOW_STATEMENT_MS = 100.0
+STATEMENT_SAMPLES = 256
+MAX_STATEMENT_SHAPES = 512
+OTHER_STATEMENTS = "<other statements>"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Return the statement shape used to group timings."""
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    return _IN_LIST.sub("IN (?...)", shape)
+
+
+def parameter_shape(parameters: Any) -> str:
+    """Describe bound parameters by type only, e.g. ``(str, int, None)``."""
+    if parameters is None or parameters == ():
+        return "()"
+    if isinstance(parameters, Mapping):
+        return (
+            "{"
+            + ", ".join(
+                f"{name}: {_type_name(value)}" for name, value in parameters.items()
+            )
+            + "}"
+        )
+    values = list(parameters)
+    described = ", ".join(_type_name(value) for value in values[:12])
+    if len(values) > 12:
+        described += f", +{len(values) - 12}"
+    return f"({described})"
+
+
+def _type_name(value: Any) -> str:
+    return "None" if value is None else type(value).__name__
+
+
+@dataclass(frozen=True)
+class StatementStat:
+    """Aggregated timings for one statement shape."""
+
+    sql: str
+    calls: int
+    rows: int
+    slow: int
+    total_ms: float
+    p95_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class _ShapeTotals:
+    __slots__ = ("calls", "rows", "slow", "total_ms", "max_ms", "samples")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.rows = 0
+        self.slow = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=STATEMENT_SAMPLES)
+
+
+class StatementStats:
+    """Thread-safe collector shared by every connection of one broker."""
+
+    def __init__(
+        self,
+        *,
+        slow_ms: float = DEFAULT_SLOW_STATEMENT_MS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.slow_ms = max(0.0, float(slow_ms))
+        self._logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._shapes: dict[str, _ShapeTotals] = {}
+        # Filled without the lock by cursors finalized during garbage
+        # collection, which may run while this thread already holds it.
+        self._dropped: deque[tuple[str, str, float, int]] = deque()
+
+    def instrument(self, connection: Any) -> "InstrumentedConnection":
+        return InstrumentedConnection(self, connection)
+
+    def record(self, sql: str, parameters: str, elapsed_ms: float, rows: int) -> None:
+        with self._lock:
+            slow = self._add(sql, elapsed_ms, rows)
+            pending = self._drain_dropped()
+        if slow:
+            self._log_slow(sql, parameters, elapsed_ms, rows)
+        for statement in pending:
+            self._log_slow(*statement)
+
+    def record_dropped(
+        self, sql: str, parameters: str, elapsed_ms: float, rows: int
+    ) -> None:
+        """Queue a statement from a finalizer; it is counted on the next read."""
+        self._dropped.append((sql, parameters, elapsed_ms, rows))
+
+    def _add(self, sql: str, elapsed_ms: float, rows: int) -> bool:
+        shape = normalize_sql(sql)
+        slow = elapsed_ms >= self.slow_ms
+        totals = self._shapes.get(shape)
+        if totals is None:
+            if len(self._shapes) >= MAX_STATEMENT_SHAPES:
+                shape = OTHER_STATEMENTS
+            totals = self._shapes.setdefault(shape, _ShapeTotals())
+        totals.calls += 1
+        totals.rows += rows
+        totals.slow += int(slow)
+        totals.total_ms += elapsed_ms
+        totals.max_ms = max(totals.max_ms, elapsed_ms)
+        totals.samples.append(elapsed_ms)
+        return slow
+
+    def _drain_dropped(self) -> list[tuple[str, str, float, int]]:
+        """Fold queued statements into the totals; return the slow ones."""
+        slow = []
+        while self._dropped:
+            statement = self._dropped.popleft()
+            sql, _, elapsed_ms, rows = statement
+            if self._add(sql, elapsed_ms, rows):
+                slow.append(statement)
+        return slow
+
+    def _log_slow(
+        self, sql: str, parameters: str, elapsed_ms: float, rows: int
+    ) -> None:
+        self._logger.warning(
+            "[perf] database.slow_statement_ms=%.3f rows=%d params=%s sql=%s",
+            elapsed_ms,
+            rows,
+            parameters,
+            normalize_sql(sql),
+        )
+
+    def snapshot(self) -> tuple[StatementStat, ...]:
+        """Return every shape, most total time first."""
+        with self._lock:
+            self._drain_dropped()
+            captured = [
+                (shape, totals, sorted(totals.samples))
+                for shape, totals in list(self._shapes.items())
+            ]
+            stats = [
+                StatementStat(
+                    sql=shape,
+                    calls=totals.calls,
+                    rows=totals.rows,
+                    slow=totals.slow,
+                    total_ms=totals.total_ms,
+                    p95_ms=(
+                        samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                        if samples
+                        else 0.0
+                    ),
+                    max_ms=totals.max_ms,
+                )
+                for shape, totals, samples in captured
+            ]
+        return tuple(sorted(stats, key=lambda stat: stat.total_ms, reverse=True))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._dropped.clear()
+            self._shapes.clear()
+
+
+def statement_stats_from_environment(
+    environ: MutableMapping[str, str] | None = None,
+    *,
+    logger: logging.Logger | None = None,
+) -> StatementStats | None:
+    """Build a collector when ``SILVER_SQL_STATS`` is set, otherwise ``None``.
+
+    ``SILVER_SQL_SLOW_MS`` overrides the slow-statement threshold.
+    """
+    source = os.environ if environ is None else environ
+    if source.get(SQL_STATS_ENV, "").lower() not in ("true", "1", "yes"):
+        return None
+    try:
+        slow_ms = float(source.get(SQL_SLOW_MS_ENV, DEFAULT_SLOW_STATEMENT_MS))
+    except ValueError:
+        slow_ms = DEFAULT_SLOW_STATEMENT_MS
+    return StatementStats(slow_ms=slow_ms, logger=logger)
+
+
+class InstrumentedCursor:
+    """DB-API cursor proxy that times each statement through its last fetch."""
+
+    def __init__(self, stats: StatementStats, cursor: Any) -> None:
+        self._stats = stats
+        self._cursor = cursor
+        self._sql: str | None = None
+        self._parameters = "()"
+        self._elapsed_ms = 0.0
+        self._rows = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self) -> "InstrumentedCursor":
+        return self
+
+    def __next__(self) -> Any:
+        started = time.perf_counter()
+        try:
+            row = next(self._cursor)
+        except StopIteration:
+            self._elapsed_ms += (time.perf_counter() - started) * 1000.0
+            self._finish()
+            raise
+        self._fetched(started, 1)
+        return row
+
+    def __del__(self) -> None:
+        # A dropped cursor still reports its statement; never raise or lock
+        # here, since collection can run inside the collector's own lock.
+        with suppress(Exception):
+            self._finish(dropped=True)
+
+    def _start(self, sql: str, parameters: str) -> float:
+        self._finish()
+        self._sql = sql
+        self._parameters = parameters
+        self._elapsed_ms = 0.0
+        self._rows = 0
+        return time.perf_counter()
+
+    def _fetched(self, started: float, rows: int) -> None:
+        self._elapsed_ms += (time.perf_counter() - started) * 1000.0
+        self._rows += rows
+
+    def _finish(self, *, dropped: bool = False) -> None:
+        sql, self._sql = self._sql, None
+        if sql is None:
+            return
+        rows = self._rows
+        if not rows:
+            rows = max(0, int(getattr(self._cursor, "rowcount", -1) or 0))
+        record = self._stats.record_dropped if dropped else self._stats.record
+        record(sql, self._parameters, self._elapsed_ms, rows)
+
+    def execute(self, sql: str, parameters: Any = ()) -> "InstrumentedCursor":
+        started = self._start(sql, parameter_shape(parameters))
+        try:
+            self._cursor.execute(sql, parameters)
+        except BaseException:
+            self._fetched(started, 0)
+            self._finish()
+            raise
+        self._fetched(started, 0)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> "InstrumentedCursor":
+        if isinstance(seq_of_parameters, (list, tuple)):
+            first = seq_of_parameters[0] if seq_of_parameters else ()
+            shape = f"many[{len(seq_of_parameters)}] {parameter_shape(first)}"
+        else:
+            shape = "many"
+        started = self._start(sql, shape)
+        try:
+            self._cursor.executemany(sql, seq_of_parameters)
+        finally:
+            self._fetched(started, 0)
+            self._finish()
+        return self
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(started, 0 if row is None else 1)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        requested = self._cursor.arraysize if size is None else size
+        started = time.perf_counter()
+        rows: list[Any] = self._cursor.fetchmany(requested)
+        self._fetched(started, len(rows))
+        if len(rows) < requested:
+            self._finish()
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        started = time.perf_counter()
+        rows: list[Any] = self._cursor.fetchall()
+        self._fetched(started, len(rows))
+        self._finish()
+        return rows
+
+    def close(self) -> None:
+        self._finish()
+        self._cursor.close()
+
+
+class InstrumentedConnection:
+    """DB-API connection proxy whose cursors report to a ``StatementStats``."""
+
+    def __init__(self, stats: StatementStats, connection: Any) -> None:
+        object.__setattr__(self, "_stats", stats)
+        object.__setattr__(self, "_connection", connection)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._connection, name, value)
+
+    def __enter__(self) -> "InstrumentedConnection":
+        self._connection.__enter__()
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> Any:
+        return self._connection.__exit__(exc_type, exc, tb)
+
+    def cursor(self, *args: Any) -> InstrumentedCursor:
+        return InstrumentedCursor(self._stats, self._connection.cursor(*args))
+
+    def execute(self, sql: str, parameters: Any = ()) -> InstrumentedCursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> InstrumentedCursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def unwrap_connection(connection: Any) -> Any:
+    """Return the driver connection behind an instrumented proxy."""
+    return (
+        connection._connection
+        if isinstance(connection, InstrumentedConnection)
+        else connection
+    )
+
+
+__all__ = [
+    "DEFAULT_SLOW_STATEMENT_MS",
+    "InstrumentedConnection",
+    "InstrumentedCursor",
+    "SQL_SLOW_MS_ENV",
+    "SQL_STATS_ENV",
+    "StatementStat",
+    "StatementStats",
+    "normalize_sql",
+    "parameter_shape",
+    "statement_stats_from_environment",
+    "unwrap_connection",
+]
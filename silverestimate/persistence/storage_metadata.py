@@ -134,6 +134,25 @@ class BackupManifest:
     sqlcipher_version: str
     device_binding_fingerprint: str | None = None
     kdf_sha256: str | None = None
+    change_generation: int | None = None
+    estimate_archive_sha256: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class DifferentialManifest:
+    version: int
+    created_utc: str
+    database_sha256: str
+    schema_version: int
+    sqlcipher_version: str
+    base_generation: int
+    generation: int
+    upserted_rows: int
+    deleted_rows: int
+    device_binding_fingerprint: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -168,6 +187,50 @@ class RestoreJournal:
     staged_path: str
     staged_sha256: str
     retained_path: str
+    staged_archive_sha256: str | None = None
+
+
+@dataclass(frozen=True)
+class OpenFingerprint:
+    """State recorded at a clean close so the next open can skip page scans."""
+
+    version: int
+    schema_sha256: str
+    database_size: int
+    database_mtime_ns: int
+    wal_size: int
+    closed_utc: str
+
+    VERSION: ClassVar[int] = 1
+
+    @classmethod
+    def from_dict(cls, value: dict[str, Any]) -> Self:
+        try:
+            result = cls(**value)
+        except TypeError as exc:
+            raise StorageMetadataError("Malformed open fingerprint") from exc
+        if (
+            result.version != cls.VERSION
+            or not isinstance(result.schema_sha256, str)
+            or len(result.schema_sha256) != 64
+            or not all(
+                isinstance(field, int) and field >= 0
+                for field in (
+                    result.database_size,
+                    result.database_mtime_ns,
+                    result.wal_size,
+                )
+            )
+        ):
+            raise StorageMetadataError("Unsupported open fingerprint")
+        return result
+
+    @classmethod
+    def read(cls, path: str | Path) -> Self:
+        return cls.from_dict(read_json(path))
+
+    def write(self, path: str | Path) -> None:
+        atomic_write_json(path, asdict(self))
 
 
 def sha256_file(path: str | Path) -> str:
@@ -188,7 +251,9 @@ def write_journal(
 __all__ = [
     "BackupManifest",
     "BindingMigrationJournal",
+    "DifferentialManifest",
     "KdfMetadata",
+    "OpenFingerprint",
     "RekeyJournal",
     "RestoreJournal",
     "StorageMetadataError",
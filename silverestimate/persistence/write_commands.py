@@ -0,0 +1,258 @@
+"""Typed repository writes run by ``DatabaseWriter`` on its own connection.
+
+Each command calls one repository method on the session it is applied to.
+``DatabaseManager``'s write methods build these commands and wait for the
+writer to run them, so every repository write shares the writer's
+connection instead of competing with it from the GUI thread.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from silverestimate.persistence.database_repository_facade import (
+        DatabaseRepositoryFacadeMixin,
+    )
+
+
+class WriteCommand:
+    """A typed repository write executed on the writer thread.
+
+    Batchable commands are small, self-contained writes that may share one
+    transaction with adjacent batchable commands; each still runs inside its
+    own savepoint so a failure only undoes that command.
+    """
+
+    batchable: ClassVar[bool] = True
+
+    @property
+    def command_name(self) -> str:
+        return type(self).__name__
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class SaveEstimate(WriteCommand):
+    voucher_no: str
+    date: str
+    silver_rate: float
+    regular_items: Sequence[Mapping[str, Any]]
+    return_items: Sequence[Mapping[str, Any]]
+    totals: Mapping[str, Any]
+    silver_bars: Sequence[Mapping[str, Any]] | None = None
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.estimates_repo.save_estimate_with_silver_bars(
+            self.voucher_no,
+            self.date,
+            self.silver_rate,
+            [dict(item) for item in self.regular_items],
+            [dict(item) for item in self.return_items],
+            dict(self.totals),
+            None if self.silver_bars is None else list(self.silver_bars),
+        )
+
+
+@dataclass(frozen=True)
+class DeleteEstimate(WriteCommand):
+    # Runs alone: deleting an archived voucher attaches the archive file.
+    batchable: ClassVar[bool] = False
+
+    voucher_no: str
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.estimates_repo.delete_single_estimate(self.voucher_no)
+
+
+@dataclass(frozen=True)
+class DeleteAllEstimates(WriteCommand):
+    batchable: ClassVar[bool] = False
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.estimates_repo.delete_all_estimates()
+
+
+@dataclass(frozen=True)
+class SyncSilverBars(WriteCommand):
+    voucher_no: str
+    bars: Sequence[Mapping[str, Any]]
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_synchronization_repo.synchronize(
+            self.voucher_no, [dict(bar) for bar in self.bars]
+        )
+
+
+@dataclass(frozen=True)
+class AddItem(WriteCommand):
+    code: str
+    name: str
+    purity: float
+    wage_type: str
+    wage_rate: float
+    tunch: Any = None
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.items_repo.add_item(*self._fields())
+
+    def _fields(self) -> tuple[Any, ...]:
+        fields = (self.code, self.name, self.purity, self.wage_type, self.wage_rate)
+        return fields if self.tunch is None else (*fields, self.tunch)
+
+
+@dataclass(frozen=True)
+class UpdateItem(AddItem):
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.items_repo.update_item(*self._fields())
+
+
+@dataclass(frozen=True)
+class DeleteItem(WriteCommand):
+    code: str
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.items_repo.delete_item(self.code)
+
+
+@dataclass(frozen=True)
+class UpsertItemCatalog(WriteCommand):
+    batchable: ClassVar[bool] = False
+
+    items: Sequence[Mapping[str, Any]]
+    replace_existing: bool = False
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.items_repo.upsert_item_catalog(
+            [dict(item) for item in self.items],
+            replace_existing=self.replace_existing,
+        )
+
+
+@dataclass(frozen=True)
+class CreateSilverBarList(WriteCommand):
+    note: str | None = None
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.create_list(self.note)
+
+
+@dataclass(frozen=True)
+class UpdateSilverBarListNote(WriteCommand):
+    list_id: int
+    note: str
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.update_list_note(self.list_id, self.note)
+
+
+@dataclass(frozen=True)
+class DeleteSilverBarList(WriteCommand):
+    list_id: int
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.delete_list(self.list_id)
+
+
+@dataclass(frozen=True)
+class DeleteSilverBarListResult(DeleteSilverBarList):
+    """Delete a list, reporting the outcome as a ``RepositoryResult``."""
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.delete_list_result(self.list_id)
+
+
+@dataclass(frozen=True)
+class AssignBarToList(WriteCommand):
+    bar_id: int
+    list_id: int
+    note: str = "Assigned to list"
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.assign_bar_to_list(
+            self.bar_id, self.list_id, note=self.note
+        )
+
+
+@dataclass(frozen=True)
+class RemoveBarFromList(WriteCommand):
+    bar_id: int
+    note: str = "Removed from list"
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.remove_bar_from_list(
+            self.bar_id, note=self.note
+        )
+
+
+@dataclass(frozen=True)
+class AssignBarsToList(WriteCommand):
+    batchable: ClassVar[bool] = False
+
+    bar_ids: Sequence[int]
+    list_id: int
+    note: str = "Assigned to list"
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.assign_bars_to_list_bulk(
+            list(self.bar_ids), self.list_id, note=self.note
+        )
+
+
+@dataclass(frozen=True)
+class RemoveBarsFromList(WriteCommand):
+    batchable: ClassVar[bool] = False
+
+    bar_ids: Sequence[int]
+    note: str = "Removed from list"
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.remove_bars_from_list_bulk(
+            list(self.bar_ids), note=self.note
+        )
+
+
+@dataclass(frozen=True)
+class IssueSilverBarList(WriteCommand):
+    list_id: int
+    issued_date: str | None = None
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.mark_list_as_issued(
+            self.list_id, issued_date=self.issued_date
+        )
+
+
+@dataclass(frozen=True)
+class ReactivateSilverBarList(WriteCommand):
+    list_id: int
+
+    def apply(self, db: DatabaseRepositoryFacadeMixin) -> Any:
+        return db.silver_bar_command_repo.reactivate_list(self.list_id)
+
+
+__all__ = [
+    "AddItem",
+    "AssignBarToList",
+    "AssignBarsToList",
+    "CreateSilverBarList",
+    "DeleteAllEstimates",
+    "DeleteEstimate",
+    "DeleteItem",
+    "DeleteSilverBarList",
+    "DeleteSilverBarListResult",
+    "IssueSilverBarList",
+    "ReactivateSilverBarList",
+    "RemoveBarFromList",
+    "RemoveBarsFromList",
+    "SaveEstimate",
+    "SyncSilverBars",
+    "UpdateItem",
+    "UpdateSilverBarListNote",
+    "UpsertItemCatalog",
+    "WriteCommand",
+]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Mapping, Optional, Protocol, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Protocol, Sequence
 
 from silverestimate.domain.estimate_models import EstimateLine, TotalsResult
 from silverestimate.services.estimate_calculator import compute_totals
 from silverestimate.services.estimate_repository import EstimateRepository
 
+if TYPE_CHECKING:
+    from silverestimate.persistence.estimates_repository import EstimateSaveOutcome
+
 
 @dataclass(frozen=True)
 class EstimateEntryViewState:
@@ -102,6 +106,7 @@ class SaveOutcome:
     bars_added: int = 0
     bars_failed: int = 0
     error_detail: Optional[str] = None
+    phase_ms: Mapping[str, float] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -249,64 +254,79 @@ class EstimateEntryPresenter:
         self._view.show_status(f"Item '{normalized}' not found.", 2000)
         return False
 
-    def save_estimate(self, payload: SavePayload) -> SaveOutcome:
-        """Persist the estimate and synchronize related silver bar metadata."""
-        try:
-            regular_dicts = [self._item_to_dict(item) for item in payload.regular_items]
-            return_dicts = [self._item_to_dict(item) for item in payload.return_items]
-            success = self._repository.save_estimate(
-                payload.voucher_no,
-                payload.date,
-                payload.silver_rate,
-                regular_dicts,
-                return_dicts,
-                payload.totals,
-            )
-            if not success:
-                detail = self._repository.last_error()
-                return SaveOutcome(
-                    success=False,
-                    message=f"Failed to save estimate '{payload.voucher_no}'.",
-                    error_detail=detail,
-                )
-
-            bars_added = 0
-            bars_failed = 0
+    def save_estimate(self, payload: SavePayload) -> Future[SaveOutcome]:
+        """Queue the estimate and its silver bars, returning the save outcome.
 
+        The returned future always settles with a ``SaveOutcome``; write
+        errors become failed outcomes rather than exceptions.
+        """
+        outcome: Future[SaveOutcome] = Future()
+        try:
             current_bar_items = [
                 item
                 for item in payload.items
                 if item.is_silver_bar and not item.is_return
             ]
-            bars_added, bars_failed = self._sync_silver_bars_for_estimate(
+            saved = self._repository.save_estimate_with_silver_bars(
                 payload.voucher_no,
-                current_bar_items,
+                payload.date,
+                payload.silver_rate,
+                [self._item_to_dict(item) for item in payload.regular_items],
+                [self._item_to_dict(item) for item in payload.return_items],
+                payload.totals,
+                self._silver_bar_payload(current_bar_items),
             )
+        except Exception as exc:
+            outcome.set_result(self._save_error(payload, exc))
+            return outcome
+        saved.add_done_callback(
+            lambda done: outcome.set_result(self._save_outcome(payload, done))
+        )
+        return outcome
 
-            message_parts = [f"Estimate '{payload.voucher_no}' saved successfully."]
-            if bars_added:
-                message_parts.append(f"{bars_added} silver bar(s) created.")
-            if bars_failed:
-                message_parts.append(f"{bars_failed} bar update(s) failed.")
-            message = " ".join(message_parts)
-
-            return SaveOutcome(
-                success=True,
-                message=message,
-                bars_added=bars_added,
-                bars_failed=bars_failed,
-            )
+    def _save_outcome(
+        self, payload: SavePayload, saved: Future[EstimateSaveOutcome]
+    ) -> SaveOutcome:
+        try:
+            result = saved.result()
         except Exception as exc:
+            return self._save_error(payload, exc)
+        phase_ms = dict(result.phase_ms)
+        if not result.saved:
             return SaveOutcome(
                 success=False,
-                message=f"Unexpected error saving estimate '{payload.voucher_no}'.",
-                error_detail=str(exc),
+                message=f"Failed to save estimate '{payload.voucher_no}'.",
+                error_detail=result.error or self._repository.last_error(),
+                phase_ms=phase_ms,
             )
 
-    def _sync_silver_bars_for_estimate(
-        self, voucher_no: str, items: Sequence[SaveItem]
-    ) -> tuple[int, int]:
-        bars_payload = [
+        bars = result.bars
+        bars_added = int(bars.added) if bars is not None else 0
+        bars_failed = int(bars.failed) if bars is not None else 0
+        message_parts = [f"Estimate '{payload.voucher_no}' saved successfully."]
+        if bars_added:
+            message_parts.append(f"{bars_added} silver bar(s) created.")
+        if bars_failed:
+            message_parts.append(f"{bars_failed} bar update(s) failed.")
+        return SaveOutcome(
+            success=True,
+            message=" ".join(message_parts),
+            bars_added=bars_added,
+            bars_failed=bars_failed,
+            phase_ms=phase_ms,
+        )
+
+    @staticmethod
+    def _save_error(payload: SavePayload, exc: Exception) -> SaveOutcome:
+        return SaveOutcome(
+            success=False,
+            message=f"Unexpected error saving estimate '{payload.voucher_no}'.",
+            error_detail=str(exc),
+        )
+
+    @staticmethod
+    def _silver_bar_payload(items: Sequence[SaveItem]) -> list[Dict[str, object]]:
+        return [
             {
                 "weight": float(item.net_wt or 0.0),
                 "purity": float(item.purity or 0.0),
@@ -314,11 +334,6 @@ class EstimateEntryPresenter:
             }
             for item in items
         ]
-        added, failed = self._repository.sync_silver_bars_for_estimate(
-            voucher_no,
-            bars_payload,
-        )
-        return int(added or 0), int(failed or 0)
 
     @staticmethod
     def _item_to_dict(item: SaveItem) -> Dict[str, object]:
@@ -387,8 +402,8 @@ class EstimateEntryPresenter:
             return cls._normalize_wage_type(normalized)
         return None
 
-    def delete_estimate(self, voucher_no: str) -> bool:
-        """Delete an estimate by voucher number."""
+    def delete_estimate(self, voucher_no: str) -> Future[bool]:
+        """Queue the delete of an estimate; the future tells whether it existed."""
         return self._repository.delete_estimate(voucher_no)
 
     def open_silver_bar_management(self) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
@@ -104,8 +105,8 @@ class EstimateEntryPersistenceService:
         date: str,
         note: str,
         presenter,
-    ) -> tuple[SaveOutcome, SavePreparation]:
-        """Run save using the presenter and return the outcome plus preparation info."""
+    ) -> tuple[Future[SaveOutcome], SavePreparation]:
+        """Queue the save with the presenter; return its outcome and preparation."""
         preparation = self.prepare_save_payload(
             voucher_no=voucher_no,
             date=date,
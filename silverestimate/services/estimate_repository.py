@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping as MappingABC
+from concurrent.futures import Future
 from typing import Any, Iterable, Mapping, Optional, Protocol
 
+from silverestimate.infrastructure.write_futures import map_future
 from silverestimate.persistence.database_protocols import EstimateDataSource
+from silverestimate.persistence.estimates_repository import EstimateSaveOutcome
 
 EstimateRow = Mapping[str, Any]
 
@@ -26,7 +29,7 @@ class EstimateRepository(Protocol):
 
     def load_estimate(self, voucher_no: str) -> Optional[EstimateRow]: ...
 
-    def save_estimate(
+    def save_estimate_with_silver_bars(  # noqa: PLR0913 - mirrors the save API
         self,
         voucher_no: str,
         date: str,
@@ -34,15 +37,12 @@ class EstimateRepository(Protocol):
         regular_items: Iterable[EstimateRow],
         return_items: Iterable[EstimateRow],
         totals: Mapping[str, Any],
-    ) -> bool: ...
-
-    def sync_silver_bars_for_estimate(
-        self, voucher_no: str, bars: Iterable[EstimateRow]
-    ) -> tuple[int, int]: ...
+        silver_bars: Iterable[EstimateRow],
+    ) -> Future[EstimateSaveOutcome]: ...
 
     def last_error(self) -> Optional[str]: ...
 
-    def delete_estimate(self, voucher_no: str) -> bool: ...
+    def delete_estimate(self, voucher_no: str) -> Future[bool]: ...
 
 
 class DatabaseEstimateRepository:
@@ -70,7 +70,7 @@ class DatabaseEstimateRepository:
     def load_estimate(self, voucher_no: str) -> Optional[EstimateRow]:
         return self._db.get_estimate_by_voucher(voucher_no)
 
-    def save_estimate(
+    def save_estimate_with_silver_bars(  # noqa: PLR0913 - mirrors the save API
         self,
         voucher_no: str,
         date: str,
@@ -78,36 +78,21 @@ class DatabaseEstimateRepository:
         regular_items: Iterable[EstimateRow],
         return_items: Iterable[EstimateRow],
         totals: Mapping[str, Any],
-    ) -> bool:
-        return bool(
-            self._db.save_estimate_with_returns(
-                voucher_no,
-                date,
-                silver_rate,
-                list(regular_items or []),
-                list(return_items or []),
-                dict(totals or {}),
-            )
+        silver_bars: Iterable[EstimateRow],
+    ) -> Future[EstimateSaveOutcome]:
+        """Queue the estimate save and its bar reconciliation as one commit."""
+        return self._db.save_estimate_with_silver_bars(
+            voucher_no,
+            date,
+            silver_rate,
+            list(regular_items or []),
+            list(return_items or []),
+            dict(totals or {}),
+            list(silver_bars or []),
         )
 
-    def sync_silver_bars_for_estimate(
-        self, voucher_no: str, bars: Iterable[EstimateRow]
-    ) -> tuple[int, int]:
-        bars_list = list(bars or [])
-        try:
-            added, failed = self._db.sync_silver_bars_for_estimate(
-                voucher_no,
-                bars_list,
-            )
-            return int(added or 0), int(failed or 0)
-        except Exception:
-            return 0, len(bars_list)
-
     def last_error(self) -> Optional[str]:
         return getattr(self._db, "last_error", None)
 
-    def delete_estimate(self, voucher_no: str) -> bool:
-        try:
-            return bool(self._db.delete_single_estimate(voucher_no))
-        except Exception:
-            return False
+    def delete_estimate(self, voucher_no: str) -> Future[bool]:
+        return map_future(self._db.delete_single_estimate(voucher_no), bool)
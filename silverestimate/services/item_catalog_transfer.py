@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping, cast
 
 from silverestimate.domain.item_validation import validate_item
+from silverestimate.infrastructure.write_futures import map_future
 from silverestimate.persistence.database_protocols import (
     ItemCatalogDatabase,
     ReadConnectionFactory,
@@ -94,21 +96,31 @@ def import_item_catalog(
     file_path: str,
     *,
     replace_existing: bool = False,
-) -> dict[str, int]:
-    """Load a native catalog backup file and upsert its contents atomically."""
+) -> Future[dict[str, int]]:
+    """Load a native catalog backup file and queue an atomic upsert of it.
+
+    The file is read and validated before anything is written; the returned
+    future settles with the import summary once the writer has applied it.
+    """
     if not db_manager:
         raise ItemCatalogTransferError("Database connection not available.")
 
     items = load_item_catalog_file(file_path)
-    summary = db_manager.upsert_item_catalog(items, replace_existing=replace_existing)
-    if not isinstance(summary, dict):
-        raise ItemCatalogTransferError("Item catalog import could not be applied.")
-    return {
-        "inserted": int(summary.get("inserted", 0)),
-        "updated": int(summary.get("updated", 0)),
-        "deleted": int(summary.get("deleted", 0)),
-        "total": int(summary.get("total", len(items))),
-    }
+
+    def summarize(summary: Any) -> dict[str, int]:
+        if not isinstance(summary, dict):
+            raise ItemCatalogTransferError("Item catalog import could not be applied.")
+        return {
+            "inserted": int(summary.get("inserted", 0)),
+            "updated": int(summary.get("updated", 0)),
+            "deleted": int(summary.get("deleted", 0)),
+            "total": int(summary.get("total", len(items))),
+        }
+
+    return map_future(
+        db_manager.upsert_item_catalog(items, replace_existing=replace_existing),
+        summarize,
+    )
 
 
 def load_item_catalog_file(file_path: str) -> list[dict[str, Any]]:
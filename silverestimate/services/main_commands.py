@@ -10,6 +10,7 @@ from typing import Optional, cast
 from PySide6.QtCore import QObject, QThread, Signal
 from PySide6.QtWidgets import QCheckBox, QFileDialog, QInputDialog, QMessageBox
 
+from silverestimate.infrastructure.database_write_notifier import when_written
 from silverestimate.persistence.database_protocols import (
     MainCommandsDatabase,
     ReadConnectionFactory,
@@ -228,20 +229,26 @@ class MainCommands:
         replace_existing = replace_checkbox.isChecked()
 
         try:
-            summary = import_item_catalog(
+            restored = import_item_catalog(
                 self.db,
                 file_path,
                 replace_existing=replace_existing,
             )
         except Exception as exc:
-            self.logger.error("Item catalog restore failed: %s", exc, exc_info=True)
-            QMessageBox.critical(
-                self.main_window,
-                "Restore Failed",
-                str(exc),
-            )
+            self._show_catalog_restore_failure(exc)
             return MainCommandOutcome(MainCommandStatus.FAILED, str(exc))
 
+        when_written(restored, self._finish_item_catalog_restore)
+        return MainCommandOutcome(
+            MainCommandStatus.STARTED,
+            "Item catalog restore started.",
+        )
+
+    def _finish_item_catalog_restore(self, summary) -> None:
+        if isinstance(summary, Exception):
+            self._show_catalog_restore_failure(summary)
+            return
+
         item_master = getattr(self.main_window, "item_master_widget", None)
         if item_master is not None and item_master.isVisible():
             try:
@@ -251,19 +258,23 @@ class MainCommands:
                     "Could not refresh item master after import: %s", exc
                 )
 
-        message = (
+        QMessageBox.information(
+            self.main_window,
+            "Restore Complete",
             "Item catalog backup restored successfully.\n\n"
             f"Total records: {summary['total']}\n"
             f"Inserted: {summary['inserted']}\n"
             f"Updated: {summary['updated']}\n"
-            f"Deleted: {summary['deleted']}"
+            f"Deleted: {summary['deleted']}",
         )
-        QMessageBox.information(
+
+    def _show_catalog_restore_failure(self, exc: Exception) -> None:
+        self.logger.error("Item catalog restore failed: %s", exc, exc_info=exc)
+        QMessageBox.critical(
             self.main_window,
-            "Restore Complete",
-            message,
+            "Restore Failed",
+            str(exc),
         )
-        return MainCommandOutcome(MainCommandStatus.SUCCESS, message)
 
     def create_item_catalog_backup(self) -> MainCommandOutcome:
         """Create a native Silver Estimate item catalog backup."""
@@ -324,41 +335,53 @@ class MainCommands:
             return MainCommandOutcome(MainCommandStatus.CANCELLED)
 
         try:
-            if self.db.delete_all_estimates():
-                message = "All estimates have been deleted successfully."
-                QMessageBox.information(
-                    self.main_window,
-                    "Success",
-                    message,
-                )
-                widget = getattr(self.main_window, "estimate_widget", None)
-                if widget:
-                    try:
-                        widget.clear_form(confirm=False)
-                    except Exception as form_exc:
-                        self.logger.error(
-                            "Error clearing estimate form: %s", form_exc, exc_info=True
-                        )
-                return MainCommandOutcome(MainCommandStatus.SUCCESS, message)
-            else:
-                message = "Failed to delete all estimates (database error)."
-                QMessageBox.critical(
-                    self.main_window,
-                    "Error",
-                    message,
-                )
-                return MainCommandOutcome(MainCommandStatus.FAILED, message)
+            deleted = self.db.delete_all_estimates()
         except Exception as exc:
-            self.logger.error("Error deleting all estimates: %s", exc, exc_info=True)
+            return self._show_delete_all_estimates_error(exc)
+
+        when_written(deleted, self._finish_delete_all_estimates)
+        return MainCommandOutcome(
+            MainCommandStatus.STARTED,
+            "Deleting all estimates.",
+        )
+
+    def _finish_delete_all_estimates(self, deleted) -> None:
+        if isinstance(deleted, Exception):
+            self._show_delete_all_estimates_error(deleted)
+            return
+        if not deleted:
             QMessageBox.critical(
                 self.main_window,
                 "Error",
-                f"An unexpected error occurred: {exc}",
-            )
-            return MainCommandOutcome(
-                MainCommandStatus.FAILED,
-                f"An unexpected error occurred: {exc}",
+                "Failed to delete all estimates (database error).",
             )
+            return
+
+        QMessageBox.information(
+            self.main_window,
+            "Success",
+            "All estimates have been deleted successfully.",
+        )
+        widget = getattr(self.main_window, "estimate_widget", None)
+        if widget:
+            try:
+                widget.clear_form(confirm=False)
+            except Exception as form_exc:
+                self.logger.error(
+                    "Error clearing estimate form: %s", form_exc, exc_info=True
+                )
+
+    def _show_delete_all_estimates_error(self, exc: Exception) -> MainCommandOutcome:
+        self.logger.error("Error deleting all estimates: %s", exc, exc_info=exc)
+        QMessageBox.critical(
+            self.main_window,
+            "Error",
+            f"An unexpected error occurred: {exc}",
+        )
+        return MainCommandOutcome(
+            MainCommandStatus.FAILED,
+            f"An unexpected error occurred: {exc}",
+        )
 
     def _start_item_catalog_export_worker(
         self,
@@ -0,0 +1,124 @@
+"""Run one cancellable background task behind a modal progress dialog."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from PySide6.QtCore import QEventLoop, QObject, Qt, Signal, Slot
+from PySide6.QtWidgets import QProgressDialog, QWidget
+
+from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
+
+ResultT = TypeVar("ResultT")
+
+ProgressReport = Callable[[int, int, str], None]
+"""``(done, total, label)``; a zero total shows a busy bar, an empty label keeps the text."""
+
+
+@dataclass(frozen=True)
+class BackgroundOutcome(Generic[ResultT]):
+    """How a background task ended: a value, an error, or a cancellation."""
+
+    value: ResultT | None = None
+    error: object | None = None
+    cancelled: bool = False
+
+
+class _ProgressSession(QObject):
+    """Relay worker progress to the dialog and end the wait when work settles."""
+
+    advanced = Signal(int, int, str)
+
+    def __init__(self, progress: QProgressDialog, parent: QObject | None) -> None:
+        super().__init__(parent)
+        self.progress = progress
+        self.loop = QEventLoop(self)
+        self.value: object | None = None
+        self.error: object | None = None
+        self.cancelled = False
+        self.settled = False
+        self.advanced.connect(self._on_advanced)
+
+    @Slot(int, int, str)
+    def _on_advanced(self, done: int, total: int, label: str) -> None:
+        if label:
+            self.progress.setLabelText(label)
+        self.progress.setMaximum(max(0, total))
+        self.progress.setValue(min(max(0, done), max(0, total)))
+
+    @Slot(int, object)
+    def on_result(self, _generation: int, value: object) -> None:
+        self.value = value
+        self._settle()
+
+    @Slot(int, object)
+    def on_failed(self, _generation: int, error: object) -> None:
+        self.error = error
+        self._settle()
+
+    @Slot(int)
+    def on_settled(self, _generation: int) -> None:
+        self._settle()
+
+    @Slot()
+    def on_cancel(self) -> None:
+        if self.settled:
+            # Closing the progress dialog also emits ``canceled``.
+            return
+        self.cancelled = True
+        self._settle()
+
+    def _settle(self) -> None:
+        self.settled = True
+        self.loop.quit()
+
+
+def run_with_progress(
+    parent: QWidget | None,
+    worker: Callable[[ProgressReport, threading.Event], ResultT],
+    *,
+    title: str,
+    label: str,
+    name: str = "background-task",
+) -> BackgroundOutcome[ResultT]:
+    """Run ``worker`` off the GUI thread while events keep being processed.
+
+    The dialog appears only when the work outlasts a short delay. Cancelling
+    sets the worker's event and returns at once; the worker is expected to
+    stop at its next check, raising ``RequestCancelledError`` or otherwise.
+    """
+    progress = QProgressDialog(label, "Cancel", 0, 0, parent)
+    progress.setWindowTitle(title)
+    progress.setWindowModality(Qt.WindowModality.WindowModal)
+    progress.setMinimumDuration(400)
+    progress.setAutoClose(False)
+    progress.setAutoReset(False)
+    session = _ProgressSession(progress, parent)
+    # The submitted request is the progress callback itself.
+    runner = LatestRequestRunner(worker, parent, name=name)
+    runner.result.connect(session.on_result)
+    runner.failed.connect(session.on_failed)
+    runner.settled.connect(session.on_settled)
+    progress.canceled.connect(session.on_cancel)
+    try:
+        runner.submit(session.advanced.emit)
+        if not session.settled:
+            session.loop.exec()
+    finally:
+        runner.shutdown()
+        progress.close()
+        progress.deleteLater()
+        session.deleteLater()
+        runner.deleteLater()
+
+    if session.cancelled:
+        return BackgroundOutcome(cancelled=True)
+    if session.error is not None:
+        return BackgroundOutcome(error=session.error)
+    return BackgroundOutcome(value=session.value)  # type: ignore[arg-type]
+
+
+__all__ = ["BackgroundOutcome", "ProgressReport", "run_with_progress"]
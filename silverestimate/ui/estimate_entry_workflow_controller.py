@@ -25,8 +25,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from silverestimate.infrastructure.database_write_notifier import when_written
 from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
-from silverestimate.presenter import LoadedEstimate
+from silverestimate.presenter import LoadedEstimate, SaveOutcome
 from silverestimate.services.dda_rate_fetcher import DdaCurrentRatesClient
 from silverestimate.services.estimate_entry_persistence import (
     EstimateEntryPersistenceService,
@@ -46,6 +47,7 @@ class EstimateEntryWorkflowController:
 
     def __init__(self, host: Any) -> None:
         self.host = host
+        self._saving = False
 
     if TYPE_CHECKING:
         _loading_estimate: bool
@@ -141,13 +143,16 @@ class EstimateEntryWorkflowController:
 
         if not self.host.presenter:
             return
+        if self._saving:
+            self.host._status(f"Estimate {voucher_no} is still saving...", 2000)
+            return
 
         self.host._status(f"Saving estimate {voucher_no}...", 2000)
         self._update_view_model_snapshot()
 
         service = EstimateEntryPersistenceService(self.host.view_model)
         try:
-            outcome, preparation = service.execute_save(
+            saved, preparation = service.execute_save(
                 voucher_no=voucher_no,
                 date=self.host.date_edit.date().toString("yyyy-MM-dd"),
                 note=self.host.note_edit.text().strip()
@@ -155,7 +160,25 @@ class EstimateEntryWorkflowController:
                 else "",
                 presenter=self.host.presenter,
             )
+            del preparation
+        except Exception as exc:
+            self.host.logger.error(
+                "Failed to save estimate %s: %s", voucher_no, exc, exc_info=True
+            )
+            QMessageBox.critical(self._parent_widget(), "Save Error", str(exc))
+            return
+        # The form stays usable while the writer commits; another save is
+        # refused until this one settles.
+        self._saving = True
+        when_written(
+            saved,
+            lambda outcome: self._finish_save(voucher_no, outcome),
+            self.host,
+        )
 
+    def _finish_save(self, voucher_no: str, outcome: SaveOutcome) -> None:
+        self._saving = False
+        try:
             if outcome.success:
                 self.host._last_saved_status = datetime.now().strftime(
                     "%d-%m-%Y %I:%M %p"
@@ -173,7 +196,6 @@ class EstimateEntryWorkflowController:
                     self._parent_widget(), "Save Error", outcome.message
                 )
                 self.host._status(outcome.message, 5000)
-            del preparation
         except Exception as exc:
             self.host.logger.error(
                 "Failed to save estimate %s: %s", voucher_no, exc, exc_info=True
@@ -193,13 +215,24 @@ class EstimateEntryWorkflowController:
             QMessageBox.StandardButton.Cancel,
         )
         if reply == QMessageBox.StandardButton.Yes and self.host.presenter:
-            if self.host.presenter.delete_estimate(voucher_no):
-                self.host._status(f"Estimate {voucher_no} deleted.", 3000)
-                self.clear_form(confirm=False)
-            else:
-                QMessageBox.warning(
-                    self._parent_widget(), "Error", "Could not delete estimate."
-                )
+            when_written(
+                self.host.presenter.delete_estimate(voucher_no),
+                lambda deleted: self._finish_delete(voucher_no, deleted),
+                self.host,
+            )
+
+    def _finish_delete(self, voucher_no: str, deleted: object) -> None:
+        if deleted is True:
+            self.host._status(f"Estimate {voucher_no} deleted.", 3000)
+            self.clear_form(confirm=False)
+            return
+        if isinstance(deleted, Exception):
+            self.host.logger.error(
+                "Failed to delete estimate %s: %s", voucher_no, deleted
+            )
+        QMessageBox.warning(
+            self._parent_widget(), "Error", "Could not delete estimate."
+        )
 
     def print_estimate(self):
         from silverestimate.ui.print_manager import PrintManager
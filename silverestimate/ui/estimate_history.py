@@ -25,13 +25,21 @@ from PySide6.QtWidgets import (
 )
 
 from silverestimate.domain.pagination import EstimateHistoryCursor, Page
+from silverestimate.infrastructure.database_change_watcher import (
+    follow_database_changes,
+)
+from silverestimate.infrastructure.database_write_notifier import when_written
 from silverestimate.infrastructure.latest_request_runner import (
     LatestRequestRunner,
     RequestCancelledError,
 )
 from silverestimate.infrastructure.paged_load_state import PagedLoadState
 from silverestimate.infrastructure.sqlite_worker import cancellable_sqlite_connection
-from silverestimate.persistence.estimates_repository import fetch_estimate_history_page
+from silverestimate.persistence.estimates_repository import (
+    count_estimate_history,
+    fetch_estimate_history_page,
+)
+from silverestimate.persistence.query_cache import QueryCache, query_cache_of
 from silverestimate.ui.display_formatting import format_display_date, format_rupees
 from silverestimate.ui.models import EstimateHistoryRow, EstimateHistoryTableModel
 from silverestimate.ui.modern_components import (
@@ -58,6 +66,7 @@ class _HistoryLoadRequest:
     cursor: EstimateHistoryCursor | None
     append: bool
     started_at: float
+    query_cache: QueryCache | None = None
 
 
 def _load_history_page(
@@ -74,10 +83,35 @@ def _load_history_page(
             voucher_search=request.voucher_search,
             page_cursor=request.cursor,
             limit=500,
+            include_total=False,
+            cache=request.query_cache,
         )
     return request, page
 
 
+@dataclass(frozen=True)
+class _HistoryCountRequest:
+    load: _HistoryLoadRequest
+    generation: int
+
+
+def _count_history(
+    request: _HistoryCountRequest,
+    cancel_event: threading.Event,
+) -> tuple[_HistoryCountRequest, int]:
+    load = request.load
+    with cancellable_sqlite_connection(
+        load.connection_factory, cancel_event
+    ) as connection:
+        total = count_estimate_history(
+            connection.cursor(),
+            date_from=load.date_from,
+            date_to=load.date_to,
+            voucher_search=load.voucher_search,
+        )
+    return request, total
+
+
 @dataclass(frozen=True)
 class _PreviewRequest:
     print_manager: PrintManager
@@ -118,6 +152,13 @@ class EstimateHistoryDialog(QDialog):
         self._load_runner.result.connect(self._handle_load_result)
         self._load_runner.failed.connect(self._handle_load_error)
         self._load_runner.settled.connect(self._loading_done)
+        self._count_runner = LatestRequestRunner(
+            _count_history,
+            self,
+            name="estimate-history-counter",
+        )
+        self._count_runner.result.connect(self._handle_count_result)
+        self._count_runner.failed.connect(self._handle_count_error)
         self._print_preview_progress: QProgressDialog | None = None
         self._print_preview_runner = LatestRequestRunner(
             _build_preview,
@@ -129,6 +170,12 @@ class EstimateHistoryDialog(QDialog):
         self._print_preview_runner.settled.connect(self._finish_print_preview_build)
         self.init_ui()
         self.load_estimates()
+        follow_database_changes(main_window_ref, self.handle_database_changes)
+
+    def handle_database_changes(self, changes) -> None:
+        """Reload the list when another connection changed estimates."""
+        if changes.touches("estimates"):
+            self.load_estimates()
 
     def init_ui(self):
         """Set up the user interface."""
@@ -398,6 +445,7 @@ class EstimateHistoryDialog(QDialog):
         """Load estimates based on search criteria (runs queries in a background thread)."""
         if not append:
             self._history_page_state.reset()
+            self._count_runner.cancel()
             self.estimates_model.set_rows([])
             self.load_more_button.setVisible(False)
         elif not self._history_page_state.has_more:
@@ -437,6 +485,7 @@ class EstimateHistoryDialog(QDialog):
             self._history_page_state.cursor,
             append,
             started_at,
+            query_cache=query_cache_of(self.db_manager),
         )
         self._load_runner.submit(request)
 
@@ -466,6 +515,18 @@ class EstimateHistoryDialog(QDialog):
             value,
         )
         self._populate_table(page, started_at=request.started_at, append=request.append)
+        if self._history_page_state.total_pending:
+            self._count_runner.submit(
+                _HistoryCountRequest(request, self._history_page_state.generation)
+            )
+
+    def _handle_count_result(self, _generation: int, value: object) -> None:
+        request, total = cast(tuple[_HistoryCountRequest, int], value)
+        if self._history_page_state.apply_total(total, generation=request.generation):
+            self._update_results_summary()
+
+    def _handle_count_error(self, _generation: int, error: object) -> None:
+        self.logger.warning("Failed to count estimate history: %s", error)
 
     def _handle_load_error(self, _generation: int, error: object) -> None:
         QMessageBox.warning(self, "Load Error", str(error))
@@ -556,6 +617,8 @@ class EstimateHistoryDialog(QDialog):
             text = "No estimates found"
         elif total == 1 and loaded == 1:
             text = "1 of 1 estimate"
+        elif total is None:
+            text = f"{loaded} of {loaded}+ estimates"
         else:
             text = f"{loaded} of {total} estimates"
 
@@ -616,6 +679,7 @@ class EstimateHistoryDialog(QDialog):
 
     def _cancel_active_loads(self) -> None:
         self._load_runner.shutdown()
+        self._count_runner.shutdown()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
@@ -765,23 +829,33 @@ class EstimateHistoryDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                success = self.db_manager.delete_single_estimate(voucher_no)
-                if success:
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Estimate '{voucher_no}' deleted successfully.",
-                    )
-                    self.load_estimates()  # Refresh the list
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Delete Error",
-                        f"Estimate '{voucher_no}' could not be deleted (might already be deleted).",
-                    )
+                deleted = self.db_manager.delete_single_estimate(voucher_no)
             except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"An unexpected error occurred during deletion: {str(e)}",
-                )
+                self._show_delete_result(voucher_no, e)
+                return
+            when_written(
+                deleted,
+                lambda result: self._show_delete_result(voucher_no, result),
+                self,
+            )
+
+    def _show_delete_result(self, voucher_no: str, result: object) -> None:
+        if isinstance(result, Exception):
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"An unexpected error occurred during deletion: {str(result)}",
+            )
+        elif result:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Estimate '{voucher_no}' deleted successfully.",
+            )
+            self.load_estimates()  # Refresh the list
+        else:
+            QMessageBox.warning(
+                self,
+                "Delete Error",
+                f"Estimate '{voucher_no}' could not be deleted (might already be deleted).",
+            )
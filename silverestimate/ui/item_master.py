@@ -24,10 +24,17 @@ from PySide6.QtWidgets import (
 
 from silverestimate.domain.item_validation import ItemValidationError, validate_item
 from silverestimate.domain.pagination import ItemCursor, Page
+from silverestimate.infrastructure.database_change_watcher import (
+    follow_database_changes,
+)
+from silverestimate.infrastructure.database_write_notifier import when_written
 from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
 from silverestimate.infrastructure.paged_load_state import PagedLoadState
 from silverestimate.infrastructure.sqlite_worker import cancellable_sqlite_connection
-from silverestimate.persistence.items_repository import fetch_item_catalog_page
+from silverestimate.persistence.items_repository import (
+    count_item_catalog,
+    fetch_item_catalog_page,
+)
 from silverestimate.ui.models import ItemMasterTableModel
 from silverestimate.ui.modern_components import (
     BottomStatusStrip,
@@ -59,10 +66,28 @@ def _load_item_page(
             request.search_term,
             page_cursor=request.cursor,
             limit=1000,
+            include_total=False,
         )
     return request, page
 
 
+@dataclass(frozen=True)
+class _ItemCountRequest:
+    load: _ItemLoadRequest
+    generation: int
+
+
+def _count_items(
+    request: _ItemCountRequest,
+    cancel_event: threading.Event,
+) -> tuple[_ItemCountRequest, int]:
+    with cancellable_sqlite_connection(
+        request.load.connection_factory, cancel_event
+    ) as connection:
+        total = count_item_catalog(connection.cursor(), request.load.search_term)
+    return request, total
+
+
 class ItemMasterWidget(QWidget):
     """Widget for managing silver item catalog."""
 
@@ -84,8 +109,17 @@ class ItemMasterWidget(QWidget):
         self._load_runner.result.connect(self._handle_async_load_result)
         self._load_runner.failed.connect(self._handle_async_load_error)
         self._load_runner.settled.connect(self._finish_async_load)
+        self._count_runner = LatestRequestRunner(
+            _count_items,
+            self,
+            name="item-master-counter",
+        )
+        self._count_runner.result.connect(self._handle_async_count_result)
+        self._count_runner.failed.connect(self._handle_async_count_error)
+        self._reload_when_shown = False
         self.init_ui()
         self.load_items()
+        follow_database_changes(main_window, self.handle_database_changes)
 
     # --- Helper to show status messages ---
     def show_status(self, message, timeout=3000):
@@ -381,6 +415,7 @@ class ItemMasterWidget(QWidget):
         normalized_term = (search_term or "").strip()
         if not append:
             self._item_page_state.reset()
+            self._count_runner.cancel()
             self.items_model.set_rows([])
             self._item_count_label.setText("0 of 0 items")
             self.load_more_button.setVisible(False)
@@ -427,6 +462,21 @@ class ItemMasterWidget(QWidget):
         search_term = self.search_edit.text().strip()
         self.load_items(search_term)
 
+    def handle_database_changes(self, changes) -> None:
+        """Reload the list when another connection changed items."""
+        if not changes.touches("items"):
+            return
+        if self.isVisible():
+            self.search_items()
+        else:
+            self._reload_when_shown = True
+
+    def showEvent(self, event):
+        if self._reload_when_shown:
+            self._reload_when_shown = False
+            self.search_items()
+        super().showEvent(event)
+
     def _load_more_items(self) -> None:
         self.load_items(self.search_edit.text().strip(), append=True)
 
@@ -460,6 +510,27 @@ class ItemMasterWidget(QWidget):
             started_at=request.started_at,
             append=request.append,
         )
+        if self._item_page_state.total_pending:
+            self._count_runner.submit(
+                _ItemCountRequest(request, self._item_page_state.generation)
+            )
+
+    def _handle_async_count_result(self, _generation: int, value: object) -> None:
+        request, total = cast(tuple[_ItemCountRequest, int], value)
+        if self._item_page_state.apply_total(total, generation=request.generation):
+            self._item_count_label.setText(self._item_count_text())
+
+    def _handle_async_count_error(self, _generation: int, error: object) -> None:
+        self.logger.warning("Failed to count item master rows: %s", error)
+
+    def _item_count_text(self) -> str:
+        count = self._item_page_state.loaded
+        total = self._item_page_state.total
+        return (
+            f"{count} of {count}+ items"
+            if total is None
+            else f"{count} of {total} items"
+        )
 
     def _handle_async_load_error(self, _generation: int, error: object) -> None:
         QMessageBox.warning(self, "Load Error", str(error))
@@ -494,16 +565,12 @@ class ItemMasterWidget(QWidget):
             table.viewport().update()
 
         count = self._item_page_state.loaded
-        self._item_count_label.setText(
-            f"{count} of {self._item_page_state.total} items"
-        )
+        count_text = self._item_count_text()
+        self._item_count_label.setText(count_text)
         self.load_more_button.setVisible(self._item_page_state.has_more)
         self.load_more_button.setEnabled(True)
         self._update_bottom_status(count)
-        self.show_status(
-            f"Loaded {count} of {self._item_page_state.total} items.",
-            2000,
-        )
+        self.show_status(f"Loaded {count_text}.", 2000)
         elapsed_ms = (time.perf_counter() - started_at) * 1000.0
         self.logger.debug(
             "[perf] item_master.load_items=%.2fms search_term=%r rows=%s",
@@ -525,6 +592,7 @@ class ItemMasterWidget(QWidget):
 
     def _cancel_active_loads(self) -> None:
         self._load_runner.shutdown()
+        self._count_runner.shutdown()
 
     def on_item_selected(self):
         """Handle item selection in the table."""
@@ -650,16 +718,22 @@ class ItemMasterWidget(QWidget):
             )
             return
 
-        success = self.db_manager.add_item(
-            validated.code,
-            validated.name,
-            validated.purity,
-            validated.wage_type,
-            validated.wage_rate,
-            tunch=validated.tunch,
+        when_written(
+            self.db_manager.add_item(
+                validated.code,
+                validated.name,
+                validated.purity,
+                validated.wage_type,
+                validated.wage_rate,
+                tunch=validated.tunch,
+            ),
+            lambda success: self._finish_add_item(validated.code, success),
+            self,
         )
-        if success:
-            self.show_status(f"Item '{validated.code}' added successfully.", 3000)
+
+    def _finish_add_item(self, code: str, success) -> None:
+        if self._item_write_succeeded("add", code, success):
+            self.show_status(f"Item '{code}' added successfully.", 3000)
             self.clear_form()
             self.load_items()
         else:
@@ -693,16 +767,22 @@ class ItemMasterWidget(QWidget):
             self.show_status(f"Update Item Error: {exc}", 3000)
             return
 
-        success = self.db_manager.update_item(
-            validated.code,
-            validated.name,
-            validated.purity,
-            validated.wage_type,
-            validated.wage_rate,
-            tunch=validated.tunch,
+        when_written(
+            self.db_manager.update_item(
+                validated.code,
+                validated.name,
+                validated.purity,
+                validated.wage_type,
+                validated.wage_rate,
+                tunch=validated.tunch,
+            ),
+            lambda success: self._finish_update_item(validated.code, success),
+            self,
         )
-        if success:
-            self.show_status(f"Item '{validated.code}' updated successfully.", 3000)
+
+    def _finish_update_item(self, code: str, success) -> None:
+        if self._item_write_succeeded("update", code, success):
+            self.show_status(f"Item '{code}' updated successfully.", 3000)
             self.clear_form()
             self.load_items()
         else:
@@ -712,7 +792,7 @@ class ItemMasterWidget(QWidget):
                 "Failed to update item. Please verify values and try again.",
             )
             self.show_status(
-                f"Update Item Error: Database operation failed for '{validated.code}'.",
+                f"Update Item Error: Database operation failed for '{code}'.",
                 4000,
             )
 
@@ -735,20 +815,34 @@ class ItemMasterWidget(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success = self.db_manager.delete_item(code)
-            if success:
-                self.show_status(f"Item '{code}' deleted successfully.", 3000)
-                self.clear_form()
-                self.load_items()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Database Error",
-                    f"Failed to delete item '{code}'. It might be used in existing estimates. See console/logs.",
-                )
-                self.show_status(
-                    f"Delete Item Error: Database operation failed for '{code}'.", 4000
-                )
+            when_written(
+                self.db_manager.delete_item(code),
+                lambda success: self._finish_delete_item(code, success),
+                self,
+            )
+
+    def _finish_delete_item(self, code: str, success) -> None:
+        if self._item_write_succeeded("delete", code, success):
+            self.show_status(f"Item '{code}' deleted successfully.", 3000)
+            self.clear_form()
+            self.load_items()
+        else:
+            QMessageBox.critical(
+                self,
+                "Database Error",
+                f"Failed to delete item '{code}'. It might be used in existing estimates. See console/logs.",
+            )
+            self.show_status(
+                f"Delete Item Error: Database operation failed for '{code}'.", 4000
+            )
+
+    def _item_write_succeeded(self, action: str, code: str, success) -> bool:
+        if isinstance(success, Exception):
+            self.logger.error(
+                "Failed to %s item %s: %s", action, code, success, exc_info=success
+            )
+            return False
+        return bool(success)
 
     def keyPressEvent(self, event):
         """Handle key press events."""
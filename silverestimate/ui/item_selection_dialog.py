@@ -26,6 +26,10 @@ class ItemSelectionDialog(QDialog):
     """Dialog for selecting an item when code is invalid or ambiguous."""
 
     MAX_VISIBLE_RESULTS = 500
+    FILTER_DELAY_MS = 150
+    # Searches of the loaded item catalog return within a millisecond, so
+    # keystrokes are not batched behind the database delay.
+    IN_MEMORY_FILTER_DELAY_MS = 0
 
     def __init__(self, db_manager, search_term, parent=None):
         super().__init__(parent)
@@ -326,7 +330,13 @@ class ItemSelectionDialog(QDialog):
         )
 
     def _schedule_filter(self, _text) -> None:
-        self._filter_timer.start(150)
+        self._filter_timer.start(self._filter_delay_ms())
+
+    def _filter_delay_ms(self) -> int:
+        controller = getattr(self.db_manager, "item_cache_controller", None)
+        if getattr(controller, "searchable", False) is True:
+            return self.IN_MEMORY_FILTER_DELAY_MS
+        return self.FILTER_DELAY_MS
 
     def _apply_filter_now(self) -> None:
         self._filtered_items, self._results_truncated = self._ranked_items_from_db(
@@ -94,6 +94,9 @@ class MainWindow(QMainWindow):
         self.item_master_widget = None
         self.silver_bar_widget = None
         self.live_rate_controller: Optional["LiveRateController"] = None
+        self._integrity_runner: Any = None
+        self._idle_maintenance: Any = None
+        self.database_changes: Any = None
 
         self._configure_window_shell()
         self._apply_initial_window_state()
@@ -172,6 +175,9 @@ class MainWindow(QMainWindow):
             )
         self._initialize_live_rate()
         self._deliver_pending_status_message()
+        self._start_integrity_verification()
+        self._start_idle_maintenance()
+        self._start_change_watcher()
         self._runtime_services_initialized = True
         services_ready_ms = (time.perf_counter() - self._startup_started_at) * 1000.0
         self.logger.info(
@@ -335,6 +341,85 @@ class MainWindow(QMainWindow):
                 exc_info=True,
             )
 
+    def _start_integrity_verification(self) -> None:
+        """Run integrity checks deferred by a fingerprint-validated open."""
+        if not getattr(self.db, "integrity_verification_pending", False):
+            return
+        verify = getattr(self.db, "verify_integrity", None)
+        if not callable(verify):
+            return
+        from silverestimate.infrastructure.latest_request_runner import (
+            LatestRequestRunner,
+        )
+
+        runner: LatestRequestRunner[None, Any] = LatestRequestRunner(
+            lambda _request, cancel_event: verify(cancel_event),
+            self,
+            name="database-integrity",
+        )
+        runner.result.connect(self._handle_integrity_result)
+        runner.failed.connect(self._handle_integrity_failure)
+        self._integrity_runner = runner
+        runner.submit(None)
+
+    def _start_idle_maintenance(self) -> None:
+        """Checkpoint the WAL and refresh statistics while the user is away."""
+        run = getattr(self.db, "run_idle_maintenance", None)
+        app = QApplication.instance()
+        if not callable(run) or app is None:
+            return
+        from silverestimate.infrastructure.idle_maintenance_scheduler import (
+            IdleMaintenanceScheduler,
+        )
+
+        scheduler = IdleMaintenanceScheduler(run, self, logger=self.logger)
+        app.installEventFilter(scheduler)
+        scheduler.start()
+        self._idle_maintenance = scheduler
+
+    def _start_change_watcher(self) -> None:
+        """Let open screens reload what other connections change."""
+        monitor = getattr(self.db, "change_monitor", None)
+        if monitor is None:
+            return
+        from silverestimate.infrastructure.database_change_watcher import (
+            DatabaseChangeWatcher,
+        )
+
+        watcher = DatabaseChangeWatcher(monitor, self, logger=self.logger)
+        watcher.start()
+        self.database_changes = watcher
+
+    def _stop_database_background_work(self) -> None:
+        if self._integrity_runner is not None:
+            self._integrity_runner.shutdown()
+            self._integrity_runner = None
+        if self._idle_maintenance is not None:
+            app = QApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self._idle_maintenance)
+            self._idle_maintenance.stop()
+            self._idle_maintenance = None
+        if self.database_changes is not None:
+            self.database_changes.stop()
+            self.database_changes = None
+
+    def _handle_integrity_result(self, _generation: int, result: Any) -> None:
+        if getattr(result, "succeeded", False):
+            self.show_status_message("Database integrity verified", 3000, "info")
+        elif getattr(getattr(result, "state", None), "name", "") == "FAILED":
+            self.show_status_message(
+                "Database integrity check failed. Restore from a backup.",
+                0,
+                level="error",
+            )
+
+    def _handle_integrity_failure(self, _generation: int, error: object) -> None:
+        self.logger.warning("Background integrity verification failed: %s", error)
+        self.show_status_message(
+            "Database integrity could not be verified", 8000, level="warning"
+        )
+
     def _deliver_pending_status_message(self) -> None:
         pending = getattr(self, "_pending_status_message", None)
         if not pending:
@@ -472,6 +557,7 @@ class MainWindow(QMainWindow):
                 controller.shutdown()
             except Exception as exc:
                 self.logger.debug("Failed to shut down live-rate controller: %s", exc)
+        self._stop_database_background_work()
         if hasattr(self, "db") and self.db:
             self.logger.debug("Closing database connection")
             self.db.close()
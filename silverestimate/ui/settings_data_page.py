@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Callable, Protocol
 
+from PySide6.QtCore import QDate
 from PySide6.QtWidgets import (
     QFileDialog,
     QGroupBox,
@@ -19,14 +21,35 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from silverestimate.persistence.encrypted_backup import (
+    BackupCancelledError,
+    BackupMode,
+    BackupProgress,
+)
+
+from .background_progress import ProgressReport, run_with_progress
+
 LOGGER = logging.getLogger(__name__)
 DATABASE_BACKUP_FILTER = "Silver Estimate Encrypted Backup (*.sedbbackup)"
+DEFAULT_ARCHIVE_AGE_MONTHS = 24
+BACKUP_PHASE_LABELS = {
+    "export": "Copying the encrypted database...",
+    "validate": "Validating the exported copy...",
+    "archive": "Writing the backup archive...",
+}
 
 
 class DatabaseMaintenanceGateway(Protocol):
     """Database operations exposed to the settings data controller."""
 
-    def create_encrypted_backup(self, destination: str) -> object: ...
+    def create_encrypted_backup(
+        self,
+        destination: str,
+        *,
+        mode: BackupMode = BackupMode.EXPORT,
+        cancel_event: threading.Event | None = None,
+        progress: BackupProgress | None = None,
+    ) -> object: ...
 
     def stage_encrypted_restore(
         self,
@@ -34,6 +57,8 @@ class DatabaseMaintenanceGateway(Protocol):
         archive_password: str,
     ) -> object: ...
 
+    def archive_estimates_before(self, cutoff_date: str) -> object: ...
+
 
 @dataclass(frozen=True)
 class DataManagementActions:
@@ -90,13 +115,28 @@ class SettingsDataController:
             "Item-catalog backup command",
         )
 
-    def create_database_backup(self, destination: str) -> DataActionResult:
+    def create_database_backup(
+        self,
+        destination: str,
+        *,
+        cancel_event: threading.Event | None = None,
+        progress: BackupProgress | None = None,
+    ) -> DataActionResult:
         database = self._database_provider()
         if database is None:
             return DataActionResult(False, "Database is unavailable.")
         destination = self.ensure_backup_suffix(destination)
         try:
-            outcome = database.create_encrypted_backup(destination)
+            # Online backups let billing continue while the copy is taken.
+            outcome = database.create_encrypted_backup(
+                destination,
+                mode=BackupMode.ONLINE,
+                cancel_event=cancel_event,
+                progress=progress,
+            )
+        except BackupCancelledError as exc:
+            LOGGER.info("Encrypted database backup cancelled.")
+            return DataActionResult(False, str(exc), cancelled=True)
         except Exception as exc:
             LOGGER.error("Encrypted database backup failed: %s", exc, exc_info=True)
             return DataActionResult(False, str(exc))
@@ -117,6 +157,17 @@ class SettingsDataController:
             return DataActionResult(False, str(exc))
         return self._maintenance_result(outcome, archive_path)
 
+    def archive_old_estimates(self, cutoff_date: str) -> DataActionResult:
+        database = self._database_provider()
+        if database is None:
+            return DataActionResult(False, "Database is unavailable.")
+        try:
+            outcome = database.archive_estimates_before(cutoff_date)
+        except Exception as exc:
+            LOGGER.error("Estimate archiving failed: %s", exc, exc_info=True)
+            return DataActionResult(False, str(exc))
+        return self._maintenance_result(outcome, "")
+
     @staticmethod
     def ensure_backup_suffix(path: str) -> str:
         return path if path.lower().endswith(".sedbbackup") else f"{path}.sedbbackup"
@@ -181,6 +232,7 @@ class DataManagementPage(QWidget):
         layout.addLayout(self._create_delete_actions())
         layout.addWidget(self._create_item_backup_group())
         layout.addWidget(self._create_database_backup_group())
+        layout.addWidget(self._create_estimate_archive_group())
         layout.addStretch()
 
     def _create_delete_actions(self) -> QHBoxLayout:
@@ -278,6 +330,51 @@ class DataManagementPage(QWidget):
         layout.addWidget(self.restore_database_backup_button)
         return group
 
+    def _create_estimate_archive_group(self) -> QGroupBox:
+        group = QGroupBox("Estimate Archive")
+        layout = QVBoxLayout(group)
+
+        self.archive_estimates_button = QPushButton("Archive Old Estimates...")
+        self.archive_estimates_button.setToolTip(
+            "Move old estimates without silver bars into an encrypted\n"
+            "archive file beside the database\n"
+            "Archived estimates still appear in Estimate History, read-only"
+        )
+        self.archive_estimates_button.clicked.connect(self._archive_old_estimates)
+        layout.addWidget(self.archive_estimates_button)
+        return group
+
+    def _archive_old_estimates(self) -> None:
+        months, accepted = QInputDialog.getInt(
+            self,
+            "Archive Old Estimates",
+            "Archive estimates older than this many months:",
+            DEFAULT_ARCHIVE_AGE_MONTHS,
+            1,
+            1200,
+        )
+        if not accepted:
+            return
+        cutoff = QDate.currentDate().addMonths(-months).toString("yyyy-MM-dd")
+        reply = QMessageBox.question(
+            self,
+            "Confirm Estimate Archive",
+            f"Estimates dated before {cutoff} will move into the archive file."
+            "\n\nEstimates that produced silver bars stay in the database, so "
+            "silver bar lists, history, and totals do not change. Archived "
+            "estimates still appear in Estimate History but can no longer be "
+            "edited.\n\nContinue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        result = self._controller.archive_old_estimates(cutoff)
+        if result.succeeded:
+            QMessageBox.information(self, "Estimates Archived", result.message)
+        else:
+            QMessageBox.critical(self, "Archive Error", result.message)
+
     def _create_database_backup(self) -> None:
         path, _selected_filter = QFileDialog.getSaveFileName(
             self,
@@ -287,7 +384,35 @@ class DataManagementPage(QWidget):
         )
         if not path:
             return
-        result = self._controller.create_database_backup(path)
+
+        def create_backup(
+            report: ProgressReport, cancel_event: threading.Event
+        ) -> DataActionResult:
+            def advance(phase: str, done: int, total: int) -> None:
+                # Progress bars take ints, so archive bytes are reported in KiB.
+                unit = 1024 if phase == "archive" else 1
+                report(done // unit, total // unit, BACKUP_PHASE_LABELS.get(phase, ""))
+
+            return self._controller.create_database_backup(
+                path,
+                cancel_event=cancel_event,
+                progress=advance,
+            )
+
+        outcome = run_with_progress(
+            self,
+            create_backup,
+            title="Create Encrypted Database Backup",
+            label=BACKUP_PHASE_LABELS["export"],
+            name="database-backup",
+        )
+        if outcome.cancelled:
+            return
+        result = outcome.value
+        if not isinstance(result, DataActionResult):
+            result = DataActionResult(False, str(outcome.error or "Backup failed."))
+        if result.cancelled:
+            return
         if result.succeeded:
             QMessageBox.information(
                 self,
@@ -331,6 +456,8 @@ class DataManagementPage(QWidget):
 
 
 __all__ = [
+    "BACKUP_PHASE_LABELS",
+    "DEFAULT_ARCHIVE_AGE_MONTHS",
     "DataActionResult",
     "DataManagementActions",
     "DataManagementPage",
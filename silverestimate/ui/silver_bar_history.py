@@ -25,6 +25,10 @@ from PySide6.QtWidgets import (
 )
 
 from silverestimate.domain.pagination import Page, SilverBarHistoryCursor
+from silverestimate.infrastructure.database_change_watcher import (
+    follow_database_changes,
+)
+from silverestimate.infrastructure.database_write_notifier import when_written
 from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
 from silverestimate.infrastructure.paged_load_state import PagedLoadState
 from silverestimate.infrastructure.settings import SettingsKey, get_app_settings
@@ -71,10 +75,34 @@ def _load_bars_history_page(
         status_text=request.status_text,
         cursor=request.cursor,
         limit=1000,
+        include_total=False,
     )
     return request, page
 
 
+@dataclass(frozen=True)
+class _BarsHistoryCountRequest:
+    load: _BarsHistoryRequest
+    generation: int
+
+
+def _count_bars_history(
+    request: _BarsHistoryCountRequest,
+    cancel_event: threading.Event,
+) -> tuple[_BarsHistoryCountRequest, int]:
+    load = request.load
+    snapshot = SilverBarsSnapshotRepository(
+        load.connection_factory,
+        cancel_event=cancel_event,
+    )
+    total = snapshot.count_history_bars(
+        voucher_term=load.voucher_term,
+        weight_text=load.weight_text,
+        status_text=load.status_text,
+    )
+    return request, total
+
+
 class SilverBarHistoryDialog(QDialog):
     """Dialog for viewing silver bar history and searching all bars in the database."""
 
@@ -153,10 +181,25 @@ class SilverBarHistoryDialog(QDialog):
         self._bars_load_runner.result.connect(self._on_bars_load_ready)
         self._bars_load_runner.failed.connect(self._on_bars_load_error)
         self._bars_load_runner.settled.connect(self._on_bars_load_finished)
+        self._bars_count_runner = LatestRequestRunner(
+            _count_bars_history,
+            self,
+            name="silver-bar-history-counter",
+        )
+        self._bars_count_runner.result.connect(self._on_bars_count_ready)
+        self._bars_count_runner.failed.connect(self._on_bars_count_error)
 
         self.init_ui()
         self.load_all_bars()
         self.load_issued_lists()
+        follow_database_changes(parent, self.handle_database_changes)
+
+    def handle_database_changes(self, changes) -> None:
+        """Reload what another connection changed, keeping the filters."""
+        if changes.touches("silver_bars"):
+            self.search_bars()
+        if changes.touches("silver_bars", "silver_bar_lists"):
+            self.load_issued_lists()
 
     def init_ui(self):
         """Set up the user interface."""
@@ -490,6 +533,7 @@ class SilverBarHistoryDialog(QDialog):
     def _start_bars_load(self, payload: dict, *, append: bool = False) -> None:
         if not append:
             self._bars_page_state.reset()
+            self._bars_count_runner.cancel()
             self.bars_model.set_rows([])
             self.load_more_button.setVisible(False)
         elif not self._bars_page_state.has_more:
@@ -595,6 +639,18 @@ class SilverBarHistoryDialog(QDialog):
             append=request.append,
         )
         self.populate_bars_table(history_rows)
+        if self._bars_page_state.total_pending:
+            self._bars_count_runner.submit(
+                _BarsHistoryCountRequest(request, self._bars_page_state.generation)
+            )
+
+    def _on_bars_count_ready(self, _generation: int, value: object) -> None:
+        request, total = cast(tuple[_BarsHistoryCountRequest, int], value)
+        if self._bars_page_state.apply_total(total, generation=request.generation):
+            self._update_bars_bottom_status()
+
+    def _on_bars_count_error(self, _generation: int, error: object) -> None:
+        self.logger.warning("Failed to count silver bar history: %s", error)
 
     def _on_bars_load_error(self, _generation: int, error: object) -> None:
         QMessageBox.critical(
@@ -762,20 +818,33 @@ class SilverBarHistoryDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                success = self.db_manager.reactivate_silver_bar_list(list_id)
-                if not success:
-                    raise RuntimeError("Failed to reactivate the selected list.")
+                reactivated = self.db_manager.reactivate_silver_bar_list(list_id)
+            except Exception as e:
+                self._show_reactivated_list(list_identifier, e)
+                return
+            when_written(
+                reactivated,
+                lambda result: self._show_reactivated_list(list_identifier, result),
+                self,
+            )
 
-                QMessageBox.information(
-                    self, "Success", f"List '{list_identifier}' has been reactivated."
-                )
+    def _show_reactivated_list(self, list_identifier: str, result: object) -> None:
+        try:
+            if isinstance(result, Exception):
+                raise result
+            if not result:
+                raise RuntimeError("Failed to reactivate the selected list.")
 
-                # Refresh the interface
-                self.load_issued_lists()
-                self.load_all_bars()
+            QMessageBox.information(
+                self, "Success", f"List '{list_identifier}' has been reactivated."
+            )
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to reactivate list: {e}")
+            # Refresh the interface
+            self.load_issued_lists()
+            self.load_all_bars()
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to reactivate list: {e}")
 
     def _update_selected_bar_details(self) -> None:
         details = getattr(self, "selected_bar_details", None)
@@ -821,7 +890,9 @@ class SilverBarHistoryDialog(QDialog):
         selection_model = self.bars_table.selectionModel()
         selected = len(selection_model.selectedRows()) if selection_model else 0
         refreshed = getattr(self, "_last_refreshed_text", "-")
-        strip.set_left_items([f"Loaded: {total} of {self._bars_page_state.total} bars"])
+        matched = self._bars_page_state.total
+        matched_text = f"{total}+" if matched is None else str(matched)
+        strip.set_left_items([f"Loaded: {total} of {matched_text} bars"])
         strip.set_right_items([f"Selected: {selected}", f"Refreshed: {refreshed}"])
 
     def show_bars_context_menu(self, pos):
@@ -894,6 +965,7 @@ class SilverBarHistoryDialog(QDialog):
 
     def _cancel_active_loads(self) -> None:
         self._bars_load_runner.shutdown()
+        self._bars_count_runner.shutdown()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
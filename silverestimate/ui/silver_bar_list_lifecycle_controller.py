@@ -6,6 +6,8 @@ import logging
 
 from PySide6.QtWidgets import QInputDialog, QLineEdit, QMessageBox
 
+from silverestimate.infrastructure.database_write_notifier import when_written
+
 from ._host_proxy import HostProxy
 
 
@@ -22,8 +24,14 @@ class SilverBarListLifecycleController(HostProxy):
         )
         if not ok:
             return
-        new_list_id = self.db_manager.create_silver_bar_list(note if note else None)
-        if not new_list_id:
+        when_written(
+            self.db_manager.create_silver_bar_list(note if note else None),
+            self._show_created_list,
+            self.host,
+        )
+
+    def _show_created_list(self, new_list_id):
+        if not new_list_id or isinstance(new_list_id, Exception):
             QMessageBox.critical(self.host, "Error", "Failed to create new list.")
             return
         QMessageBox.information(self.host, "Success", "New list created.")
@@ -49,34 +57,45 @@ class SilverBarListLifecycleController(HostProxy):
         )
         if not ok:
             return
-        new_list_id = self.db_manager.create_silver_bar_list(note if note else None)
-        if not new_list_id:
+        bar_ids = self._bar_ids_from_indexes(self.available_bars_table, selected)
+        when_written(
+            self.db_manager.create_silver_bar_list(note if note else None),
+            lambda new_list_id: self._fill_created_list(new_list_id, bar_ids),
+            self.host,
+        )
+
+    def _fill_created_list(self, new_list_id, bar_ids):
+        if not new_list_id or isinstance(new_list_id, Exception):
             QMessageBox.critical(self.host, "Error", "Failed to create new list.")
             return
         self.load_lists()
         idx = self.list_combo.findData(new_list_id)
         if idx >= 0:
             self.list_combo.setCurrentIndex(idx)
-        bar_ids = self._bar_ids_from_indexes(self.available_bars_table, selected)
-        added_count, failed = self._run_with_wait_cursor(
+
+        def finish(result):
+            added_count, failed = result
+            self.load_available_bars()
+            self.load_bars_in_selected_list()
+            if added_count:
+                QMessageBox.information(
+                    self.host,
+                    "Success",
+                    f"Created list and added {added_count} bar(s).",
+                )
+            if failed:
+                QMessageBox.warning(
+                    self.host,
+                    "Partial",
+                    f"Failed to add bars: {', '.join(failed)}",
+                )
+
+        self._run_transfer(
             lambda: self._bulk_assign_to_list(bar_ids, new_list_id),
+            finish,
             enable_log="Could not enable wait cursor for list creation: %s",
             restore_log="Could not restore cursor after list creation: %s",
         )
-        self.load_available_bars()
-        self.load_bars_in_selected_list()
-        if added_count:
-            QMessageBox.information(
-                self.host,
-                "Success",
-                f"Created list and added {added_count} bar(s).",
-            )
-        if failed:
-            QMessageBox.warning(
-                self.host,
-                "Partial",
-                f"Failed to add bars: {', '.join(failed)}",
-            )
 
     def edit_list_note(self):
         if self.current_list_id is None:
@@ -103,20 +122,27 @@ class SilverBarListLifecycleController(HostProxy):
         if not ok or new_note == current_note:
             return
 
-        if not self.db_manager.update_silver_bar_list_note(
-            self.current_list_id,
-            new_note,
-        ):
+        list_id = self.current_list_id
+        when_written(
+            self.db_manager.update_silver_bar_list_note(list_id, new_note),
+            lambda updated: self._show_updated_note(
+                list_id, details, new_note, updated
+            ),
+            self.host,
+        )
+
+    def _show_updated_note(self, list_id, details, new_note, updated):
+        if not updated or isinstance(updated, Exception):
             QMessageBox.critical(self.host, "Error", "Failed to update list note.")
             return
 
         QMessageBox.information(self.host, "Success", "List note updated.")
         details_label = getattr(self, "list_details_label", None)
-        if details_label is not None:
+        if details_label is not None and self.current_list_id == list_id:
             details_label.setText(
                 f"Selected List: {details['list_identifier']} (Note: {new_note or 'N/A'})"
             )
-        index = self.list_combo.findData(self.current_list_id)
+        index = self.list_combo.findData(list_id)
         if index >= 0:
             list_date = (
                 details["creation_date"].split()[0]
@@ -150,9 +176,16 @@ class SilverBarListLifecycleController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        typed_delete = getattr(self.db_manager, "delete_silver_bar_list_result", None)
-        if callable(typed_delete):
-            result = typed_delete(self.current_list_id)
+        when_written(
+            self.db_manager.delete_silver_bar_list_result(self.current_list_id),
+            lambda result: self._show_deleted_list(list_name, result),
+            self.host,
+        )
+
+    def _show_deleted_list(self, list_name, result):
+        if isinstance(result, Exception):
+            success, message = False, str(result)
+        else:
             success = bool(result.succeeded)
             message = (
                 result.value
@@ -161,10 +194,6 @@ class SilverBarListLifecycleController(HostProxy):
                 if result.failure is not None
                 else "Unknown repository failure."
             )
-        else:
-            success, message = self.db_manager.delete_silver_bar_list(
-                self.current_list_id
-            )
         if success:
             QMessageBox.information(
                 self.host,
@@ -205,11 +234,18 @@ class SilverBarListLifecycleController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
+        list_id = self.current_list_id
+        when_written(
+            self.db_manager.mark_silver_bar_list_as_issued(list_id),
+            lambda issued: self._show_issued_list(list_id, list_name, issued),
+            self.host,
+        )
+
+    def _show_issued_list(self, list_id, list_name, issued):
         try:
-            success = self.db_manager.mark_silver_bar_list_as_issued(
-                self.current_list_id
-            )
-            if not success:
+            if isinstance(issued, Exception):
+                raise issued
+            if not issued:
                 raise RuntimeError("Failed to mark the selected list as issued.")
 
             QMessageBox.information(
@@ -225,7 +261,7 @@ class SilverBarListLifecycleController(HostProxy):
         except Exception as exc:
             self.logger.warning(
                 "Failed to mark list %s as issued: %s",
-                self.current_list_id,
+                list_id,
                 exc,
                 exc_info=True,
             )
@@ -18,6 +18,7 @@ from silverestimate.domain.pagination import (
 )
 from silverestimate.infrastructure.latest_request_runner import LatestRequestRunner
 from silverestimate.infrastructure.paged_load_state import PagedLoadState
+from silverestimate.persistence.silver_bar_summary import SilverBarTotals
 from silverestimate.persistence.silver_bars_snapshot_repository import (
     SilverBarsSnapshotRepository,
 )
@@ -38,6 +39,10 @@ class _BarsLoadRequest:
 _BarsPage: TypeAlias = (
     Page[dict[str, Any], AvailableBarCursor] | Page[dict[str, Any], BarListCursor]
 )
+_BarsPageState: TypeAlias = (
+    PagedLoadState[dict[str, Any], AvailableBarCursor]
+    | PagedLoadState[dict[str, Any], BarListCursor]
+)
 
 
 class _BarsLoadError(RuntimeError):
@@ -65,12 +70,14 @@ def _load_bars_page(
                 date_range=request.payload.get("date_range"),
                 cursor=cast(AvailableBarCursor | None, request.cursor),
                 limit=1500,
+                include_total=False,
             )
         elif request.target == "list":
             page = snapshot.get_bars_in_list_keyset_page(
                 request.payload.get("list_id"),
                 cursor=cast(BarListCursor | None, request.cursor),
                 limit=1500,
+                include_total=False,
             )
         else:
             raise ValueError(f"Unknown load target: {request.target}")
@@ -79,6 +86,34 @@ def _load_bars_page(
     return request, page
 
 
+@dataclass(frozen=True)
+class _BarsCountRequest:
+    load: _BarsLoadRequest
+    generation: int
+
+
+def _count_bars(
+    request: _BarsCountRequest,
+    cancel_event: threading.Event,
+) -> tuple[_BarsCountRequest, SilverBarTotals]:
+    load = request.load
+    snapshot = SilverBarsSnapshotRepository(
+        load.connection_factory,
+        cancel_event=cancel_event,
+    )
+    if load.target == "available":
+        totals = snapshot.get_available_bars_totals(
+            weight_query=load.payload.get("weight_query"),
+            weight_tolerance=load.payload.get("weight_tolerance", 0.001),
+            min_purity=load.payload.get("min_purity"),
+            max_purity=load.payload.get("max_purity"),
+            date_range=load.payload.get("date_range"),
+        )
+    else:
+        totals = snapshot.get_bars_in_list_totals(load.payload.get("list_id"))
+    return request, totals
+
+
 class SilverBarLoadController(HostProxy):
     """Coordinate async available/list loads and stale-response handling."""
 
@@ -104,6 +139,19 @@ class SilverBarLoadController(HostProxy):
             runner.result.connect(self._on_bars_load_ready)
             runner.failed.connect(self._on_bars_load_error)
             runner.settled.connect(self._on_bars_load_finished)
+        self._available_count_runner = LatestRequestRunner(
+            _count_bars,
+            host,
+            name="available-bars-counter",
+        )
+        self._list_count_runner = LatestRequestRunner(
+            _count_bars,
+            host,
+            name="list-bars-counter",
+        )
+        for count_runner in (self._available_count_runner, self._list_count_runner):
+            count_runner.result.connect(self._on_bars_count_ready)
+            count_runner.failed.connect(self._on_bars_count_error)
 
     def _schedule_available_reload(self, *args, **kwargs):
         del args, kwargs
@@ -159,6 +207,7 @@ class SilverBarLoadController(HostProxy):
             runner = self._available_runner
             if not append:
                 self._available_page_state.reset()
+                self._available_count_runner.cancel()
                 cursor = None
             elif not self._available_page_state.has_more:
                 return runner.generation
@@ -168,6 +217,7 @@ class SilverBarLoadController(HostProxy):
             runner = self._list_runner
             if not append:
                 self._list_page_state.reset()
+                self._list_count_runner.cancel()
                 cursor = None
             elif not self._list_page_state.has_more:
                 return runner.generation
@@ -261,38 +311,48 @@ class SilverBarLoadController(HostProxy):
                 tuple(dict(row) for row in page.items),
                 page.total,
                 cast(AvailableBarCursor | None, page.next_cursor),
+                page.totals,
             )
-            rows = self._available_page_state.apply(
-                available_page,
-                append=request.append,
-            )
+            available_state = self._available_page_state
+            rows = available_state.apply(available_page, append=request.append)
             self._populate_table(
                 self.available_bars_table,
                 rows,
-                total_rows=page.total,
+                total_rows=available_state.total,
+                totals=available_state.totals,
+                pending=available_state.total_pending,
             )
             self._restore_table_column_widths()
             button = getattr(self, "available_load_more_button", None)
             if button is not None:
-                button.setVisible(self._available_page_state.has_more)
+                button.setVisible(available_state.has_more)
+            if available_state.total_pending:
+                self._available_count_runner.submit(
+                    _BarsCountRequest(request, available_state.generation)
+                )
         elif target == "list":
             list_page = Page(
                 tuple(dict(row) for row in page.items),
                 page.total,
                 cast(BarListCursor | None, page.next_cursor),
+                page.totals,
             )
-            rows = self._list_page_state.apply(
-                list_page,
-                append=request.append,
-            )
+            list_state = self._list_page_state
+            rows = list_state.apply(list_page, append=request.append)
             self._populate_table(
                 self.list_bars_table,
                 rows,
-                total_rows=page.total,
+                total_rows=list_state.total,
+                totals=list_state.totals,
+                pending=list_state.total_pending,
             )
             button = getattr(self, "list_load_more_button", None)
             if button is not None:
-                button.setVisible(self._list_page_state.has_more)
+                button.setVisible(list_state.has_more)
+            if list_state.total_pending:
+                self._list_count_runner.submit(
+                    _BarsCountRequest(request, list_state.generation)
+                )
         else:
             return
         self._update_transfer_buttons_state()
@@ -307,6 +367,21 @@ class SilverBarLoadController(HostProxy):
             page.total,
         )
 
+    def _on_bars_count_ready(self, _generation: int, value: object) -> None:
+        request, totals = cast(tuple[_BarsCountRequest, SilverBarTotals], value)
+        state: _BarsPageState
+        if request.load.target == "available":
+            state = self._available_page_state
+            table = self.available_bars_table
+        else:
+            state = self._list_page_state
+            table = self.list_bars_table
+        if state.apply_total(totals.bar_count, totals, generation=request.generation):
+            self._show_table_totals(table, state.totals)
+
+    def _on_bars_count_error(self, _generation: int, error: object) -> None:
+        self.logger.warning("Failed to count silver bars: %s", error)
+
     def _on_bars_load_error(self, _generation: int, error: object) -> None:
         target = error.target if isinstance(error, _BarsLoadError) else "available"
         self._on_direct_load_error(target, error)
@@ -338,7 +413,12 @@ class SilverBarLoadController(HostProxy):
             button.setEnabled(True)
 
     def _cancel_active_loads(self) -> None:
-        for runner in (self._available_runner, self._list_runner):
+        for runner in (
+            self._available_runner,
+            self._list_runner,
+            self._available_count_runner,
+            self._list_count_runner,
+        ):
             runner.cancel()
 
     def _shutdown_loads(self) -> None:
@@ -353,6 +433,12 @@ class SilverBarLoadController(HostProxy):
             with contextlib.suppress(TypeError, RuntimeError):
                 runner.settled.disconnect(self._on_bars_load_finished)
             runner.shutdown()
+        for count_runner in (self._available_count_runner, self._list_count_runner):
+            with contextlib.suppress(TypeError, RuntimeError):
+                count_runner.result.disconnect(self._on_bars_count_ready)
+            with contextlib.suppress(TypeError, RuntimeError):
+                count_runner.failed.disconnect(self._on_bars_count_error)
+            count_runner.shutdown()
 
     def load_available_bars(self, *, append: bool = False):
         if object.__getattribute__(self, "_load_shutdown"):
@@ -443,6 +529,7 @@ class SilverBarLoadController(HostProxy):
     def load_bars_in_selected_list(self, *, append: bool = False):
         if self.current_list_id is None:
             self._list_page_state.reset()
+            self._list_count_runner.cancel()
             self._clear_management_table(self.list_bars_table)
             button = getattr(self, "list_load_more_button", None)
             if button is not None:
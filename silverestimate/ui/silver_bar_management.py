@@ -20,6 +20,10 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from silverestimate.infrastructure.database_change_watcher import (
+    follow_database_changes,
+)
+
 from .shared_screen_theme import build_management_screen_stylesheet
 from .silver_bar_list_lifecycle_controller import SilverBarListLifecycleController
 from .silver_bar_list_print_controller import SilverBarListPrintController
@@ -63,6 +67,17 @@ class SilverBarDialog(SilverBarManagementFacade, QDialog):
         self.init_ui()
         self.load_lists()
         self.load_available_bars()
+        follow_database_changes(parent, self.handle_database_changes)
+
+    def handle_database_changes(self, changes) -> None:
+        """Reload the tables another connection changed."""
+        if changes.touches("silver_bar_lists"):
+            # Reselecting the list also reloads its bars.
+            self.load_lists()
+        elif changes.touches("silver_bars") and self.current_list_id is not None:
+            self.load_bars_in_selected_list()
+        if changes.touches("silver_bars"):
+            self.load_available_bars()
 
     def showEvent(self, event):
         try:
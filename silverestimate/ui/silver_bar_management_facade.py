@@ -90,6 +90,11 @@ class SilverBarManagementFacade:
             "_transfer_controller", "_bulk_remove_from_list", *args, **kwargs
         )
 
+    def _run_transfer(self, *args: Any, **kwargs: Any) -> Any:
+        return self._facade_call(
+            "_transfer_controller", "_run_transfer", *args, **kwargs
+        )
+
     def add_selected_to_list(self, *args: Any, **kwargs: Any) -> Any:
         return self._facade_call(
             "_transfer_controller", "add_selected_to_list", *args, **kwargs
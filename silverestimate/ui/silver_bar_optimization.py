@@ -1,82 +1,273 @@
-"""Pure optimization helpers for silver-bar list generation."""
+"""Pure optimization helpers for silver-bar list generation.
+
+Bars are sorted by fine weight (heaviest first) and weighed in integer
+milligrams. For each candidate bar count the search first probes the sets
+made of a heaviest prefix, a lightest suffix, and one bar in between, which
+are ordered by total weight and can be searched with a bisection. Only when
+no such set lands in the target range does a pruned branch-and-bound search
+run, under a shared time budget; once it is spent the remaining counts are
+still probed.
+"""
 
 from __future__ import annotations
 
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
 
-def find_optimal_combination(
-    available_bars, min_target: float, max_target: float, optimization_type: str
-):
-    """Find a bar combination within the target range."""
-    bars = sorted(available_bars, key=lambda row: row["fine_weight"], reverse=True)
-    if optimization_type == "min_bars":
-        return find_min_bars_combination(bars, min_target, max_target)
-    return find_max_bars_combination(bars, min_target, max_target)
+WEIGHT_SCALE = 1000  # fine weights are stored to 0.001 g
+DEFAULT_TIME_BUDGET_S = 5.0
+_CHECK_INTERVAL = 4096
 
+ProgressCallback = Callable[[int, int], None]
 
-def find_min_bars_combination(bars, min_target: float, max_target: float):
-    """Prefer the smallest number of bars within the target range."""
-    selected = []
-    current_total = 0.0
-
-    for bar in bars:
-        if current_total + bar["fine_weight"] <= max_target:
-            selected.append(bar)
-            current_total += bar["fine_weight"]
-            if current_total >= min_target:
+
+class OptimizationCancelledError(RuntimeError):
+    """Raised when the caller cancels an optimization in progress."""
+
+
+@dataclass(frozen=True)
+class OptimizationResult:
+    """A bar selection plus how it was found.
+
+    ``proven_optimal`` is false when the time budget cut a search short, so a
+    smaller (or, for ``max_bars``, larger) selection might still exist.
+    """
+
+    bars: tuple[Mapping[str, Any], ...]
+    total_fine_weight: float
+    proven_optimal: bool
+    elapsed_ms: float
+    nodes: int
+
+    @property
+    def found(self) -> bool:
+        return bool(self.bars)
+
+
+class _SearchCheck:
+    def __init__(self, cancel_event: Any, deadline: float) -> None:
+        self._cancel_event = cancel_event
+        self._deadline = deadline
+        self.nodes = 0
+        self.expired = False
+
+    def cancelled(self) -> bool:
+        return self._cancel_event is not None and self._cancel_event.is_set()
+
+    def visit(self) -> bool:
+        """Count a node; return ``False`` once the time budget is spent."""
+        self.nodes += 1
+        if self.nodes % _CHECK_INTERVAL == 0:
+            if self.cancelled():
+                raise OptimizationCancelledError("Optimization cancelled.")
+            self.spent()
+        return not self.expired
+
+    def spent(self) -> bool:
+        """Check the clock now; return ``True`` once the time budget is spent."""
+        if time.perf_counter() >= self._deadline:
+            self.expired = True
+        return self.expired
+
+
+class _BarSearch:
+    """Fixed-count subset search over weights sorted in descending order."""
+
+    def __init__(self, weights: Sequence[int], low: int, high: int) -> None:
+        self.weights = weights
+        self.low = low
+        self.high = high
+        self.count = len(weights)
+        self.prefix = [0]
+        for weight in weights:
+            self.prefix.append(self.prefix[-1] + weight)
+        self._ascending = [-weight for weight in weights]
+
+    def heaviest(self, size: int) -> int:
+        return self.prefix[size]
+
+    def lightest(self, size: int) -> int:
+        return self.prefix[self.count] - self.prefix[self.count - size]
+
+    def candidate_sizes(self) -> range:
+        """Bar counts whose heaviest set reaches ``low`` and lightest fits ``high``."""
+        smallest = max(1, bisect_left(self.prefix, self.low))
+        largest = 0
+        for size in range(self.count, 0, -1):
+            if self.lightest(size) <= self.high:
+                largest = size
                 break
+        return range(smallest, largest + 1)
 
-    if min_target <= current_total <= max_target:
-        return selected
+    def probe(self, size: int, check: _SearchCheck) -> list[int] | None:
+        """Try every prefix + one + suffix set of ``size`` bars by bisection."""
+        weights_total = self.prefix[self.count]
+        for suffix in range(size):
+            if not check.visit():
+                return None
+            head = size - 1 - suffix
+            base = self.prefix[head] + weights_total - self.prefix[self.count - suffix]
+            first = max(head, bisect_left(self._ascending, base - self.high))
+            last = min(
+                self.count - 1 - suffix,
+                bisect_right(self._ascending, base - self.low) - 1,
+            )
+            if first <= last:
+                return [
+                    *range(head),
+                    first,
+                    *range(self.count - suffix, self.count),
+                ]
+        return None
 
-    if len(bars) <= 50:
-        return dp_combination_range(bars, min_target, max_target)
+    def branch_and_bound(self, size: int, check: _SearchCheck) -> list[int] | None:
+        """Depth-first search for ``size`` bars, skipping equal-weight siblings."""
+        weights = self.weights
+        prefix = self.prefix
+        count = self.count
+        chosen: list[int] = []
+        # Each frame is the next position to try at that depth.
+        frames = [0]
+        total = 0
+        while frames:
+            if not check.visit():
+                return None
+            depth = len(chosen)
+            remaining = size - depth
+            position = frames[-1]
+            advanced = False
+            while position <= count - remaining:
+                # Scanning positions is most of the work, so it is charged too.
+                if not check.visit():
+                    return None
+                if (
+                    position > (chosen[-1] + 1 if chosen else 0)
+                    and weights[position] == weights[position - 1]
+                ):
+                    position += 1
+                    continue
+                if total + prefix[position + remaining] - prefix[position] < self.low:
+                    # Later positions are lighter, so none can reach ``low``.
+                    position = count
+                    break
+                after = total + weights[position]
+                rest = remaining - 1
+                if after + prefix[count] - prefix[count - rest] > self.high:
+                    position += 1
+                    continue
+                if rest == 0:
+                    if after >= self.low:
+                        chosen.append(position)
+                        return chosen
+                    position += 1
+                    continue
+                frames[-1] = position + 1
+                chosen.append(position)
+                total = after
+                frames.append(position + 1)
+                advanced = True
+                break
+            if advanced:
+                continue
+            frames.pop()
+            if chosen:
+                total -= weights[chosen.pop()]
+        return None
 
-    return []
 
+def _scaled(weight: Any) -> int:
+    return int(round(float(weight or 0.0) * WEIGHT_SCALE))
 
-def find_max_bars_combination(bars, min_target: float, max_target: float):
-    """Prefer the largest number of bars while staying in the range."""
-    bars_asc = sorted(bars, key=lambda row: row["fine_weight"])
-    selected = []
-    current_total = 0.0
 
-    for bar in bars_asc:
-        if current_total + bar["fine_weight"] <= max_target:
-            selected.append(bar)
-            current_total += bar["fine_weight"]
+def optimize_bar_selection(  # noqa: PLR0913 - explicit search controls
+    available_bars: Iterable[Mapping[str, Any]],
+    min_target: float,
+    max_target: float,
+    optimization_type: str,
+    *,
+    cancel_event: Any = None,
+    progress: ProgressCallback | None = None,
+    time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+) -> OptimizationResult:
+    """Select bars whose fine weight lands in ``[min_target, max_target]``.
 
-    return selected if min_target <= current_total <= max_target else []
+    ``min_bars`` returns the fewest bars that fit and ``max_bars`` the most.
+    ``progress`` receives ``(bar counts tried, bar counts to try)``; setting
+    ``cancel_event`` raises :class:`OptimizationCancelledError`.
+    """
+    started = time.perf_counter()
+    bars = sorted(available_bars, key=lambda row: row["fine_weight"], reverse=True)
+    search = _BarSearch(
+        [_scaled(bar["fine_weight"]) for bar in bars],
+        _scaled(min_target),
+        _scaled(max_target),
+    )
+    check = _SearchCheck(cancel_event, started + max(0.0, time_budget_s))
+    sizes = search.candidate_sizes()
+    if optimization_type != "min_bars":
+        sizes = sizes[::-1]
 
+    selected: list[int] | None = None
+    proven = True
+    for tried, size in enumerate(sizes):
+        if check.cancelled():
+            raise OptimizationCancelledError("Optimization cancelled.")
+        if check.spent():
+            # The remaining counts were never searched.
+            proven = False
+            break
+        if progress is not None:
+            progress(tried, len(sizes))
+        selected = search.probe(size, check)
+        if selected is None and not check.expired:
+            selected = search.branch_and_bound(size, check)
+        if selected is not None:
+            break
+        # Without a full search this count may still hold a selection.
+        proven = proven and not check.expired
+    if progress is not None:
+        progress(len(sizes), len(sizes))
 
-def dp_combination_range(bars, min_target: float, max_target: float):
-    """Find a minimum-bar solution using a DP range search."""
-    min_target_int = int(min_target * 10)
-    max_target_int = int(max_target * 10)
+    chosen = tuple(bars[index] for index in sorted(selected or ()))
+    return OptimizationResult(
+        bars=chosen,
+        total_fine_weight=sum(float(bar["fine_weight"]) for bar in chosen),
+        proven_optimal=proven,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        nodes=check.nodes,
+    )
 
-    dp: dict[int, tuple[int, list[int]]] = {0: (0, [])}
 
-    for index, bar in enumerate(bars):
-        bar_weight = int(bar["fine_weight"] * 10)
-        new_dp = dp.copy()
+def find_optimal_combination(
+    available_bars, min_target: float, max_target: float, optimization_type: str
+):
+    """Find a bar combination within the target range."""
+    result = optimize_bar_selection(
+        available_bars, min_target, max_target, optimization_type
+    )
+    return list(result.bars)
 
-        for weight, (count, indices) in dp.items():
-            new_weight = weight + bar_weight
-            if new_weight <= max_target_int and (
-                new_weight not in new_dp or new_dp[new_weight][0] > count + 1
-            ):
-                new_dp[new_weight] = (count + 1, indices + [index])
 
-        dp = new_dp
+def find_min_bars_combination(bars, min_target: float, max_target: float):
+    """Prefer the smallest number of bars within the target range."""
+    return find_optimal_combination(bars, min_target, max_target, "min_bars")
 
-    best_solution = None
-    best_bars_count = float("inf")
 
-    for weight, (count, indices) in dp.items():
-        if min_target_int <= weight <= max_target_int and count < best_bars_count:
-            best_bars_count = count
-            best_solution = indices
+def find_max_bars_combination(bars, min_target: float, max_target: float):
+    """Prefer the largest number of bars while staying in the range."""
+    return find_optimal_combination(bars, min_target, max_target, "max_bars")
 
-    if best_solution:
-        return [bars[index] for index in best_solution]
 
-    return []
+__all__ = [
+    "DEFAULT_TIME_BUDGET_S",
+    "OptimizationCancelledError",
+    "OptimizationResult",
+    "WEIGHT_SCALE",
+    "find_max_bars_combination",
+    "find_min_bars_combination",
+    "find_optimal_combination",
+    "optimize_bar_selection",
+]
@@ -2,12 +2,60 @@
 
 from __future__ import annotations
 
+import threading
 import traceback
+from dataclasses import dataclass
+from typing import Any
 
 from PySide6.QtWidgets import QMessageBox
 
+from silverestimate.infrastructure.database_write_notifier import when_written
+from silverestimate.infrastructure.latest_request_runner import RequestCancelledError
+
 from ._host_proxy import HostProxy
-from .silver_bar_optimization import find_optimal_combination
+from .background_progress import ProgressReport, run_with_progress
+from .silver_bar_optimization import (
+    OptimizationCancelledError,
+    OptimizationResult,
+    optimize_bar_selection,
+)
+
+
+@dataclass(frozen=True)
+class _GeneratedList:
+    """An optimizer result waiting for its list to be created and filled."""
+
+    name: str
+    min_target: float
+    max_target: float
+    optimization_type: str
+    result: OptimizationResult
+
+    def message(self, added_count: int, failed_bars: list[str]) -> str:
+        actual_fine_weight = sum(bar["fine_weight"] for bar in self.result.bars)
+        message = "Optimal list created successfully!\n\n"
+        message += f"List Name: {self.name}\n"
+        message += f"Target Range: {self.min_target:.1f}g - {self.max_target:.1f}g\n"
+        message += f"Actual Fine Weight: {actual_fine_weight:.1f}g\n"
+        message += f"Bars Added: {added_count}\n"
+        message += (
+            "Optimization: Minimum bars"
+            if self.optimization_type == "min_bars"
+            else "Optimization: Maximum bars"
+        )
+
+        if not self.result.proven_optimal:
+            message += (
+                "\n\nThe search time limit was reached; this is the best "
+                "combination found."
+            )
+
+        if failed_bars:
+            message += (
+                "\n\nWarning: Failed to add "
+                f"{len(failed_bars)} bars: {', '.join(failed_bars)}"
+            )
+        return message
 
 
 class SilverBarOptimizationController(HostProxy):
@@ -37,13 +85,25 @@ class SilverBarOptimizationController(HostProxy):
                 )
                 return
 
-            selected_bars = find_optimal_combination(
+            result = self._optimize_in_background(
                 available_bars,
                 min_target,
                 max_target,
                 optimization_type,
             )
+            if result is None:
+                return
+            selected_bars = list(result.bars)
 
+            if not selected_bars and not result.proven_optimal:
+                QMessageBox.information(
+                    self.host,
+                    "Search Time Limit Reached",
+                    "The search time limit was reached before a combination of "
+                    f"bars within the range {min_target:.1f}g - {max_target:.1f}g "
+                    "was found. One may still exist; try a wider range.",
+                )
+                return
             if not selected_bars:
                 QMessageBox.information(
                     self.host,
@@ -52,36 +112,38 @@ class SilverBarOptimizationController(HostProxy):
                 )
                 return
 
-            new_list_id = self.db_manager.create_silver_bar_list(list_name)
-            if not new_list_id:
-                QMessageBox.critical(self.host, "Error", "Failed to create new list.")
-                return
-
-            selected_ids = [bar["bar_id"] for bar in selected_bars]
-            added_count, failed_bars = self._bulk_assign_to_list(
-                selected_ids,
-                new_list_id,
+            generated = _GeneratedList(
+                list_name, min_target, max_target, optimization_type, result
+            )
+            when_written(
+                self.db_manager.create_silver_bar_list(list_name),
+                lambda new_list_id: self._fill_generated_list(generated, new_list_id),
+                self.host,
             )
 
-            actual_fine_weight = sum(bar["fine_weight"] for bar in selected_bars)
-            message = "Optimal list created successfully!\n\n"
-            message += f"List Name: {list_name}\n"
-            message += f"Target Range: {min_target:.1f}g - {max_target:.1f}g\n"
-            message += f"Actual Fine Weight: {actual_fine_weight:.1f}g\n"
-            message += f"Bars Added: {added_count}\n"
-            message += (
-                "Optimization: Minimum bars"
-                if optimization_type == "min_bars"
-                else "Optimization: Maximum bars"
+        except Exception as exc:
+            self.logger.error("Failed to generate optimal list: %s", exc, exc_info=True)
+            QMessageBox.critical(
+                self.host,
+                "Error",
+                f"Failed to generate optimal list: {exc}\n{traceback.format_exc()}",
             )
 
-            if failed_bars:
-                message += (
-                    "\n\nWarning: Failed to add "
-                    f"{len(failed_bars)} bars: {', '.join(failed_bars)}"
-                )
+    def _fill_generated_list(self, generated: _GeneratedList, new_list_id) -> None:
+        if isinstance(new_list_id, Exception):
+            self.logger.error("Failed to create optimal list: %s", new_list_id)
+            new_list_id = None
+        if not new_list_id:
+            QMessageBox.critical(self.host, "Error", "Failed to create new list.")
+            return
 
-            QMessageBox.information(self.host, "List Generated", message)
+        def finish(assigned) -> None:
+            added_count, failed_bars = assigned
+            QMessageBox.information(
+                self.host,
+                "List Generated",
+                generated.message(added_count, failed_bars),
+            )
             self.load_lists()
             self.load_available_bars()
 
@@ -89,10 +151,61 @@ class SilverBarOptimizationController(HostProxy):
             if index >= 0:
                 self.list_combo.setCurrentIndex(index)
 
-        except Exception as exc:
-            self.logger.error("Failed to generate optimal list: %s", exc, exc_info=True)
-            QMessageBox.critical(
-                self.host,
-                "Error",
-                f"Failed to generate optimal list: {exc}\n{traceback.format_exc()}",
-            )
+        selected_ids = [bar["bar_id"] for bar in generated.result.bars]
+        self._run_transfer(
+            lambda: self._bulk_assign_to_list(selected_ids, new_list_id),
+            finish,
+            enable_log="Could not enable wait cursor for the optimal list: %s",
+            restore_log="Could not restore cursor after the optimal list: %s",
+        )
+
+    def _optimize_in_background(
+        self,
+        available_bars,
+        min_target: float,
+        max_target: float,
+        optimization_type: str,
+    ) -> OptimizationResult | None:
+        """Run the optimizer off the GUI thread; ``None`` means it was cancelled."""
+        bars = tuple(available_bars)
+
+        def optimize(
+            report: ProgressReport, cancel_event: threading.Event
+        ) -> OptimizationResult:
+            try:
+                return optimize_bar_selection(
+                    bars,
+                    min_target,
+                    max_target,
+                    optimization_type,
+                    cancel_event=cancel_event,
+                    progress=lambda done, total: report(done, total, ""),
+                )
+            except OptimizationCancelledError as exc:
+                raise RequestCancelledError(str(exc)) from exc
+
+        outcome = run_with_progress(
+            self.host,
+            optimize,
+            title="Generate Optimal List",
+            label="Searching for the best bar combination...",
+            name="silver-bar-optimizer",
+        )
+        if outcome.cancelled:
+            self.logger.info("Optimal list generation cancelled.")
+            return None
+        if outcome.error is not None:
+            raise RuntimeError(str(outcome.error))
+        result: Any = outcome.value
+        if not isinstance(result, OptimizationResult):
+            return None
+        self.logger.debug(
+            "[perf] silver_bars.optimize=%.2fms bars=%s selected=%s "
+            "nodes=%s optimal=%s",
+            result.elapsed_ms,
+            len(bars),
+            len(result.bars),
+            result.nodes,
+            result.proven_optimal,
+        )
+        return result
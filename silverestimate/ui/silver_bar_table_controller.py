@@ -8,6 +8,8 @@ import traceback
 from PySide6.QtCore import QItemSelectionModel, Qt
 from PySide6.QtWidgets import QApplication, QMenu, QMessageBox
 
+from silverestimate.persistence.silver_bar_summary import SilverBarTotals
+
 from ._host_proxy import HostProxy
 
 
@@ -112,7 +114,9 @@ class SilverBarTableController(HostProxy):
         except Exception as exc:
             self.logger.debug("Could not clear management table: %s", exc)
 
-    def _populate_table(self, table, bars_data, *, total_rows=None):
+    def _populate_table(
+        self, table, bars_data, *, total_rows=None, totals=None, pending=False
+    ):
         start = time.perf_counter()
         try:
             selected_bar_ids = self._selected_bar_ids(table)
@@ -122,34 +126,7 @@ class SilverBarTableController(HostProxy):
                 setter(list(bars_data or []), total_count=total_rows)
                 self._restore_selected_bar_ids(table, selected_bar_ids)
 
-            loaded_count_getter = getattr(model, "loaded_count", None)
-            total_weight_getter = getattr(model, "total_weight", None)
-            total_fine_getter = getattr(model, "total_fine_weight", None)
-
-            bar_count = (
-                int(loaded_count_getter())
-                if callable(loaded_count_getter)
-                else len(list(bars_data or []))
-            )
-            total_weight = (
-                float(total_weight_getter()) if callable(total_weight_getter) else 0.0
-            )
-            total_fine_weight = (
-                float(total_fine_getter()) if callable(total_fine_getter) else 0.0
-            )
-            totals_text = (
-                f"Total: {total_weight:.3f} g  ·  Fine: {total_fine_weight:.3f} g"
-            )
-            if table == self.available_bars_table:
-                self.available_totals_label.setText(f"Available {totals_text}")
-                badge = getattr(self, "available_header_badge", None)
-                if badge is not None:
-                    badge.setText(f"Available: {bar_count}")
-            elif table == self.list_bars_table:
-                self.list_totals_label.setText(f"List {totals_text}")
-                badge = getattr(self, "list_header_badge", None)
-                if badge is not None:
-                    badge.setText(f"List: {bar_count}")
+            self._show_table_totals(table, totals, pending=pending)
         except Exception as exc:
             QMessageBox.critical(
                 self.host,
@@ -170,6 +147,50 @@ class SilverBarTableController(HostProxy):
                     len(bars_data or []),
                 )
 
+    def _show_table_totals(self, table, totals=None, *, pending: bool = False):
+        """Refresh a table's count badge and weight totals.
+
+        ``totals`` holds full-filter aggregates from the repository; without
+        them the loaded rows are summed, and ``pending`` marks that a count
+        for the rest of the filter is still on its way.
+        """
+        model = table.model()
+        loaded_count_getter = getattr(model, "loaded_count", None)
+        total_weight_getter = getattr(model, "total_weight", None)
+        total_fine_getter = getattr(model, "total_fine_weight", None)
+
+        bar_count = (
+            int(loaded_count_getter())
+            if callable(loaded_count_getter)
+            else int(model.rowCount())
+        )
+        total_weight = (
+            float(total_weight_getter()) if callable(total_weight_getter) else 0.0
+        )
+        total_fine_weight = (
+            float(total_fine_getter()) if callable(total_fine_getter) else 0.0
+        )
+        if isinstance(totals, SilverBarTotals):
+            # Full-filter totals from the repository, not just loaded rows.
+            bar_count = totals.bar_count
+            total_weight = totals.total_weight
+            total_fine_weight = totals.total_fine_weight
+            pending = False
+        count_text = f"{bar_count}+" if pending else str(bar_count)
+        totals_text = f"Total: {total_weight:.3f} g  ·  Fine: {total_fine_weight:.3f} g"
+        if pending:
+            totals_text += " (loaded rows)"
+        if table == self.available_bars_table:
+            self.available_totals_label.setText(f"Available {totals_text}")
+            badge = getattr(self, "available_header_badge", None)
+            if badge is not None:
+                badge.setText(f"Available: {count_text}")
+        elif table == self.list_bars_table:
+            self.list_totals_label.setText(f"List {totals_text}")
+            badge = getattr(self, "list_header_badge", None)
+            if badge is not None:
+                badge.setText(f"List: {count_text}")
+
     def _show_available_context_menu(self, pos):
         try:
             menu = QMenu(self.host)
@@ -7,41 +7,29 @@ import csv
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
 
+from silverestimate.infrastructure.database_write_notifier import when_written
+from silverestimate.infrastructure.write_futures import map_future
+
 from ._host_proxy import HostProxy
 
 
+def _transfer_counts(result):
+    count, failed_ids = result or (0, [])
+    return int(count or 0), [str(bar_id) for bar_id in failed_ids or []]
+
+
 class SilverBarTransferController(HostProxy):
     """Handle moving bars between lists and exporting list contents."""
 
     def _bulk_assign_to_list(self, bar_ids, list_id):
-        assign_bulk = getattr(self.db_manager, "assign_bars_to_list_bulk", None)
-        if callable(assign_bulk):
-            added, failed_ids = assign_bulk(bar_ids, list_id)
-            return int(added or 0), [str(bar_id) for bar_id in (failed_ids or [])]
-
-        added = 0
-        failed = []
-        for bar_id in list(bar_ids or []):
-            if self.db_manager.assign_bar_to_list(bar_id, list_id):
-                added += 1
-            else:
-                failed.append(str(bar_id))
-        return added, failed
+        """Queue the assignment; the future settles with the count and failures."""
+        assigned = self.db_manager.assign_bars_to_list_bulk(bar_ids, list_id)
+        return map_future(assigned, _transfer_counts)
 
     def _bulk_remove_from_list(self, bar_ids):
-        remove_bulk = getattr(self.db_manager, "remove_bars_from_list_bulk", None)
-        if callable(remove_bulk):
-            removed, failed_ids = remove_bulk(bar_ids)
-            return int(removed or 0), [str(bar_id) for bar_id in (failed_ids or [])]
-
-        removed = 0
-        failed = []
-        for bar_id in list(bar_ids or []):
-            if self.db_manager.remove_bar_from_list(bar_id):
-                removed += 1
-            else:
-                failed.append(str(bar_id))
-        return removed, failed
+        """Queue the removal; the future settles with the count and failures."""
+        removed = self.db_manager.remove_bars_from_list_bulk(bar_ids)
+        return map_future(removed, _transfer_counts)
 
     def add_selected_to_list(self):
         if self.current_list_id is None:
@@ -83,18 +71,23 @@ class SilverBarTransferController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        added_count, failed_ids = self._run_with_wait_cursor(
-            lambda: self._bulk_assign_to_list(bar_ids_to_add, self.current_list_id),
+        def finish(result):
+            added_count, failed_ids = result
+            self._show_transfer_result(
+                added_count,
+                failed_ids,
+                success_message=f"{added_count} bar(s) added to the list.",
+                failure_prefix="Failed to add bars with IDs",
+            )
+            self._refresh_after_transfer()
+
+        list_id = self.current_list_id
+        self._run_transfer(
+            lambda: self._bulk_assign_to_list(bar_ids_to_add, list_id),
+            finish,
             enable_log="Could not enable wait cursor while adding bars: %s",
             restore_log="Could not restore cursor after adding bars: %s",
         )
-        self._show_transfer_result(
-            added_count,
-            failed_ids,
-            success_message=f"{added_count} bar(s) added to the list.",
-            failure_prefix="Failed to add bars with IDs",
-        )
-        self._refresh_after_transfer()
 
     def remove_selected_from_list(self):
         if self.current_list_id is None:
@@ -131,18 +124,22 @@ class SilverBarTransferController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        removed_count, failed_ids = self._run_with_wait_cursor(
+        def finish(result):
+            removed_count, failed_ids = result
+            self._show_transfer_result(
+                removed_count,
+                failed_ids,
+                success_message=f"{removed_count} bar(s) removed from the list.",
+                failure_prefix="Failed to remove bars with IDs",
+            )
+            self._refresh_after_transfer()
+
+        self._run_transfer(
             lambda: self._bulk_remove_from_list(bar_ids_to_remove),
+            finish,
             enable_log="Could not enable wait cursor while removing bars: %s",
             restore_log="Could not restore cursor after removing bars: %s",
         )
-        self._show_transfer_result(
-            removed_count,
-            failed_ids,
-            success_message=f"{removed_count} bar(s) removed from the list.",
-            failure_prefix="Failed to remove bars with IDs",
-        )
-        self._refresh_after_transfer()
 
     def add_all_filtered_to_list(self):
         if self.current_list_id is None:
@@ -166,19 +163,25 @@ class SilverBarTransferController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
         bar_ids = self._all_bar_ids(self.available_bars_table)
-        added, failed = self._run_with_wait_cursor(
-            lambda: self._bulk_assign_to_list(bar_ids, self.current_list_id),
+
+        def finish(result):
+            added, failed = result
+            self._refresh_after_transfer()
+            self._show_transfer_result(
+                added,
+                failed,
+                success_message=f"{added} bar(s) added to the list.",
+                failure_prefix="Failed to add bars",
+                partial_title="Partial",
+            )
+
+        list_id = self.current_list_id
+        self._run_transfer(
+            lambda: self._bulk_assign_to_list(bar_ids, list_id),
+            finish,
             enable_log="Could not enable wait cursor while adding all bars: %s",
             restore_log="Could not restore cursor after add-all: %s",
         )
-        self._refresh_after_transfer()
-        self._show_transfer_result(
-            added,
-            failed,
-            success_message=f"{added} bar(s) added to the list.",
-            failure_prefix="Failed to add bars",
-            partial_title="Partial",
-        )
 
     def remove_all_from_list(self):
         if self.current_list_id is None:
@@ -206,19 +209,24 @@ class SilverBarTransferController(HostProxy):
         if reply != QMessageBox.StandardButton.Yes:
             return
         bar_ids = self._all_bar_ids(self.list_bars_table)
-        removed, failed = self._run_with_wait_cursor(
+
+        def finish(result):
+            removed, failed = result
+            self._refresh_after_transfer()
+            self._show_transfer_result(
+                removed,
+                failed,
+                success_message=f"{removed} bar(s) removed from the list.",
+                failure_prefix="Failed to remove bars",
+                partial_title="Partial",
+            )
+
+        self._run_transfer(
             lambda: self._bulk_remove_from_list(bar_ids),
+            finish,
             enable_log="Could not enable wait cursor while removing all bars: %s",
             restore_log="Could not restore cursor after remove-all: %s",
         )
-        self._refresh_after_transfer()
-        self._show_transfer_result(
-            removed,
-            failed,
-            success_message=f"{removed} bar(s) removed from the list.",
-            failure_prefix="Failed to remove bars",
-            partial_title="Partial",
-        )
 
     def export_current_list_to_csv(self):
         if self.current_list_id is None:
@@ -300,18 +308,32 @@ class SilverBarTransferController(HostProxy):
                 bar_ids.append(bar_id)
         return bar_ids
 
-    def _run_with_wait_cursor(self, operation, *, enable_log: str, restore_log: str):
+    def _run_transfer(self, start, finish, *, enable_log: str, restore_log: str):
+        """Queue a bulk transfer and finish it once the writer settles it."""
         try:
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         except Exception as exc:
             self.logger.debug(enable_log, exc)
-        try:
-            return operation()
-        finally:
+
+        def settle(result) -> None:
             try:
                 QApplication.restoreOverrideCursor()
             except Exception as exc:
                 self.logger.debug(restore_log, exc)
+            if isinstance(result, Exception):
+                QMessageBox.critical(
+                    self.host, "Error", f"Failed to update the list: {result}"
+                )
+                self._refresh_after_transfer()
+                return
+            finish(result)
+
+        try:
+            transferred = start()
+        except Exception as exc:
+            settle(exc)
+            return
+        when_written(transferred, settle, self.host)
 
     def _refresh_after_transfer(self) -> None:
         self.load_available_bars()
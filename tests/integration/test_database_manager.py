@@ -1,9 +1,18 @@
+import threading
+from dataclasses import dataclass
+
 import pytest
 
 from silverestimate.persistence.database_manager import (
     DatabaseManager,
     MaintenanceStatus,
 )
+from silverestimate.persistence.database_writer import (
+    AddItem,
+    SaveEstimate,
+    UpdateItem,
+    WriteCommand,
+)
 from silverestimate.services.item_catalog_transfer import (
     export_item_catalog,
     import_item_catalog,
@@ -133,6 +142,93 @@ def test_database_manager_persists_estimates(tmp_path, settings_stub):
         reopened.close()
 
 
+def test_database_manager_writes_through_the_writer_thread(tmp_path, settings_stub):
+    db_path = tmp_path / "storage" / "writer.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    manager = DatabaseManager(
+        str(db_path), "test-password", device_secret=DEVICE_SECRET
+    )
+    try:
+        upsert = manager.submit_write(AddItem("BAR001", "Bar", 99.0, "WT", 0.0))
+        save = manager.submit_write(
+            SaveEstimate(
+                "920",
+                "2026-01-01",
+                75000.0,
+                [regular_item(code="BAR001", line_key="bar", is_silver_bar=True)],
+                [],
+                estimate_totals(),
+                [{"line_key": "bar", "weight": 9.0, "purity": 99.0}],
+            )
+        )
+        assert upsert.result(timeout=10).value is True
+        outcome = save.result(timeout=10)
+        assert outcome.value.saved
+        assert outcome.value.bars.added == 1
+
+        backup = manager.create_encrypted_backup(tmp_path / "writer.sedbbackup")
+        assert backup.status is MaintenanceStatus.SUCCESS
+
+        renamed = manager.submit_write(UpdateItem("BAR001", "Fine bar", 99.0, "WT", 0))
+        assert renamed.result(timeout=10).value is True
+        assert manager.get_item_by_code("BAR001")["name"] == "Fine bar"
+        assert manager.get_estimate_by_voucher("920") is not None
+        metrics = manager.writer_metrics()
+        assert metrics is not None and metrics.completed == 3
+    finally:
+        manager.close()
+    assert manager.writer_metrics() is None
+
+
+@dataclass(frozen=True)
+class _HoldTransaction(WriteCommand):
+    started: threading.Event
+    release: threading.Event
+
+    def apply(self, db):
+        db.conn.execute("BEGIN IMMEDIATE")
+        db.cursor.execute("UPDATE items SET name = name")
+        self.started.set()
+        assert self.release.wait(10)
+        db.conn.commit()
+        return True
+
+
+def test_database_manager_routes_facade_writes_through_the_writer(
+    tmp_path, settings_stub
+):
+    db_path = tmp_path / "storage" / "routed.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    manager = DatabaseManager(
+        str(db_path), "test-password", device_secret=DEVICE_SECRET
+    )
+    try:
+        assert manager.add_item("REG001", "Regular", 92.0, "WT", 12.0).result(10)
+        started, release = threading.Event(), threading.Event()
+        held = manager.submit_write(_HoldTransaction(started, release))
+        assert started.wait(10)
+        # Queued behind the open write transaction, and returned to the
+        # caller without waiting for it.
+        saved = manager.save_estimate_with_returns(
+            "930",
+            "2026-01-01",
+            75000.0,
+            [regular_item(code="REG001")],
+            [],
+            estimate_totals(),
+        )
+        assert not saved.done()
+        release.set()
+        assert held.result(timeout=10).value is True
+        assert saved.result(timeout=10) is True
+        assert manager.last_error is None
+        assert manager.get_estimate_by_voucher("930") is not None
+        metrics = manager.writer_metrics()
+        assert metrics is not None and metrics.completed == 3
+    finally:
+        manager.close()
+
+
 def test_database_manager_does_not_retain_plaintext_password(tmp_path, settings_stub):
     db_path = tmp_path / "storage" / "secure_session.db"
     db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -183,7 +279,7 @@ def test_database_manager_item_catalog_backup_roundtrip(tmp_path, settings_stub)
         assert target.items_repo.add_item("ITM001", "Old Name", 70.0, "WT", 1.0)
         assert target.items_repo.add_item("KEEP01", "Keep", 75.0, "WT", 3.0)
 
-        summary = import_item_catalog(target, str(backup_path))
+        summary = import_item_catalog(target, str(backup_path)).result(timeout=10)
 
         assert summary == {"inserted": 1, "updated": 1, "deleted": 0, "total": 2}
         assert target.items_repo.get_item_by_code("ITM001") == {
@@ -243,7 +339,7 @@ def test_database_manager_item_catalog_restore_can_replace_existing_catalog(
             target,
             str(backup_path),
             replace_existing=True,
-        )
+        ).result(timeout=10)
 
         assert summary == {"inserted": 1, "updated": 1, "deleted": 1, "total": 2}
         assert target.items_repo.get_item_by_code("ITM001") == {
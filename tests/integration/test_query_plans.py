@@ -0,0 +1,339 @@
+"""EXPLAIN QUERY PLAN checks for every SQL shape the paged views emit.
+
+Each builder is expanded over every filter combination it accepts and planned
+against the real schema from ``run_schema_setup``. A plan fails when it scans
+a whole table or sorts through a temp B-tree, unless ``ALLOWED_PLANS`` names
+the case and says why the narrower work is intended.
+"""
+
+import itertools
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from sqlcipher3 import dbapi2 as sqlite3
+
+from silverestimate.domain.pagination import EstimateHistoryCursor, ItemCursor
+from silverestimate.persistence import schema
+from silverestimate.persistence.estimates_repository import (
+    fetch_estimate_history_page,
+)
+from silverestimate.persistence.items_repository import fetch_item_catalog_page
+from silverestimate.persistence.silver_bars_queries import (
+    build_available_bars_queries,
+    build_bars_in_list_queries,
+    build_history_bars_query,
+)
+
+_FULL_SCAN = re.compile(r"^SCAN (TABLE )?[\w.]+( AS \w+)?$")
+_TEMP_SORT = "USE TEMP B-TREE"
+
+
+@dataclass(frozen=True)
+class AllowedPlan:
+    case: str
+    violation: str
+    reason: str
+
+
+ALLOWED_PLANS = (
+    AllowedPlan(
+        r"^available\[.*weight",
+        _TEMP_SORT,
+        "a weight window holds a handful of bars; sorting them beats walking "
+        "every in-stock bar in date order",
+    ),
+    AllowedPlan(
+        r"^available\[.*date_range",
+        _TEMP_SORT,
+        "a closed date window is read from its range index and sorted",
+    ),
+    AllowedPlan(
+        r"^history_bars\[.*voucher=trigram",
+        _TEMP_SORT,
+        "trigram matches reach bars through their vouchers, then sort",
+    ),
+    AllowedPlan(
+        r"^estimate_history\[.*voucher=trigram",
+        _TEMP_SORT,
+        "trigram candidates are sorted after the index narrows them",
+    ),
+    AllowedPlan(
+        r"^estimate_history\[.*date_from,date_to",
+        _TEMP_SORT,
+        "a closed date window is read from idx_estimates_date and sorted",
+    ),
+    AllowedPlan(
+        r"^item_catalog\[term=(prefix|trigram-\w+)[,\]]",
+        _TEMP_SORT,
+        "prefix matches merge code and name index ranges; trigram candidates "
+        "come from the search index; both are sorted afterwards",
+    ),
+    AllowedPlan(
+        r"^item_catalog\[term=short-contains[,\]].*/count$",
+        "SCAN items",
+        "two-character contains terms are below the trigram minimum",
+    ),
+)
+
+
+class PlanDB:
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.cursor = self.conn.cursor()
+        self.logger = logging.getLogger("test")
+
+    def _table_exists(self, table_name: str) -> bool:
+        self.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+            (table_name,),
+        )
+        return self.cursor.fetchone() is not None
+
+    def _check_schema_version(self) -> int:
+        if not self._table_exists("schema_version"):
+            return 0
+        self.cursor.execute("SELECT MAX(version) FROM schema_version")
+        row = self.cursor.fetchone()
+        return row[0] if row and row[0] is not None else 0
+
+    def _update_schema_version(self, new_version: int) -> bool:
+        self.cursor.execute(
+            "INSERT INTO schema_version (version, applied_date) VALUES (?, ?)",
+            (new_version, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        return True
+
+
+class RecordingCursor:
+    """Forward to a real cursor and keep every SELECT it was asked to run."""
+
+    def __init__(self, cursor) -> None:
+        self._cursor = cursor
+        self.statements: list[tuple[str, tuple]] = []
+
+    def execute(self, sql, params=()):
+        if sql.lstrip().upper().startswith("SELECT") and "sqlite_master" not in sql:
+            self.statements.append((sql, tuple(params)))
+        return self._cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+@pytest.fixture()
+def plan_db():
+    db = PlanDB()
+    schema.run_schema_setup(db)
+    db.conn.execute(
+        "INSERT INTO items (code, name, purity, wage_type, wage_rate) "
+        "VALUES ('ABC1', 'Anklet', 92.5, 'WT', 10)"
+    )
+    db.conn.commit()
+    yield db
+    db.conn.close()
+
+
+def _case_id(family: str, filters: dict, statement: str) -> str:
+    active = [
+        name if value is True else f"{name}={value}"
+        for name, value in filters.items()
+        if value
+    ]
+    return f"{family}[{','.join(active)}]/{statement}"
+
+
+def _violations(conn, case: str, sql: str, params) -> list[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", tuple(params)).fetchall()
+    found = []
+    for detail in (str(row[3]) for row in rows):
+        if not (_FULL_SCAN.match(detail) or detail.startswith(_TEMP_SORT)):
+            continue
+        if any(
+            detail.startswith(allowed.violation) and re.search(allowed.case, case)
+            for allowed in ALLOWED_PLANS
+        ):
+            continue
+        found.append(f"{case}: {detail}")
+    return found
+
+
+def _assert_plans(conn, cases) -> None:
+    failures = [
+        violation
+        for case, sql, params in cases
+        for violation in _violations(conn, case, sql, params)
+    ]
+    assert not failures, "\n".join(failures)
+
+
+def test_available_bar_queries_use_indexes(plan_db):
+    cases = []
+    for weight, floor, ceiling, dates, keyset, limit in itertools.product(
+        (False, True), repeat=6
+    ):
+        statements = build_available_bars_queries(
+            weight_query="10.5" if weight else None,
+            min_purity=90.0 if floor else None,
+            max_purity=99.9 if ceiling else None,
+            date_range=("2026-01-01", "2026-01-31") if dates else None,
+            limit=500 if limit else None,
+            after_date_added="2026-01-15 10:00:00" if keyset else None,
+            after_bar_id=42 if keyset else None,
+        )
+        filters = {
+            "weight": weight,
+            "min_purity": floor,
+            "max_purity": ceiling,
+            "date_range": dates,
+            "keyset": keyset,
+            "limit": limit,
+        }
+        for name in ("query", "count_query", "totals_query"):
+            statement = getattr(statements, name)
+            cases.append(
+                (
+                    _case_id("available", filters, name),
+                    statement.query,
+                    statement.params,
+                )
+            )
+    _assert_plans(plan_db.conn, cases)
+
+
+def test_bars_in_list_queries_use_indexes(plan_db):
+    cases = []
+    for keyset, limit in itertools.product((False, True), repeat=2):
+        statements = build_bars_in_list_queries(
+            7, limit=500 if limit else None, after_bar_id=42 if keyset else None
+        )
+        filters = {"keyset": keyset, "limit": limit}
+        for name in ("query", "count_query", "totals_query"):
+            statement = getattr(statements, name)
+            cases.append(
+                (
+                    _case_id("list_bars", filters, name),
+                    statement.query,
+                    statement.params,
+                )
+            )
+    _assert_plans(plan_db.conn, cases)
+
+
+def test_history_bar_queries_use_indexes(plan_db):
+    vouchers = {"": "", "short": "12", "trigram": "1042"}
+    cases = []
+    for voucher, weight, status, keyset, indexed in itertools.product(
+        vouchers, (False, True), (False, True), (False, True), (False, True)
+    ):
+        if indexed and voucher != "trigram":
+            continue
+        statement = build_history_bars_query(
+            voucher_term=vouchers[voucher],
+            weight_text="10.5" if weight else "",
+            status_text="In Stock" if status else "All Statuses",
+            after_date_added="2026-01-15 10:00:00" if keyset else None,
+            after_bar_id=42 if keyset else None,
+            search_index=indexed,
+        )
+        filters = {
+            "voucher": voucher,
+            "weight": weight,
+            "status": status,
+            "keyset": keyset,
+        }
+        cases.append(
+            (
+                _case_id("history_bars", filters, "query"),
+                statement.query,
+                statement.params,
+            )
+        )
+    _assert_plans(plan_db.conn, cases)
+
+
+def test_estimate_history_pages_use_indexes(plan_db):
+    vouchers = {"": None, "short": "12", "trigram": "1042"}
+    cases = []
+    for date_from, date_to, voucher, keyset in itertools.product(
+        (False, True), (False, True), vouchers, (False, True)
+    ):
+        recorder = RecordingCursor(plan_db.conn.cursor())
+        fetch_estimate_history_page(
+            recorder,
+            date_from="2026-01-01" if date_from else None,
+            date_to="2026-01-31" if date_to else None,
+            voucher_search=vouchers[voucher],
+            page_cursor=EstimateHistoryCursor(1042, "1042") if keyset else None,
+        )
+        filters = {
+            "date_from": date_from,
+            "date_to": date_to,
+            "voucher": voucher,
+            "keyset": keyset,
+        }
+        count, page = [
+            (sql, params)
+            for sql, params in recorder.statements
+            if "FROM estimates" in sql or "FROM main.estimates" in sql
+        ]
+        cases.append((_case_id("estimate_history", filters, "count"), *count))
+        cases.append((_case_id("estimate_history", filters, "page"), *page))
+    _assert_plans(plan_db.conn, cases)
+
+
+def test_item_catalog_pages_use_indexes(plan_db):
+    terms = {
+        "": "",
+        "prefix": "a",
+        "trigram-prefix": "abc",
+        "trigram-contains": "bc1",
+        "short-contains": "c1",
+    }
+    cases = []
+    for term, keyset in itertools.product(terms, (False, True)):
+        recorder = RecordingCursor(plan_db.conn.cursor())
+        fetch_item_catalog_page(
+            recorder,
+            terms[term],
+            page_cursor=ItemCursor("A", "A") if keyset else None,
+        )
+        assert recorder.statements, term
+        filters = {"term": term, "keyset": keyset}
+        for sql, params in recorder.statements:
+            statement = (
+                "exists"
+                if "EXISTS" in sql
+                else "count"
+                if "COUNT(*)" in sql
+                else "page"
+            )
+            cases.append((_case_id("item_catalog", filters, statement), sql, params))
+    _assert_plans(plan_db.conn, cases)
+
+
+def test_schema_setup_drops_the_indexes_the_order_indexes_replace(plan_db):
+    plan_db.conn.execute(
+        "CREATE INDEX idx_estimates_history_keyset "
+        "ON estimates(voucher_no_int DESC, voucher_no DESC)"
+    )
+    plan_db.conn.execute(
+        "CREATE INDEX idx_sbars_status_list_date_id "
+        "ON silver_bars(status, list_id, date_added DESC, bar_id DESC)"
+    )
+    plan_db.conn.commit()
+
+    schema.run_schema_setup(plan_db)
+
+    indexes = {
+        row[0]
+        for row in plan_db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    assert "idx_estimates_history_keyset" not in indexes
+    assert "idx_sbars_status_list_date_id" not in indexes
+    assert {"idx_estimates_history_order", "idx_sbars_status_list_order"} <= indexes
@@ -7,8 +7,23 @@ from sqlcipher3 import dbapi2 as sqlite3
 
 from silverestimate.infrastructure.item_cache import ItemCacheController
 from silverestimate.persistence import schema
-from silverestimate.persistence.estimates_repository import EstimatesRepository
-from silverestimate.persistence.items_repository import ItemsRepository
+from silverestimate.persistence.estimates_repository import (
+    EstimatesRepository,
+    count_estimate_history,
+    fetch_estimate_history_page,
+)
+from silverestimate.persistence.item_usage import (
+    read_usage,
+    rebuild_usage,
+    usage_weight,
+)
+from silverestimate.persistence.items_repository import (
+    ItemsRepository,
+    count_item_catalog,
+    fetch_item_catalog_page,
+    fetch_item_catalog_rows,
+)
+from silverestimate.persistence.query_cache import QueryCache
 from silverestimate.persistence.silver_bar_command_repository import (
     SilverBarCommandRepository,
 )
@@ -19,6 +34,7 @@ from silverestimate.persistence.silver_bar_synchronization_repository import (
     SilverBarSynchronizationRepository,
     SilverBarSyncResult,
 )
+from silverestimate.persistence.silver_bars_queries import build_history_bars_query
 from tests.factories import estimate_totals, regular_item, return_item, silver_bar_item
 
 
@@ -163,6 +179,15 @@ def test_item_catalog_keyset_pages_do_not_duplicate_rows(fake_db):
     assert second.next_cursor is None
     assert fake_db.item_cache_controller.get("B001")["name"] == "Item B001"
 
+    uncounted = fetch_item_catalog_page(
+        fake_db.cursor, "A", limit=2, include_total=False
+    )
+    assert uncounted.total is None
+    assert [row["code"] for row in uncounted.items] == ["A001", "A002"]
+    assert count_item_catalog(fake_db.cursor, "A") == 3
+    assert count_item_catalog(fake_db.cursor, "tem B") == 1
+    assert count_item_catalog(fake_db.cursor, "Z") == 0
+
 
 def test_estimate_history_keyset_page_reads_header_totals(fake_db):
     repo = EstimatesRepository(fake_db)
@@ -186,6 +211,14 @@ def test_estimate_history_keyset_page_reads_header_totals(fake_db):
     assert first.items[0]["total_gross"] == 30.0
     assert [row["voucher_no"] for row in second.items] == ["1"]
 
+    uncounted = fetch_estimate_history_page(
+        fake_db.cursor, limit=2, include_total=False
+    )
+    assert uncounted.total is None
+    assert uncounted.items == first.items and uncounted.next_cursor == first.next_cursor
+    assert count_estimate_history(fake_db.cursor) == 3
+    assert count_estimate_history(fake_db.cursor, voucher_search="2") == 1
+
 
 def test_schema_setup_creates_current_v8_schema(fake_db):
     fake_db.cursor.execute("SELECT MAX(version) AS v FROM schema_version")
@@ -309,6 +342,177 @@ def test_items_repository_selection_search_ranking_and_limit(fake_db):
     assert truncated_full is False
 
 
+def test_items_repository_answers_searches_from_the_loaded_catalog(fake_db):
+    repo = ItemsRepository(fake_db)
+    names = ("Metal Ring", "Classic Chain", "Adorn Pendant", "Roadline Anklet")
+    assert repo.upsert_item_catalog(
+        [
+            {
+                "code": code,
+                "name": name,
+                "purity": 91.0,
+                "wage_type": "WT",
+                "wage_rate": 5.0,
+            }
+            for code, name in zip(("BAD2", "AD01", "ZZ10", "AXAD"), names, strict=True)
+        ]
+    )
+    assert repo.update_item("ZZ10", "Adamant Pendant", 88.0, "PC", 3.0)
+    assert repo.delete_item("BAD2")
+    assert repo.add_item("AD_1", "Odd Code", 80.0, "WT", 1.0)
+    # A row written behind the repository's back is invisible to the catalog.
+    fake_db.conn.execute(
+        "INSERT INTO items (code, name, purity, wage_type, wage_rate) "
+        "VALUES ('ADX', 'Unseen', 1, 'WT', 1)"
+    )
+
+    assert fake_db.item_cache_controller.searchable is True
+    assert [row["code"] for row in repo.search_items("ad")] == ["AD01", "AD_1", "ZZ10"]
+    assert [row["code"] for row in repo.search_items_for_selection("AD")[0]] == [
+        "AD01",
+        "AD_1",
+        "ZZ10",
+        "AXAD",
+    ]
+    assert repo.get_item_by_code("zz10")["name"] == "Adamant Pendant"
+    assert repo.get_item_by_code("BAD2") is None
+    assert repo.get_item_by_code("ADX") is None
+    assert "ADX" in {
+        row["code"] for row in fetch_item_catalog_rows(fake_db.cursor, "AD")
+    }
+
+
+def _item_search_codes(db, term: str) -> set[str]:
+    rows = db.conn.execute(
+        "SELECT items.code FROM items_fts JOIN items ON items.rowid = items_fts.rowid "
+        "WHERE items_fts MATCH ?",
+        ('"' + term + '"',),
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def test_item_search_index_follows_item_writes(fake_db):
+    repo = ItemsRepository(fake_db)
+    repo.add_item("RNG100", "Plain Ring", 91.0, "WT", 5.0)
+    repo.add_item("CHN200", "Rope Chain", 91.0, "WT", 5.0)
+    assert _item_search_codes(fake_db, "ring") == {"RNG100"}
+
+    repo.update_item("RNG100", "Plain Band", 91.0, "WT", 5.0)
+    assert _item_search_codes(fake_db, "ring") == set()
+    assert _item_search_codes(fake_db, "band") == {"RNG100"}
+
+    repo.delete_item("CHN200")
+    assert _item_search_codes(fake_db, "chain") == set()
+
+    repo.upsert_item_catalog(
+        [
+            {
+                "code": "RNG100",
+                "name": "Signet Ring",
+                "purity": 91.0,
+                "wage_type": "WT",
+                "wage_rate": 5.0,
+            },
+            {
+                "code": "ANK300",
+                "name": "Ring Anklet",
+                "purity": 80.0,
+                "wage_type": "WT",
+                "wage_rate": 9.0,
+            },
+        ],
+        replace_existing=True,
+    )
+    assert _item_search_codes(fake_db, "ring") == {"RNG100", "ANK300"}
+    # Raises SQLITE_CORRUPT_VTAB when the index disagrees with items.
+    fake_db.conn.execute(
+        "INSERT INTO items_fts(items_fts, rank) VALUES ('integrity-check', 1)"
+    )
+
+
+def test_item_search_index_preserves_selection_ranking(fake_db):
+    repo = ItemsRepository(fake_db)
+    repo.add_item("ZZRIN", "Chain", 75.0, "WT", 20.0)
+    repo.add_item("RING1", "Classic", 91.5, "WT", 12.5)
+    repo.add_item("BB01", "Ring Pendant", 88.0, "PC", 3.0)
+    repo.add_item("CC02", "Earring", 80.0, "WT", 9.75)
+    repo.add_item("DD03", "R_ing Literal", 80.0, "WT", 9.75)
+
+    rows, truncated = repo.search_items_for_selection("rin", limit=10)
+    assert [row["code"] for row in rows] == ["RING1", "BB01", "ZZRIN", "CC02"]
+    assert truncated is False
+    assert [row["code"] for row in repo.search_items("RINX")] == []
+    assert [row["code"] for row in repo.search_items("arri")] == ["CC02"]
+
+    page = repo.search_items_page("rin", limit=2)
+    assert page.total == 2
+    assert [row["code"] for row in page.items] == ["BB01", "RING1"]
+
+    # LIKE wildcards bypass the trigram filter and keep their LIKE meaning.
+    wildcard_rows, _ = repo.search_items_for_selection("r_ing", limit=10)
+    assert [row["code"] for row in wildcard_rows] == ["DD03", "CC02"]
+
+
+def test_item_search_index_is_rebuilt_when_a_trigger_is_missing(fake_db):
+    repo = ItemsRepository(fake_db)
+    fake_db.conn.execute("DROP TRIGGER trg_items_fts_insert")
+    fake_db.conn.commit()
+    repo.add_item("BRC500", "Bracelet", 91.0, "WT", 5.0)
+    assert _item_search_codes(fake_db, "bracelet") == set()
+
+    schema.run_schema_setup(fake_db)
+
+    assert _item_search_codes(fake_db, "bracelet") == {"BRC500"}
+
+
+def _query_plan(db, sql: str, params) -> str:
+    rows = db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", tuple(params)).fetchall()
+    return " | ".join(str(row[3]) for row in rows)
+
+
+def test_history_searches_use_the_estimate_search_index(fake_db):
+    fake_db.conn.executemany(
+        "INSERT INTO estimates (voucher_no, voucher_no_int, date, note) "
+        "VALUES (?, ?, '2026-01-01', ?)",
+        (
+            ("10420", 10420, "Walk-in"),
+            ("20420", 20420, "Ramesh Jewellers"),
+            ("30001", 30001, "Order 0420 repeat"),
+        ),
+    )
+    fake_db.conn.executemany(
+        "INSERT INTO silver_bars (estimate_voucher_no, weight, purity, "
+        "fine_weight, date_added, status) VALUES (?, 10.0, 99.0, 9.9, ?, 'In Stock')",
+        (
+            ("10420", "2026-01-01 10:00:00"),
+            ("20420", "2026-01-01 11:00:00"),
+            ("30001", "2026-01-01 12:00:00"),
+        ),
+    )
+    fake_db.conn.execute(
+        "UPDATE estimates SET note = 'Ramesh' WHERE voucher_no = '30001'"
+    )
+    fake_db.conn.commit()
+
+    page = fetch_estimate_history_page(fake_db.cursor, voucher_search="0420")
+    assert [row["voucher_no"] for row in page.items] == ["20420", "10420"]
+    assert page.total == 2
+
+    queries = SilverBarQueryRepository(fake_db)
+    bars = queries.search_history_bars_page(voucher_term="ramesh")
+    assert [row["estimate_voucher_no"] for row in bars.items] == ["30001", "20420"]
+    assert bars.total == 2
+    assert queries.search_history_bars_page(voucher_term="0420 repeat").total == 0
+
+    statement = build_history_bars_query(voucher_term="ramesh", search_index=True)
+    plan = _query_plan(fake_db, statement.query, statement.params)
+    assert "estimates_fts" in plan
+    assert "SCAN sb" not in plan
+
+    fake_db.conn.execute("DELETE FROM estimates WHERE voucher_no = '20420'")
+    assert fetch_estimate_history_page(fake_db.cursor, voucher_search="0420").total == 1
+
+
 def test_estimates_repository_save_and_fetch(fake_db):
     repo = EstimatesRepository(fake_db)
     ItemsRepository(fake_db).add_item("ITM001", "Sample Item", 92.5, "WT", 10.0)
@@ -346,6 +550,105 @@ def test_estimates_repository_save_and_fetch(fake_db):
     assert data["items"][0]["wage_type"] == "WT"
 
 
+def _line_ids(db, voucher_no: str) -> dict[str, int]:
+    rows = db.conn.execute(
+        "SELECT line_key, id FROM estimate_items WHERE voucher_no = ?", (voucher_no,)
+    ).fetchall()
+    return {row["line_key"]: row["id"] for row in rows}
+
+
+def test_estimate_save_applies_a_line_key_diff(fake_db):
+    repo = EstimatesRepository(fake_db)
+    ItemsRepository(fake_db).add_item("REG001", "Regular", 92.5, "WT", 10.0)
+    ItemsRepository(fake_db).add_item("RET001", "Return", 90.0, "WT", 0.0)
+    lines = [
+        regular_item(line_key="a"),
+        regular_item(line_key="b", gross=20.0),
+        regular_item(line_key="c", gross=30.0),
+    ]
+    returns = [return_item(line_key="r")]
+    totals = estimate_totals(note="Diff")
+
+    def save(regular, returned=returns, saved_totals=totals):
+        assert repo.save_estimate_with_returns(
+            "700", "2026-01-01", 75000.0, regular, returned, saved_totals
+        )
+        return repo.last_save_stats
+
+    first = save(lines)
+    assert (first.lines_inserted, first.header_written) == (4, True)
+    original_ids = _line_ids(fake_db, "700")
+
+    repeat = save(lines)
+    assert repeat.rows_touched == 0
+    assert repeat.lines_unchanged == 4
+    assert _line_ids(fake_db, "700") == original_ids
+
+    edited = save([lines[0], regular_item(line_key="b", gross=21.0), lines[2]])
+    assert (edited.lines_updated, edited.rows_touched) == (1, 1)
+    assert _line_ids(fake_db, "700") == original_ids
+
+    trimmed = save(
+        [lines[0], regular_item(line_key="c", gross=30.0), regular_item(line_key="d")],
+        saved_totals=estimate_totals(note="Trimmed"),
+    )
+    assert trimmed.lines_deleted == 1
+    assert trimmed.lines_inserted == 1
+    assert trimmed.header_written is True
+    ids = _line_ids(fake_db, "700")
+    assert ids["a"] == original_ids["a"] and ids["c"] == original_ids["c"]
+    assert "b" not in ids
+
+    reordered = save(
+        [regular_item(line_key="d"), lines[0], regular_item(line_key="c", gross=30.0)],
+        saved_totals=estimate_totals(note="Trimmed"),
+    )
+    assert reordered.header_written is False
+    loaded = repo.get_estimate_by_voucher("700")
+    assert [row["line_key"] for row in loaded["items"]] == ["d", "a", "c", "r"]
+    assert loaded["header"]["note"] == "Trimmed"
+
+
+def test_estimate_save_with_silver_bars_commits_one_unit_of_work(fake_db):
+    fake_db.silver_bar_synchronization_repo = SilverBarSynchronizationRepository(
+        fake_db
+    )
+    repo = EstimatesRepository(fake_db)
+    ItemsRepository(fake_db).add_item("BAR001", "Bar", 99.0, "WT", 0.0)
+    bar_line = regular_item(code="BAR001", line_key="bar", is_silver_bar=True)
+    bars = [{"line_key": "bar", "weight": 9.0, "purity": 99.0}]
+
+    outcome = repo.save_estimate_with_silver_bars(
+        "710", "2026-01-01", 75000.0, [bar_line], [], estimate_totals(), bars
+    )
+
+    assert outcome.saved and outcome.error is None
+    assert (outcome.bars.added, outcome.bars.failed) == (1, 0)
+    assert list(outcome.phase_ms) == [
+        "validate",
+        "header",
+        "lines",
+        "silver_bars",
+        "commit",
+    ]
+    assert outcome.total_ms == pytest.approx(sum(outcome.phase_ms.values()))
+    assert repo.last_save_stats == outcome.stats
+
+    fake_db.conn.execute(
+        "CREATE TEMP TRIGGER reject_bar BEFORE INSERT ON silver_bars "
+        "BEGIN SELECT RAISE(ABORT, 'bar rejected'); END"
+    )
+    failed = repo.save_estimate_with_silver_bars(
+        "711", "2026-01-01", 75000.0, [bar_line], [], estimate_totals(), bars
+    )
+
+    assert not failed.saved
+    assert "bar rejected" in failed.error
+    assert fake_db.last_error == failed.error
+    assert repo.get_estimate_by_voucher("711") is None
+    assert fake_db.conn.in_transaction is False
+
+
 def test_estimates_repository_history_rows_include_regular_item_aggregates(fake_db):
     repo = EstimatesRepository(fake_db)
     items_repo = ItemsRepository(fake_db)
@@ -846,6 +1149,12 @@ def test_silver_bar_repository_available_page_and_history_search(fake_db):
     SilverBarSynchronizationRepository(fake_db)
     list_id = commands.create_list("Page List")
     assert list_id is not None
+    # Production connections enforce the bar -> estimate foreign key, which
+    # the indexed history search relies on.
+    fake_db.conn.executemany(
+        "INSERT INTO estimates (voucher_no, date) VALUES (?, '2026-01-01')",
+        (("PAGE1",), ("PAGE2",)),
+    )
 
     free_bar = commands.add_silver_bar("PAGE1", 10.0, 99.0)
     assigned_bar = commands.add_silver_bar("PAGE2", 11.0, 98.0)
@@ -894,6 +1203,175 @@ def test_silver_bar_repository_counts_rows_by_list_and_cycles_issue_state(fake_d
     assert {row["status"] for row in queries.get_bars_in_list(list_id)} == {"Assigned"}
 
 
+def _summary_matches_silver_bars(db) -> bool:
+    summary = db.conn.execute(
+        "SELECT status, list_id, bar_count, ROUND(total_weight, 6), "
+        "ROUND(total_fine_weight, 6) FROM silver_bar_summary ORDER BY 1, 2"
+    ).fetchall()
+    aggregate = db.conn.execute(
+        "SELECT COALESCE(status, ''), COALESCE(list_id, 0), COUNT(*), "
+        "ROUND(TOTAL(weight), 6), ROUND(TOTAL(fine_weight), 6) "
+        "FROM silver_bars GROUP BY 1, 2 ORDER BY 1, 2"
+    ).fetchall()
+    return [tuple(row) for row in summary] == [tuple(row) for row in aggregate]
+
+
+def test_silver_bar_summary_follows_bar_lifecycle(fake_db):
+    commands = SilverBarCommandRepository(fake_db)
+    queries = SilverBarQueryRepository(fake_db)
+    SilverBarSynchronizationRepository(fake_db)
+    list_id = commands.create_list("Summary List")
+    bar_ids = [
+        commands.add_silver_bar(f"SUM{idx}", weight, 99.0)
+        for idx, weight in enumerate((5.0, 7.5, 10.0))
+    ]
+    assert _summary_matches_silver_bars(fake_db)
+
+    available = queries.get_available_bars_totals()
+    assert available.bar_count == 3
+    assert available.total_weight == pytest.approx(22.5)
+    assert available.total_fine_weight == pytest.approx(22.275)
+
+    assert commands.assign_bars_to_list_bulk(bar_ids[:2], list_id)[0] == 2
+    assert queries.get_available_bars_totals().bar_count == 1
+    listed = queries.get_bars_in_list_totals(list_id)
+    assert (listed.bar_count, listed.total_weight) == (2, pytest.approx(12.5))
+    page = queries.get_bars_in_list_keyset_page(list_id, limit=1)
+    assert page.total == 2
+    assert page.totals == listed
+
+    assert commands.mark_list_as_issued(list_id, "2026-02-27 09:30:00")
+    inventory = queries.get_inventory_totals()
+    assert inventory["Issued"].bar_count == 2
+    assert inventory["In Stock"].bar_count == 1
+    assert queries.get_bars_in_list_totals(list_id).bar_count == 2
+
+    fake_db.conn.execute("DELETE FROM silver_bars WHERE bar_id = ?", (bar_ids[0],))
+    fake_db.conn.commit()
+    assert queries.count_bars_by_list_ids([list_id]) == {list_id: 1}
+    assert _summary_matches_silver_bars(fake_db)
+
+    filtered = queries.get_available_bars_totals(weight_query=10.0, weight_tolerance=0)
+    assert filtered.bar_count == 1
+    assert filtered.total_weight == pytest.approx(10.0)
+
+
+def test_silver_bar_summary_is_rebuilt_when_a_trigger_is_missing(fake_db):
+    commands = SilverBarCommandRepository(fake_db)
+    queries = SilverBarQueryRepository(fake_db)
+    fake_db.conn.execute(
+        "INSERT INTO estimates (voucher_no, date) VALUES ('REBUILD', '2026-07-19')"
+    )
+    fake_db.conn.execute("DROP TRIGGER trg_silver_bar_summary_insert")
+    fake_db.conn.commit()
+    commands.add_silver_bar("REBUILD", 4.0, 99.0)
+    assert queries.get_available_bars_totals().bar_count == 0
+
+    schema.run_schema_setup(fake_db)
+
+    assert queries.get_available_bars_totals().bar_count == 1
+    assert _summary_matches_silver_bars(fake_db)
+
+
+def _save_lines(repo, voucher_no: str, date: str, codes: list[str]) -> None:
+    assert repo.save_estimate_with_returns(
+        voucher_no=voucher_no,
+        date=date,
+        silver_rate=75000.0,
+        regular_items=[
+            regular_item(code=code, line_key=f"{voucher_no}-{index}")
+            for index, code in enumerate(codes)
+        ],
+        return_items=[],
+        totals=estimate_totals(),
+    )
+
+
+def _usage_matches_lines(db) -> bool:
+    stored = read_usage(db.cursor)
+    rebuild_usage(db.cursor)
+    rebuilt = read_usage(db.cursor)
+    db.conn.rollback()
+    return stored.keys() == rebuilt.keys() and all(
+        stored[code][0] == rebuilt[code][0]
+        and stored[code][1] == pytest.approx(rebuilt[code][1])
+        for code in stored
+    )
+
+
+def test_item_usage_follows_estimate_writes_and_ranks_selection(fake_db):
+    items_repo = ItemsRepository(fake_db)
+    repo = EstimatesRepository(fake_db)
+    for code in ("AD01", "AD02", "AD03", "ZZ01"):
+        items_repo.add_item(code, f"Item {code}", 91.5, "WT", 5.0)
+
+    _save_lines(repo, "1", "2025-01-01", ["ad03", "AD03", "AD02"])
+    _save_lines(repo, "2", "2025-05-01", ["AD01"])
+    assert read_usage(fake_db.cursor) == {
+        "AD01": (1, pytest.approx(usage_weight("2025-05-01"))),
+        "AD02": (1, pytest.approx(usage_weight("2025-01-01"))),
+        "AD03": (2, pytest.approx(2 * usage_weight("2025-01-01"))),
+    }
+    assert _usage_matches_lines(fake_db)
+
+    def selection(term: str) -> list[str]:
+        rows, _ = items_repo.search_items_for_selection(term, limit=10)
+        return [row["code"] for row in rows]
+
+    # Two half-lives later, one line outweighs the two older ones.
+    assert fake_db.item_cache_controller.searchable is False
+    assert selection("AD") == ["AD01", "AD03", "AD02"]
+    assert selection("") == ["AD01", "AD03", "AD02", "ZZ01"]
+
+    _save_lines(repo, "1", "2025-07-01", ["AD02", "ZZ01"])
+    assert set(read_usage(fake_db.cursor)) == {"AD01", "AD02", "ZZ01"}
+    assert _usage_matches_lines(fake_db)
+    assert selection("AD") == ["AD02", "AD01", "AD03"]
+
+    # The in-memory catalog picks up the same ranking from committed saves.
+    assert items_repo.upsert_item_catalog(
+        [dict(row) for row in fetch_item_catalog_rows(fake_db.cursor, "")]
+    )
+    assert fake_db.item_cache_controller.searchable is True
+    assert selection("AD") == ["AD02", "AD01", "AD03"]
+    assert selection("") == ["AD02", "ZZ01", "AD01", "AD03"]
+
+    assert repo.delete_single_estimate("1")
+    assert set(read_usage(fake_db.cursor)) == {"AD01"}
+    assert selection("") == ["AD01", "AD02", "AD03", "ZZ01"]
+    assert repo.delete_all_estimates()
+    assert read_usage(fake_db.cursor) == {}
+    assert selection("AD") == ["AD01", "AD02", "AD03"]
+
+
+def test_item_usage_is_rebuilt_when_the_table_is_missing(fake_db):
+    ItemsRepository(fake_db).add_item("AD01", "Item", 91.5, "WT", 5.0)
+    fake_db.conn.execute("DROP TABLE item_usage")
+    fake_db.conn.commit()
+    _save_lines(EstimatesRepository(fake_db), "1", "2025-01-01", ["AD01"])
+
+    schema.run_schema_setup(fake_db)
+
+    assert read_usage(fake_db.cursor) == {
+        "AD01": (1, pytest.approx(usage_weight("2025-01-01")))
+    }
+
+
+def test_item_usage_caps_the_weight_of_far_future_dates(fake_db):
+    ItemsRepository(fake_db).add_item("AD01", "Item", 91.5, "WT", 5.0)
+    repo = EstimatesRepository(fake_db)
+
+    _save_lines(repo, "1", "9999-12-31", ["AD01"])
+    _save_lines(repo, "2", "2300-01-01", ["AD01"])
+    schema.run_schema_setup(fake_db)
+
+    assert usage_weight("9999-12-31") == usage_weight("2300-01-01")
+    assert read_usage(fake_db.cursor) == {
+        "AD01": (2, pytest.approx(2 * usage_weight("9999-12-31")))
+    }
+    assert not fake_db.conn.in_transaction
+
+
 def test_estimate_repository_load_preserves_item_types(fake_db):
     repo = EstimatesRepository(fake_db)
     items_repo = ItemsRepository(fake_db)
@@ -1164,3 +1642,44 @@ def test_silver_bar_repository_exercises_edge_outcomes(fake_db) -> None:
         ],
     )
     assert (sync_result.added, sync_result.failed) == (1, 2)
+
+
+def test_repository_reads_are_cached_until_a_repository_write(fake_db):
+    fake_db.query_cache = QueryCache()
+    fake_db.invalidate_tables = fake_db.query_cache.invalidate
+    commands = SilverBarCommandRepository(fake_db)
+    queries = SilverBarQueryRepository(fake_db)
+    estimates = EstimatesRepository(fake_db)
+    list_id = commands.create_list("Cached")
+    bar_id = commands.add_silver_bar("400", 5.0, 99.0)
+    assert commands.assign_bar_to_list(bar_id, list_id)
+
+    assert len(queries.get_lists()) == 1
+    assert queries.count_bars_by_list_ids([list_id]) == {list_id: 1}
+    assert estimates.get_first_estimate_date() is None
+    # A write that bypasses the repositories is invisible until a bypass read.
+    fake_db.cursor.execute(
+        "INSERT INTO silver_bar_lists (list_identifier, creation_date) "
+        "VALUES ('L-RAW', '2026-01-01')"
+    )
+    fake_db.conn.commit()
+    assert len(queries.get_lists()) == 1
+    assert len(queries.get_lists(use_cache=False)) == 2
+    assert fake_db.query_cache.metrics().hits == 1
+
+    commands.create_list("After")
+    assert len(queries.get_lists()) == 3
+    assert queries.count_bars_by_list_ids([list_id]) == {list_id: 1}
+    assert commands.remove_bar_from_list(bar_id)
+    assert queries.count_bars_by_list_ids([list_id]) == {}
+
+    ItemsRepository(fake_db).add_item("REG001", "Cached Item", 92.5, "WT", 10.0)
+    assert estimates.save_estimate_with_returns(
+        "401",
+        "2026-02-03",
+        75000.0,
+        [regular_item(code="REG001", name="Cached Item")],
+        [],
+        estimate_totals(),
+    )
+    assert estimates.get_first_estimate_date() == "2026-02-03"
@@ -1,21 +1,40 @@
+import hashlib
+import json
+import os
 import threading
+import zipfile
 from pathlib import Path
 
 import pytest
 
 from silverestimate.persistence import database_driver
+from silverestimate.persistence.change_journal import ChangeJournalError
 from silverestimate.persistence.database_driver import (
     DatabaseAuthenticationError,
     DriverUnavailableError,
     MaintenanceBusyError,
+    SqlCipherConnectionBroker,
     export_database,
+    online_backup,
 )
 from silverestimate.persistence.database_manager import (
     DatabaseManager,
+    DatabaseOpenPath,
     DatabaseOpenStatus,
+    IntegrityState,
     MaintenanceStatus,
     StorageFormat,
 )
+from silverestimate.persistence.encrypted_backup import (
+    ESTIMATE_ARCHIVE_MEMBER,
+    BackupCancelledError,
+    BackupMode,
+)
+from silverestimate.persistence.estimates_repository import (
+    fetch_estimate_history_page,
+)
+from silverestimate.persistence.idle_maintenance import IdleMaintenancePolicy
+from silverestimate.persistence.integrity_verifier import IntegrityVerifier
 from silverestimate.persistence.storage_metadata import (
     BindingMigrationJournal,
     KdfMetadata,
@@ -26,6 +45,7 @@ from silverestimate.persistence.storage_metadata import (
     write_journal,
 )
 from silverestimate.security import encryption
+from tests.factories import estimate_totals, regular_item, silver_bar_item
 
 DEVICE_SECRET = b"S" * 32
 FOREIGN_DEVICE_SECRET = b"F" * 32
@@ -259,6 +279,611 @@ def test_encrypted_backup_rejects_a_foreign_device_secret(tmp_path):
         foreign.close()
 
 
+def test_encrypted_backup_streams_from_a_worker_and_can_be_cancelled(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"),
+        "password",
+        device_secret=DEVICE_SECRET,
+    )
+    phases: list[str] = []
+    outcomes: list[object] = []
+    try:
+        worker = threading.Thread(
+            target=lambda: outcomes.append(
+                manager.create_encrypted_backup(
+                    tmp_path / "worker.sedbbackup",
+                    progress=lambda phase, _done, _total: phases.append(phase),
+                )
+            )
+        )
+        worker.start()
+        worker.join(30)
+        (backup,) = outcomes
+        assert backup.status is MaintenanceStatus.SUCCESS
+        assert set(backup.phase_ms) == {"lock_wait", "export", "validate", "archive"}
+        assert phases[:2] == ["export", "validate"] and phases[-1] == "archive"
+        with zipfile.ZipFile(backup.path) as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            digest = hashlib.sha256(archive.read("database.sqlcipher")).hexdigest()
+        assert manifest["database_sha256"] == digest
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        cancelled = tmp_path / "cancelled.sedbbackup"
+        with pytest.raises(BackupCancelledError):
+            manager.create_encrypted_backup(cancelled, cancel_event=cancel_event)
+        assert not cancelled.exists()
+        assert not list(tmp_path.glob(".silverestimate-backup-*"))
+        assert manager.conn.execute("SELECT COUNT(*) FROM items").fetchone()
+    finally:
+        manager.close()
+
+
+def test_online_backup_copies_one_snapshot_while_writes_continue(tmp_path):
+    key, salt = b"K" * 32, b"S" * 16
+    source_broker = SqlCipherConnectionBroker(
+        tmp_path / "live.db", key, database_salt=salt
+    )
+    writer, _ = source_broker.open_writer(create=True)
+    writer.execute("CREATE TABLE payload(id INTEGER PRIMARY KEY, value BLOB)")
+    writer.executemany(
+        "INSERT INTO payload(value) VALUES (randomblob(4000))", [()] * 64
+    )
+    writer.commit()
+    target, _ = SqlCipherConnectionBroker(
+        tmp_path / "copy.db", key, database_salt=salt
+    ).open_writer(create=True)
+    reader = source_broker.open_read_connection()
+    steps: list[tuple[int, int]] = []
+
+    def write_between_steps(done: int, total: int) -> None:
+        steps.append((done, total))
+        writer.execute("INSERT INTO payload(value) VALUES (x'00')")
+        writer.commit()
+
+    try:
+        online_backup(
+            reader,
+            target,
+            pages_per_step=8,
+            step_sleep_s=0,
+            progress=write_between_steps,
+        )
+        assert len(steps) > 1 and steps[-1][0] == steps[-1][1]
+        assert target.execute("SELECT COUNT(*) FROM payload").fetchone()[0] == 64
+        assert target.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+    finally:
+        reader.close()
+        target.close()
+        writer.close()
+
+
+def test_online_encrypted_backup_restores_without_draining_readers(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    manager.conn.execute("INSERT INTO items(code,name) VALUES('ON1','Online')")
+    manager.conn.commit()
+    reader = manager.open_read_connection()
+    try:
+        backup = manager.create_encrypted_backup(
+            tmp_path / "online.sedbbackup", mode=BackupMode.ONLINE
+        )
+        assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] >= 1
+    finally:
+        reader.close()
+    assert backup.status is MaintenanceStatus.SUCCESS
+    assert backup.phase_ms["lock_wait"] == 0.0
+    manager.conn.execute("UPDATE items SET name='Changed' WHERE code='ON1'")
+    manager.conn.commit()
+    restore = manager.stage_encrypted_restore(backup.path, "password")
+    assert restore.status is MaintenanceStatus.STAGED_RESTART_REQUIRED
+    manager.close()
+
+    reopened = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        name = reopened.conn.execute(
+            "SELECT name FROM items WHERE code='ON1'"
+        ).fetchone()[0]
+        assert name == "Online"
+    finally:
+        reopened.close()
+
+
+def _journal_rows(manager, since=0):
+    return manager.conn.execute(
+        "SELECT table_name, row_key, op FROM change_journal "
+        "WHERE generation > ? ORDER BY generation",
+        (since,),
+    ).fetchall()
+
+
+def test_change_journal_records_row_changes_including_cascades(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"), "password", device_secret=DEVICE_SECRET
+    )
+    try:
+        start = manager.change_generation()
+        conn = manager.conn
+        conn.execute("INSERT INTO items(code,name) VALUES('J1','Journal')")
+        conn.execute("UPDATE items SET code='J2' WHERE code='J1'")
+        conn.execute("INSERT INTO estimates(voucher_no,date) VALUES('V1','2026-01-01')")
+        conn.execute(
+            "INSERT INTO estimate_items(id,voucher_no,item_code) VALUES(7,'V1','J2')"
+        )
+        conn.execute("DELETE FROM estimates WHERE voucher_no='V1'")
+        conn.commit()
+
+        rows = [tuple(row) for row in _journal_rows(manager, start)]
+        assert rows == [
+            ("items", "J1", "I"),
+            ("items", "J1", "D"),
+            ("items", "J2", "U"),
+            ("estimates", "V1", "I"),
+            ("estimate_items", 7, "I"),
+            ("estimate_items", 7, "D"),
+            ("estimates", "V1", "D"),
+        ]
+        assert manager.change_generation() == start + len(rows)
+    finally:
+        manager.close()
+
+
+def test_change_monitor_refreshes_caches_after_another_process_commits(tmp_path):
+    path = str(tmp_path / "estimation.db")
+    manager = DatabaseManager(path, "password", device_secret=DEVICE_SECRET)
+    other = None
+    try:
+        published = []
+        manager.change_monitor.subscribe(published.append)
+        assert manager.add_item("M1", "Mine", 90.0, "WT", 1.0).result(timeout=10)
+        assert manager.get_item_by_code("M1")["name"] == "Mine"
+        assert manager.change_monitor.poll() is None
+
+        other = DatabaseManager(path, "password", device_secret=DEVICE_SECRET)
+        assert other.add_item("O1", "Theirs", 80.0, "WT", 1.0).result(timeout=10)
+        assert other.update_item("M1", "Edited", 90.0, "WT", 1.0).result(timeout=10)
+        changes = manager.change_monitor.poll()
+
+        assert changes is not None
+        assert changes.tables == {"items"}
+        assert changes.item_codes == {"O1", "M1"}
+        assert published == [changes]
+        assert manager.get_item_by_code("M1")["name"] == "Edited"
+        assert manager.get_item_by_code("O1")["name"] == "Theirs"
+        assert manager.change_monitor.poll() is None
+    finally:
+        if other is not None:
+            other.close()
+        manager.close()
+
+
+def test_differential_backup_replays_changes_onto_a_restored_full_backup(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    conn = manager.conn
+    conn.execute("INSERT INTO items(code,name) VALUES('KEEP','Kept')")
+    conn.execute("INSERT INTO items(code,name) VALUES('GONE','Removed')")
+    conn.execute("INSERT INTO items(code,name) VALUES('EDIT','Before')")
+    conn.execute("INSERT INTO estimates(voucher_no,date) VALUES('V1','2026-01-01')")
+    conn.execute("INSERT INTO estimate_items(voucher_no,item_code) VALUES('V1','KEEP')")
+    conn.commit()
+    full = manager.create_encrypted_backup(tmp_path / "full.sedbbackup")
+    with zipfile.ZipFile(full.path) as archive:
+        base = json.loads(archive.read("manifest.json"))["change_generation"]
+    assert base == manager.change_generation()
+
+    conn.execute("UPDATE items SET name='After' WHERE code='EDIT'")
+    conn.execute("DELETE FROM items WHERE code='GONE'")
+    conn.execute("INSERT INTO items(code,name) VALUES('NEW','Added')")
+    conn.execute("INSERT INTO estimates(voucher_no,date) VALUES('V2','2026-01-02')")
+    conn.execute("INSERT INTO estimate_items(voucher_no,item_code) VALUES('V2','NEW')")
+    conn.commit()
+    expected = (
+        conn.execute("SELECT code, name FROM items ORDER BY code").fetchall(),
+        conn.execute(
+            "SELECT id, voucher_no, item_code FROM estimate_items ORDER BY id"
+        ).fetchall(),
+    )
+    generation = manager.change_generation()
+
+    differential = manager.create_differential_backup(
+        tmp_path / "changes.sedbbackup", base
+    )
+    assert differential.status is MaintenanceStatus.SUCCESS
+    assert set(differential.phase_ms) == {"export", "validate", "archive"}
+    with zipfile.ZipFile(differential.path) as archive:
+        assert "database.sqlcipher" not in archive.namelist()
+        manifest = json.loads(archive.read("manifest.json"))
+        assert b"Added" not in archive.read("changes.sqlcipher")
+    assert (manifest["base_generation"], manifest["generation"]) == (base, generation)
+    assert manifest["deleted_rows"] == 1
+
+    manager.stage_encrypted_restore(full.path, "password")
+    manager.close()
+    restored = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        assert restored.change_generation() == base
+        outcome = restored.apply_differential_backup(differential.path, "password")
+        assert outcome.status is MaintenanceStatus.SUCCESS
+        actual = (
+            restored.conn.execute(
+                "SELECT code, name FROM items ORDER BY code"
+            ).fetchall(),
+            restored.conn.execute(
+                "SELECT id, voucher_no, item_code FROM estimate_items ORDER BY id"
+            ).fetchall(),
+        )
+        assert [list(map(tuple, rows)) for rows in actual] == [
+            list(map(tuple, rows)) for rows in expected
+        ]
+        assert restored.change_generation() == generation
+        assert restored.conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        with pytest.raises(ChangeJournalError, match="already at generation"):
+            restored.apply_differential_backup(differential.path, "password")
+    finally:
+        restored.close()
+
+
+def test_differential_backup_refuses_pruned_or_unmatched_generations(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"), "password", device_secret=DEVICE_SECRET
+    )
+    try:
+        base = manager.change_generation()
+        manager.conn.execute("INSERT INTO items(code,name) VALUES('P1','One')")
+        manager.conn.commit()
+        middle = manager.change_generation()
+        manager.conn.execute("INSERT INTO items(code,name) VALUES('P2','Two')")
+        manager.conn.commit()
+        later = manager.create_differential_backup(
+            tmp_path / "later.sedbbackup", middle
+        )
+        fresh = DatabaseManager(
+            str(tmp_path / "fresh.db"), "password", device_secret=DEVICE_SECRET
+        )
+        try:
+            with pytest.raises(ChangeJournalError, match="apply the changes"):
+                fresh.apply_differential_backup(later.path, "password")
+            assert fresh.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        finally:
+            fresh.close()
+
+        assert manager.prune_change_journal(middle) == middle - base
+        with pytest.raises(ChangeJournalError, match="no longer journaled"):
+            manager.create_differential_backup(tmp_path / "stale.sedbbackup", base)
+        assert not (tmp_path / "stale.sedbbackup").exists()
+    finally:
+        manager.close()
+
+
+def _history_vouchers(manager, **filters):
+    reader = manager.open_read_connection()
+    try:
+        vouchers, page_cursor, total = [], None, None
+        while True:
+            page = fetch_estimate_history_page(
+                reader.cursor(), page_cursor=page_cursor, limit=1, **filters
+            )
+            total = page.total
+            vouchers.extend(row["voucher_no"] for row in page.items)
+            page_cursor = page.next_cursor
+            if page_cursor is None:
+                return vouchers, total
+    finally:
+        reader.close()
+
+
+def test_estimate_archive_moves_old_estimates_and_history_falls_through(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    conn = manager.conn
+    for voucher, date in (
+        ("1", "2020-01-01"),
+        ("2", "2020-02-01"),
+        ("3", "2026-01-01"),
+    ):
+        conn.execute(
+            "INSERT INTO estimates(voucher_no,voucher_no_int,date,note) "
+            "VALUES(?,?,?,'ArchivedCanary')",
+            (voucher, int(voucher), date),
+        )
+        conn.execute(
+            "INSERT INTO estimate_items(voucher_no,item_name,gross) VALUES(?,'Line',5)",
+            (voucher,),
+        )
+    conn.execute(
+        "INSERT INTO silver_bars(bar_id,estimate_voucher_no,weight,status) "
+        "VALUES(20,'2',2.0,'In Stock')"
+    )
+    conn.commit()
+    try:
+        assert manager.get_first_estimate_date() == "2020-01-01"
+        outcome = manager.archive_estimates_before("2025-01-01")
+        assert outcome.status is MaintenanceStatus.SUCCESS
+        assert manager.get_first_estimate_date() == "2020-01-01"
+        archive = manager.estimate_archive_path
+        assert archive.exists() and b"ArchivedCanary" not in archive.read_bytes()
+        live = conn.execute("SELECT voucher_no FROM estimates ORDER BY 1").fetchall()
+        assert [row[0] for row in live] == ["2", "3"]
+        assert conn.execute("SELECT bar_id FROM silver_bars").fetchone()[0] == 20
+
+        assert _history_vouchers(manager) == (["3", "2", "1"], 3)
+        assert _history_vouchers(manager, date_to="2020-01-31") == (["1"], 1)
+        archived = manager.get_estimate_by_voucher("1")
+        assert archived["header"]["date"] == "2020-01-01"
+        assert [item["item_name"] for item in archived["items"]] == ["Line"]
+
+        assert manager.change_passwords("new-password").status is (
+            MaintenanceStatus.SUCCESS
+        )
+        conn = manager.conn
+        conn.execute("DELETE FROM estimates WHERE voucher_no IN ('2','3')")
+        conn.commit()
+        assert manager.get_estimate_by_voucher("1") is not None
+        assert manager.generate_voucher_no() == "2"
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+        assert _history_vouchers(manager, voucher_search="1") == (["1"], 1)
+        assert _history_vouchers(
+            manager, date_from="2020-01-01", date_to="2020-12-31", voucher_search="1"
+        ) == (["1"], 1)
+    finally:
+        manager.close()
+
+
+def test_archived_estimates_are_read_only(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"), "password", device_secret=DEVICE_SECRET
+    )
+    conn = manager.conn
+    conn.execute(
+        "INSERT INTO items(code,name,purity,wage_type,wage_rate) "
+        "VALUES('BAR001','Bar',99.0,'WT',0)"
+    )
+    conn.execute(
+        "INSERT INTO estimates(voucher_no,voucher_no_int,date) "
+        "VALUES('1',1,'2020-01-01')"
+    )
+    conn.commit()
+    line = silver_bar_item(line_key="bar")
+    try:
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+        saved = manager.save_estimate_with_silver_bars(
+            "1",
+            "2020-01-01",
+            75000.0,
+            [line],
+            [],
+            estimate_totals(),
+            [{"line_key": "bar", "weight": 9.0, "purity": 99.0}],
+        ).result(timeout=10)
+
+        assert not saved.saved and "archived and read-only" in saved.error
+        assert "archived" in manager.last_error
+        assert conn.execute("SELECT COUNT(*) FROM estimates").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM silver_bars").fetchone()[0] == 0
+        assert manager.get_estimate_by_voucher("1")["header"]["date"] == "2020-01-01"
+        assert (
+            manager.save_estimate_with_silver_bars(
+                "2", "2026-01-01", 75000.0, [line], [], estimate_totals()
+            )
+            .result(timeout=10)
+            .saved
+        )
+    finally:
+        manager.close()
+
+
+def test_estimate_deletes_reach_the_archive(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"), "password", device_secret=DEVICE_SECRET
+    )
+    conn = manager.conn
+    for voucher, date in (
+        ("1", "2020-01-01"),
+        ("2", "2020-02-01"),
+        ("3", "2026-01-01"),
+    ):
+        conn.execute(
+            "INSERT INTO estimates(voucher_no,voucher_no_int,date) VALUES(?,?,?)",
+            (voucher, int(voucher), date),
+        )
+    conn.commit()
+    try:
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+        assert manager.delete_single_estimate("1").result(timeout=10)
+        assert manager.get_estimate_by_voucher("1") is None
+        assert _history_vouchers(manager) == (["3", "2"], 2)
+        assert not manager.delete_single_estimate("1").result(timeout=10)
+
+        archive = manager.estimate_archive_path
+        assert manager.delete_all_estimates().result(timeout=10)
+        assert not archive.exists()
+        assert _history_vouchers(manager) == ([], 0)
+        assert manager.generate_voucher_no() == "1"
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+    finally:
+        manager.close()
+
+
+def test_estimate_archive_keeps_estimates_whose_bars_are_on_issued_lists(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"), "password", device_secret=DEVICE_SECRET
+    )
+    manager.conn.execute(
+        "INSERT INTO items(code,name,purity,wage_type,wage_rate) "
+        "VALUES('BAR001','Bar',99.0,'WT',0),('REG001','Regular',92.5,'WT',10)"
+    )
+    manager.conn.commit()
+    line = silver_bar_item(line_key="bar")
+    try:
+        assert (
+            manager.save_estimate_with_silver_bars(
+                "1",
+                "2020-01-01",
+                75000.0,
+                [line],
+                [],
+                estimate_totals(),
+                [{"line_key": "bar", "weight": 9.0, "purity": 99.0}],
+            )
+            .result(timeout=10)
+            .saved
+        )
+        assert (
+            manager.save_estimate_with_silver_bars(
+                "2", "2020-02-01", 75000.0, [regular_item()], [], estimate_totals()
+            )
+            .result(timeout=10)
+            .saved
+        )
+        bar_ids = [bar["bar_id"] for bar in manager.get_silver_bars()]
+        list_id = manager.create_silver_bar_list("Old list").result(timeout=10)
+        assert manager.assign_bars_to_list_bulk(bar_ids, list_id).result(timeout=10)
+        assert manager.mark_silver_bar_list_as_issued(list_id).result(timeout=10)
+        history_before = manager.search_silver_bar_history()
+        totals_before = manager.get_silver_bars_in_list_totals(list_id)
+
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+
+        live = manager.conn.execute("SELECT voucher_no FROM estimates").fetchall()
+        assert [row[0] for row in live] == ["1"]
+        listed = manager.get_bars_in_list(list_id)
+        assert [bar["bar_id"] for bar in listed] == bar_ids
+        assert manager.get_silver_bars_in_list_totals(list_id) == totals_before
+        history = manager.search_silver_bar_history()
+        assert [bar["bar_id"] for bar in history] == [
+            bar["bar_id"] for bar in history_before
+        ]
+        assert manager.count_silver_bars_by_list_ids([list_id], use_cache=False) == {
+            list_id: len(bar_ids)
+        }
+        assert _history_vouchers(manager) == (["2", "1"], 2)
+    finally:
+        manager.close()
+
+
+@pytest.mark.parametrize("mode", [BackupMode.EXPORT, BackupMode.ONLINE])
+def test_encrypted_backups_carry_the_estimate_archive(tmp_path, mode):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    for voucher, date in (("1", "2020-01-01"), ("2", "2026-01-01")):
+        manager.conn.execute(
+            "INSERT INTO estimates(voucher_no,voucher_no_int,date) VALUES(?,?,?)",
+            (voucher, int(voucher), date),
+        )
+    manager.conn.commit()
+    before = manager.create_encrypted_backup(tmp_path / "before.sedbbackup", mode=mode)
+    assert manager.archive_estimates_before("2025-01-01").status is (
+        MaintenanceStatus.SUCCESS
+    )
+    after = manager.create_encrypted_backup(tmp_path / "after.sedbbackup", mode=mode)
+    with zipfile.ZipFile(before.path) as archive:
+        assert ESTIMATE_ARCHIVE_MEMBER not in archive.namelist()
+    with zipfile.ZipFile(after.path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        digest = hashlib.sha256(archive.read(ESTIMATE_ARCHIVE_MEMBER)).hexdigest()
+    assert manifest["estimate_archive_sha256"] == digest
+
+    assert manager.delete_single_estimate("1").result(timeout=10)
+    manager.stage_encrypted_restore(after.path, "password")
+    manager.close()
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        assert manager.open_status is DatabaseOpenStatus.RESTORE_ACTIVATED
+        assert manager.get_estimate_by_voucher("1")["header"]["date"] == "2020-01-01"
+        manager.stage_encrypted_restore(before.path, "password")
+    finally:
+        manager.close()
+
+    # A backup from before archiving must not inherit an archive it has no key for.
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        assert not manager.estimate_archive_path.exists()
+        assert path.with_suffix(".pre-restore.archive.sqlcipher").exists()
+        assert manager.conn.execute("SELECT COUNT(*) FROM estimates").fetchone()[0] == 2
+        assert manager.archive_estimates_before("2025-01-01").status is (
+            MaintenanceStatus.SUCCESS
+        )
+    finally:
+        manager.close()
+
+
+def test_idle_maintenance_checkpoints_wal_and_refreshes_statistics(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    conn = manager.conn
+    conn.executemany(
+        "INSERT INTO items(code,name,purity,wage_type,wage_rate) "
+        "VALUES(?,?,92.5,'WT',10)",
+        [(f"I{index:04d}", f"Item {index}") for index in range(500)],
+    )
+    conn.commit()
+    policy = IdleMaintenancePolicy(
+        passive_checkpoint_pages=1, restart_checkpoint_pages=1
+    )
+    try:
+        cancelled = threading.Event()
+        cancelled.set()
+        skipped = manager.run_idle_maintenance(cancelled, policy=policy, force=True)
+        assert skipped is not None and skipped.tasks == ()
+        assert {"optimize", "analyze"} <= set(skipped.skipped)
+
+        report = manager.run_idle_maintenance(policy=policy, force=True)
+        assert report is not None
+        assert {"checkpoint_passive", "optimize", "analyze"} <= set(report.tasks)
+        assert report.wal_bytes_before > 0 and report.wal_frames > 0
+        assert report.checkpoint_mode in {"passive", "restart"}
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'items'"
+        ).fetchone()[0]
+
+        quiet = manager.run_idle_maintenance(policy=policy)
+        assert quiet is not None
+        assert "optimize" not in quiet.tasks and "analyze" not in quiet.tasks
+    finally:
+        manager.close()
+
+
+def test_idle_maintenance_prunes_journal_rows_past_the_retention_window(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    conn = manager.conn
+    conn.executemany(
+        "INSERT INTO items(code,name,purity,wage_type,wage_rate) "
+        "VALUES(?,?,92.5,'WT',10)",
+        [(f"I{index:04d}", f"Item {index}") for index in range(50)],
+    )
+    conn.commit()
+    policy = IdleMaintenancePolicy(journal_retention_generations=10)
+    try:
+        generation = manager.change_generation()
+        report = manager.run_idle_maintenance(policy=policy)
+        assert report is not None and "prune_journal" in report.tasks
+        assert report.journal_rows_pruned == generation - 10
+        assert tuple(
+            conn.execute(
+                "SELECT MIN(generation), COUNT(*) FROM change_journal"
+            ).fetchone()
+        ) == (generation - 9, 10)
+
+        quiet = manager.run_idle_maintenance(policy=policy)
+        assert quiet is not None and "prune_journal" not in quiet.tasks
+        with pytest.raises(ChangeJournalError, match="no longer journaled"):
+            manager.create_differential_backup(tmp_path / "stale.sedbbackup", 0)
+    finally:
+        manager.close()
+
+
 def test_maintenance_blocks_new_readers_until_existing_reader_drains(tmp_path):
     manager = DatabaseManager(
         str(tmp_path / "estimation.db"),
@@ -277,6 +902,167 @@ def test_maintenance_blocks_new_readers_until_existing_reader_drains(tmp_path):
         manager.close()
 
 
+def test_reader_pool_reuses_keyed_connections_and_drains_on_maintenance(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"),
+        "password",
+        device_secret=DEVICE_SECRET,
+    )
+    try:
+        first = manager.open_read_connection(threading.Event())
+        raw = first._connection
+        first.close()
+        first.close()
+        second = manager.open_read_connection(threading.Event())
+        assert second._connection is raw
+        assert second.execute("SELECT count(*) FROM items").fetchone()[0] == 0
+        second.close()
+
+        metrics = manager._broker.reader_pool_metrics()
+        assert (metrics.hits, metrics.misses, metrics.idle) == (1, 1, 1)
+        assert metrics.hit_rate == 0.5
+        assert metrics.checkout_max_ms >= metrics.checkout_p95_ms >= 0.0
+
+        with manager._broker.maintenance():
+            assert manager._broker.reader_pool_metrics().idle == 0
+        third = manager.open_read_connection(threading.Event())
+        assert third._connection is not raw
+        third.close()
+    finally:
+        manager.close()
+    assert manager._broker.reader_pool_metrics().idle == 0
+
+
+def test_reader_pool_discards_readers_checked_out_before_key_replacement(tmp_path):
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"),
+        "password",
+        device_secret=DEVICE_SECRET,
+    )
+    try:
+        reader = manager.open_read_connection(threading.Event())
+        manager._broker.replace_key(manager.key, database_salt=manager.database_salt)
+        reader.close()
+        metrics = manager._broker.reader_pool_metrics()
+        assert (metrics.idle, metrics.active, metrics.discarded) == (0, 0, 1)
+    finally:
+        manager.close()
+
+
+def test_statement_stats_time_writer_and_reader_statements(tmp_path, monkeypatch):
+    monkeypatch.setenv("SILVER_SQL_STATS", "1")
+    manager = DatabaseManager(
+        str(tmp_path / "estimation.db"),
+        "password",
+        device_secret=DEVICE_SECRET,
+    )
+    try:
+        assert manager.add_item("SQL1", "Timed", 92.5, "WT", 5.0).result(timeout=10)
+        reader = manager.open_read_connection(threading.Event())
+        try:
+            reader.execute("SELECT code FROM items WHERE code = ?", ("SQL1",))
+            assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+        finally:
+            reader.close()
+        target, _ = SqlCipherConnectionBroker(
+            tmp_path / "copy.db", manager.key, database_salt=manager.database_salt
+        ).open_writer(create=True)
+        try:
+            online_backup(manager.conn, target, step_sleep_s=0)
+            assert target.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+        finally:
+            target.close()
+
+        shapes = {stat.sql: stat for stat in manager.statement_stats()}
+        assert shapes["SELECT COUNT(*) FROM items"].calls == 1
+        assert shapes["SELECT code FROM items WHERE code = ?"].calls == 1
+        assert any(sql.startswith("INSERT INTO items") for sql in shapes)
+    finally:
+        manager.close()
+
+
+def test_clean_close_fingerprint_enables_fast_open_with_deferred_verification(
+    tmp_path,
+):
+    path = tmp_path / "estimation.db"
+    fingerprint = path.with_suffix(".open.json")
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    assert manager.open_path is DatabaseOpenPath.FULL
+    assert manager.integrity_status.state is IntegrityState.VERIFIED
+    manager.close()
+    assert fingerprint.is_file()
+
+    reopened = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        assert reopened.open_path is DatabaseOpenPath.FAST
+        assert reopened.integrity_verification_pending
+        assert not fingerprint.exists()
+        result = reopened.verify_integrity(threading.Event())
+        assert result.state is IntegrityState.VERIFIED
+        assert result.checked_utc
+        assert not reopened.integrity_verification_pending
+    finally:
+        reopened.close()
+    assert fingerprint.is_file()
+
+
+def test_open_fingerprint_mismatch_or_unverified_session_forces_full_open(tmp_path):
+    path = tmp_path / "estimation.db"
+    fingerprint = path.with_suffix(".open.json")
+    DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET).close()
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    assert changed.open_path is DatabaseOpenPath.FULL
+    changed.close()
+
+    fast = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    assert fast.open_path is DatabaseOpenPath.FAST
+    fast.close()
+    assert not fingerprint.exists()
+
+    full = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        assert full.open_path is DatabaseOpenPath.FULL
+    finally:
+        full.close()
+
+
+def test_integrity_verifier_checks_bounded_slices_and_resumes(tmp_path):
+    path = tmp_path / "estimation.db"
+    manager = DatabaseManager(str(path), "password", device_secret=DEVICE_SECRET)
+    try:
+        verifier = IntegrityVerifier(
+            manager.open_read_connection,
+            tmp_path / "progress.json",
+            slice_pause_seconds=0,
+        )
+        paused = verifier.run(threading.Event(), max_slices=2)
+        assert paused.state is IntegrityState.PENDING
+        first = verifier.progress()
+        assert first.last_slice is not None
+        assert first.cycle_started_utc is not None
+
+        with manager._broker.maintenance():
+            deferred = verifier.run(threading.Event())
+        assert deferred.state is IntegrityState.PENDING
+        assert verifier.progress().last_slice == first.last_slice
+
+        cancelled = threading.Event()
+        cancelled.set()
+        assert verifier.run(cancelled).state is IntegrityState.PENDING
+
+        completed = verifier.run(threading.Event())
+        assert completed.state is IntegrityState.VERIFIED
+        progress = verifier.progress()
+        assert progress.last_slice is None
+        assert progress.last_completed_utc == completed.checked_utc
+        assert manager.integrity_progress().last_completed_utc is not None
+    finally:
+        manager.close()
+
+
 def test_kdf_metadata_requires_exact_version_one_policy():
     metadata = KdfMetadata.create()
     assert len(metadata.salt) == 16
@@ -0,0 +1,105 @@
+import logging
+
+from sqlcipher3 import dbapi2 as sqlite3
+
+from silverestimate.persistence.statement_stats import (
+    StatementStats,
+    normalize_sql,
+    parameter_shape,
+    statement_stats_from_environment,
+    unwrap_connection,
+)
+
+
+def _instrumented(stats: StatementStats):
+    connection = stats.instrument(sqlite3.connect(":memory:"))
+    connection.row_factory = sqlite3.Row
+    connection.execute("CREATE TABLE bars(bar_id INTEGER PRIMARY KEY, note TEXT)")
+    connection.executemany(
+        "INSERT INTO bars(note) VALUES (?)", [(f"bar {index}",) for index in range(5)]
+    )
+    stats.reset()
+    return connection
+
+
+def test_statement_shapes_drop_literals_and_bound_values():
+    assert (
+        normalize_sql(
+            "SELECT *  FROM bars\n WHERE note = 'x''y' AND bar_id IN (?, ?,?) LIMIT 50"
+        )
+        == "SELECT * FROM bars WHERE note = ? AND bar_id IN (?...) LIMIT ?"
+    )
+    assert normalize_sql("SELECT idx_2 FROM t WHERE w > -1.5") == (
+        "SELECT idx_2 FROM t WHERE w > ?"
+    )
+    assert parameter_shape(("secret", 7, None, 1.5)) == "(str, int, None, float)"
+    assert parameter_shape({"voucher": "A1"}) == "{voucher: str}"
+
+
+def test_instrumented_cursors_record_calls_rows_and_latency():
+    stats = StatementStats(slow_ms=10_000)
+    connection = _instrumented(stats)
+
+    assert connection.row_factory is sqlite3.Row
+    rows = connection.execute("SELECT * FROM bars WHERE bar_id > ?", (0,)).fetchall()
+    assert rows[0]["note"] == "bar 0"
+    for bar_id in (1, 2):
+        cursor = connection.cursor()
+        assert [
+            row["bar_id"]
+            for row in cursor.execute(
+                "SELECT bar_id FROM bars WHERE bar_id >= ?", (bar_id,)
+            )
+        ] == list(range(bar_id, 6))
+    # A cursor dropped after one row still reports its statement.
+    assert connection.execute("SELECT COUNT(*) FROM bars").fetchone()[0] == 5
+    connection.execute("UPDATE bars SET note = 'moved' WHERE bar_id IN (1, 2, 3)")
+
+    by_shape = {stat.sql: stat for stat in stats.snapshot()}
+    assert by_shape["SELECT * FROM bars WHERE bar_id > ?"].rows == 5
+    iterated = by_shape["SELECT bar_id FROM bars WHERE bar_id >= ?"]
+    assert (iterated.calls, iterated.rows) == (2, 9)
+    assert by_shape["SELECT COUNT(*) FROM bars"].calls == 1
+    assert by_shape["UPDATE bars SET note = ? WHERE bar_id IN (?...)"].rows == 3
+    for stat in by_shape.values():
+        assert stat.max_ms >= stat.p95_ms >= 0.0 and stat.slow == 0
+    assert unwrap_connection(connection) is connection._connection
+
+
+def test_cursors_collected_while_the_lock_is_held_do_not_deadlock():
+    stats = StatementStats(slow_ms=10_000)
+    connection = _instrumented(stats)
+    cursor = connection.execute("SELECT COUNT(*) FROM bars")
+
+    # Garbage collection can finalize a cursor inside snapshot()'s lock.
+    with stats._lock:
+        del cursor
+
+    [stat] = stats.snapshot()
+    assert (stat.sql, stat.calls) == ("SELECT COUNT(*) FROM bars", 1)
+
+
+def test_slow_statements_are_logged_by_shape_without_values(caplog):
+    stats = StatementStats(slow_ms=0.0, logger=logging.getLogger("sql-test"))
+    connection = _instrumented(stats)
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="sql-test"):
+        connection.execute(
+            "SELECT note FROM bars WHERE note = ?", ("customer secret",)
+        ).fetchall()
+
+    [record] = [r for r in caplog.records if "slow_statement_ms" in r.getMessage()]
+    message = record.getMessage()
+    assert "params=(str)" in message
+    assert "sql=SELECT note FROM bars WHERE note = ?" in message
+    assert "customer secret" not in message
+    assert stats.snapshot()[0].slow == 1
+
+
+def test_statement_stats_are_opt_in_from_the_environment():
+    assert statement_stats_from_environment({}) is None
+    enabled = statement_stats_from_environment(
+        {"SILVER_SQL_STATS": "1", "SILVER_SQL_SLOW_MS": "25"}
+    )
+    assert enabled is not None and enabled.slow_ms == 25.0
@@ -1,7 +1,9 @@
 import logging
 import types
+from concurrent.futures import Future
 from typing import Any
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.services import main_commands
 
 
@@ -431,7 +433,9 @@ def test_restore_item_catalog_success_refreshes_visible_item_master(monkeypatch)
 
     def _import_item_catalog(db, file_path, *, replace_existing=False):
         import_calls.append((db, file_path, replace_existing))
-        return {"total": 4, "inserted": 1, "updated": 2, "deleted": 1}
+        return settled_future(
+            lambda: {"total": 4, "inserted": 1, "updated": 2, "deleted": 1}
+        )
 
     monkeypatch.setitem(
         __import__("sys").modules,
@@ -486,13 +490,40 @@ def test_restore_item_catalog_handles_import_failure(monkeypatch):
     assert any(args[1] == "Restore Failed" for args in _MessageBoxStub.critical_calls)
 
 
+def test_restore_item_catalog_reports_a_failed_write(monkeypatch):
+    _install_stubs(monkeypatch)
+    _FileDialogStub.next_open_result = ("backup.seitems.json", "Silver Estimate")
+    _MessageBoxInstanceStub.return_value = _MessageBoxStub.Yes
+
+    def _import_item_catalog(db, file_path, *, replace_existing=False):
+        def fail():
+            raise RuntimeError("write failed")
+
+        return settled_future(fail)
+
+    monkeypatch.setitem(
+        __import__("sys").modules,
+        "silverestimate.services.item_catalog_transfer",
+        types.SimpleNamespace(
+            ITEM_CATALOG_FILE_FILTER="filter",
+            import_item_catalog=_import_item_catalog,
+        ),
+    )
+
+    commands = _make_commands(db_manager=object())
+    commands.restore_item_catalog()
+
+    assert any(args[1] == "Restore Failed" for args in _MessageBoxStub.critical_calls)
+    assert not _MessageBoxStub.information_calls
+
+
 def test_delete_all_estimates_clears_form(monkeypatch):
     _install_stubs(monkeypatch)
     _MessageBoxStub.return_warning = _MessageBoxStub.Yes
 
     class _DB:
         def delete_all_estimates(self):
-            return True
+            return settled_future(lambda: True)
 
     clear_calls: list[bool] = []
 
@@ -511,13 +542,43 @@ def test_delete_all_estimates_clears_form(monkeypatch):
     assert any(args[1] == "Success" for args in _MessageBoxStub.information_calls)
 
 
+def test_delete_all_estimates_clears_form_once_the_write_settles(monkeypatch):
+    _install_stubs(monkeypatch)
+    _MessageBoxStub.return_warning = _MessageBoxStub.Yes
+    pending: Future[bool] = Future()
+
+    class _DB:
+        def delete_all_estimates(self):
+            return pending
+
+    clear_calls: list[bool] = []
+
+    class _EstimateWidget:
+        def clear_form(self, confirm=True):
+            clear_calls.append(confirm)
+
+    commands = _make_commands(
+        types.SimpleNamespace(estimate_widget=_EstimateWidget()),
+        db_manager=_DB(),
+    )
+
+    outcome = commands.delete_all_estimates()
+
+    assert outcome.status is main_commands.MainCommandStatus.STARTED
+    assert clear_calls == []
+
+    pending.set_result(True)
+
+    assert clear_calls == [False]
+
+
 def test_delete_all_estimates_handles_database_failure(monkeypatch):
     _install_stubs(monkeypatch)
     _MessageBoxStub.return_warning = _MessageBoxStub.Yes
 
     class _DB:
         def delete_all_estimates(self):
-            return False
+            return settled_future(lambda: False)
 
     commands = _make_commands(db_manager=_DB())
 
@@ -532,7 +593,7 @@ def test_delete_all_estimates_handles_clear_form_exception(monkeypatch):
 
     class _DB:
         def delete_all_estimates(self):
-            return True
+            return settled_future(lambda: True)
 
     class _EstimateWidget:
         def clear_form(self, confirm=True):
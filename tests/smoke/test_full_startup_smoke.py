@@ -400,8 +400,12 @@ def _seed_smoke_database(db_manager) -> None:
     )
     active_bar_id = db_manager.silver_bar_command_repo.add_silver_bar("2", 35.0, 99.5)
     issued_bar_id = db_manager.silver_bar_command_repo.add_silver_bar("2", 25.0, 99.0)
-    active_list_id = db_manager.create_silver_bar_list("Smoke active list")
-    issued_list_id = db_manager.create_silver_bar_list("Smoke issued list")
+    active_list_id = db_manager.create_silver_bar_list("Smoke active list").result(
+        timeout=10
+    )
+    issued_list_id = db_manager.create_silver_bar_list("Smoke issued list").result(
+        timeout=10
+    )
     assert available_bar_id is not None
     assert active_bar_id is not None
     assert issued_bar_id is not None
@@ -411,16 +415,16 @@ def _seed_smoke_database(db_manager) -> None:
         active_bar_id,
         active_list_id,
         note="Smoke active assignment",
-    )
+    ).result(timeout=10)
     assert db_manager.assign_bar_to_list(
         issued_bar_id,
         issued_list_id,
         note="Smoke issued assignment",
-    )
+    ).result(timeout=10)
     assert db_manager.mark_silver_bar_list_as_issued(
         issued_list_id,
         issued_date="2026-01-18 09:00:00",
-    )
+    ).result(timeout=10)
 
     deterministic_updates = (
         (
@@ -7,6 +7,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QLineEdit
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.estimate_entry import EstimateEntryWidget
 from silverestimate.ui.estimate_entry_logic import (
     COL_CODE,
@@ -43,7 +44,7 @@ def fake_db():
             return True
 
         def delete_all_estimates(self):
-            return True
+            return settled_future(lambda: True)
 
         def get_item_by_code(self, code):
             return {"wage_type": "WT", "wage_rate": 10}
@@ -78,33 +79,21 @@ class _RepositoryStub:
             rows[str(code or "").strip().upper()] = item
         return rows
 
-    def save_estimate(
-        self, voucher_no, date, silver_rate, regular_items, return_items, totals
+    def save_estimate_with_silver_bars(
+        self, voucher_no, date, silver_rate, regular_items, return_items, totals, bars
     ):
-        saver = getattr(self.db, "save_estimate_with_returns", None)
-        if callable(saver):
-            return bool(
-                saver(
-                    voucher_no,
-                    date,
-                    silver_rate,
-                    list(regular_items or []),
-                    list(return_items or []),
-                    dict(totals or {}),
-                )
+        return settled_future(
+            lambda: types.SimpleNamespace(
+                saved=True, bars=None, phase_ms={}, error=None
             )
-        return True
-
-    def sync_silver_bars_for_estimate(self, voucher_no, bars):
-        syncer = getattr(self.db, "sync_silver_bars_for_estimate", None)
-        if callable(syncer):
-            added, failed = syncer(voucher_no, list(bars or []))
-            return int(added or 0), int(failed or 0)
-        return 0, len(list(bars or []))
+        )
 
     def last_error(self):
         return getattr(self.db, "last_error", None)
 
+    def delete_estimate(self, voucher_no):
+        return settled_future(lambda: True)
+
 
 def _make_widget(db_manager):
     """Create a widget instance for testing."""
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from silverestimate.domain.estimate_models import EstimateLineCategory
+from silverestimate.infrastructure.write_futures import map_future, settled_future
 from silverestimate.persistence.database_manager import DatabaseManager
 from silverestimate.presenter.estimate_entry_presenter import LoadedEstimate, SaveItem
 from silverestimate.ui.estimate_entry import EstimateEntryWidget
@@ -51,7 +52,7 @@ def fake_db(tmp_path):
             return True
 
         def delete_all_estimates(self):
-            return True
+            return settled_future(lambda: True)
 
         def get_item_by_code(self, code):
             return {"wage_type": "WT", "wage_rate": 10}
@@ -118,38 +119,24 @@ class _RepositoryStub:
             rows[str(code or "").strip().upper()] = item
         return rows
 
-    def save_estimate(
-        self, voucher_no, date, silver_rate, regular_items, return_items, totals
+    def save_estimate_with_silver_bars(
+        self, voucher_no, date, silver_rate, regular_items, return_items, totals, bars
     ):
-        saver = getattr(self.db, "save_estimate_with_returns", None)
-        if callable(saver):
-            return bool(
-                saver(
-                    voucher_no,
-                    date,
-                    silver_rate,
-                    list(regular_items or []),
-                    list(return_items or []),
-                    dict(totals or {}),
-                )
-            )
-        return True
-
-    def sync_silver_bars_for_estimate(self, voucher_no, bars):
-        syncer = getattr(self.db, "sync_silver_bars_for_estimate", None)
-        if callable(syncer):
-            added, failed = syncer(voucher_no, list(bars or []))
-            return int(added or 0), int(failed or 0)
-        return 0, len(list(bars or []))
+        return self.db.save_estimate_with_silver_bars(
+            voucher_no,
+            date,
+            silver_rate,
+            list(regular_items or []),
+            list(return_items or []),
+            dict(totals or {}),
+            list(bars or []),
+        )
 
     def last_error(self):
         return getattr(self.db, "last_error", None)
 
     def delete_estimate(self, voucher_no):
-        deleter = getattr(self.db, "delete_single_estimate", None)
-        if callable(deleter):
-            return bool(deleter(voucher_no))
-        return True
+        return map_future(self.db.delete_single_estimate(voucher_no), bool)
 
 
 def _make_widget(db_manager):
@@ -169,6 +156,14 @@ def _pump_events(wait_ms: int = 20) -> None:
     loop.exec()
 
 
+def _pump_events_until(condition, timeout_ms: int = 5000) -> None:
+    for _ in range(timeout_ms // 20):
+        if condition():
+            return
+        _pump_events()
+    assert condition()
+
+
 def _find_named_widget(root: QWidget, object_name: str) -> QWidget | None:
     for child in root.findChildren(QWidget):
         if child.objectName() == object_name:
@@ -544,6 +539,7 @@ def test_widget_save_and_reload(qt_app, tmp_path, settings_stub, monkeypatch):
 
     widget.workflow_controller.print_estimate = lambda: None
     widget.save_estimate()
+    _pump_events_until(lambda: not widget.workflow_controller._saving)
 
     widget_loaded = _make_widget(manager)
     widget_loaded.voucher_edit.setText("SAVE01")
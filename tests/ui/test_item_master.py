@@ -1,10 +1,12 @@
 import sqlite3
 import time
 import types
+from concurrent.futures import Future
 
 from PySide6.QtCore import QItemSelectionModel
 
 from silverestimate.domain.pagination import Page
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.item_master import ItemMasterWidget
 
 
@@ -29,6 +31,7 @@ class _StubDbManager:
             },
         ]
         self.search_calls = []
+        self.pending_update = None
 
     def get_all_items(self):
         return list(self._rows)
@@ -50,15 +53,15 @@ class _StubDbManager:
 
     def add_item(self, *args, **kwargs):
         del args, kwargs
-        return True
+        return settled_future(lambda: True)
 
     def update_item(self, *args, **kwargs):
         del args, kwargs
-        return True
+        return self.pending_update or settled_future(lambda: True)
 
     def delete_item(self, *args, **kwargs):
         del args, kwargs
-        return True
+        return settled_future(lambda: True)
 
 
 def test_item_master_selection_populates_form_and_clear_resets(qtbot):
@@ -108,6 +111,36 @@ def test_item_master_selection_populates_form_and_clear_resets(qtbot):
         widget.deleteLater()
 
 
+def test_item_master_update_reports_once_the_write_settles(qtbot):
+    db = _StubDbManager()
+    db.pending_update = Future()
+    statuses = []
+    main_window = types.SimpleNamespace(
+        show_status_message=lambda message, _timeout: statuses.append(message)
+    )
+    widget = ItemMasterWidget(db, main_window)
+    qtbot.addWidget(widget)
+    try:
+        widget.code_edit.setText("ITM001")
+        widget.name_edit.setText("Ring")
+        widget.purity_edit.setText("92.5")
+        widget.wage_rate_edit.setText("12")
+
+        widget.update_item()
+
+        assert "Item 'ITM001' updated successfully." not in statuses
+        assert widget.code_edit.text() == "ITM001"
+
+        db.pending_update.set_result(True)
+
+        qtbot.waitUntil(
+            lambda: "Item 'ITM001' updated successfully." in statuses, timeout=1000
+        )
+        assert widget.code_edit.text() == ""
+    finally:
+        widget.deleteLater()
+
+
 def test_item_master_search_reloads_table_model(qtbot):
     db = _StubDbManager()
     widget = ItemMasterWidget(db)
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 from PySide6.QtCore import QItemSelectionModel, Qt
 from PySide6.QtTest import QTest
@@ -222,3 +224,14 @@ def test_requires_selection_search_provider():
 
     with pytest.raises(AttributeError):
         ItemSelectionDialog(_MissingSearchDb(), "")
+
+
+def test_in_memory_search_filters_without_the_database_delay(qtbot, sample_items):
+    dialog = _make_dialog(qtbot, sample_items)
+    assert dialog._filter_delay_ms() == ItemSelectionDialog.FILTER_DELAY_MS
+
+    db = _FakeDb(sample_items)
+    db.item_cache_controller = SimpleNamespace(searchable=True)
+    dialog = ItemSelectionDialog(db, "AD")
+    qtbot.addWidget(dialog)
+    assert dialog._filter_delay_ms() == 0
@@ -1,5 +1,7 @@
 import logging
+from concurrent.futures import Future
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -7,6 +9,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction
 
 from silverestimate.infrastructure.app_constants import APP_TITLE
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.estimate_entry_logic.constants import (
     COL_CODE,
     COL_FINE_WT,
@@ -75,7 +78,7 @@ class FakeDbManager:
     def get_estimate_by_voucher(self, voucher_no: str) -> Optional[Dict[str, Any]]:
         return None
 
-    def save_estimate_with_returns(
+    def save_estimate_with_silver_bars(
         self,
         voucher_no: str,
         date: str,
@@ -83,7 +86,8 @@ class FakeDbManager:
         regular_items,
         return_items,
         totals,
-    ) -> bool:
+        silver_bars=None,
+    ) -> Future:
         self.saved_estimates.append(
             {
                 "voucher_no": voucher_no,
@@ -94,13 +98,15 @@ class FakeDbManager:
                 "totals": dict(totals or {}),
             }
         )
-        return True
+        return settled_future(
+            lambda: SimpleNamespace(saved=True, bars=None, phase_ms={}, error=None)
+        )
 
-    def delete_single_estimate(self, voucher_no: str) -> bool:
-        return True
+    def delete_single_estimate(self, voucher_no: str) -> Future:
+        return settled_future(lambda: True)
 
-    def delete_all_estimates(self) -> bool:
-        return True
+    def delete_all_estimates(self) -> Future:
+        return settled_future(lambda: True)
 
     def drop_tables(self) -> bool:
         return True
@@ -6,6 +6,7 @@ import pytest
 from PySide6.QtCore import QCoreApplication, QEvent, Qt
 from PySide6.QtTest import QTest
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.estimate_entry import EstimateEntryWidget
 from silverestimate.ui.estimate_entry_logic import COL_TYPE
 
@@ -40,8 +41,12 @@ class _RepositoryStub:
     def fetch_item(self, code):
         return self.db.get_item_by_code(code)
 
-    def save_estimate(self, *args, **kwargs):
-        return True
+    def save_estimate_with_silver_bars(self, *args, **kwargs):
+        return settled_future(
+            lambda: types.SimpleNamespace(
+                saved=True, bars=None, phase_ms={}, error=None
+            )
+        )
 
     def last_error(self):
         return None
@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QApplication, QMessageBox
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.silver_bar_history import SilverBarHistoryDialog
 
 
@@ -127,7 +128,7 @@ class _FakeSilverBarHistoryDb:
 
     def reactivate_silver_bar_list(self, list_id):
         self.reactivated_calls.append(int(list_id))
-        return True
+        return settled_future(lambda: True)
 
 
 def _row_for_bar_id(model, bar_id: int) -> int:
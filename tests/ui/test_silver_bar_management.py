@@ -3,6 +3,7 @@ import logging
 from PySide6.QtCore import QItemSelectionModel
 from PySide6.QtWidgets import QApplication, QFrame, QMessageBox
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.silver_bar_list_print_controller import (
     SilverBarListPrintController,
 )
@@ -111,7 +112,11 @@ class _FakeSilverBarManagementDb:
                 return dict(row)
         return None
 
-    def assign_bar_to_list(self, bar_id, list_id):
+    def assign_bars_to_list_bulk(self, bar_ids, list_id):
+        failed = [bar_id for bar_id in bar_ids if not self._assign_bar(bar_id, list_id)]
+        return settled_future(lambda: (len(bar_ids) - len(failed), failed))
+
+    def _assign_bar(self, bar_id, list_id):
         self.assigned_calls.append((int(bar_id), int(list_id)))
         for index, row in enumerate(list(self.available_rows)):
             if int(row["bar_id"]) == int(bar_id):
@@ -126,7 +131,7 @@ class _FakeSilverBarManagementDb:
     def mark_silver_bar_list_as_issued(self, list_id):
         self.marked_calls.append(int(list_id))
         self.lists = [row for row in self.lists if int(row["list_id"]) != int(list_id)]
-        return True
+        return settled_future(lambda: True)
 
 
 class _ThreadStub:
@@ -0,0 +1,120 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from silverestimate.persistence.change_journal import (
+    JOURNALED_TABLES,
+    journal_statements,
+    prune_journal,
+)
+from silverestimate.persistence.change_monitor import (
+    ChangeMonitor,
+    TableChanges,
+    track_local_changes,
+)
+from silverestimate.persistence.query_cache import QueryCache
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "changes.db"
+    with closing(sqlite3.connect(path)) as connection:
+        for table, key in JOURNALED_TABLES.items():
+            connection.execute(f"CREATE TABLE {table} ({key} PRIMARY KEY, name TEXT)")
+        for statement in journal_statements().values():
+            connection.execute(statement)
+        connection.commit()
+    return path
+
+
+def _monitor(path, published):
+    monitor = ChangeMonitor(lambda _cancel=None: sqlite3.connect(path))
+    monitor.subscribe(published.append)
+    return monitor
+
+
+def test_monitor_publishes_foreign_commits_but_not_local_ones(database):
+    published: list[TableChanges] = []
+    monitor = _monitor(database, published)
+    with (
+        closing(sqlite3.connect(database)) as local,
+        closing(sqlite3.connect(database)) as other,
+    ):
+        cursor = local.cursor()
+        assert track_local_changes(cursor)
+        monitor.reset(cursor)
+        assert monitor.poll() is None
+
+        cursor.execute("INSERT INTO items VALUES ('AD1', 'Local')")
+        local.commit()
+        monitor.claim_local(cursor)
+        other.execute("INSERT INTO items VALUES ('ad2', 'Other')")
+        other.execute("INSERT INTO silver_bars VALUES (1, 'Bar')")
+        other.commit()
+        cursor.execute("UPDATE items SET name = 'Again' WHERE code = 'AD1'")
+        local.commit()
+        monitor.claim_local(cursor)
+
+        changes = monitor.poll()
+        assert changes is not None
+        assert changes.tables == {"items", "silver_bars"}
+        assert changes.item_codes == {"ad2"}
+        assert published == [changes]
+        assert monitor.poll() is None
+
+        cursor.execute("DELETE FROM items WHERE code = 'AD1'")
+        local.commit()
+        monitor.claim_local(cursor)
+        assert monitor.poll() is None
+        assert monitor.generation == 5
+        assert published == [changes]
+
+
+def test_monitor_reports_everything_after_pruning_past_its_baseline(database):
+    published: list[TableChanges] = []
+    monitor = _monitor(database, published)
+    with closing(sqlite3.connect(database)) as other:
+        monitor.reset(other.cursor())
+        other.execute("INSERT INTO items VALUES ('AD1', 'One')")
+        other.execute("INSERT INTO items VALUES ('AD2', 'Two')")
+        prune_journal(other.cursor(), 2)
+        other.commit()
+
+    changes = monitor.poll()
+    assert changes is not None
+    assert changes.everything
+    assert changes.touches("silver_bars")
+    assert changes.item_codes is None
+
+
+def test_query_cache_following_a_monitor_expires_only_foreign_tables(database):
+    published: list[TableChanges] = []
+    monitor = _monitor(database, published)
+    cache = QueryCache()
+    cache.follow(monitor)
+    with (
+        closing(sqlite3.connect(database)) as reader,
+        closing(sqlite3.connect(database)) as other,
+    ):
+        cursor = reader.cursor()
+        monitor.reset(cursor)
+        calls = {"items": 0, "silver_bars": 0}
+
+        def loader(table):
+            def load():
+                calls[table] += 1
+                return calls[table]
+
+            return load
+
+        for _ in range(2):
+            for table in calls:
+                cache.read(cursor, table, (), (table,), loader(table))
+        other.execute("INSERT INTO silver_bars VALUES (7, 'Bar')")
+        other.commit()
+        for table in calls:
+            cache.read(cursor, table, (), (table,), loader(table))
+
+    assert calls == {"items": 1, "silver_bars": 2}
+    assert [changes.tables for changes in published] == [{"silver_bars"}]
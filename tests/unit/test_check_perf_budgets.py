@@ -9,11 +9,38 @@ SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "check_perf_budg
 METRICS = {
     "estimate_history.page": (20, 20.0),
     "silver_bar_history.page": (20, 20.0),
+    "estimate_history.first_page": (20, 10.0),
+    "silver_bar_history.first_page": (20, 10.0),
+    "estimate_history.first_page_cached": (20, 1.0),
+    "estimate_history.search": (20, 2.0),
+    "silver_bar_history.search": (20, 2.0),
     "estimate_totals.recompute": (20, 5.0),
     "view_model.synchronize": (20, 5.0),
     "encrypted_backup_export": (5, 50.0),
+    "encrypted_backup_export.validate": (5, 50.0),
+    "encrypted_backup_export.archive": (5, 10.0),
+    "encrypted_backup.export_10mib": (5, 50.0),
+    "encrypted_backup.online_10mib": (5, 90.0),
+    "encrypted_backup.export_500mib": (3, 4_000.0),
+    "encrypted_backup.online_500mib": (3, 8_000.0),
     "dda_current.parse": (20, 1.0),
     "dda_sse.parse_apply": (20, 1.0),
+    "item_search.contains": (20, 1.0),
+    "item_cache.build": (3, 900.0),
+    "item_cache.lookup": (20, 0.1),
+    "item_cache.prefix": (20, 0.5),
+    "item_cache.contains": (20, 0.5),
+    "item_cache.keystroke": (20, 0.3),
+    "silver_bar_optimizer.bars_1k": (6, 1.0),
+    "silver_bar_optimizer.bars_10k": (6, 1.0),
+    "silver_bar_optimizer.bars_50k": (6, 1.0),
+    "estimate.save": (20, 5.0),
+    "estimate.delete_with_bars": (20, 5.0),
+    "silver_bars.synchronize": (20, 2.0),
+    "silver_bars.assign_bulk": (20, 30.0),
+    "silver_bars.remove_bulk": (20, 30.0),
+    "silver_bars.mark_issued": (20, 20.0),
+    "item_catalog.upsert": (5, 700.0),
 }
 
 
@@ -104,6 +131,21 @@ def test_perf_gate_accepts_complete_telemetry(tmp_path: Path) -> None:
     assert "All configured performance metrics" in result.stdout
 
 
+def test_perf_gate_only_budgets_the_default_dataset_tier(tmp_path: Path) -> None:
+    log_path = tmp_path / "perf.log"
+    telemetry = _valid_telemetry().replace(
+        "[perf] estimate_history.page=20.00ms",
+        "[perf] estimate_history.page=20.00ms tier=10k",
+    )
+    scale = "\n".join(["[perf] estimate_history.page=900.00ms tier=1m"] * 20)
+    log_path.write_text(f"{telemetry}\n{scale}", encoding="utf-8")
+
+    result = _run_script("--log-file", str(log_path))
+
+    assert result.returncode == 0
+    assert "metric=estimate_history.page samples=20 " in result.stdout
+
+
 def test_github_windows_profile_does_not_weaken_local_export_budget(
     tmp_path: Path,
 ) -> None:
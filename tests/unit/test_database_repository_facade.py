@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from silverestimate.persistence.database_repository_facade import (
     DatabaseRepositoryFacadeMixin,
 )
@@ -26,16 +28,16 @@ class _StubEstimateRepo:
     def __init__(self):
         self.calls = []
 
-    def save_estimate_with_returns(self, *args):
-        self.calls.append(("save_estimate_with_returns", args))
-        return "saved"
+    def save_estimate_with_silver_bars(self, *args):
+        self.calls.append(("save_estimate_with_silver_bars", args))
+        return SimpleNamespace(saved=True)
 
     def get_estimate_history_rows(self, **kwargs):
         self.calls.append(("get_estimate_history_rows", kwargs))
         return [{"voucher_no": "100"}]
 
-    def get_first_estimate_date(self):
-        self.calls.append(("get_first_estimate_date", ()))
+    def get_first_estimate_date(self, *, use_cache=True):
+        self.calls.append(("get_first_estimate_date", (use_cache,)))
         return "2025-01-01"
 
 
@@ -85,8 +87,10 @@ class _FacadeHarness(DatabaseRepositoryFacadeMixin):
 def test_item_facade_delegates_and_preload_uses_keyed_connection_factory():
     facade = _FacadeHarness()
 
-    assert facade.add_item("ITM001", "Sample", 92.5, "WT", 10.0) == "added"
-    assert facade.upsert_item_catalog([{"code": "ITM001"}], replace_existing=True) == {
+    assert facade.add_item("ITM001", "Sample", 92.5, "WT", 10.0).result() == "added"
+    assert facade.upsert_item_catalog(
+        [{"code": "ITM001"}], replace_existing=True
+    ).result() == {
         "inserted": 1,
         "updated": 1,
         "deleted": 0,
@@ -118,11 +122,11 @@ def test_estimate_facade_clears_last_error_before_delegating():
         {"total_net": 1.0},
     )
 
-    assert result == "saved"
+    assert result.result() is True
     assert facade.last_error is None
     assert facade.estimates_repo.calls == [
         (
-            "save_estimate_with_returns",
+            "save_estimate_with_silver_bars",
             (
                 "100",
                 "2025-01-01",
@@ -130,22 +134,38 @@ def test_estimate_facade_clears_last_error_before_delegating():
                 [{"code": "REG001"}],
                 [{"code": "RET001"}],
                 {"total_net": 1.0},
+                None,
             ),
         )
     ]
 
 
+def test_facade_write_reports_repository_errors_through_the_future():
+    facade = _FacadeHarness()
+
+    def fail(note):
+        raise RuntimeError("list table is locked")
+
+    facade.silver_bar_command_repo.create_list = fail
+
+    created = facade.create_silver_bar_list("Test List")
+
+    assert isinstance(created.exception(), RuntimeError)
+
+
 def test_estimate_facade_delegates_history_rows_lookup():
     facade = _FacadeHarness()
 
     assert facade.get_first_estimate_date() == "2025-01-01"
+    assert facade.get_first_estimate_date(use_cache=False) == "2025-01-01"
     assert facade.get_estimate_history_rows(
         date_from="2025-01-01",
         date_to="2025-01-31",
         voucher_search="10",
     ) == [{"voucher_no": "100"}]
     assert facade.estimates_repo.calls == [
-        ("get_first_estimate_date", ()),
+        ("get_first_estimate_date", (True,)),
+        ("get_first_estimate_date", (False,)),
         (
             "get_estimate_history_rows",
             {
@@ -160,7 +180,7 @@ def test_estimate_facade_delegates_history_rows_lookup():
 def test_silver_bar_facade_delegates_keyword_arguments():
     facade = _FacadeHarness()
 
-    assert facade.create_silver_bar_list("Test List") == 17
+    assert facade.create_silver_bar_list("Test List").result() == 17
     assert facade.get_silver_bars(
         status="In Stock",
         weight_query="10",
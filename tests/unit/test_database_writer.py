@@ -0,0 +1,131 @@
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from typing import ClassVar
+
+import pytest
+from PySide6.QtCore import QThread
+from PySide6.QtWidgets import QApplication
+
+from silverestimate.infrastructure.database_write_notifier import (
+    DatabaseWriteNotifier,
+)
+from silverestimate.persistence.database_writer import (
+    DatabaseWriter,
+    WriteCommand,
+    WriterSession,
+)
+
+
+@dataclass(frozen=True)
+class _Insert(WriteCommand):
+    value: str
+    fail: bool = False
+
+    def apply(self, db):
+        db.conn.execute("BEGIN TRANSACTION")
+        db.cursor.execute("INSERT INTO notes (value) VALUES (?)", (self.value,))
+        if self.fail:
+            raise ValueError(f"rejected {self.value}")
+        db.conn.commit()
+        return self.value
+
+
+@dataclass(frozen=True)
+class _Bulk(_Insert):
+    batchable: ClassVar[bool] = False
+
+
+@pytest.fixture()
+def writer(tmp_path):
+    path = tmp_path / "writer.db"
+    with closing(sqlite3.connect(path)) as setup:
+        setup.execute("CREATE TABLE notes (value TEXT NOT NULL)")
+    sessions = []
+
+    def open_session():
+        session = WriterSession(
+            sqlite3.connect(path), logger=logging.getLogger("test-writer")
+        )
+        sessions.append(threading.current_thread())
+        return session
+
+    writer = DatabaseWriter(open_session, name="test-writer")
+    writer.path = path
+    writer.sessions = sessions
+    yield writer
+    writer.shutdown()
+
+
+def _notes(path):
+    with closing(sqlite3.connect(path)) as connection:
+        return [row[0] for row in connection.execute("SELECT value FROM notes")]
+
+
+def test_writer_batches_adjacent_commands_in_savepoints(writer):
+    with writer.hold():
+        futures = [
+            writer.submit(_Insert("a")),
+            writer.submit(_Insert("b", fail=True)),
+            writer.submit(_Insert("c")),
+            writer.submit(_Bulk("d")),
+        ]
+        assert writer.queue_depth == 4
+
+    first = futures[0].result(timeout=5)
+    with pytest.raises(ValueError, match="rejected b"):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5).value == "c"
+    bulk = futures[3].result(timeout=5)
+
+    assert (first.value, first.batch_size, bulk.batch_size) == ("a", 3, 1)
+    assert first.latency_ms >= first.run_ms
+    assert _notes(writer.path) == ["a", "c", "d"]
+    assert writer.sessions[0] is not threading.main_thread()
+    metrics = writer.metrics()
+    assert (metrics.completed, metrics.failed, metrics.batches) == (3, 1, 2)
+    assert metrics.max_queue_depth == 4
+    assert metrics.mean_batch_size == pytest.approx(2.0)
+
+
+def test_writer_hold_closes_the_connection_until_released(writer):
+    writer.submit(_Insert("before")).result(timeout=5)
+    with writer.hold():
+        pending = writer.submit(_Insert("after"))
+        assert not pending.done()
+        assert writer._session is None
+    assert pending.result(timeout=5).value == "after"
+    assert len(writer.sessions) == 2
+
+
+def test_writer_shutdown_drains_the_queue_and_rejects_new_commands(writer):
+    future = writer.submit(_Insert("queued"))
+    assert writer.shutdown()
+    assert future.result(timeout=0).value == "queued"
+    with pytest.raises(RuntimeError):
+        writer.submit(_Insert("late"))
+
+
+def test_write_notifier_delivers_outcomes_on_the_gui_thread(qtbot, writer):
+    notifier = DatabaseWriteNotifier()
+    received = []
+    notifier.completed.connect(
+        lambda ticket, outcome: received.append(
+            (
+                ticket,
+                outcome.value,
+                QThread.currentThread() is QApplication.instance().thread(),
+            )
+        )
+    )
+    notifier.failed.connect(
+        lambda ticket, error: received.append((ticket, str(error), None))
+    )
+
+    first = notifier.watch(writer.submit(_Insert("ok")))
+    second = notifier.watch(writer.submit(_Bulk("bad", fail=True)))
+
+    qtbot.waitUntil(lambda: len(received) == 2, timeout=2000)
+    assert received == [(first, "ok", True), (second, "rejected bad", None)]
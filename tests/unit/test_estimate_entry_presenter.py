@@ -1,8 +1,11 @@
+from concurrent.futures import Future
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Dict, Iterable, List, Optional
 
 import pytest
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.presenter import (
     EstimateEntryPresenter,
     EstimateEntryViewState,
@@ -37,8 +40,8 @@ class FakeRepository:
         self.last_error_value: Optional[str] = None
         self.fetch_item_map: Dict[str, Dict] = {}
         self.fetch_items_calls: List[List[str]] = []
-        self.sync_calls: List[Dict] = []
-        self.sync_result: tuple[int, int] = (0, 0)
+        self.bars_added = 0
+        self.pending_save: Optional[Future] = None
         self.deleted_vouchers: List[str] = []
 
     def generate_voucher_no(self) -> str:
@@ -59,7 +62,7 @@ class FakeRepository:
             if code in self.fetch_item_map
         }
 
-    def save_estimate(
+    def save_estimate_with_silver_bars(
         self,
         voucher_no: str,
         date: str,
@@ -67,7 +70,8 @@ class FakeRepository:
         regular_items: Iterable[Dict],
         return_items: Iterable[Dict],
         totals: Dict,
-    ) -> bool:
+        silver_bars: Iterable[Dict],
+    ) -> Future:
         self.save_calls.append(
             {
                 "voucher": voucher_no,
@@ -76,22 +80,26 @@ class FakeRepository:
                 "regular": list(regular_items),
                 "returns": list(return_items),
                 "totals": totals,
+                "bars": list(silver_bars),
             }
         )
-        return self.save_result
-
-    def sync_silver_bars_for_estimate(
-        self, voucher_no: str, bars: Iterable[Dict]
-    ) -> tuple[int, int]:
-        self.sync_calls.append({"voucher": voucher_no, "bars": list(bars)})
-        return self.sync_result
+        if self.pending_save is not None:
+            return self.pending_save
+        return settled_future(
+            lambda: SimpleNamespace(
+                saved=self.save_result,
+                bars=SimpleNamespace(added=self.bars_added, failed=0),
+                phase_ms={"lines": 1.5, "silver_bars": 0.5},
+                error=None,
+            )
+        )
 
     def last_error(self) -> Optional[str]:
         return self.last_error_value
 
-    def delete_estimate(self, voucher_no: str) -> bool:
+    def delete_estimate(self, voucher_no: str) -> Future:
         self.deleted_vouchers.append(voucher_no)
-        return True
+        return settled_future(lambda: True)
 
 
 class FakeView:
@@ -315,38 +323,51 @@ def test_handle_item_code_cancel_selection_reports_not_found(presenter_fixtures)
 def test_save_estimate_success_adds_new_bar(presenter_fixtures):
     presenter, view, repo = presenter_fixtures
     payload = _Make_sample_payload()
-    repo.sync_result = (1, 0)
+    repo.bars_added = 1
 
-    outcome = presenter.save_estimate(payload)
+    outcome = presenter.save_estimate(payload).result()
 
     assert outcome.success
     assert outcome.bars_added == 1
+    assert outcome.phase_ms == {"lines": 1.5, "silver_bars": 0.5}
     assert "saved successfully" in outcome.message
-    assert repo.save_calls
 
 
-def test_save_estimate_prefers_bulk_bar_sync_when_available(presenter_fixtures):
+def test_save_estimate_writes_silver_bars_with_the_estimate(presenter_fixtures):
     presenter, view, repo = presenter_fixtures
     payload = _Make_sample_payload()
-    repo.sync_result = (1, 0)
 
-    outcome = presenter.save_estimate(payload)
+    presenter.save_estimate(payload).result()
 
-    assert outcome.success
-    assert outcome.bars_added == 1
-    assert len(repo.sync_calls) == 1
-    assert repo.sync_calls[0]["bars"] == [
+    assert len(repo.save_calls) == 1
+    assert repo.save_calls[0]["bars"] == [
         {"weight": 2.0, "purity": 99.0, "line_key": "line-bar"}
     ]
 
 
+def test_save_estimate_settles_once_the_write_does(presenter_fixtures):
+    presenter, view, repo = presenter_fixtures
+    repo.pending_save = Future()
+
+    saved = presenter.save_estimate(_Make_sample_payload())
+
+    assert not saved.done()
+
+    repo.pending_save.set_exception(RuntimeError("database is locked"))
+
+    outcome = saved.result()
+    assert not outcome.success
+    assert outcome.error_detail == "database is locked"
+    assert "Unexpected error saving" in outcome.message
+
+
 def test_save_estimate_failure_returns_error(presenter_fixtures):
     presenter, view, repo = presenter_fixtures
     payload = _Make_sample_payload()
     repo.save_result = False
     repo.last_error_value = "database failure"
 
-    outcome = presenter.save_estimate(payload)
+    outcome = presenter.save_estimate(payload).result()
 
     assert not outcome.success
     assert outcome.error_detail == "database failure"
@@ -356,7 +377,7 @@ def test_save_estimate_failure_returns_error(presenter_fixtures):
 def test_delete_estimate_delegates_to_repository(presenter_fixtures):
     presenter, view, repo = presenter_fixtures
 
-    assert presenter.delete_estimate("V500")
+    assert presenter.delete_estimate("V500").result()
     assert repo.deleted_vouchers == ["V500"]
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import types
+from concurrent.futures import Future
 from typing import Any
 
 import pytest
@@ -16,6 +17,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.presenter import LoadedEstimate, SaveItem, SaveOutcome
 from silverestimate.ui import estimate_entry_workflow_controller as workflow_module
 from silverestimate.ui.estimate_entry_workflow_controller import (
@@ -518,12 +520,16 @@ def test_save_estimate_success_invokes_print_and_clear(workflow_host, monkeypatc
 
         def execute_save(self, **kwargs):
             del kwargs
-            return SaveOutcome(success=True, message="Saved ok"), object()
+            return self.saved, object()
 
     monkeypatch.setattr(
         workflow_module, "EstimateEntryPersistenceService", _ServiceStub
     )
 
+    _ServiceStub.saved = settled_future(
+        lambda: SaveOutcome(success=True, message="Saved ok")
+    )
+
     controller.save_estimate()
 
     assert ("Saving estimate S001...", 2000) in host.status_calls
@@ -533,6 +539,50 @@ def test_save_estimate_success_invokes_print_and_clear(workflow_host, monkeypatc
     assert any(args[1] == "Success" for args in _MessageBoxStub.information_calls)
 
 
+def test_save_estimate_waits_for_the_write_before_print_and_clear(
+    workflow_host, monkeypatch
+):
+    host, controller = workflow_host
+    host.voucher_edit.setText("S005")
+    host.print_calls = 0
+    host.clear_calls = []
+    controller.print_estimate = lambda: setattr(
+        host, "print_calls", host.print_calls + 1
+    )
+    controller.clear_form = lambda confirm=False: host.clear_calls.append(confirm)
+    controller._update_view_model_snapshot = lambda: None
+    host.presenter = object()
+    pending: Future[SaveOutcome] = Future()
+    save_calls: list[dict[str, Any]] = []
+
+    class _ServiceStub:
+        def __init__(self, view_model):
+            self.view_model = view_model
+
+        def execute_save(self, **kwargs):
+            save_calls.append(kwargs)
+            return pending, object()
+
+    monkeypatch.setattr(
+        workflow_module, "EstimateEntryPersistenceService", _ServiceStub
+    )
+
+    controller.save_estimate()
+    controller.save_estimate()
+
+    assert len(save_calls) == 1
+    assert host.status_calls[-1] == ("Estimate S005 is still saving...", 2000)
+    assert host.print_calls == 0
+    assert host.clear_calls == []
+
+    pending.set_result(SaveOutcome(success=True, message="Saved ok"))
+
+    assert host.print_calls == 1
+    assert host.clear_calls == [False]
+    controller.save_estimate()
+    assert len(save_calls) == 2
+
+
 def test_save_estimate_requires_voucher_number(workflow_host):
     _host, controller = workflow_host
 
@@ -588,7 +638,9 @@ def test_save_estimate_failure_shows_critical(workflow_host, monkeypatch):
 
         def execute_save(self, **kwargs):
             del kwargs
-            return SaveOutcome(success=False, message="No good"), object()
+            return settled_future(
+                lambda: SaveOutcome(success=False, message="No good")
+            ), object()
 
     monkeypatch.setattr(
         workflow_module, "EstimateEntryPersistenceService", _ServiceStub
@@ -603,7 +655,9 @@ def test_save_estimate_failure_shows_critical(workflow_host, monkeypatch):
 def test_delete_current_estimate_success_clears_form(workflow_host):
     host, controller = workflow_host
     host.voucher_edit.setText("DEL1")
-    host.presenter = types.SimpleNamespace(delete_estimate=lambda voucher_no: True)
+    host.presenter = types.SimpleNamespace(
+        delete_estimate=lambda voucher_no: settled_future(lambda: True)
+    )
     host.clear_calls = []
     controller.clear_form = lambda confirm=False: host.clear_calls.append(confirm)
 
@@ -616,7 +670,9 @@ def test_delete_current_estimate_success_clears_form(workflow_host):
 def test_delete_current_estimate_failure_shows_warning(workflow_host):
     host, controller = workflow_host
     host.voucher_edit.setText("DEL2")
-    host.presenter = types.SimpleNamespace(delete_estimate=lambda voucher_no: False)
+    host.presenter = types.SimpleNamespace(
+        delete_estimate=lambda voucher_no: settled_future(lambda: False)
+    )
 
     controller.delete_current_estimate()
 
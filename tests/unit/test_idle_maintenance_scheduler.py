@@ -0,0 +1,53 @@
+import threading
+
+from silverestimate.infrastructure.idle_maintenance_scheduler import (
+    IdleMaintenanceScheduler,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_runs_once_per_idle_window_and_activity_cancels(qtbot):
+    clock = _Clock()
+    started = threading.Event()
+    cancelled = threading.Event()
+    runs = []
+
+    def run(cancel_event):
+        runs.append(clock.now)
+        started.set()
+        if len(runs) == 1:
+            cancel_event.wait(2.0)
+            if cancel_event.is_set():
+                cancelled.set()
+
+    scheduler = IdleMaintenanceScheduler(
+        run, idle_after_s=60.0, poll_interval_ms=10_000, clock=clock
+    )
+    try:
+        assert scheduler.poll() is False
+        clock.now = 61.0
+        assert scheduler.poll() is True
+        assert started.wait(1.0)
+        assert scheduler.running and scheduler.poll() is False
+
+        scheduler.record_activity()
+        assert cancelled.wait(1.0)
+        assert not scheduler.running
+
+        clock.now = 100.0
+        assert scheduler.poll() is False
+        clock.now = 125.0
+        assert scheduler.poll() is True
+        qtbot.waitUntil(lambda: not scheduler.running, timeout=2000)
+        assert runs == [61.0, 125.0]
+        assert scheduler.poll() is False
+    finally:
+        scheduler.stop()
+        scheduler.deleteLater()
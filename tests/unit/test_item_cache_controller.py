@@ -103,3 +103,152 @@ def test_item_cache_preload_failure_and_thread_start_failure(
     monkeypatch.setattr(threading, "Thread", StartFailureThread)
     cache.start_preload(lambda: sqlite3.connect(tmp_path / "items.sqlite"))
     assert cache._thread is None
+
+
+def _catalog_rows():
+    return [
+        {
+            "code": code,
+            "name": name,
+            "tunch": None,
+            "purity": 91.5,
+            "wage_type": "WT",
+            "wage_rate": 5.0,
+        }
+        for code, name in (
+            ("BAD2", "Metal Ring"),
+            ("AD01", "Classic Chain"),
+            ("ZZ10", "Adorn Pendant"),
+            ("AXAD", "Roadline Anklet"),
+            ("A_1", "Underscore"),
+        )
+    ]
+
+
+def test_item_cache_answers_searches_only_when_complete() -> None:
+    cache = ItemCacheController()
+    cache.store("AD01", _catalog_rows()[1])
+    assert cache.search_rows("AD") is None
+    assert cache.get_many(["AD01"]) is None
+    assert cache.knows_absent("MISSING") is False
+
+    cache.replace_all(_catalog_rows())
+
+    assert cache.searchable is True
+    assert [row["code"] for row in cache.search_rows("ad")] == ["AD01", "ZZ10"]
+    assert [row["code"] for row in cache.search_rows("XAD")] == ["AXAD"]
+    assert cache.search_rows("Q") == []
+    assert [row["code"] for row in cache.search_rows("")] == [
+        "A_1",
+        "AD01",
+        "AXAD",
+        "BAD2",
+        "ZZ10",
+    ]
+    rows, truncated = cache.search_for_selection("AD", 3)
+    assert [row["code"] for row in rows] == ["AD01", "ZZ10", "AXAD"]
+    assert truncated is True
+    assert cache.search_rows("A_") is None
+    assert cache.get("ad01")["purity"] == 91.5
+    assert cache.knows_absent("MISSING") is True
+    assert set(cache.get_many(["ad01", "missing"])) == {"AD01"}
+
+
+def test_item_cache_overlays_row_changes_until_the_next_full_load() -> None:
+    cache = ItemCacheController()
+    cache.replace_all(_catalog_rows())
+
+    cache.store("ADZ9", {**_catalog_rows()[0], "code": "ADZ9", "name": "New"})
+    cache.store("BAD2", {**_catalog_rows()[0], "name": "Adamant Ring"})
+    cache.remove("AD01")
+
+    rows, truncated = cache.search_for_selection("AD", 10)
+    assert [row["code"] for row in rows] == ["ADZ9", "BAD2", "ZZ10", "AXAD"]
+    assert truncated is False
+    assert [row["code"] for row in cache.search_rows("ad")] == [
+        "ADZ9",
+        "BAD2",
+        "ZZ10",
+    ]
+    assert cache.knows_absent("AD01") is True
+
+    cache.invalidate("ZZ10")
+    assert cache.searchable is False
+    assert cache.search_for_selection("AD", 10) is None
+    cache.store("ZZ10", _catalog_rows()[2])
+    assert cache.searchable is True
+
+    cache.clear()
+    assert cache.searchable is False
+    assert cache.cache == {}
+
+
+def test_item_cache_preload_keeps_changes_made_while_it_ran(tmp_path) -> None:
+    db_path = tmp_path / "items.sqlite"
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        "CREATE TABLE items "
+        "(code TEXT, name TEXT, tunch TEXT, purity REAL, wage_type TEXT, wage_rate REAL)"
+    )
+    connection.execute("INSERT INTO items VALUES ('A1', 'Old', NULL, 90.0, 'P', 1.0)")
+    connection.commit()
+    connection.close()
+
+    cache = ItemCacheController()
+    querying = threading.Event()
+    release = threading.Event()
+
+    def factory():
+        connection = sqlite3.connect(db_path)
+        connection.row_factory = sqlite3.Row
+        querying.set()
+        release.wait(2)
+        return connection
+
+    cache.start_preload(factory)
+    querying.wait(2)
+    cache.store("A1", {"code": "A1", "name": "Edited", "purity": 91.0})
+    release.set()
+    cache._thread.join(2)
+
+    assert cache.searchable is True
+    assert cache.get("A1")["name"] == "Edited"
+    assert [row["name"] for row in cache.search_rows("A")] == ["Edited"]
+
+
+def test_item_cache_refreshes_rows_changed_by_another_connection(tmp_path) -> None:
+    db_path = tmp_path / "items.sqlite"
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        "CREATE TABLE items "
+        "(code TEXT, name TEXT, tunch TEXT, purity REAL, wage_type TEXT, wage_rate REAL)"
+    )
+    connection.execute("CREATE TABLE item_usage (item_code TEXT, use_count, score)")
+    connection.executemany(
+        "INSERT INTO items VALUES (?, ?, NULL, 90.0, 'P', 1.0)",
+        [("a1", "Edited"), ("A3", "Added")],
+    )
+    connection.execute("INSERT INTO item_usage VALUES ('A3', 1, 5.0)")
+    connection.commit()
+    connection.close()
+
+    def factory():
+        connection = sqlite3.connect(db_path)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    cache = ItemCacheController()
+    cache.replace_all(
+        [
+            {"code": "a1", "name": "Old", "purity": 90.0},
+            {"code": "A2", "name": "Deleted", "purity": 90.0},
+        ]
+    )
+    cache.refresh(["A1", "a2", "a3"], factory)
+    cache.reload_usage(factory)
+
+    assert cache.searchable is True
+    assert cache.get("A1")["name"] == "Edited"
+    assert cache.knows_absent("A2") is True
+    rows, _ = cache.search_for_selection("A", 10)
+    assert [row["code"] for row in rows] == ["A3", "a1"]
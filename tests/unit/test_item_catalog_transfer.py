@@ -2,6 +2,7 @@ import json
 
 import pytest
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.services.item_catalog_transfer import (
     ITEM_CATALOG_FORMAT,
     ITEM_CATALOG_VERSION,
@@ -31,7 +32,7 @@ class _DbStub:
     def upsert_item_catalog(self, items, *, replace_existing=False):
         self.imported_items = list(items)
         self.replace_existing = replace_existing
-        return dict(self._summary)
+        return settled_future(lambda: self._summary)
 
 
 def test_export_item_catalog_writes_native_backup_file(tmp_path):
@@ -107,7 +108,7 @@ def test_import_item_catalog_validates_and_normalizes_records(tmp_path):
         encoding="utf-8",
     )
 
-    summary = import_item_catalog(db, str(path), replace_existing=True)
+    summary = import_item_catalog(db, str(path), replace_existing=True).result()
 
     assert summary == {"inserted": 1, "updated": 1, "deleted": 0, "total": 2}
     assert db.replace_existing is True
@@ -164,6 +165,27 @@ def test_import_item_catalog_rejects_duplicate_codes_in_file(tmp_path):
         import_item_catalog(db, str(path))
 
 
+def test_import_item_catalog_rejects_a_write_without_a_summary(tmp_path):
+    db = _DbStub()
+    db._summary = None
+    path = tmp_path / "catalog.seitems.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": ITEM_CATALOG_FORMAT,
+                "version": ITEM_CATALOG_VERSION,
+                "items": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    restored = import_item_catalog(db, str(path))
+
+    with pytest.raises(ItemCatalogTransferError, match="could not be applied"):
+        restored.result()
+
+
 def test_load_item_catalog_file_rejects_wrong_format(tmp_path):
     path = tmp_path / "catalog.seitems.json"
     path.write_text(
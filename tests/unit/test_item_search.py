@@ -0,0 +1,173 @@
+import random
+
+from silverestimate.infrastructure.item_cache import ItemCacheController
+from silverestimate.infrastructure.item_catalog import (
+    ItemCatalog,
+    ItemRecord,
+    within_one_edit,
+)
+from silverestimate.infrastructure.item_search import TYPO_RANK, ItemSearch
+
+
+def _catalog(pairs) -> ItemCatalog:
+    return ItemCatalog(
+        ItemRecord(code, name, None, 91.5, "WT", 5.0) for code, name in pairs
+    )
+
+
+def test_within_one_edit_allows_a_single_typo() -> None:
+    assert within_one_edit("AD10", "AD10")
+    assert within_one_edit("AD10", "AD1O")
+    assert within_one_edit("AD10", "A1D0")
+    assert within_one_edit("AD10", "AD1")
+    assert within_one_edit("AD10", "AD100")
+    assert within_one_edit("", "A")
+    assert not within_one_edit("AD10", "DA01")
+    assert not within_one_edit("AD10", "AD")
+    assert not within_one_edit("AD10", "XAD10X")
+
+
+def test_typo_matches_agree_with_a_full_scan() -> None:
+    rng = random.Random(7)
+    codes = {
+        "".join(rng.choice("AB12") for _ in range(rng.randint(1, 6)))
+        for _ in range(400)
+    }
+    catalog = _catalog((code, "") for code in codes)
+    keys = [catalog.code_key(index) for index in range(len(catalog))]
+
+    for term in ["A", "AB", "B21", "1A2B", "AB12A", *rng.sample(keys, 40)]:
+        expected = [
+            index
+            for index, key in enumerate(keys)
+            if key != term and within_one_edit(term, key)
+        ]
+        assert catalog.typo_matches(term) == expected
+
+
+def test_selection_ranks_typos_after_substring_matches() -> None:
+    search = ItemSearch(
+        _catalog(
+            [
+                ("RG101", "Ring Classic"),
+                ("RG110", "Ring Plain"),
+                ("CH01", "Chain RG10 Hook"),
+                ("RG10", "Ring"),
+            ]
+        )
+    )
+    codes = search.catalog.code_key
+
+    ranked = search.ranked("RG10", 10)
+
+    assert [(rank, codes(index)) for rank, index in ranked] == [
+        (0, "RG10"),
+        (0, "RG101"),
+        (3, "CH01"),
+        (TYPO_RANK, "RG110"),
+    ]
+    assert [codes(index) for _rank, index in search.ranked("RG01", 10)] == [
+        "RG10",
+        "RG101",
+    ]
+    assert search.ranked("RG", 10) == search.catalog.ranked_matches("RG", 10)
+
+
+def test_selection_narrows_previous_matches_as_the_term_grows() -> None:
+    rng = random.Random(3)
+    catalog = _catalog(
+        (
+            "".join(rng.choice("ABC123") for _ in range(5)),
+            " ".join(rng.choice(["Ring", "Chain", "Cab"]) for _ in range(2)),
+        )
+        for _ in range(300)
+    )
+    search = ItemSearch(catalog)
+
+    for term in ["C", "CA", "CAB", "CAB ", "CA", "1", "1A", "1AB", "1AB2", "B"]:
+        for limit in (5, 500):
+            expected = ItemSearch(catalog).ranked(term, limit)
+            assert search.ranked(term, limit) == expected, term
+
+
+def test_item_cache_selection_includes_typos_and_keeps_the_limit() -> None:
+    cache = ItemCacheController()
+    cache.replace_all(
+        [
+            {"code": code, "name": name, "purity": 91.5, "wage_type": "WT"}
+            for code, name in (
+                ("AD10", "Classic Chain"),
+                ("AD11", "Plain Chain"),
+                ("ZZ10", "Adorn Pendant"),
+            )
+        ]
+    )
+
+    rows, truncated = cache.search_for_selection("ad1o", 500)
+    assert [row["code"] for row in rows] == ["AD10", "AD11"]
+    assert truncated is False
+    rows, truncated = cache.search_for_selection("AD12", 1)
+    assert [row["code"] for row in rows] == ["AD10"]
+    assert truncated is True
+
+    cache.store("AD21", {"code": "AD21", "name": "New", "purity": 80.0})
+    rows, _ = cache.search_for_selection("AD12", 10)
+    assert [row["code"] for row in rows] == ["AD10", "AD11", "AD21"]
+
+
+def test_favourites_lead_their_rank_and_survive_narrowing() -> None:
+    catalog = _catalog(
+        [
+            ("AD10", "Classic Chain"),
+            ("AD11", "Plain Chain"),
+            ("AD12", "Adorn Ring"),
+            ("CH01", "Adorn Chain"),
+            ("ZZAD", "Band"),
+        ]
+    )
+    codes = catalog.code_key
+    favourites = (catalog.find("ZZAD"), catalog.find("AD12"), catalog.find("CH01"))
+    search = ItemSearch(catalog)
+
+    assert [codes(index) for _rank, index in search.ranked("A", 10, favourites)] == [
+        "AD12",
+        "AD10",
+        "AD11",
+        "CH01",
+        "ZZAD",
+    ]
+    assert [
+        (rank, codes(index)) for rank, index in search.ranked("AD", 3, favourites)
+    ] == [(0, "AD12"), (0, "AD10"), (0, "AD11")]
+    assert [codes(index) for _rank, index in search.ranked("AD", 10, favourites)] == [
+        "AD12",
+        "AD10",
+        "AD11",
+        "CH01",
+        "ZZAD",
+    ]
+    for term in ["C", "CH", "A", "AD1", "AD12", ""]:
+        expected = ItemSearch(catalog).ranked(term, 10, favourites)
+        assert search.ranked(term, 10, favourites) == expected, term
+
+
+def test_item_cache_orders_overlay_rows_by_usage() -> None:
+    cache = ItemCacheController()
+    cache.replace_all(
+        [
+            {"code": code, "name": "Chain", "purity": 91.5, "wage_type": "WT"}
+            for code in ("AD10", "AD11", "AD12")
+        ]
+    )
+    cache.record_usage({"ad12": (2, 4.0), "AD11": (1, 1.0)})
+    rows, _ = cache.search_for_selection("AD", 10)
+    assert [row["code"] for row in rows] == ["AD12", "AD11", "AD10"]
+
+    cache.store("AD13", {"code": "AD13", "name": "New", "purity": 80.0})
+    cache.record_usage({"AD13": (1, 2.0), "AD12": (-2, -4.0)})
+    rows, _ = cache.search_for_selection("AD", 10)
+    assert [row["code"] for row in rows] == ["AD13", "AD11", "AD10", "AD12"]
+
+    cache.replace_usage({})
+    rows, _ = cache.search_for_selection("AD", 10)
+    assert [row["code"] for row in rows] == ["AD10", "AD11", "AD12", "AD13"]
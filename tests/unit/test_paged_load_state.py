@@ -41,3 +41,50 @@ def test_paged_load_state_does_not_share_default_row_lists() -> None:
 
     assert first.rows == [1]
     assert second.rows == []
+
+
+def test_paged_load_state_keeps_totals_across_appended_pages() -> None:
+    state = PagedLoadState[int, int]()
+    state.apply(Page((1,), 2, 1, totals="full-filter"))
+
+    state.apply(Page((2,), 2), append=True)
+    assert state.totals == "full-filter"
+
+    state.apply(Page((3,), 1))
+    assert state.totals is None
+
+
+def test_paged_load_state_keeps_an_uncounted_total_pending_until_applied() -> None:
+    state = PagedLoadState[int, int]()
+    state.reset()
+    generation = state.generation
+
+    state.apply(Page((1, 2), None, 2))
+    assert state.total_pending and state.total is None
+
+    assert state.apply_total(7, "weights", generation=generation)
+    assert state.total == 7 and state.totals == "weights"
+
+    # Appended uncounted pages reuse the count instead of asking again.
+    state.apply(Page((3,), None, 3), append=True)
+    assert state.total == 7 and not state.total_pending
+
+
+def test_paged_load_state_counts_an_uncounted_last_page_from_its_rows() -> None:
+    state = PagedLoadState[int, int]()
+
+    state.apply(Page((1, 2, 3), None))
+
+    assert state.total == 3 and not state.total_pending
+
+
+def test_paged_load_state_drops_a_count_for_an_earlier_query() -> None:
+    state = PagedLoadState[int, int]()
+    stale_generation = state.generation
+    state.apply(Page((1,), None, 1))
+
+    state.reset()
+    state.apply(Page((9,), None, 9))
+
+    assert not state.apply_total(50, generation=stale_generation)
+    assert state.total_pending
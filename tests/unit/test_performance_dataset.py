@@ -1,33 +1,55 @@
 from __future__ import annotations
 
-import sqlite3
 from pathlib import Path
 
 from scripts.run_performance_gate import (
-    BAR_COUNT,
-    ESTIMATE_COUNT,
-    ESTIMATE_LINE_COUNT,
-    ITEM_COUNT,
+    DATASET_TIERS,
+    cached_dataset,
     create_deterministic_dataset,
+    dataset_broker,
 )
+from silverestimate.persistence import schema
 
 
 def test_deterministic_dataset_has_required_scale(tmp_path: Path) -> None:
-    database_path = tmp_path / "performance.sqlite"
-    create_deterministic_dataset(database_path)
+    database_path = tmp_path / "performance.sqlcipher"
+    tier = DATASET_TIERS["small"]
+    create_deterministic_dataset(database_path, tier)
 
-    connection = sqlite3.connect(database_path)
+    connection = dataset_broker(database_path).open_read_connection()
     try:
         counts = {
             table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
             for table in ("items", "silver_bars", "estimates", "estimate_items")
         }
+        version = connection.execute("SELECT MAX(version) FROM schema_version")
+        assert version.fetchone()[0] == schema.CURRENT_SCHEMA_VERSION
+        indexed = connection.execute(
+            "SELECT COUNT(*) FROM estimates_fts WHERE estimates_fts MATCH '\"0042\"'"
+        ).fetchone()[0]
+        summary = connection.execute(
+            "SELECT TOTAL(bar_count) FROM silver_bar_summary"
+        ).fetchone()[0]
     finally:
         connection.close()
 
     assert counts == {
-        "items": ITEM_COUNT,
-        "silver_bars": BAR_COUNT,
-        "estimates": ESTIMATE_COUNT,
-        "estimate_items": ESTIMATE_LINE_COUNT,
+        "items": tier.items,
+        "silver_bars": tier.bars,
+        "estimates": tier.estimates,
+        "estimate_items": tier.estimate_lines,
     }
+    assert indexed > 0
+    assert summary == tier.bars
+
+
+def test_cached_dataset_is_built_once_per_tier_and_seed(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = cached_dataset(cache_dir, "small", seed=1, scratch_dir=tmp_path)
+    built_at = first.stat().st_mtime_ns
+
+    assert cached_dataset(cache_dir, "small", seed=1, scratch_dir=tmp_path) == first
+    assert first.stat().st_mtime_ns == built_at
+    other = cached_dataset(cache_dir, "small", seed=2, scratch_dir=tmp_path)
+    assert other != first and other.is_file()
+    assert not list(cache_dir.glob("*.partial*"))
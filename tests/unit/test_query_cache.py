@@ -0,0 +1,128 @@
+import logging
+import sqlite3
+from contextlib import closing
+
+from silverestimate.persistence.database_writer import WriterSession
+from silverestimate.persistence.query_cache import QueryCache, cached_read
+
+
+class _Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_query_cache_expires_only_entries_that_read_a_written_table():
+    cache = QueryCache()
+    lists = _Loader([{"list_id": 1}])
+    items = _Loader([{"code": "A"}])
+
+    with closing(sqlite3.connect(":memory:")) as connection:
+        cursor = connection.cursor()
+        for _ in range(2):
+            cache.read(cursor, "lists", (), ("silver_bar_lists",), lists)
+            cache.read(cursor, "items", ("A",), ("items",), items)
+        cache.invalidate("silver_bar_lists")
+        cache.read(cursor, "lists", (), ("silver_bar_lists",), lists)
+        cache.read(cursor, "items", ("A",), ("items",), items)
+
+    assert (lists.calls, items.calls) == (2, 1)
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.entries) == (3, 3, 2)
+    assert metrics.hit_rate == 0.5
+
+
+def test_query_cache_sees_commits_from_other_connections(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = QueryCache()
+    with (
+        closing(sqlite3.connect(path)) as reader,
+        closing(sqlite3.connect(path)) as writer,
+    ):
+        writer.execute("CREATE TABLE notes (value TEXT)")
+        writer.commit()
+        cursor = reader.cursor()
+
+        def count_notes():
+            cursor.execute("SELECT COUNT(*) FROM notes")
+            return cursor.fetchone()[0]
+
+        assert cache.read(cursor, "notes", (), ("notes",), count_notes) == 0
+        writer.execute("INSERT INTO notes VALUES ('a')")
+        writer.commit()
+        assert cache.read(cursor, "notes", (), ("notes",), count_notes) == 1
+        assert cache.read(cursor, "notes", (), ("notes",), count_notes) == 1
+
+    assert cache.metrics().hits == 1
+
+
+def test_query_cache_evicts_least_recent_entries_within_its_bounds():
+    cache = QueryCache(max_entries=2)
+    with closing(sqlite3.connect(":memory:")) as connection:
+        cursor = connection.cursor()
+        for key in ("a", "b", "a", "c"):
+            cache.read(cursor, "rows", (key,), ("items",), _Loader([key]))
+        kept = _Loader(["fresh"])
+        assert cache.read(cursor, "rows", ("a",), ("items",), kept) == ["a"]
+        assert cache.read(cursor, "rows", ("b",), ("items",), kept) == ["fresh"]
+
+        small = QueryCache(max_bytes=4096)
+        large = _Loader([{"name": "x" * 8192}])
+        small.read(cursor, "large", (), ("items",), large)
+        small.read(cursor, "large", (), ("items",), large)
+
+    assert cache.metrics().evictions == 2
+    assert large.calls == 2
+    assert small.metrics().entries == 0
+
+
+def test_query_cache_hits_return_copies_of_rows():
+    cache = QueryCache()
+    with closing(sqlite3.connect(":memory:")) as connection:
+        cursor = connection.cursor()
+        loader = _Loader([{"list_id": 1}])
+        first = cache.read(cursor, "lists", (), ("silver_bar_lists",), loader)
+        first[0]["list_id"] = 99
+        first.append({"list_id": 2})
+        second = cache.read(cursor, "lists", (), ("silver_bar_lists",), loader)
+
+    assert second == [{"list_id": 1}]
+
+
+def test_cached_read_runs_the_loader_without_a_cache_or_when_bypassed():
+    class _Db:
+        def __init__(self, connection):
+            self.cursor = connection.cursor()
+            self.query_cache = QueryCache()
+
+    loader = _Loader(7)
+    with closing(sqlite3.connect(":memory:")) as connection:
+        db = _Db(connection)
+        assert cached_read(object(), "n", (), ("items",), loader) == 7
+        cached_read(db, "n", (), ("items",), loader)
+        cached_read(db, "n", (), ("items",), loader)
+        cached_read(db, "n", (), ("items",), loader, use_cache=False)
+
+    assert loader.calls == 3
+
+
+def test_writer_session_holds_invalidations_until_its_batch_ends():
+    cache = QueryCache()
+    session = WriterSession(
+        sqlite3.connect(":memory:"),
+        logger=logging.getLogger("test-query-cache"),
+        query_cache=cache,
+    )
+    try:
+        with session.deferred_invalidation():
+            session.invalidate_tables("items", "estimates")
+            assert cache.generation("items") == 0
+        assert (cache.generation("items"), cache.generation("estimates")) == (1, 1)
+        session.invalidate_tables("items")
+        assert cache.generation("items") == 2
+    finally:
+        session.close()
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 
+from silverestimate.persistence.encrypted_backup import (
+    BackupCancelledError,
+    BackupMode,
+)
 from silverestimate.ui.settings_data_page import (
     DataManagementActions,
     SettingsDataController,
@@ -11,10 +16,22 @@ from silverestimate.ui.settings_data_page import (
 class _DatabaseStub:
     def __init__(self) -> None:
         self.backup_destinations: list[str] = []
+        self.backup_modes: list[BackupMode] = []
         self.restore_requests: list[tuple[str, str]] = []
+        self.archive_cutoffs: list[str] = []
 
-    def create_encrypted_backup(self, destination: str) -> object:
+    def create_encrypted_backup(
+        self,
+        destination: str,
+        *,
+        mode: BackupMode = BackupMode.EXPORT,
+        cancel_event: object = None,
+        progress: object = None,
+    ) -> object:
         self.backup_destinations.append(destination)
+        self.backup_modes.append(mode)
+        if cancel_event is not None and cancel_event.is_set():
+            raise BackupCancelledError("Database backup cancelled.")
         return SimpleNamespace(
             message="Backup created.",
             path=destination,
@@ -31,6 +48,12 @@ class _DatabaseStub:
             path="database.restore.staged",
         )
 
+    def archive_estimates_before(self, cutoff_date: str) -> object:
+        self.archive_cutoffs.append(cutoff_date)
+        if not cutoff_date:
+            raise RuntimeError("cutoff required")
+        return SimpleNamespace(message="Archived 3 estimates.", path="db.archive")
+
 
 def _actions(calls: list[str]) -> DataManagementActions:
     return DataManagementActions(
@@ -75,12 +98,26 @@ def test_database_backup_and_restore_return_explicit_outcomes() -> None:
     assert backup.message == "Backup created."
     assert backup.path == "counter-backup.sedbbackup"
     assert database.backup_destinations == ["counter-backup.sedbbackup"]
+    assert database.backup_modes == [BackupMode.ONLINE]
     assert restore.succeeded
     assert restore.message == "Restore staged."
     assert restore.path == "database.restore.staged"
     assert database.restore_requests == [("counter-backup.sedbbackup", "main-password")]
 
 
+def test_cancelled_database_backup_is_reported_as_cancelled() -> None:
+    database = _DatabaseStub()
+    controller = SettingsDataController(lambda: database, _actions([]))
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    result = controller.create_database_backup("counter", cancel_event=cancel_event)
+
+    assert not result.succeeded
+    assert result.cancelled
+    assert database.backup_destinations == ["counter.sedbbackup"]
+
+
 def test_database_actions_report_unavailable_or_failed_dependencies() -> None:
     unavailable = SettingsDataController(lambda: None, _actions([]))
 
@@ -118,3 +155,22 @@ def test_cancelled_application_command_is_not_reported_as_an_error() -> None:
 
     assert result.cancelled
     assert not result.succeeded
+
+
+def test_estimate_archive_reports_outcome_and_failure() -> None:
+    database = _DatabaseStub()
+    controller = SettingsDataController(lambda: database, _actions([]))
+
+    archived = controller.archive_old_estimates("2024-01-01")
+    failed = controller.archive_old_estimates("")
+
+    assert archived.succeeded
+    assert archived.message == "Archived 3 estimates."
+    assert not failed.succeeded
+    assert failed.message == "cutoff required"
+    assert database.archive_cutoffs == ["2024-01-01", ""]
+    assert (
+        not SettingsDataController(lambda: None, _actions([]))
+        .archive_old_estimates("2024-01-01")
+        .succeeded
+    )
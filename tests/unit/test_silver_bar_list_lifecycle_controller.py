@@ -8,6 +8,7 @@ from PySide6.QtWidgets import (
     QTableView,
 )
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.models import AvailableSilverBarsTableModel
 from silverestimate.ui.silver_bar_list_lifecycle_controller import (
     SilverBarListLifecycleController,
@@ -20,7 +21,7 @@ class _LifecycleDbStub:
 
     def create_silver_bar_list(self, note):
         self.created_notes.append(note)
-        return 11
+        return settled_future(lambda: 11)
 
 
 class _LifecycleHost(QDialog):
@@ -86,13 +87,13 @@ class _LifecycleHost(QDialog):
         model = table.model()
         return [model.bar_id_at(index.row()) for index in indexes if model is not None]
 
-    def _run_with_wait_cursor(self, operation, **kwargs):
+    def _run_transfer(self, start, finish, **kwargs):
         del kwargs
-        return operation()
+        finish(start().result())
 
     def _bulk_assign_to_list(self, bar_ids, list_id):
         self.assigned_payloads.append((list(bar_ids), int(list_id)))
-        return len(list(bar_ids)), []
+        return settled_future(lambda: (len(list(bar_ids)), []))
 
 
 def test_lifecycle_controller_creates_list_from_selection_and_assigns_bars(
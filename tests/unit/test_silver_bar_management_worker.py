@@ -3,8 +3,11 @@ import threading
 import time
 from pathlib import Path
 
+from silverestimate.persistence.silver_bar_summary import SilverBarTotals
 from silverestimate.ui.silver_bar_load_controller import (
+    _BarsCountRequest,
     _BarsLoadRequest,
+    _count_bars,
     _load_bars_page,
 )
 
@@ -85,12 +88,13 @@ def test_available_worker_filters_unassigned_stock_only(qt_app, tmp_path):
     returned_request, page = _load_bars_page(request, threading.Event())
 
     assert returned_request is request
-    assert page.total == 1
+    # The page is shown before it is counted.
+    assert page.total is None
     assert [row["list_id"] for row in page.items] == [None]
     assert [row["status"] for row in page.items] == ["In Stock"]
 
 
-def test_list_worker_returns_keyset_page_and_total_count(qt_app, tmp_path):
+def test_list_worker_returns_an_uncounted_keyset_page(qt_app, tmp_path):
     del qt_app
     db_path = tmp_path / "bars.sqlite"
     _seed_worker_db(db_path)
@@ -106,6 +110,29 @@ def test_list_worker_returns_keyset_page_and_total_count(qt_app, tmp_path):
     returned_request, page = _load_bars_page(request, threading.Event())
 
     assert returned_request is request
-    assert page.total == 2
+    assert page.total is None
     assert len(page.items) == 2
     assert all(row["list_id"] == 1 for row in page.items)
+
+
+def test_count_worker_totals_the_loaded_filter(qt_app, tmp_path):
+    del qt_app
+    db_path = tmp_path / "bars.sqlite"
+    _seed_worker_db(db_path)
+
+    def load(target, payload):
+        return _BarsLoadRequest(
+            target, _factory(db_path), payload, None, False, time.perf_counter()
+        )
+
+    available = _BarsCountRequest(load("available", {"min_purity": None}), 3)
+    returned_request, totals = _count_bars(available, threading.Event())
+    assert returned_request is available
+    assert totals == SilverBarTotals(1, 10.0, 9.9)
+
+    _request, totals = _count_bars(
+        _BarsCountRequest(load("list", {"list_id": 1}), 1), threading.Event()
+    )
+    assert totals.bar_count == 2
+    assert totals.total_weight == 23.0
+    assert round(totals.total_fine_weight, 2) == 22.42
@@ -1,6 +1,14 @@
+import random
+import threading
+import time
+
+import pytest
+
 from silverestimate.ui.silver_bar_optimization import (
+    OptimizationCancelledError,
     find_max_bars_combination,
     find_min_bars_combination,
+    optimize_bar_selection,
 )
 
 
@@ -24,3 +32,57 @@ def test_find_max_bars_combination_prefers_more_bars_within_range():
 
     assert [row["bar_id"] for row in selected] == [2, 3, 4]
     assert sum(row["fine_weight"] for row in selected) == 75.0
+
+
+def test_optimizer_solves_large_inventories_that_greedy_misses():
+    bars = [_bar(index, 12.0 + (index % 97) * 0.013) for index in range(5_000)]
+    bars.append(_bar(9_999, 3.337))
+
+    result = optimize_bar_selection(bars, 40.0, 40.0, "min_bars")
+
+    assert result.proven_optimal
+    assert len(result.bars) == 4
+    assert round(result.total_fine_weight, 3) == 40.0
+
+
+def test_optimizer_reports_progress_and_honours_cancellation():
+    bars = [_bar(index, 1.0 + index * 0.01) for index in range(200)]
+    calls = []
+
+    optimize_bar_selection(
+        bars, 30.0, 31.0, "max_bars", progress=lambda *args: calls.append(args)
+    )
+    assert calls and calls[-1][0] == calls[-1][1]
+
+    cancelled = threading.Event()
+    cancelled.set()
+    with pytest.raises(OptimizationCancelledError):
+        optimize_bar_selection(bars, 30.0, 31.0, "min_bars", cancel_event=cancelled)
+
+
+def test_optimizer_stops_at_the_time_budget_without_a_proof():
+    bars = [_bar(index, 0.002 * (index + 1)) for index in range(200)]
+
+    result = optimize_bar_selection(bars, 5.001, 5.001, "min_bars", time_budget_s=0.0)
+
+    assert not result.found
+    assert not result.proven_optimal
+
+
+@pytest.mark.parametrize("count", [10_000, 50_000])
+def test_optimizer_honours_the_time_budget_on_unreachable_targets(count):
+    # Even-milligram bars can never add up to an odd-milligram target.
+    rng = random.Random(7)
+    bars = [
+        _bar(index, rng.randrange(1_000, 60_000, 2) / 1000) for index in range(count)
+    ]
+
+    started = time.perf_counter()
+    result = optimize_bar_selection(
+        bars, 1_000.001, 1_000.001, "min_bars", time_budget_s=0.5
+    )
+    elapsed = time.perf_counter() - started
+
+    assert not result.found
+    assert not result.proven_optimal
+    assert elapsed < 1.5
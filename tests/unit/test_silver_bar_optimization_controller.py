@@ -2,6 +2,8 @@ import logging
 
 from PySide6.QtWidgets import QComboBox, QDialog
 
+from silverestimate.infrastructure.write_futures import settled_future
+from silverestimate.ui.silver_bar_optimization import OptimizationResult
 from silverestimate.ui.silver_bar_optimization_controller import (
     SilverBarOptimizationController,
 )
@@ -21,7 +23,7 @@ class _OptimizationDbStub:
 
     def create_silver_bar_list(self, name):
         self.created_names.append(name)
-        return 12
+        return settled_future(lambda: 12)
 
 
 class _OptimizationHost(QDialog):
@@ -37,7 +39,11 @@ class _OptimizationHost(QDialog):
 
     def _bulk_assign_to_list(self, bar_ids, list_id):
         self.bulk_assign_calls.append((list(bar_ids), int(list_id)))
-        return len(list(bar_ids)), []
+        return settled_future(lambda: (len(list(bar_ids)), []))
+
+    def _run_transfer(self, start, finish, **kwargs):
+        del kwargs
+        finish(start().result())
 
     def load_lists(self):
         self.loaded_lists += 1
@@ -81,3 +87,29 @@ def test_optimization_controller_creates_and_selects_generated_list(
     assert host.loaded_lists == 1
     assert host.loaded_available == 1
     assert host.list_combo.currentData() == 12
+
+
+def test_optimization_controller_reports_an_unfinished_search_as_timed_out(
+    qt_app, monkeypatch
+):
+    del qt_app
+    from PySide6.QtWidgets import QMessageBox
+
+    host = _OptimizationHost()
+    controller = SilverBarOptimizationController(host)
+    titles = []
+    monkeypatch.setattr(
+        QMessageBox,
+        "information",
+        lambda parent, title, text: titles.append(title),
+    )
+    monkeypatch.setattr(
+        controller,
+        "_optimize_in_background",
+        lambda *args: OptimizationResult((), 0.0, False, 5000.0, 4096),
+    )
+
+    controller.generate_optimal_list(_AcceptedDialog)
+
+    assert titles == ["Search Time Limit Reached"]
+    assert host.db_manager.created_names == []
@@ -1,9 +1,11 @@
 import csv
 import logging
+from concurrent.futures import Future
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QComboBox, QDialog, QTableView
 
+from silverestimate.infrastructure.write_futures import settled_future
 from silverestimate.ui.models import (
     AvailableSilverBarsTableModel,
     SelectedListSilverBarsTableModel,
@@ -16,10 +18,13 @@ from silverestimate.ui.silver_bar_transfer_controller import (
 class _TransferDbStub:
     def __init__(self):
         self.assigned_calls = []
+        self.pending = None
 
-    def assign_bar_to_list(self, bar_id, list_id):
-        self.assigned_calls.append((int(bar_id), int(list_id)))
-        return True
+    def assign_bars_to_list_bulk(self, bar_ids, list_id):
+        self.assigned_calls.append((list(bar_ids), int(list_id)))
+        if self.pending is not None:
+            return self.pending
+        return settled_future(lambda: (len(list(bar_ids)), []))
 
 
 class _TransferHost(QDialog):
@@ -116,12 +121,86 @@ def test_transfer_controller_adds_all_filtered_rows_and_refreshes(qtbot, monkeyp
 
     controller.add_all_filtered_to_list()
 
-    assert host.db_manager.assigned_calls == [(1, 10), (2, 10)]
+    assert host.db_manager.assigned_calls == [([1, 2], 10)]
     assert host.available_loads == 1
     assert host.list_loads == 1
     assert host.transfer_state_refreshes == 1
 
 
+def test_transfer_controller_refreshes_once_the_bulk_assignment_settles(
+    qtbot, monkeypatch
+):
+    host = _TransferHost()
+    host.available_bars_model.set_rows(
+        [
+            _management_row(1, "V001", "Alpha", 10.5, 10.489),
+            _management_row(2, "V002", "Beta", 9.0, 8.820),
+        ]
+    )
+    pending: Future = Future()
+    host.db_manager.pending = pending
+    controller = SilverBarTransferController(host)
+    qtbot.addWidget(host)
+
+    from PySide6.QtWidgets import QMessageBox
+
+    warnings = []
+    monkeypatch.setattr(
+        QMessageBox,
+        "question",
+        lambda *args, **kwargs: QMessageBox.StandardButton.Yes,
+    )
+    monkeypatch.setattr(
+        QMessageBox,
+        "information",
+        lambda *args, **kwargs: QMessageBox.StandardButton.Ok,
+    )
+    monkeypatch.setattr(
+        QMessageBox,
+        "warning",
+        lambda *args, **kwargs: warnings.append(args[2]),
+    )
+
+    controller.add_all_filtered_to_list()
+
+    assert host.db_manager.assigned_calls == [([1, 2], 10)]
+    assert host.available_loads == 0
+    pending.set_result((1, [2]))
+    qtbot.waitUntil(lambda: host.available_loads == 1, timeout=2000)
+    assert warnings == ["Failed to add bars: 2"]
+
+
+def test_transfer_controller_reports_a_failed_bulk_assignment(qtbot, monkeypatch):
+    host = _TransferHost()
+    host.available_bars_model.set_rows(
+        [_management_row(1, "V001", "Alpha", 10.5, 10.489)]
+    )
+    pending: Future = Future()
+    host.db_manager.pending = pending
+    controller = SilverBarTransferController(host)
+    qtbot.addWidget(host)
+
+    from PySide6.QtWidgets import QMessageBox
+
+    errors = []
+    monkeypatch.setattr(
+        QMessageBox,
+        "question",
+        lambda *args, **kwargs: QMessageBox.StandardButton.Yes,
+    )
+    monkeypatch.setattr(
+        QMessageBox,
+        "critical",
+        lambda *args, **kwargs: errors.append(args[2]),
+    )
+
+    controller.add_all_filtered_to_list()
+    pending.set_exception(RuntimeError("database is locked"))
+
+    qtbot.waitUntil(lambda: host.available_loads == 1, timeout=2000)
+    assert errors == ["Failed to update the list: database is locked"]
+
+
 def test_transfer_controller_exports_current_list_to_csv(qtbot, monkeypatch, tmp_path):
     host = _TransferHost()
     host.list_bars_model.set_rows(
@@ -1,3 +1,7 @@
+from silverestimate.persistence.silver_bar_summary import (
+    UNASSIGNED_LIST_ID,
+    SummaryKey,
+)
 from silverestimate.persistence.silver_bars_queries import (
     build_available_bars_queries,
     build_bars_in_list_queries,
@@ -139,3 +143,19 @@ def test_keyset_queries_bind_stable_cursor_values():
         42,
         100,
     )
+
+
+def test_paged_statements_pair_totals_and_summary_keys():
+    unfiltered = build_available_bars_queries(limit=50)
+    assert unfiltered.summary_key == SummaryKey("In Stock", UNASSIGNED_LIST_ID)
+    assert unfiltered.totals_query.query.startswith(
+        "SELECT COUNT(*), TOTAL(weight), TOTAL(fine_weight) FROM silver_bars sb"
+    )
+
+    filtered = build_available_bars_queries(weight_query=10.0, weight_tolerance=0.0)
+    assert filtered.summary_key is None
+    assert filtered.totals_query.params == filtered.count_query.params
+
+    listed = build_bars_in_list_queries(12)
+    assert listed.summary_key == SummaryKey(list_id=12)
+    assert listed.totals_query.params == (12,)
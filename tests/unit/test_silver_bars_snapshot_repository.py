@@ -138,6 +138,21 @@ def test_snapshot_repository_history_search_filters_by_note_and_status(tmp_path)
     assert rows[0]["list_identifier"] == "LIST-002"
 
 
+def test_snapshot_repository_history_page_can_defer_its_count(tmp_path):
+    db_path = tmp_path / "snapshot.sqlite"
+    _seed_snapshot_db(db_path)
+
+    repo = SilverBarsSnapshotRepository(_connection_factory(db_path))
+    counted = repo.search_history_bars_page(status_text="Assigned", limit=1)
+    uncounted = repo.search_history_bars_page(
+        status_text="Assigned", limit=1, include_total=False
+    )
+
+    assert uncounted.total is None
+    assert uncounted.items == counted.items
+    assert repo.count_history_bars(status_text="Assigned") == counted.total == 2
+
+
 def test_snapshot_repository_closes_connections_after_queries():
     class _CursorStub:
         def execute(self, query, params):